@@ -1,8 +1,29 @@
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import reduce
+from operator import or_
+from typing import Any, List, Optional
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Field, OrderBy, Q, QuerySet, Value
+from django.db.models.constants import LOOKUP_SEP
+
 from rest_framework.exceptions import APIException, NotFound
+from rest_framework.exceptions import ValidationError as DRFValidationError
+from rest_framework.fields import BooleanField, IntegerField
+from rest_framework.pagination import BasePagination
 from rest_framework.pagination import (
     PageNumberPagination as RestFrameworkPageNumberPagination,
 )
+from rest_framework.response import Response
 from rest_framework.status import HTTP_400_BAD_REQUEST
+from rest_framework.utils.urls import replace_query_param
+
+from baserow.core.expressions import RowValueComparison
 
 
 class PageNumberPagination(RestFrameworkPageNumberPagination):
@@ -39,3 +60,283 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
             exception = APIException({"error": "ERROR_INVALID_PAGE", "detail": str(e)})
             exception.status_code = HTTP_400_BAD_REQUEST
             raise exception
+
+
+@dataclass
+class KeysetOrderKey:
+    """
+    A single sort key of a keyset paginated queryset. If `field` is set then the key
+    directly references a column of the model, otherwise the expression is annotated
+    on the queryset using `name`.
+    """
+
+    name: str
+    expression: Any
+    descending: bool
+    nulls_first: bool
+    field: Optional[Field] = None
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginates a queryset by seeking past the sort key values of the last row of the
+    previous page instead of skipping rows with an `OFFSET`. The sort key values are
+    encoded in an opaque cursor, which makes fetching the last page as cheap as
+    fetching the first. The total count is only computed if explicitly requested.
+
+    The queryset must be ordered by a unique set of keys, the `id` is appended as
+    tie-breaker if it's not the last order key already.
+    """
+
+    page_size = 100
+    page_size_query_param = "size"
+    cursor_query_param = "cursor"
+    count_query_param = "include_count"
+
+    def __init__(self, limit_page_size=None):
+        self.limit_page_size = limit_page_size
+        self.request = None
+        self.count = None
+        self.next_cursor = None
+
+    @classmethod
+    def is_requested(cls, request) -> bool:
+        """
+        Indicates whether the client opted in to keyset pagination by providing the
+        cursor query parameter. An empty cursor fetches the first page.
+        """
+
+        return cls.cursor_query_param in request.query_params
+
+    def get_page_size(self, request) -> int:
+        # Just like the page number pagination, an invalid page size falls back to
+        # the default one.
+        try:
+            page_size = IntegerField(min_value=1).run_validation(
+                request.query_params[self.page_size_query_param]
+            )
+        except (KeyError, DRFValidationError):
+            page_size = self.page_size
+
+        if self.limit_page_size and page_size > self.limit_page_size:
+            exception = APIException(
+                {
+                    "error": "ERROR_PAGE_SIZE_LIMIT",
+                    "detail": f"The page size is limited to {self.limit_page_size}.",
+                }
+            )
+            exception.status_code = HTTP_400_BAD_REQUEST
+            raise exception
+
+        return page_size
+
+    def get_order_keys(self, queryset: QuerySet) -> List[KeysetOrderKey]:
+        """
+        Converts the ordering of the queryset into a list of keyset order keys.
+        """
+
+        model = queryset.model
+        query = queryset.query
+        ordering = list(query.order_by)
+        if not ordering and query.default_ordering:
+            ordering = list(model._meta.ordering)
+
+        keys = []
+        for index, order in enumerate(ordering):
+            if isinstance(order, str):
+                descending = order.startswith("-")
+                order = F(order.lstrip("-"))
+                order = order.desc() if descending else order.asc()
+            elif not isinstance(order, OrderBy):
+                order = order.asc()
+
+            expression = order.expression
+            # PostgreSQL considers null values larger than any other value, unless
+            # the position of the nulls is explicitly provided.
+            nulls_first = order.nulls_first or (
+                order.descending and not order.nulls_last
+            )
+            field = None
+            if (
+                isinstance(expression, F)
+                and LOOKUP_SEP not in expression.name
+                and expression.name not in query.annotations
+            ):
+                try:
+                    field = model._meta.get_field(expression.name)
+                except FieldDoesNotExist:
+                    pass
+
+            keys.append(
+                KeysetOrderKey(
+                    name=field.attname if field else f"keyset_key_{index}",
+                    expression=expression,
+                    descending=order.descending,
+                    nulls_first=nulls_first,
+                    field=field,
+                )
+            )
+
+        if not keys or keys[-1].field is None or not keys[-1].field.primary_key:
+            pk = model._meta.pk
+            keys.append(
+                KeysetOrderKey(
+                    name=pk.attname,
+                    expression=F(pk.attname),
+                    descending=False,
+                    nulls_first=False,
+                    field=pk,
+                )
+            )
+
+        return keys
+
+    def encode_cursor(self, keys: List[KeysetOrderKey], row) -> str:
+        values = [getattr(row, key.name) for key in keys]
+        data = json.dumps(values, cls=DjangoJSONEncoder).encode("utf-8")
+        return urlsafe_b64encode(data).decode("ascii")
+
+    def decode_cursor(self, keys: List[KeysetOrderKey], cursor: str) -> List[Any]:
+        try:
+            values = json.loads(urlsafe_b64decode(cursor.encode("ascii")))
+            if not isinstance(values, list) or len(values) != len(keys):
+                raise ValueError("The cursor does not match the ordering.")
+            return [
+                key.field.to_python(value)
+                if key.field is not None and value is not None
+                else value
+                for key, value in zip(keys, values)
+            ]
+        except (ValueError, TypeError, ValidationError, binascii.Error):
+            self.raise_invalid_cursor()
+
+    def raise_invalid_cursor(self):
+        exception = APIException(
+            {"error": "ERROR_INVALID_CURSOR", "detail": "The cursor is invalid."}
+        )
+        exception.status_code = HTTP_400_BAD_REQUEST
+        raise exception
+
+    def _get_order_by(self, key: KeysetOrderKey) -> OrderBy:
+        expression = F(key.name)
+        if key.field is not None and not key.field.null:
+            return expression.desc() if key.descending else expression.asc()
+
+        nulls = {"nulls_first": True} if key.nulls_first else {"nulls_last": True}
+        return expression.desc(**nulls) if key.descending else expression.asc(**nulls)
+
+    def _get_key_after_q(self, key: KeysetOrderKey, value: Any) -> Optional[Q]:
+        if value is None:
+            return Q(**{f"{key.name}__isnull": False}) if key.nulls_first else None
+
+        lookup = "lt" if key.descending else "gt"
+        q = Q(**{f"{key.name}__{lookup}": value})
+        if not key.nulls_first:
+            q |= Q(**{f"{key.name}__isnull": True})
+        return q
+
+    def _get_key_equal_q(self, key: KeysetOrderKey, value: Any) -> Q:
+        if value is None:
+            return Q(**{f"{key.name}__isnull": True})
+        return Q(**{key.name: value})
+
+    def get_seek_filter(
+        self, keys: List[KeysetOrderKey], values: List[Any]
+    ) -> Optional[Q]:
+        """
+        Builds the filter that only matches the rows that come after the row with
+        the provided sort key values. The trailing keys that reference non nullable
+        columns in the same direction, like `order` and `id`, are compared with a
+        single row value comparison so that a composite index can be used. Returns
+        `None` if no row can come after the provided values.
+        """
+
+        row_value_start = len(keys) - 1
+        while (
+            row_value_start > 0
+            and keys[row_value_start - 1].field is not None
+            and not keys[row_value_start - 1].field.null
+            and keys[row_value_start - 1].descending == keys[-1].descending
+            and values[row_value_start - 1] is not None
+        ):
+            row_value_start -= 1
+
+        conditions = []
+        equal_prefix = Q()
+        for key, value in zip(keys[:row_value_start], values[:row_value_start]):
+            after = self._get_key_after_q(key, value)
+            if after is not None:
+                conditions.append(equal_prefix & after)
+            equal_prefix &= self._get_key_equal_q(key, value)
+
+        row_value_keys = keys[row_value_start:]
+        row_value_values = values[row_value_start:]
+        if len(row_value_keys) == 1:
+            after = self._get_key_after_q(row_value_keys[0], row_value_values[0])
+        else:
+            after = Q(
+                RowValueComparison(
+                    [key.name for key in row_value_keys],
+                    [
+                        Value(value, output_field=key.field)
+                        for key, value in zip(row_value_keys, row_value_values)
+                    ],
+                    "<" if row_value_keys[-1].descending else ">",
+                )
+            )
+        if after is not None:
+            conditions.append(equal_prefix & after)
+
+        if not conditions:
+            return None
+
+        return reduce(or_, conditions)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        keys = self.get_order_keys(queryset)
+
+        queryset = queryset.annotate(
+            **{key.name: key.expression for key in keys if key.field is None}
+        ).order_by(*[self._get_order_by(key) for key in keys])
+
+        if request.query_params.get(self.count_query_param, "") in (
+            BooleanField.TRUE_VALUES
+        ):
+            self.count = queryset.count()
+
+        cursor = request.query_params.get(self.cursor_query_param, "")
+        if cursor:
+            values = self.decode_cursor(keys, cursor)
+            try:
+                seek_filter = self.get_seek_filter(keys, values)
+                queryset = (
+                    queryset.filter(seek_filter)
+                    if seek_filter is not None
+                    else queryset.none()
+                )
+            except (ValueError, TypeError, ValidationError):
+                self.raise_invalid_cursor()
+
+        rows = list(queryset[: page_size + 1])
+        page = rows[:page_size]
+        if len(rows) > page_size:
+            self.next_cursor = self.encode_cursor(keys, page[-1])
+
+        return page
+
+    def get_next_link(self) -> Optional[str]:
+        if self.next_cursor is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        response = OrderedDict()
+        if self.count is not None:
+            response["count"] = self.count
+        response["next"] = self.get_next_link()
+        response["results"] = data
+        return Response(response)
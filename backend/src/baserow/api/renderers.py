@@ -0,0 +1,37 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class OrjsonRenderer(JSONRenderer):
+    """
+    A drop-in replacement of the DRF JSON renderer that uses `orjson` to render the
+    data, which is a lot faster when large responses, like pages of rows, must be
+    rendered. Values that `orjson` doesn't support natively, like decimals, and
+    dates, which must be formatted like the DRF renderer does, are converted by the
+    DRF JSON encoder.
+    """
+
+    orjson_options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data, default=self.encoder_class().default, option=self.orjson_options
+            )
+        except orjson.JSONEncodeError:
+            # For example integers that don't fit in 64 bits aren't supported by
+            # `orjson`, so we fall back on the DRF renderer in that case.
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escape the unicode line and paragraph separators like the DRF renderer
+        # does, because they are not valid in JavaScript strings.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
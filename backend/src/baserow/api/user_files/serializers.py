@@ -33,11 +33,20 @@ class UserFileURLAndThumbnailsSerializerMixin(serializers.Serializer):
             return None
 
         name = self.get_instance_attr(instance, "name")
+        handler = UserFileHandler()
+
+        # The thumbnails of recently uploaded images are generated asynchronously.
+        # Until then, the original image is used as thumbnail.
+        pending = handler.are_thumbnails_pending(
+            name, self.get_instance_attr(instance, "uploaded_at")
+        )
 
         return {
             thumbnail_name: {
                 "url": default_storage.url(
-                    UserFileHandler().user_file_thumbnail_path(name, thumbnail_name)
+                    handler.user_file_path(name)
+                    if pending
+                    else handler.user_file_thumbnail_path(name, thumbnail_name)
                 ),
                 "width": size[0],
                 "height": size[1],
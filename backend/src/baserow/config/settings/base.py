@@ -562,6 +562,12 @@ MIDNIGHT_CRONTAB_STR = "0 0 * * *"
 BASEROW_STORAGE_USAGE_JOB_CRONTAB = get_crontab_from_env(
     "BASEROW_STORAGE_USAGE_JOB_CRONTAB", default_crontab=MIDNIGHT_CRONTAB_STR
 )
+# The storage usage of the workspaces whose files have changed is recalculated every
+# this many seconds. The job above recalculates the usage of all the workspaces to
+# correct any drift.
+BASEROW_STORAGE_USAGE_UPDATE_INTERVAL_SECONDS = int(
+    os.getenv("BASEROW_STORAGE_USAGE_UPDATE_INTERVAL_SECONDS", 60)
+)
 
 ONE_AM_CRONTRAB_STR = "0 1 * * *"
 BASEROW_SEAT_USAGE_JOB_CRONTAB = get_crontab_from_env(
@@ -572,6 +578,23 @@ THREE_AM_CRONTAB_STR = "0 3 * * *"
 BASEROW_ROW_COUNT_JOB_CRONTAB = get_crontab_from_env(
     "BASEROW_ROW_COUNT_JOB_CRONTAB", default_crontab=THREE_AM_CRONTAB_STR
 )
+# The row counts of the tables are maintained incrementally in the cache and written
+# to the database every this many seconds. The row count job above only counts the
+# rows of the tables whose row count deviates from the estimation of PostgreSQL.
+BASEROW_ROW_COUNT_FLUSH_INTERVAL_SECONDS = int(
+    os.getenv("BASEROW_ROW_COUNT_FLUSH_INTERVAL_SECONDS", 60)
+)
+
+# The database tokens are cached for this many seconds when they're used to
+# authenticate a request.
+BASEROW_TOKEN_CACHE_TIMEOUT_SECONDS = int(
+    os.getenv("BASEROW_TOKEN_CACHE_TIMEOUT_SECONDS", 60)
+)
+# The usage of the database tokens is accumulated in the cache and written to the
+# database every this many seconds.
+BASEROW_TOKEN_USAGE_FLUSH_INTERVAL_SECONDS = int(
+    os.getenv("BASEROW_TOKEN_USAGE_FLUSH_INTERVAL_SECONDS", 60)
+)
 
 EMAIL_BACKEND = "djcelery_email.backends.CeleryEmailBackend"
 
@@ -635,6 +658,11 @@ PERIODIC_FIELD_UPDATE_CRONTAB = get_crontab_from_env(
 PERIODIC_FIELD_UPDATE_QUEUE_NAME = os.getenv(
     "BASEROW_PERIODIC_FIELD_UPDATE_QUEUE_NAME", "export"
 )
+# The workspaces are split in at most this many shards, each one updated by a
+# separate task.
+PERIODIC_FIELD_UPDATE_MAX_PARALLEL_TASKS = int(
+    os.getenv("BASEROW_PERIODIC_FIELD_UPDATE_MAX_PARALLEL_TASKS", 4)
+)
 
 BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES = int(
     os.getenv("BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES", 8)
@@ -670,6 +698,15 @@ BASEROW_WEBHOOKS_URL_REGEX_BLACKLIST = [
 BASEROW_WEBHOOKS_URL_CHECK_TIMEOUT_SECS = int(
     os.getenv("BASEROW_WEBHOOKS_URL_CHECK_TIMEOUT_SECS", "10")
 )
+BASEROW_WEBHOOKS_MAX_CONNECTIONS_PER_HOST = int(
+    os.getenv("BASEROW_WEBHOOKS_MAX_CONNECTIONS_PER_HOST", 10)
+)
+# If higher than 0, the events triggering the same webhook within this window are
+# sent together in one batched call.
+BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS = float(
+    os.getenv("BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS", 0)
+)
+BASEROW_WEBHOOKS_MAX_BATCH_SIZE = int(os.getenv("BASEROW_WEBHOOKS_MAX_BATCH_SIZE", 100))
 
 # ======== WARNING ========
 # Please read and understand everything at:
@@ -700,6 +737,12 @@ BASEROW_JOB_EXPIRATION_TIME_LIMIT = int(
 BASEROW_JOB_SOFT_TIME_LIMIT = int(
     os.getenv("BASEROW_JOB_SOFT_TIME_LIMIT", 60 * 30)  # 30 minutes
 )
+BASEROW_ONLINE_FIELD_CONVERSION_BATCH_SIZE = int(
+    os.getenv("BASEROW_ONLINE_FIELD_CONVERSION_BATCH_SIZE", 10000)
+)
+BASEROW_AIRTABLE_IMPORT_CONCURRENCY = int(
+    os.getenv("BASEROW_AIRTABLE_IMPORT_CONCURRENCY", 4)
+)
 BASEROW_JOB_CLEANUP_INTERVAL_MINUTES = int(
     os.getenv("BASEROW_JOB_CLEANUP_INTERVAL_MINUTES", 5)  # 5 minutes
 )
@@ -798,6 +841,41 @@ BASEROW_SYNC_TEMPLATES_TIME_LIMIT = int(
 APPEND_SLASH = False
 
 BASEROW_DISABLE_MODEL_CACHE = bool(os.getenv("BASEROW_DISABLE_MODEL_CACHE", ""))
+# The maximum number of generated table model classes that every process keeps in
+# memory. Set to 0 to disable the in-process model cache.
+BASEROW_GENERATED_MODEL_LRU_CACHE_SIZE = int(
+    os.getenv("BASEROW_GENERATED_MODEL_LRU_CACHE_SIZE", 256)
+)
+# The maximum number of parsed formula expressions that every process keeps in memory.
+# Set to 0 to disable the in-process formula expression cache.
+BASEROW_FORMULA_EXPRESSION_CACHE_SIZE = int(
+    os.getenv("BASEROW_FORMULA_EXPRESSION_CACHE_SIZE", 2048)
+)
+# The number of tables, starting with the ones with the most rows, whose formula
+# expressions are parsed and cached when a celery worker starts.
+BASEROW_FORMULA_EXPRESSION_CACHE_WARM_UP_TABLES = int(
+    os.getenv("BASEROW_FORMULA_EXPRESSION_CACHE_WARM_UP_TABLES", 20)
+)
+# When enabled, the filters and sorts used by the views and API calls are counted,
+# and btree or trigram indexes are periodically created on, and dropped from, the
+# columns of the most used fields of large tables.
+BASEROW_INDEX_ADVISOR_ENABLED = bool(os.getenv("BASEROW_INDEX_ADVISOR_ENABLED", ""))
+BASEROW_INDEX_ADVISOR_INTERVAL_MINUTES = int(
+    os.getenv("BASEROW_INDEX_ADVISOR_INTERVAL_MINUTES", 60)
+)
+# Tables with fewer rows than this are fast enough without indexes.
+BASEROW_INDEX_ADVISOR_MIN_ROWS = int(os.getenv("BASEROW_INDEX_ADVISOR_MIN_ROWS", 10000))
+# The decaying usage score a field needs before an index is created. Existing
+# indexes are only dropped when the score falls below half of this value.
+BASEROW_INDEX_ADVISOR_MIN_USAGE = int(os.getenv("BASEROW_INDEX_ADVISOR_MIN_USAGE", 10))
+# Every index slows down the writes, so only this many indexes are created per table.
+BASEROW_INDEX_ADVISOR_MAX_INDEXES_PER_TABLE = int(
+    os.getenv("BASEROW_INDEX_ADVISOR_MAX_INDEXES_PER_TABLE", 5)
+)
+# When enabled, new tables get a full-text search column which is used by default when
+# searching. Existing tables can be converted using the `backfill_full_text_search`
+# management command.
+BASEROW_USE_PG_FULLTEXT_SEARCH = bool(os.getenv("BASEROW_USE_PG_FULLTEXT_SEARCH", ""))
 BASEROW_NOWAIT_FOR_LOCKS = not bool(
     os.getenv("BASEROW_WAIT_INSTEAD_OF_409_CONFLICT_ERROR", False)
 )
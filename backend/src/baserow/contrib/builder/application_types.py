@@ -85,6 +85,7 @@ class BuilderApplicationType(ApplicationType):
         builder: Builder,
         files_zip: Optional[ZipFile] = None,
         storage: Optional[Storage] = None,
+        copy_data_in_database: bool = False,
     ) -> BuilderDict:
         """
         Exports the builder application type to a serialized format that can later
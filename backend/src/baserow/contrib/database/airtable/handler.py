@@ -1,11 +1,15 @@
 import json
 import re
-from collections import defaultdict
+import shutil
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from io import BytesIO, IOBase
-from typing import Dict, List, Optional, Tuple, Union
+from io import IOBase
+from tempfile import TemporaryFile
+from typing import IO, Dict, List, Optional, Tuple, Union
 from zipfile import ZIP_DEFLATED, ZipFile
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.files.storage import Storage
 
@@ -294,14 +298,40 @@ class AirtableHandler:
         return exported_row
 
     @staticmethod
+    def download_file(url: str) -> IO[bytes]:
+        """
+        Downloads the file of the provided URL to a temporary file on disk. The
+        response is streamed, so the file is never entirely kept in memory.
+
+        :param url: The URL of the file that must be downloaded.
+        :return: The temporary file containing the downloaded file. It's deleted when
+            closed.
+        """
+
+        file = TemporaryFile()
+        try:
+            with requests.get(url, headers=BASE_HEADERS, stream=True) as response:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    file.write(chunk)
+        except Exception:
+            file.close()
+            raise
+
+        file.seek(0)
+        return file
+
+    @classmethod
     def download_files_as_zip(
+        cls,
         files_to_download: Dict[str, str],
         progress_builder: Optional[ChildProgressBuilder] = None,
         files_buffer: Union[None, IOBase] = None,
-    ) -> BytesIO:
+    ) -> IOBase:
         """
         Downloads all the user files in the provided dict and adds them to a zip file.
-        The key of the dict will be the file name in the zip file.
+        The key of the dict will be the file name in the zip file. The files are
+        downloaded concurrently by `BASEROW_AIRTABLE_IMPORT_CONCURRENCY` threads to a
+        temporary file on disk, and added to the zip file in the provided order.
 
         :param files_to_download: A dict that contains all the user file URLs that must
             be downloaded. The key is the file name and the value the URL. Additional
@@ -309,23 +339,42 @@ class AirtableHandler:
         :param progress_builder: If provided will be used to build a child progress bar
             and report on this methods progress to the parent of the progress_builder.
         :param files_buffer: Optionally a file buffer can be provided to store the
-            downloaded files in. They will be stored in memory if not provided.
-        :return: An in memory buffer as zip file containing all the user files.
+            downloaded files in. They will be stored in a temporary file on disk if not
+            provided.
+        :return: The buffer as zip file containing all the user files.
         """
 
         if files_buffer is None:
-            files_buffer = BytesIO()
+            files_buffer = TemporaryFile()
 
         progress = ChildProgressBuilder.build(
             progress_builder, child_total=len(files_to_download.keys())
         )
-
-        with ZipFile(files_buffer, "a", ZIP_DEFLATED, False) as files_zip:
-            for index, (file_name, url) in enumerate(files_to_download.items()):
-                response = requests.get(url, headers=BASE_HEADERS)
-                files_zip.writestr(file_name, response.content)
+        concurrency = settings.BASEROW_AIRTABLE_IMPORT_CONCURRENCY
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor, ZipFile(
+            files_buffer, "a", ZIP_DEFLATED, False
+        ) as files_zip:
+            # The number of files being downloaded or waiting to be added to the zip
+            # file is limited, so that the number of open temporary files is bounded.
+            downloads = deque()
+
+            def add_next_download_to_zip():
+                file_name, download = downloads.popleft()
+                with download.result() as file, files_zip.open(
+                    file_name, "w"
+                ) as zip_file:
+                    shutil.copyfileobj(file, zip_file)
                 progress.increment(state=AIRTABLE_EXPORT_JOB_DOWNLOADING_FILES)
 
+            for file_name, url in files_to_download.items():
+                downloads.append((file_name, executor.submit(cls.download_file, url)))
+                if len(downloads) >= concurrency * 2:
+                    add_next_download_to_zip()
+
+            while downloads:
+                add_next_download_to_zip()
+
         return files_buffer
 
     @classmethod
@@ -339,7 +388,7 @@ class AirtableHandler:
     ) -> Tuple[dict, IOBase]:
         """
         Converts the provided raw Airtable database dict to a Baserow export format and
-        an in memory zip file containing all the downloaded user files.
+        a zip file containing all the downloaded user files.
 
         @TODO add the views.
         @TODO preserve the order of least one view.
@@ -347,11 +396,13 @@ class AirtableHandler:
         :param init_data: The init_data, extracted from the initial page related to the
             shared base.
         :param schema: An object containing the schema of the Airtable base.
-        :param tables: a list containing the table data.
+        :param tables: a dict containing the table data by table id. The data of
+            every table is removed from the dict once it has been converted.
         :param progress_builder: If provided will be used to build a child progress bar
             and report on this methods progress to the parent of the progress_builder.
         :param download_files_buffer: Optionally a file buffer can be provided to store
-            the downloaded files in. They will be stored in memory if not provided.
+            the downloaded files in. They will be stored in a temporary file on disk if
+            not provided.
         :return: The converted Airtable base in Baserow export format and a zip file
             containing the user files.
         """
@@ -470,8 +521,12 @@ class AirtableHandler:
             # could be references to other rows and fields. the `files_to_download` is
             # needed because every value could be depending on additional files that
             # must later be downloaded.
+            # The raw Airtable rows are released from the `tables` dict once they're
+            # converted, so that they're not kept in memory together with the rows of
+            # all the other converted tables.
             exported_rows = []
-            for row_index, row in enumerate(tables[table["id"]]["rows"]):
+            raw_rows = tables.pop(table["id"])["rows"]
+            for row_index, row in enumerate(raw_rows):
                 exported_rows.append(
                     cls.to_baserow_row_export(
                         row_id_mapping, field_mapping, row, row_index, files_to_download
@@ -542,7 +597,8 @@ class AirtableHandler:
         :param progress_builder: If provided will be used to build a child progress bar
             and report on this methods progress to the parent of the progress_builder.
         :param download_files_buffer: Optionally a file buffer can be provided to store
-            the downloaded files in. They will be stored in memory if not provided.
+            the downloaded files in. They will be stored in a temporary file on disk if
+            not provided.
         :return: The imported database application representing the Airtable base.
         """
 
@@ -553,17 +609,16 @@ class AirtableHandler:
         request_id, init_data, cookies = cls.fetch_publicly_shared_base(share_id)
         progress.increment(state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE)
 
-        # Loop over all the tables and make a request for each table to obtain the raw
-        # Airtable table data.
-        tables = []
+        # Make a request for each table to obtain the raw Airtable table data. The
+        # tables are fetched concurrently, but the results are kept in the original
+        # order.
         raw_tables = list(init_data["rawTables"].keys())
-        for index, table_id in enumerate(
-            progress.track(
-                represents_progress=99,
-                state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE,
-                iterable=raw_tables,
-            )
-        ):
+        fetch_progress = progress.create_child(
+            represents_progress=99, total=len(raw_tables)
+        )
+
+        def fetch_table(index_and_table_id: Tuple[int, str]) -> dict:
+            index, table_id = index_and_table_id
             response = cls.fetch_table_data(
                 table_id=table_id,
                 init_data=init_data,
@@ -576,7 +631,15 @@ class AirtableHandler:
                 stream=False,
             )
             decoded_content = remove_invalid_surrogate_characters(response.content)
-            tables.append(json.loads(decoded_content))
+            return json.loads(decoded_content)
+
+        tables = []
+        with ThreadPoolExecutor(
+            max_workers=settings.BASEROW_AIRTABLE_IMPORT_CONCURRENCY
+        ) as executor:
+            for table in executor.map(fetch_table, enumerate(raw_tables)):
+                tables.append(table)
+                fetch_progress.increment(state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE)
 
         # Split database schema from the tables because we need this to be separated
         # later on..
@@ -593,12 +656,18 @@ class AirtableHandler:
         )
 
         # Import the converted data using the existing method to avoid duplicate code.
-        databases, _ = CoreHandler().import_applications_to_workspace(
-            workspace,
-            [baserow_database_export],
-            files_buffer,
-            storage=storage,
-            progress_builder=progress.create_child_builder(represents_progress=600),
-        )
+        try:
+            databases, _ = CoreHandler().import_applications_to_workspace(
+                workspace,
+                [baserow_database_export],
+                files_buffer,
+                storage=storage,
+                progress_builder=progress.create_child_builder(represents_progress=600),
+            )
+        finally:
+            # The temporary file created to store the downloaded files can be
+            # removed once they've been imported.
+            if download_files_buffer is None:
+                files_buffer.close()
 
         return databases[0].specific
@@ -57,6 +57,13 @@ SUPPORTED_CSV_COLUMN_SEPARATORS = [
     ("record_separator", "\x1e"),
     ("unit_separator", "\x1f"),
 ]
+# Please keep in sync with modules/database/components/export/TableParquetExporter.vue
+SUPPORTED_PARQUET_COMPRESSIONS = [
+    ("snappy", "snappy"),
+    ("gzip", "gzip"),
+    ("zstd", "zstd"),
+    ("none", "none"),
+]
 
 
 class ExportedFileURLSerializerMixin(serializers.Serializer):
@@ -150,3 +157,11 @@ class CsvExporterOptionsSerializer(BaseExporterOptionsSerializer):
         default=True,
         help_text="Whether or not to generate a header row at the top of the csv file.",
     )
+
+
+class ParquetExporterOptionsSerializer(BaseExporterOptionsSerializer):
+    parquet_compression = fields.ChoiceField(
+        choices=SUPPORTED_PARQUET_COMPRESSIONS,
+        default="snappy",
+        help_text="The compression codec used for the columns of the parquet file.",
+    )
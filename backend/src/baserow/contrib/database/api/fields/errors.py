@@ -115,6 +115,11 @@ ERROR_INCOMPATIBLE_FIELD_TYPE_FOR_UNIQUE_VALUES = (
     HTTP_400_BAD_REQUEST,
     "The requested field type is not compatible with generating unique values.",
 )
+ERROR_INCOMPATIBLE_FIELD_TYPE_FOR_ONLINE_CONVERSION = (
+    "ERROR_INCOMPATIBLE_FIELD_TYPE_FOR_ONLINE_CONVERSION",
+    HTTP_400_BAD_REQUEST,
+    "The field can't be converted to the requested field type in the background.",
+)
 ERROR_FAILED_TO_LOCK_FIELD_DUE_TO_CONFLICT = (
     "ERROR_FAILED_TO_LOCK_FIELD_DUE_TO_CONFLICT",
     HTTP_409_CONFLICT,
@@ -1,3 +1,4 @@
+from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 from drf_spectacular.plumbing import build_object_type
 
 row_names_response_schema = build_object_type(
@@ -17,3 +18,17 @@ row_names_response_schema = build_object_type(
         },
     },
 )
+
+RELATED_ROWS_LIMIT_SCHEMA_PARAMETER = OpenApiParameter(
+    name="related_rows_limit",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.INT,
+    description=(
+        "If provided, the `link_row` cells of the rows contain at most this number "
+        "of related rows, in the order of the related table. The response then "
+        "also contains a `related_rows_count` object keyed by row id, containing "
+        "the total number of related rows of every `link_row` field of the row. "
+        "All the related rows of a cell can be paged through with the "
+        "**list_database_table_row_related_rows** endpoint."
+    ),
+)
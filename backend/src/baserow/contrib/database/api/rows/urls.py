@@ -6,6 +6,7 @@ from .views import (
     RowAdjacentView,
     RowMoveView,
     RowNamesView,
+    RowRelatedRowsView,
     RowsView,
     RowView,
 )
@@ -39,6 +40,11 @@ urlpatterns = [
         RowMoveView.as_view(),
         name="move",
     ),
+    re_path(
+        r"table/(?P<table_id>[0-9]+)/(?P<row_id>[0-9]+)/related/(?P<field_id>[0-9]+)/$",
+        RowRelatedRowsView.as_view(),
+        name="related_rows",
+    ),
     re_path(
         r"names/$",
         RowNamesView.as_view(),
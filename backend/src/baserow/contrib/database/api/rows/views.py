@@ -22,20 +22,24 @@ from baserow.api.exceptions import (
     QueryParameterValidationException,
     RequestBodyValidationException,
 )
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import KeysetPagination, PageNumberPagination
+from baserow.api.renderers import OrjsonRenderer
 from baserow.api.schemas import (
     CLIENT_SESSION_ID_SCHEMA_PARAMETER,
     CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER,
     get_error_schema,
 )
+from baserow.api.serializers import get_example_pagination_serializer_class
 from baserow.api.trash.errors import ERROR_CANNOT_DELETE_ALREADY_DELETED_ITEM
 from baserow.api.utils import validate_data
 from baserow.contrib.database.api.fields.errors import (
     ERROR_FIELD_DOES_NOT_EXIST,
     ERROR_FILTER_FIELD_NOT_FOUND,
+    ERROR_INCOMPATIBLE_FIELD,
     ERROR_ORDER_BY_FIELD_NOT_FOUND,
     ERROR_ORDER_BY_FIELD_NOT_POSSIBLE,
 )
+from baserow.contrib.database.api.fields.serializers import LinkRowValueSerializer
 from baserow.contrib.database.api.rows.errors import (
     ERROR_ROW_DOES_NOT_EXIST,
     ERROR_ROW_IDS_NOT_UNIQUE,
@@ -56,6 +60,7 @@ from baserow.contrib.database.api.views.errors import (
 from baserow.contrib.database.fields.exceptions import (
     FieldDoesNotExist,
     FilterFieldNotFound,
+    IncompatibleField,
     OrderByFieldNotFound,
     OrderByFieldNotPossible,
 )
@@ -77,6 +82,7 @@ from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.rows.operations import (
     ReadAdjacentRowDatabaseRowOperationType,
 )
+from baserow.contrib.database.search.handler import SEARCH_MODES
 from baserow.contrib.database.table.exceptions import TableDoesNotExist
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.table.models import Table
@@ -99,7 +105,7 @@ from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.handler import CoreHandler
 from baserow.core.trash.exceptions import CannotDeleteAlreadyDeletedItem
 
-from .schemas import row_names_response_schema
+from .schemas import RELATED_ROWS_LIMIT_SCHEMA_PARAMETER, row_names_response_schema
 from .serializers import (
     BatchCreateRowsQueryParamsSerializer,
     BatchDeleteRowsSerializer,
@@ -110,13 +116,16 @@ from .serializers import (
     get_batch_row_serializer_class,
     get_example_batch_rows_serializer_class,
     get_example_row_serializer_class,
+    get_related_rows_count,
     get_row_serializer_class,
+    serialize_rows_for_response,
 )
 
 
 class RowsView(APIView):
     authentication_classes = APIView.authentication_classes + [TokenAuthentication]
     permission_classes = (IsAuthenticated,)
+    renderer_classes = (OrjsonRenderer,)
 
     @extend_schema(
         parameters=[
@@ -139,6 +148,24 @@ class RowsView(APIView):
                 type=OpenApiTypes.INT,
                 description="Defines how many rows should be returned per page.",
             ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="Enables the cursor pagination if provided. An empty "
+                "value returns the first page and the `next` URL of the response "
+                "contains the cursor of the next page. Can be combined with the "
+                "`size` parameter, but not with `page`. Fetching a page is equally "
+                "fast regardless of its position in the table.",
+            ),
+            OpenApiParameter(
+                name="include_count",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description="Can only be used in combination with the `cursor` "
+                "parameter. If provided the total `count` of rows is included in "
+                "the response.",
+            ),
             OpenApiParameter(
                 name="search",
                 location=OpenApiParameter.QUERY,
@@ -146,6 +173,19 @@ class RowsView(APIView):
                 description="If provided only rows with data that matches the search "
                 "query are going to be returned.",
             ),
+            OpenApiParameter(
+                name="search_mode",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                enum=SEARCH_MODES,
+                description="The way the `search` query is matched. `compat` checks "
+                "whether the value of any field contains the search query, "
+                "`full-text` matches every word of the search query as a prefix "
+                "against an indexed full-text representation of the row, which is "
+                "much faster on large tables. Falls back to `compat` if the "
+                "full-text index of the table is not yet available. Defaults to "
+                "the mode configured on the server.",
+            ),
             OpenApiParameter(
                 name="order_by",
                 location=OpenApiParameter.QUERY,
@@ -244,22 +284,23 @@ class RowsView(APIView):
                 type=OpenApiTypes.INT,
                 description="Includes all the filters and sorts of the provided view.",
             ),
+            RELATED_ROWS_LIMIT_SCHEMA_PARAMETER,
         ],
         tags=["Database table rows"],
         operation_id="list_database_table_rows",
         description=(
             "Lists all the rows of the table related to the provided parameter if the "
             "user has access to the related database's workspace. The response is "
-            "paginated by a page/size style. It is also possible to provide an "
-            "optional search query, only rows where the data matches the search query "
-            "are going to be returned then. The properties of the returned rows "
-            "depends on which fields the table has. For a complete overview of fields "
-            "use the **list_database_table_fields** endpoint to list them all. In the "
-            "example all field types are listed, but normally the number in "
-            "field_{id} key is going to be the id of the field. Or if the GET "
-            "parameter `user_field_names` is provided then the keys will be the name "
-            "of the field. The value is what the user has provided and the format of "
-            "it depends on the fields type."
+            "paginated either by a page/size or cursor style. It is also possible to "
+            "provide an optional search query, only rows where the data matches the "
+            "search query are going to be returned then. The properties of the "
+            "returned rows depends on which fields the table has. For a complete "
+            "overview of fields use the **list_database_table_fields** endpoint to "
+            "list them all. In the example all field types are listed, but normally "
+            "the number in field_{id} key is going to be the id of the field. Or if "
+            "the GET parameter `user_field_names` is provided then the keys will be "
+            "the name of the field. The value is what the user has provided and the "
+            "format of it depends on the fields type."
         ),
         responses={
             200: example_pagination_row_serializer_class,
@@ -269,6 +310,7 @@ class RowsView(APIView):
                     "ERROR_REQUEST_BODY_VALIDATION",
                     "ERROR_PAGE_SIZE_LIMIT",
                     "ERROR_INVALID_PAGE",
+                    "ERROR_INVALID_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
@@ -318,6 +360,7 @@ class RowsView(APIView):
 
         TokenHandler().check_table_permissions(request, "read", table, False)
         search = query_params.get("search")
+        search_mode = query_params.get("search_mode")
         order_by = query_params.get("order_by")
         include = query_params.get("include")
         exclude = query_params.get("exclude")
@@ -327,11 +370,14 @@ class RowsView(APIView):
             table, include, exclude, user_field_names=user_field_names
         )
 
+        related_rows_limit = query_params.get("related_rows_limit")
         model = table.get_model(
             fields=fields,
             field_ids=[] if fields else None,
         )
-        queryset = model.objects.all().enhance_by_fields()
+        queryset = model.objects.all().enhance_by_fields(
+            related_rows_limit=related_rows_limit
+        )
 
         if view_id:
             view_handler = ViewHandler()
@@ -344,7 +390,7 @@ class RowsView(APIView):
             queryset = view_handler.apply_sorting(view, queryset)
 
         if search:
-            queryset = queryset.search_all_fields(search)
+            queryset = queryset.search_all_fields(search, search_mode=search_mode)
 
         if order_by:
             queryset = queryset.order_by_fields_string(order_by, user_field_names)
@@ -358,14 +404,25 @@ class RowsView(APIView):
         filter_object = {key: request.GET.getlist(key) for key in request.GET.keys()}
         queryset = queryset.filter_by_fields_object(filter_object, filter_type)
 
-        paginator = PageNumberPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        if KeysetPagination.is_requested(request):
+            paginator = KeysetPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        else:
+            paginator = PageNumberPagination(
+                limit_page_size=settings.ROW_PAGE_SIZE_LIMIT
+            )
         page = paginator.paginate_queryset(queryset, request, self)
-        serializer_class = get_row_serializer_class(
-            model, RowSerializer, is_response=True, user_field_names=user_field_names
+        response = paginator.get_paginated_response(
+            serialize_rows_for_response(page, model, user_field_names=user_field_names)
         )
-        serializer = serializer_class(page, many=True)
 
-        return paginator.get_paginated_response(serializer.data)
+        if related_rows_limit is not None:
+            response.data.update(
+                related_rows_count=get_related_rows_count(
+                    page, model, user_field_names=user_field_names
+                )
+            )
+
+        return response
 
     @extend_schema(
         parameters=[
@@ -1413,3 +1470,106 @@ class RowAdjacentView(APIView):
         serializer = serializer_class(adjacent_row)
 
         return Response(serializer.data)
+
+
+class RowRelatedRowsView(APIView):
+    authentication_classes = APIView.authentication_classes + [TokenAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="The table of the row.",
+            ),
+            OpenApiParameter(
+                name="row_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Returns the related rows of the row with this id.",
+            ),
+            OpenApiParameter(
+                name="field_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Returns the related rows of the `link_row` field with "
+                "this id.",
+            ),
+            OpenApiParameter(
+                name="page",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+                description="Defines which page of related rows should be returned.",
+            ),
+            OpenApiParameter(
+                name="size",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+                description="Defines how many related rows should be returned per "
+                "page.",
+            ),
+        ],
+        tags=["Database table rows"],
+        operation_id="list_database_table_row_related_rows",
+        description=(
+            "Lists the rows related to a `link_row` cell, in the order of the related "
+            "table. Every related row contains its `id` and the `value` of its "
+            "primary field, just like in the cell. This can be used to page through "
+            "all the related rows when the rows have been listed with a "
+            "`related_rows_limit`."
+        ),
+        responses={
+            200: get_example_pagination_serializer_class(
+                LinkRowValueSerializer,
+                serializer_name="PaginationSerializerLinkRowValue",
+            ),
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_INCOMPATIBLE_FIELD",
+                    "ERROR_PAGE_SIZE_LIMIT",
+                    "ERROR_INVALID_PAGE",
+                ]
+            ),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(
+                [
+                    "ERROR_TABLE_DOES_NOT_EXIST",
+                    "ERROR_ROW_DOES_NOT_EXIST",
+                    "ERROR_FIELD_DOES_NOT_EXIST",
+                ]
+            ),
+        },
+    )
+    @map_exceptions(
+        {
+            UserNotInWorkspace: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            RowDoesNotExist: ERROR_ROW_DOES_NOT_EXIST,
+            FieldDoesNotExist: ERROR_FIELD_DOES_NOT_EXIST,
+            IncompatibleField: ERROR_INCOMPATIBLE_FIELD,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+        }
+    )
+    def get(
+        self, request: Request, table_id: int, row_id: int, field_id: int
+    ) -> Response:
+        """
+        Responds with a page of the rows related to the cell of the provided row
+        and link row field.
+        """
+
+        table = TableHandler().get_table(table_id)
+
+        TokenHandler().check_table_permissions(request, "read", table, False)
+        queryset = RowHandler().get_related_rows(
+            request.user, table, row_id, int(field_id)
+        )
+
+        paginator = PageNumberPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        page = paginator.paginate_queryset(queryset, request, self)
+        serializer = LinkRowValueSerializer(page, many=True)
+
+        return paginator.get_paginated_response(serializer.data)
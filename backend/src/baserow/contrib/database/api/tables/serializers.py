@@ -1,5 +1,10 @@
+import codecs
+
+from django.conf import settings
+
 from rest_framework import serializers
 
+from baserow.contrib.database.file_import.readers import IMPORT_FILE_TYPES
 from baserow.contrib.database.table.models import Table
 
 
@@ -64,6 +69,57 @@ class TableImportSerializer(serializers.Serializer):
         fields = ("data",)
 
 
+class TableImportFileSerializer(serializers.Serializer):
+    file = serializers.FileField(
+        help_text="The CSV, XLSX or JSON file containing the rows to import. The file "
+        "is parsed by the server while the rows are imported, so it doesn't have to "
+        "be parsed by the client."
+    )
+    file_type = serializers.ChoiceField(
+        choices=IMPORT_FILE_TYPES,
+        help_text="The type of the file. Only the first sheet of an XLSX file is "
+        "imported. A JSON file must contain an array of arrays or an array of "
+        "objects.",
+    )
+    first_row_header = serializers.BooleanField(
+        default=False,
+        help_text="Indicates if the first row of the file is the header. Ignored "
+        "for a JSON file containing objects because the keys are the header.",
+    )
+    csv_column_separator = serializers.CharField(
+        min_length=1,
+        max_length=1,
+        default=",",
+        trim_whitespace=False,
+        help_text="The column separator of a CSV file.",
+    )
+    encoding = serializers.CharField(
+        max_length=32,
+        default="utf-8",
+        help_text="The encoding of a CSV or JSON file.",
+    )
+
+    def validate_file(self, value):
+        if value.size > settings.BASEROW_FILE_UPLOAD_SIZE_LIMIT_MB:
+            raise serializers.ValidationError(
+                "The provided file is too large.", code="file_size_too_large"
+            )
+        return value
+
+    def validate_encoding(self, value):
+        try:
+            codecs.lookup(value)
+        except LookupError:
+            raise serializers.ValidationError(
+                f"The encoding {value} is not supported.", code="invalid"
+            )
+        return value
+
+
+class TableCreateFromFileSerializer(TableImportFileSerializer):
+    name = serializers.CharField(max_length=255, help_text="The name of the new table.")
+
+
 class TableUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Table
@@ -1,8 +1,10 @@
 from django.urls import re_path
 
 from .views import (
+    AsyncCreateTableFromFileView,
     AsyncCreateTableView,
     AsyncDuplicateTableView,
+    AsyncTableImportFileView,
     AsyncTableImportView,
     OrderTablesView,
     TablesView,
@@ -18,6 +20,11 @@ urlpatterns = [
         AsyncCreateTableView.as_view(),
         name="async_create",
     ),
+    re_path(
+        r"database/(?P<database_id>[0-9]+)/import-file/async/$",
+        AsyncCreateTableFromFileView.as_view(),
+        name="async_create_from_file",
+    ),
     re_path(
         r"database/(?P<database_id>[0-9]+)/order/$",
         OrderTablesView.as_view(),
@@ -34,4 +41,9 @@ urlpatterns = [
         AsyncTableImportView.as_view(),
         name="import_async",
     ),
+    re_path(
+        r"(?P<table_id>[0-9]+)/import-file/async/$",
+        AsyncTableImportFileView.as_view(),
+        name="import_file_async",
+    ),
 ]
@@ -4,6 +4,7 @@ from django.db import transaction
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -76,7 +77,9 @@ from .errors import (
 )
 from .serializers import (
     OrderTablesSerializer,
+    TableCreateFromFileSerializer,
     TableCreateSerializer,
+    TableImportFileSerializer,
     TableImportSerializer,
     TableSerializer,
     TableUpdateSerializer,
@@ -314,6 +317,82 @@ class AsyncCreateTableView(APIView):
         return Response(serializer.data)
 
 
+class AsyncCreateTableFromFileView(APIView):
+    permission_classes = (IsAuthenticated,)
+    parser_classes = (MultiPartParser,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="database_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Creates a table for the database related to the provided "
+                "value.",
+            ),
+            CLIENT_SESSION_ID_SCHEMA_PARAMETER,
+        ],
+        tags=["Database tables"],
+        operation_id="create_database_table_from_file_async",
+        description=(
+            "Creates a job that creates a new table from the uploaded CSV, XLSX or "
+            "JSON file for the database related to the provided `database_id` "
+            "parameter if the authorized user has access to the database's "
+            "workspace. The file is streamed into the table by the server, which "
+            "makes it possible to import files that are too big to be parsed by the "
+            "client. This endpoint is asynchronous and return the created job to "
+            "track the progress of the task."
+        ),
+        request={"multipart/form-data": TableCreateFromFileSerializer},
+        responses={
+            202: FileImportJobSerializerClass,
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_REQUEST_BODY_VALIDATION",
+                    "ERROR_MAX_JOB_COUNT_EXCEEDED",
+                ]
+            ),
+            404: get_error_schema(["ERROR_APPLICATION_DOES_NOT_EXIST"]),
+        },
+    )
+    @transaction.atomic
+    @map_exceptions(
+        {
+            ApplicationDoesNotExist: ERROR_APPLICATION_DOES_NOT_EXIST,
+            UserNotInWorkspace: ERROR_USER_NOT_IN_GROUP,
+            MaxJobCountExceeded: ERROR_MAX_JOB_COUNT_EXCEEDED,
+        }
+    )
+    @validate_body(TableCreateFromFileSerializer, return_validated=True)
+    def post(self, request, data, database_id):
+        """Creates a job to create a new table from a file in a database."""
+
+        database = DatabaseHandler().get_database(database_id)
+
+        CoreHandler().check_permissions(
+            request.user,
+            CreateTableDatabaseTableOperationType.type,
+            workspace=database.workspace,
+            context=database,
+        )
+
+        file_import_job = JobHandler().create_and_start_job(
+            request.user,
+            "file_import",
+            database=database,
+            name=data["name"],
+            file=data["file"],
+            file_type=data["file_type"],
+            first_row_header=data["first_row_header"],
+            csv_column_separator=data["csv_column_separator"],
+            encoding=data["encoding"],
+        )
+
+        serializer = job_type_registry.get_serializer(file_import_job, JobSerializer)
+        return Response(serializer.data)
+
+
 class TableView(APIView):
     permission_classes = (IsAuthenticated,)
 
@@ -511,6 +590,77 @@ class AsyncTableImportView(APIView):
         return Response(serializer.data)
 
 
+class AsyncTableImportFileView(APIView):
+    permission_classes = (IsAuthenticated,)
+    parser_classes = (MultiPartParser,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Import data into the table related to the provided value.",
+            )
+        ],
+        tags=["Database tables"],
+        operation_id="import_file_database_table_async",
+        description=(
+            "Import the rows of the uploaded CSV, XLSX or JSON file in the specified "
+            "table if the authorized user has access to the related database's "
+            "workspace. The values of every row must be ordered according to the "
+            "writable fields of the table. This endpoint is asynchronous and return "
+            "the created job to track the progress of the task."
+        ),
+        request={"multipart/form-data": TableImportFileSerializer},
+        responses={
+            202: FileImportJobSerializerClass,
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_REQUEST_BODY_VALIDATION",
+                    "ERROR_MAX_JOB_COUNT_EXCEEDED",
+                ]
+            ),
+            404: get_error_schema(["ERROR_TABLE_DOES_NOT_EXIST"]),
+        },
+    )
+    @transaction.atomic
+    @map_exceptions(
+        {
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            UserNotInWorkspace: ERROR_USER_NOT_IN_GROUP,
+            MaxJobCountExceeded: ERROR_MAX_JOB_COUNT_EXCEEDED,
+        }
+    )
+    @validate_body(TableImportFileSerializer, return_validated=True)
+    def post(self, request, data, table_id):
+        """Import the data of a file into an existing table"""
+
+        table = TableHandler().get_table(table_id)
+
+        CoreHandler().check_permissions(
+            request.user,
+            ImportRowsDatabaseTableOperationType.type,
+            workspace=table.database.workspace,
+            context=table,
+        )
+
+        file_import_job = JobHandler().create_and_start_job(
+            request.user,
+            "file_import",
+            table=table,
+            file=data["file"],
+            file_type=data["file_type"],
+            first_row_header=data["first_row_header"],
+            csv_column_separator=data["csv_column_separator"],
+            encoding=data["encoding"],
+        )
+
+        serializer = job_type_registry.get_serializer(file_import_job, JobSerializer)
+        return Response(serializer.data)
+
+
 class OrderTablesView(APIView):
     permission_classes = (IsAuthenticated,)
 
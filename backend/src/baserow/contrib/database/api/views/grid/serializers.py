@@ -2,6 +2,10 @@ from django.utils.functional import lazy
 
 from rest_framework import serializers
 
+from baserow.contrib.database.api.rows.serializers import (
+    RelatedRowsLimitQueryParamsSerializer,
+)
+from baserow.contrib.database.search.handler import SEARCH_MODES
 from baserow.contrib.database.views.models import GridViewFieldOptions
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
 
@@ -41,3 +45,7 @@ class GridViewFilterSerializer(serializers.Serializer):
         child=serializers.IntegerField(),
         help_text="Only rows related to the provided ids are added to the response.",
     )
+
+
+class ListGridViewRowsQueryParamsSerializer(RelatedRowsLimitQueryParamsSerializer):
+    search_mode = serializers.ChoiceField(choices=SEARCH_MODES, required=False)
@@ -8,9 +8,15 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from baserow.api.decorators import allowed_includes, map_exceptions, validate_body
+from baserow.api.decorators import (
+    allowed_includes,
+    map_exceptions,
+    validate_body,
+    validate_query_parameters,
+)
 from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import KeysetPagination, PageNumberPagination
+from baserow.api.renderers import OrjsonRenderer
 from baserow.api.schemas import get_error_schema
 from baserow.api.serializers import get_example_pagination_serializer_class
 from baserow.contrib.database.api.fields.errors import (
@@ -20,11 +26,14 @@ from baserow.contrib.database.api.fields.errors import (
     ERROR_ORDER_BY_FIELD_NOT_FOUND,
     ERROR_ORDER_BY_FIELD_NOT_POSSIBLE,
 )
+from baserow.contrib.database.api.rows.schemas import (
+    RELATED_ROWS_LIMIT_SCHEMA_PARAMETER,
+)
 from baserow.contrib.database.api.rows.serializers import (
-    RowSerializer,
     get_example_row_metadata_field_serializer,
     get_example_row_serializer_class,
-    get_row_serializer_class,
+    get_related_rows_count,
+    serialize_rows_for_response,
 )
 from baserow.contrib.database.api.utils import get_include_exclude_field_ids
 from baserow.contrib.database.api.views.errors import (
@@ -35,6 +44,7 @@ from baserow.contrib.database.api.views.errors import (
 )
 from baserow.contrib.database.api.views.grid.serializers import (
     GridViewFieldOptionsSerializer,
+    ListGridViewRowsQueryParamsSerializer,
 )
 from baserow.contrib.database.api.views.serializers import FieldOptionsField
 from baserow.contrib.database.api.views.utils import get_public_view_authorization_token
@@ -51,6 +61,7 @@ from baserow.contrib.database.fields.field_filters import (
 )
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.registries import row_metadata_registry
+from baserow.contrib.database.search.handler import SEARCH_MODES
 from baserow.contrib.database.table.operations import ListRowsDatabaseTableOperationType
 from baserow.contrib.database.views.exceptions import (
     AggregationTypeDoesNotExist,
@@ -83,6 +94,7 @@ def get_available_aggregation_type():
 
 class GridViewView(APIView):
     permission_classes = (IsAuthenticated,)
+    renderer_classes = (OrjsonRenderer,)
 
     def get_permissions(self):
         if self.request.method == "GET":
@@ -146,6 +158,24 @@ class GridViewView(APIView):
                 description="Can only be used in combination with the `page` parameter "
                 "and defines how many rows should be returned.",
             ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="Enables the cursor pagination if provided. An empty "
+                "value returns the first page and the `next` URL of the response "
+                "contains the cursor of the next page. Can be combined with the "
+                "`size` parameter, but not with `page` or `limit`. Fetching a page "
+                "is equally fast regardless of its position in the table.",
+            ),
+            OpenApiParameter(
+                name="include_count",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description="Can only be used in combination with the `cursor` "
+                "parameter. If provided the total `count` of rows is included in "
+                "the response.",
+            ),
             OpenApiParameter(
                 name="search",
                 location=OpenApiParameter.QUERY,
@@ -153,6 +183,18 @@ class GridViewView(APIView):
                 description="If provided only rows with data that matches the search "
                 "query are going to be returned.",
             ),
+            OpenApiParameter(
+                name="search_mode",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                enum=SEARCH_MODES,
+                description="The way the `search` query is matched. `compat` checks "
+                "whether the value of any field contains the search query, "
+                "`full-text` matches every word of the search query as a prefix "
+                "against an indexed full-text representation of the row. Falls back "
+                "to `compat` if the full-text index of the table is not yet "
+                "available. Defaults to the mode configured on the server.",
+            ),
             OpenApiParameter(
                 name="include_fields",
                 location=OpenApiParameter.QUERY,
@@ -179,17 +221,19 @@ class GridViewView(APIView):
                     "response. "
                 ),
             ),
+            RELATED_ROWS_LIMIT_SCHEMA_PARAMETER,
         ],
         tags=["Database table grid view"],
         operation_id="list_database_table_grid_view_rows",
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`view_id` if the authorized user has access to the database's workspace. "
-            "The response is paginated either by a limit/offset or page/size style. "
-            "The style depends on the provided GET parameters. The properties of the "
-            "returned rows depends on which fields the table has. For a complete "
-            "overview of fields use the **list_database_table_fields** endpoint to "
-            "list them all. In the example all field types are listed, but normally "
+            "The response is paginated either by a limit/offset, page/size or cursor "
+            "style. The style depends on the provided GET parameters. The properties "
+            "of the returned rows depends on which fields the table has. For a "
+            "complete overview of fields use the **list_database_table_fields** "
+            "endpoint to list them all. In the example all field types are listed, "
+            "but normally "
             "the number in field_{id} key is going to be the id of the field. "
             "The value is what the user has provided and the format of it depends on "
             "the fields type.\n"
@@ -212,7 +256,9 @@ class GridViewView(APIView):
                 },
                 serializer_name="PaginationSerializerWithGridViewFieldOptions",
             ),
-            400: get_error_schema(["ERROR_USER_NOT_IN_GROUP"]),
+            400: get_error_schema(
+                ["ERROR_USER_NOT_IN_GROUP", "ERROR_QUERY_PARAMETER_VALIDATION"]
+            ),
             404: get_error_schema(
                 ["ERROR_GRID_DOES_NOT_EXIST", "ERROR_FIELD_DOES_NOT_EXIST"]
             ),
@@ -226,17 +272,20 @@ class GridViewView(APIView):
         }
     )
     @allowed_includes("field_options", "row_metadata")
-    def get(self, request, view_id, field_options, row_metadata):
+    @validate_query_parameters(ListGridViewRowsQueryParamsSerializer)
+    def get(self, request, view_id, field_options, row_metadata, query_params):
         """
-        Lists all the rows of a grid view, paginated either by a page or offset/limit.
-        If the limit get parameter is provided the limit/offset pagination will be used
-        else the page number pagination.
+        Lists all the rows of a grid view, paginated either by a page, offset/limit
+        or cursor. If the cursor get parameter is provided the keyset pagination will
+        be used, if the limit get parameter is provided the limit/offset pagination
+        will be used else the page number pagination.
 
         Optionally the field options can also be included in the response if the
         `field_options` are provided in the include GET parameter.
         """
 
         search = request.GET.get("search")
+        search_mode = query_params.get("search_mode")
         include_fields = request.GET.get("include_fields")
         exclude_fields = request.GET.get("exclude_fields")
 
@@ -256,27 +305,30 @@ class GridViewView(APIView):
             view.table, include_fields, exclude_fields
         )
 
+        related_rows_limit = query_params.get("related_rows_limit")
         model = view.table.get_model()
-        queryset = view_handler.get_queryset(view, search, model)
+        queryset = view_handler.get_queryset(
+            view,
+            search,
+            model,
+            search_mode=search_mode,
+            related_rows_limit=related_rows_limit,
+        )
 
         if "count" in request.GET:
             return Response({"count": queryset.count()})
 
-        if LimitOffsetPagination.limit_query_param in request.GET:
+        if KeysetPagination.is_requested(request):
+            paginator = KeysetPagination()
+        elif LimitOffsetPagination.limit_query_param in request.GET:
             paginator = LimitOffsetPagination()
         else:
             paginator = PageNumberPagination()
 
         page = paginator.paginate_queryset(queryset, request, self)
-        serializer_class = get_row_serializer_class(
-            model,
-            RowSerializer,
-            is_response=True,
-            field_ids=field_ids,
+        response = paginator.get_paginated_response(
+            serialize_rows_for_response(page, model, field_ids=field_ids)
         )
-        serializer = serializer_class(page, many=True)
-
-        response = paginator.get_paginated_response(serializer.data)
 
         if field_options:
             context = {"fields": [o["field"] for o in model._field_objects.values()]}
@@ -291,6 +343,9 @@ class GridViewView(APIView):
             )
             response.data.update(row_metadata=row_metadata)
 
+        if related_rows_limit is not None:
+            response.data.update(related_rows_count=get_related_rows_count(page, model))
+
         return response
 
     @extend_schema(
@@ -353,11 +408,7 @@ class GridViewView(APIView):
         model = view.table.get_model(field_ids=data["field_ids"])
         results = model.objects.filter(pk__in=data["row_ids"])
 
-        serializer_class = get_row_serializer_class(
-            model, RowSerializer, is_response=True
-        )
-        serializer = serializer_class(results, many=True)
-        return Response(serializer.data)
+        return Response(serialize_rows_for_response(results, model))
 
 
 class GridViewFieldAggregationsView(APIView):
@@ -566,6 +617,7 @@ class GridViewFieldAggregationView(APIView):
 
 class PublicGridViewRowsView(APIView):
     permission_classes = (AllowAny,)
+    renderer_classes = (OrjsonRenderer,)
 
     @extend_schema(
         parameters=[
@@ -622,6 +674,24 @@ class PublicGridViewRowsView(APIView):
                 description="Can only be used in combination with the `page` parameter "
                 "and defines how many rows should be returned.",
             ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="Enables the cursor pagination if provided. An empty "
+                "value returns the first page and the `next` URL of the response "
+                "contains the cursor of the next page. Can be combined with the "
+                "`size` parameter, but not with `page` or `limit`. Fetching a page "
+                "is equally fast regardless of its position in the table.",
+            ),
+            OpenApiParameter(
+                name="include_count",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description="Can only be used in combination with the `cursor` "
+                "parameter. If provided the total `count` of rows is included in "
+                "the response.",
+            ),
             OpenApiParameter(
                 name="search",
                 location=OpenApiParameter.QUERY,
@@ -699,11 +769,12 @@ class PublicGridViewRowsView(APIView):
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`slug` if the grid view is public."
-            "The response is paginated either by a limit/offset or page/size style. "
-            "The style depends on the provided GET parameters. The properties of the "
-            "returned rows depends on which fields the table has. For a complete "
-            "overview of fields use the **list_database_table_fields** endpoint to "
-            "list them all. In the example all field types are listed, but normally "
+            "The response is paginated either by a limit/offset, page/size or cursor "
+            "style. The style depends on the provided GET parameters. The properties "
+            "of the returned rows depends on which fields the table has. For a "
+            "complete overview of fields use the **list_database_table_fields** "
+            "endpoint to list them all. In the example all field types are listed, "
+            "but normally "
             "the number in field_{id} key is going to be the id of the field. "
             "The value is what the user has provided and the format of it depends on "
             "the fields type.\n"
@@ -744,9 +815,10 @@ class PublicGridViewRowsView(APIView):
     @allowed_includes("field_options")
     def get(self, request: Request, slug: str, field_options: bool) -> Response:
         """
-        Lists all the rows of a grid view, paginated either by a page or offset/limit.
-        If the limit get parameter is provided the limit/offset pagination will be used
-        else the page number pagination.
+        Lists all the rows of a grid view, paginated either by a page, offset/limit
+        or cursor. If the cursor get parameter is provided the keyset pagination will
+        be used, if the limit get parameter is provided the limit/offset pagination
+        will be used else the page number pagination.
 
         Optionally the field options can also be included in the response if the the
         `field_options` are provided in the include GET parameter.
@@ -793,17 +865,17 @@ class PublicGridViewRowsView(APIView):
         if count:
             return Response({"count": queryset.count()})
 
-        if LimitOffsetPagination.limit_query_param in request.GET:
+        if KeysetPagination.is_requested(request):
+            paginator = KeysetPagination()
+        elif LimitOffsetPagination.limit_query_param in request.GET:
             paginator = LimitOffsetPagination()
         else:
             paginator = PageNumberPagination()
 
         page = paginator.paginate_queryset(queryset, request, self)
-        serializer_class = get_row_serializer_class(
-            model, RowSerializer, is_response=True, field_ids=field_ids
+        response = paginator.get_paginated_response(
+            serialize_rows_for_response(page, model, field_ids=field_ids)
         )
-        serializer = serializer_class(page, many=True)
-        response = paginator.get_paginated_response(serializer.data)
 
         if field_options:
             context = {"field_options": publicly_visible_field_options}
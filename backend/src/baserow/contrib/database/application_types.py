@@ -10,7 +10,10 @@ from django.urls import include, path
 from django.utils import timezone, translation
 from django.utils.translation import gettext as _
 
+from psycopg2 import sql
+
 from baserow.contrib.database.api.serializers import DatabaseSerializer
+from baserow.contrib.database.db.copy import copy_table_rows
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from baserow.contrib.database.fields.dependencies.update_collector import (
     FieldUpdateCollector,
@@ -66,10 +69,16 @@ class DatabaseApplicationType(ApplicationType):
         tables: List[Table],
         files_zip: Optional[ZipFile] = None,
         storage: Optional[Storage] = None,
+        copy_data_in_database: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Exports the tables provided  to a serialized format that can later be
         be imported via the `import_tables_serialized`.
+
+        If `copy_data_in_database` is True, the export must be imported in the same
+        transaction. The values of the fields that support it are then not
+        serialized, but copied from the original tables inside the database when
+        importing, which is a lot faster for big tables.
         """
 
         serialized_tables: List[Dict[str, Any]] = []
@@ -93,8 +102,24 @@ class DatabaseApplicationType(ApplicationType):
                 )
 
             model = table.get_model(fields=fields, add_dependencies=False)
+            copy_rows_from = None
+            copied_field_ids = set()
+            if copy_data_in_database:
+                copied_field_ids = {
+                    field_object["field"].id
+                    for field_object in model._field_objects.values()
+                    if field_object["type"].can_copy_rows_in_database
+                }
+                copy_rows_from = DatabaseExportSerializedStructure.copy_rows_from(
+                    table_id=table.id, field_ids=sorted(copied_field_ids)
+                )
+
             serialized_rows = []
-            for row in model.objects.all():
+            # The rows only have to be serialized if some values can't be copied.
+            must_serialize_rows = not copy_data_in_database or len(
+                copied_field_ids
+            ) < len(model._field_objects)
+            for row in model.objects.all() if must_serialize_rows else []:
                 serialized_row = DatabaseExportSerializedStructure.row(
                     id=row.id,
                     order=str(row.order),
@@ -102,6 +127,8 @@ class DatabaseApplicationType(ApplicationType):
                     updated_on=row.updated_on.isoformat(),
                 )
                 for field_object in model._field_objects.values():
+                    if field_object["field"].id in copied_field_ids:
+                        continue
                     field_name = field_object["name"]
                     field_type = field_object["type"]
                     serialized_row[field_name] = field_type.get_export_serialized_value(
@@ -117,6 +144,7 @@ class DatabaseApplicationType(ApplicationType):
                     fields=serialized_fields,
                     views=serialized_views,
                     rows=serialized_rows,
+                    copy_rows_from=copy_rows_from,
                 )
             )
         return serialized_tables
@@ -126,6 +154,7 @@ class DatabaseApplicationType(ApplicationType):
         database: Database,
         files_zip: Optional[ZipFile] = None,
         storage: Optional[Storage] = None,
+        copy_data_in_database: bool = False,
     ) -> Dict[str, Any]:
         """
         Exports the database application type to a serialized format that can later
@@ -139,7 +168,9 @@ class DatabaseApplicationType(ApplicationType):
             "view_set__viewsort_set",
         )
 
-        serialized_tables = self.export_tables_serialized(tables, files_zip, storage)
+        serialized_tables = self.export_tables_serialized(
+            tables, files_zip, storage, copy_data_in_database
+        )
 
         serialized = super().export_serialized(database, files_zip, storage)
         serialized.update(
@@ -169,6 +200,8 @@ class DatabaseApplicationType(ApplicationType):
                     len(table["rows"]) +
                     # Inserting every row
                     len(table["rows"]) +
+                    # Copying the rows inside the database
+                    (1 if "copy_rows_from" in table else 0) +
                     # After each field
                     len(table["fields"])
                     for table in serialized_tables
@@ -334,14 +367,23 @@ class DatabaseApplicationType(ApplicationType):
             progress.increment(state=IMPORT_SERIALIZED_IMPORTING)
 
         # Now that everything is in place we can start filling the table with the rows
-        # in an efficient matter by using the bulk_create functionality.
+        # in an efficient matter by using the bulk_create functionality, or by copying
+        # them inside the database if the export allows it.
         table_cache: Dict[str, Any] = {}
         for serialized_table in serialized_tables:
             table_model = serialized_table["_model"]
             field_ids = [
                 field_object.id for field_object in serialized_table["_field_objects"]
             ]
+            copy_rows = "copy_rows_from" in serialized_table
+            if copy_rows:
+                self._copy_table_rows_in_database(serialized_table, id_mapping)
+                progress.increment(
+                    state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{serialized_table['id']}"
+                )
+
             rows_to_be_inserted = []
+            updated_field_names = set()
 
             for serialized_row in serialized_table["rows"]:
                 created_on = serialized_row.get("created_on")
@@ -376,15 +418,17 @@ class DatabaseApplicationType(ApplicationType):
                     # of the `link_row` field which would result in duplicates if we
                     # would populate.
                     if new_field_id in field_ids and field_name in serialized_row:
+                        new_field_name = f"field_{new_field_id}"
                         field_type.set_import_serialized_value(
                             row_instance,
-                            f'field_{id_mapping["database_fields"][serialized_field["id"]]}',
+                            new_field_name,
                             serialized_row[field_name],
                             id_mapping,
                             table_cache,
                             files_zip,
                             storage,
                         )
+                        updated_field_names.add(new_field_name)
 
                 rows_to_be_inserted.append(row_instance)
                 progress.increment(
@@ -393,9 +437,21 @@ class DatabaseApplicationType(ApplicationType):
 
             # We want to insert the rows in bulk because there could potentially be
             # hundreds of thousands of rows in there and this will result in better
-            # performance.
+            # performance. Copied rows already exist, only the values that couldn't be
+            # copied have to be updated. The many to many relations have already been
+            # set by `set_import_serialized_value`.
+            concrete_field_names = [
+                name
+                for name in updated_field_names
+                if not table_model._meta.get_field(name).many_to_many
+            ]
             for chunk in grouper(512, rows_to_be_inserted):
-                table_model.objects.bulk_create(chunk, batch_size=512)
+                if not copy_rows:
+                    table_model.objects.bulk_create(chunk, batch_size=512)
+                elif concrete_field_names:
+                    table_model.objects.bulk_update(
+                        chunk, concrete_field_names, batch_size=512
+                    )
                 progress.increment(
                     len(chunk),
                     state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{serialized_table['id']}",
@@ -408,6 +464,14 @@ class DatabaseApplicationType(ApplicationType):
             with connection.cursor() as cursor:
                 cursor.execute(sequence_sql[0])
 
+        # The relations can only be copied once the rows of all the tables exist.
+        relations_cache: Dict[str, Any] = {}
+        for serialized_table in serialized_tables:
+            if "copy_rows_from" in serialized_table:
+                self._copy_table_relations_in_database(
+                    serialized_table, id_mapping, relations_cache
+                )
+
         # The progress off `apply_updates_and_get_updated_fields` takes 5% of the
         # total progress of this import.
         for field_type, field_instance in fields_excluding_reversed_linked_fields:
@@ -423,6 +487,101 @@ class DatabaseApplicationType(ApplicationType):
         progress.increment(none_field_count, state=IMPORT_SERIALIZED_IMPORTING)
         return imported_tables
 
+    def _get_copied_field_objects(
+        self, serialized_table: Dict[str, Any], id_mapping: Dict[str, Any]
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Returns the field objects of the original table of which the values must be
+        copied, paired with the field object of their duplicate in the new table.
+        Fields without duplicate in the new table, like the reversed link row fields,
+        are left out.
+        """
+
+        source_model = serialized_table["_source_model"]
+        table_model = serialized_table["_model"]
+        field_objects = []
+        for field_object in source_model._field_objects.values():
+            new_field_id = id_mapping["database_fields"].get(field_object["field"].id)
+            new_field_object = table_model._field_objects.get(new_field_id)
+            if new_field_object is not None:
+                field_objects.append((field_object, new_field_object))
+        return field_objects
+
+    def _copy_table_rows_in_database(
+        self, serialized_table: Dict[str, Any], id_mapping: Dict[str, Any]
+    ):
+        """
+        Copies the rows of the original table of a table exported with
+        `copy_data_in_database` into the newly created table, keeping their ids. The
+        rows in the trash are not copied, just like they're not exported.
+        """
+
+        copy_rows_from = serialized_table["copy_rows_from"]
+        table_model = serialized_table["_model"]
+        source_model = Table.objects.get(id=copy_rows_from["table_id"]).get_model(
+            field_ids=copy_rows_from["field_ids"], add_dependencies=False
+        )
+        serialized_table["_source_model"] = source_model
+
+        # The id, order, created_on, updated_on and trashed columns.
+        field_names = {
+            field_object["name"] for field_object in table_model._field_objects.values()
+        }
+        columns = [
+            (model_field.column, sql.Identifier(model_field.column))
+            for model_field in table_model._meta.concrete_fields
+            if model_field.name not in field_names
+        ]
+
+        for field_object, new_field_object in self._get_copied_field_objects(
+            serialized_table, id_mapping
+        ):
+            model_field = table_model._meta.get_field(new_field_object["name"])
+            if model_field.many_to_many:
+                continue
+            source_model_field = source_model._meta.get_field(field_object["name"])
+            columns.append(
+                (
+                    model_field.column,
+                    field_object["type"].get_sql_copy_select_expression(
+                        field_object["field"],
+                        sql.Identifier(source_model_field.column),
+                        id_mapping,
+                    ),
+                )
+            )
+
+        copy_table_rows(
+            source_model,
+            table_model,
+            columns,
+            where=sql.SQL("NOT {trashed}").format(trashed=sql.Identifier("trashed")),
+        )
+
+    def _copy_table_relations_in_database(
+        self,
+        serialized_table: Dict[str, Any],
+        id_mapping: Dict[str, Any],
+        cache: Dict[str, Any],
+    ):
+        """
+        Copies the values of the fields that are not stored in the table itself, like
+        the many to many relations, of a table copied with
+        `_copy_table_rows_in_database`.
+        """
+
+        for field_object, new_field_object in self._get_copied_field_objects(
+            serialized_table, id_mapping
+        ):
+            field_object["type"].copy_relations_in_database(
+                field_object["field"],
+                serialized_table["_source_model"],
+                new_field_object["field"],
+                serialized_table["_model"],
+                id_mapping,
+                cache,
+            )
+
     def import_serialized(
         self,
         workspace: Workspace,
@@ -44,11 +44,12 @@ class DatabaseConfig(AppConfig):
                 model._meta.auto_created, "_generated_table_model"
             ):
                 original_register_model(app_label, model)
-            else:
+            elif not model._meta.proxy:
                 # Trigger the pending operations because the original register_model
                 # method also triggers them. Not triggering them can cause a memory
                 # leak because everytime a table model is generated, it will register
-                # new pending operations.
+                # new pending operations. The proxies of cached generated models
+                # don't add any fields or relations, so they can be skipped.
                 self.apps.do_pending_operations(model)
                 self.apps.clear_cache()
 
@@ -391,8 +392,10 @@ class DatabaseConfig(AppConfig):
         page_registry.register(PublicViewPageType())
 
         from .export.table_exporters.csv_table_exporter import CsvTableExporter
+        from .export.table_exporters.parquet_table_exporter import ParquetTableExporter
 
         table_exporter_registry.register(CsvTableExporter())
+        table_exporter_registry.register(ParquetTableExporter())
 
         from .trash.trash_types import (
             FieldTrashableItemType,
@@ -477,7 +480,7 @@ class DatabaseConfig(AppConfig):
         from baserow.core.jobs.registries import job_type_registry
 
         from .airtable.job_types import AirtableImportJobType
-        from .fields.job_types import DuplicateFieldJobType
+        from .fields.job_types import ConvertFieldJobType, DuplicateFieldJobType
         from .file_import.job_types import FileImportJobType
         from .table.job_types import DuplicateTableJobType
 
@@ -485,6 +488,7 @@ class DatabaseConfig(AppConfig):
         job_type_registry.register(FileImportJobType())
         job_type_registry.register(DuplicateTableJobType())
         job_type_registry.register(DuplicateFieldJobType())
+        job_type_registry.register(ConvertFieldJobType())
 
         post_migrate.connect(safely_update_formula_versions, sender=self)
         pre_migrate.connect(clear_generated_model_cache_receiver, sender=self)
@@ -685,6 +689,13 @@ class DatabaseConfig(AppConfig):
         pre_migrate.connect(clear_generated_model_cache_receiver, sender=self)
 
         import baserow.contrib.database.fields.tasks  # noqa: F401
+        import baserow.contrib.database.index_advisor.signals  # noqa: F401
+        import baserow.contrib.database.index_advisor.tasks  # noqa: F401
+        import baserow.contrib.database.search.signals  # noqa: F401
+        import baserow.contrib.database.search.tasks  # noqa: F401
+        import baserow.contrib.database.tokens.signals  # noqa: F401
+        import baserow.contrib.database.tokens.tasks  # noqa: F401
+        import baserow.contrib.database.usage.signals  # noqa: F401
 
 
 # noinspection PyPep8Naming
@@ -0,0 +1,235 @@
+import datetime
+import io
+import json
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from django.db import connection
+from django.db.models import ManyToManyField, Model
+
+from psycopg2 import sql
+
+COPY_NULL = "\\N"
+COPY_ESCAPED_CHARACTERS = str.maketrans(
+    {"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+)
+
+
+def to_copy_text(value: Any) -> str:
+    """
+    Converts a value prepared for the database into its representation in the
+    PostgreSQL `COPY` text format.
+
+    :param value: The value as returned by the `get_db_prep_save` method of a model
+        field.
+    :raises TypeError: If the value can't be represented in the text format.
+    :return: The value that can be written in the `COPY` data.
+    """
+
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (int, float, Decimal)):
+        return str(value)
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    if not isinstance(value, str):
+        raise TypeError(f"{type(value)} values can't be copied.")
+    return value.translate(COPY_ESCAPED_CHARACTERS)
+
+
+def copy_model_instances(
+    model: Type[Model], instances: List[Model], batch_size: int = 10000
+) -> List[Model]:
+    """
+    Inserts the provided unsaved instances using the PostgreSQL `COPY` command, which
+    is a lot faster than `bulk_create` when inserting many rows. The ids are reserved
+    upfront from the sequence of the table and set on the instances, so that related
+    objects can be created afterwards, just like after a `bulk_create`. Instances
+    having a value that must be computed by the database, like a formula or an
+    autonumber, can't be copied and are inserted using `bulk_create` instead.
+
+    :param model: The model of the instances. The primary key must be an `id`
+        auto field.
+    :param instances: The unsaved instances that must be inserted.
+    :param batch_size: The maximum number of rows copied in one command. Limits the
+        size of the buffered data.
+    :return: The inserted instances.
+    """
+
+    if not instances:
+        return instances
+
+    table_name = model._meta.db_table
+    fields = model._meta.concrete_fields
+    copy_sql = sql.SQL("COPY {table} ({columns}) FROM STDIN").format(
+        table=sql.Identifier(table_name),
+        columns=sql.SQL(", ").join(sql.Identifier(field.column) for field in fields),
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, 'id')) "
+            "FROM generate_series(1, %s)",
+            [table_name, len(instances)],
+        )
+        ids = [row[0] for row in cursor.fetchall()]
+
+        not_copyable_instances = []
+
+        for start in range(0, len(instances), batch_size):
+            buffer = io.StringIO()
+            copied_count = 0
+            for instance, instance_id in zip(
+                instances[start : start + batch_size], ids[start : start + batch_size]
+            ):
+                instance.id = instance_id
+                values = [field.pre_save(instance, True) for field in fields]
+                if any(hasattr(value, "resolve_expression") for value in values):
+                    not_copyable_instances.append(instance)
+                    continue
+
+                buffer.write(
+                    "\t".join(
+                        to_copy_text(field.get_db_prep_save(value, connection))
+                        for field, value in zip(fields, values)
+                    )
+                )
+                buffer.write("\n")
+                copied_count += 1
+                instance._state.adding = False
+                instance._state.db = connection.alias
+
+            if copied_count:
+                buffer.seek(0)
+                cursor.copy_expert(copy_sql, buffer)
+
+    if not_copyable_instances:
+        model.objects.bulk_create(not_copyable_instances, batch_size=batch_size)
+
+    return instances
+
+
+def get_id_mapping_values(id_mapping: Dict[int, int]) -> sql.Composable:
+    """
+    Returns the SQL `VALUES` list containing the provided mapping, which can be
+    joined as a table having an `old_id` and a `new_id` column.
+
+    :param id_mapping: A dict mapping the old ids to the new ids. Must not be empty.
+    :return: The `VALUES` list.
+    """
+
+    return sql.SQL("(VALUES {values})").format(
+        values=sql.SQL(", ").join(
+            sql.SQL("({}, {})").format(sql.Literal(old_id), sql.Literal(new_id))
+            for old_id, new_id in id_mapping.items()
+        )
+    )
+
+
+def copy_table_rows(
+    source_model: Type[Model],
+    target_model: Type[Model],
+    columns: List[Tuple[str, sql.Composable]],
+    where: Optional[sql.Composable] = None,
+) -> int:
+    """
+    Copies the rows of the source table to the target table with one single
+    `INSERT ... SELECT` statement, so that the data never leaves the database.
+
+    :param source_model: The model of the table containing the rows.
+    :param target_model: The model of the table where the rows must be inserted.
+    :param columns: A list containing the name of every column of the target table
+        that must be filled and the expression selecting its value from the source
+        table.
+    :param where: An optional condition the source rows must match.
+    :return: The number of copied rows.
+    """
+
+    query = sql.SQL(
+        "INSERT INTO {target} ({columns}) SELECT {values} FROM {source} WHERE {where}"
+    ).format(
+        target=sql.Identifier(target_model._meta.db_table),
+        columns=sql.SQL(", ").join(sql.Identifier(column) for column, _ in columns),
+        values=sql.SQL(", ").join(value for _, value in columns),
+        source=sql.Identifier(source_model._meta.db_table),
+        where=sql.SQL("TRUE") if where is None else where,
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(query)
+        return cursor.rowcount
+
+
+def copy_many_to_many_relations(
+    source_model_field: ManyToManyField,
+    target_model_field: ManyToManyField,
+    related_id_mapping: Optional[Dict[int, int]] = None,
+) -> int:
+    """
+    Copies the relations of the through table of the source many to many field to
+    the through table of the target field. The rows of the target table must keep
+    the ids of the source rows. Only the relations of rows that exist in the target
+    tables are copied.
+
+    :param source_model_field: The many to many field of which the relations must be
+        copied.
+    :param target_model_field: The many to many field where the relations must be
+        copied to.
+    :param related_id_mapping: If the related objects of the target field have other
+        ids than the ones of the source field, a mapping of the old ids to the new
+        ids. Relations to objects that are not in the mapping are not copied.
+    :return: The number of copied relations.
+    """
+
+    if related_id_mapping is not None and len(related_id_mapping) == 0:
+        return 0
+
+    source_through = source_model_field.remote_field.through
+    target_through = target_model_field.remote_field.through
+    # The first field of a through model is the id, the second one references the
+    # model of the field and the third one the related model.
+    source_row_field, source_related_field = source_through._meta.get_fields()[1:3]
+    target_row_field, target_related_field = target_through._meta.get_fields()[1:3]
+    source_row_column = sql.Identifier("source", source_row_field.column)
+    source_related_column = sql.Identifier("source", source_related_field.column)
+
+    if related_id_mapping is None:
+        join = sql.SQL("")
+        related_value = source_related_column
+        related_condition = sql.SQL(" AND {column} IN (SELECT id FROM {table})").format(
+            column=source_related_column,
+            table=sql.Identifier(target_model_field.related_model._meta.db_table),
+        )
+    else:
+        join = sql.SQL(
+            " JOIN {values} AS mapping(old_id, new_id) ON mapping.old_id = {column}"
+        ).format(
+            values=get_id_mapping_values(related_id_mapping),
+            column=source_related_column,
+        )
+        related_value = sql.SQL("mapping.new_id")
+        related_condition = sql.SQL("")
+
+    query = sql.SQL(
+        "INSERT INTO {target} ({target_row_column}, {target_related_column}) "
+        "SELECT {source_row_column}, {related_value} FROM {source} AS source{join} "
+        "WHERE {source_row_column} IN (SELECT id FROM {table}){related_condition}"
+    ).format(
+        target=sql.Identifier(target_through._meta.db_table),
+        target_row_column=sql.Identifier(target_row_field.column),
+        target_related_column=sql.Identifier(target_related_field.column),
+        source_row_column=source_row_column,
+        related_value=related_value,
+        source=sql.Identifier(source_through._meta.db_table),
+        join=join,
+        table=sql.Identifier(target_model_field.model._meta.db_table),
+        related_condition=related_condition,
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(query)
+        return cursor.rowcount
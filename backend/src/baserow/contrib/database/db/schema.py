@@ -269,6 +269,9 @@ class SafeBaserowPostgresSchemaEditor:
         self-referencing link_rows when importing data without errors.
         """
 
+        # The models returned by `Table.get_model` can be proxies of a cached model,
+        # which don't have any local fields themselves.
+        model = model._meta.concrete_model
         sql, params = self.table_sql(model)
         # Prevent using [] as params, in the case a literal '%' is used in the
         # definition
@@ -302,6 +305,8 @@ class SafeBaserowPostgresSchemaEditor:
         self-referencing link_rows.
         """
 
+        model = model._meta.concrete_model
+
         # Handle auto-created intermediary models
         already_deleted_through_table_name = set()
         for field in model._meta.local_many_to_many:
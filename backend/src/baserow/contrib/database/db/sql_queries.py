@@ -19,3 +19,25 @@ sql_create_try_cast = """
     $FUNCTION$
     language plpgsql;
 """
+
+sql_drop_field_conversion_function = "DROP FUNCTION IF EXISTS %(function)s(text, int)"
+sql_create_field_conversion_function = """
+    create or replace function %(function)s(
+        p_in text,
+        p_default int default null
+    )
+        returns %(type)s
+    as
+    $FUNCTION$
+    begin
+        begin
+            %(alter_column_prepare_old_value)s
+            %(alter_column_prepare_new_value)s
+            return p_in::%(type)s;
+        exception when others then
+            return p_default;
+        end;
+    end;
+    $FUNCTION$
+    language plpgsql;
+"""
@@ -0,0 +1,237 @@
+from collections import defaultdict
+from typing import Any, Dict, List, Set, Tuple, Type
+
+from django.db import connection
+from django.db.models import Case, Field, ManyToManyField, Model, Value, When
+from django.db.models.functions import Cast
+from django.db.models.sql import UpdateQuery
+
+from psycopg2 import sql
+
+from baserow.core.utils import grouper
+
+# Columns having these types can't be used in a cast.
+NOT_CASTABLE_DB_TYPES = ["serial", "bigserial", "smallserial"]
+
+
+def update_model_instances(
+    model: Type[Model],
+    instances: List[Model],
+    field_names: List[str],
+    batch_size: int = 1000,
+) -> int:
+    """
+    Writes the provided fields of the instances to the database with one
+    `UPDATE ... FROM (VALUES ...)` statement per batch. Compared to `bulk_update`,
+    which generates a `CASE WHEN` expression per column containing every row, the
+    size of the query only grows linearly with the number of rows and columns. The
+    fields having a value that must be computed by the database, like a formula, are
+    set by an expression in the same statement. It's a `CASE WHEN` expression like
+    the one of `bulk_update`, unless all the instances have the same expression.
+
+    :param model: The model of the instances. The primary key must be named `id`.
+    :param instances: The instances that must be updated.
+    :param field_names: The names of the fields that must be written.
+    :param batch_size: The maximum number of rows updated in one statement.
+    :return: The number of updated rows.
+    """
+
+    if not instances or not field_names:
+        return 0
+
+    fields = [model._meta.get_field(field_name) for field_name in field_names]
+    values_fields = []
+    expression_fields = []
+    for field in fields:
+        if field.cast_db_type(connection) in NOT_CASTABLE_DB_TYPES or any(
+            hasattr(getattr(instance, field.attname), "resolve_expression")
+            for instance in instances
+        ):
+            expression_fields.append(field)
+        else:
+            values_fields.append(field)
+
+    pk_field = model._meta.pk
+    columns = [pk_field] + values_fields
+    row_template = sql.SQL("({})").format(
+        sql.SQL(", ").join(
+            sql.SQL("%s::{}").format(sql.SQL(field.cast_db_type(connection)))
+            for field in columns
+        )
+    )
+    # The table is not aliased, because the compiled expressions refer to the
+    # columns of the row using the name of the table.
+    query_template = sql.SQL(
+        "UPDATE {table} SET {assignments} FROM (VALUES {values}) "
+        "AS source ({columns}) WHERE {table}.{pk} = source.{pk}"
+    )
+
+    updated = 0
+    with connection.cursor() as cursor:
+        for batch in grouper(batch_size, instances):
+            expression_assignments, params = _compile_expression_assignments(
+                model, batch, expression_fields
+            )
+            for instance in batch:
+                params.extend(
+                    field.get_db_prep_save(getattr(instance, field.attname), connection)
+                    for field in columns
+                )
+
+            query = query_template.format(
+                table=sql.Identifier(model._meta.db_table),
+                assignments=sql.SQL(", ").join(
+                    [
+                        sql.SQL("{column} = source.{column}").format(
+                            column=sql.Identifier(field.column)
+                        )
+                        for field in values_fields
+                    ]
+                    + expression_assignments
+                ),
+                values=sql.SQL(", ").join([row_template] * len(batch)),
+                columns=sql.SQL(", ").join(
+                    sql.Identifier(field.column) for field in columns
+                ),
+                pk=sql.Identifier(pk_field.column),
+            )
+            cursor.execute(query, params)
+            updated += cursor.rowcount
+
+    return updated
+
+
+def _compile_expression_assignments(
+    model: Type[Model], instances: Tuple[Model, ...], fields: List[Field]
+) -> Tuple[List[sql.Composable], List[Any]]:
+    """
+    Compiles the assignments of the fields that can't be written using the values
+    list, exactly like `bulk_update` and `update` would compile them.
+
+    :return: The assignments and the parameters they need.
+    """
+
+    query = UpdateQuery(model)
+    compiler = query.get_compiler(connection=connection)
+    assignments = []
+    params = []
+    for field in fields:
+        values = [getattr(instance, field.attname) for instance in instances]
+        if hasattr(values[0], "resolve_expression") and all(
+            value == values[0] for value in values[1:]
+        ):
+            expression = values[0]
+        else:
+            expression = Case(
+                *[
+                    When(
+                        pk=instance.pk,
+                        then=(
+                            value
+                            if hasattr(value, "resolve_expression")
+                            else Value(value, output_field=field)
+                        ),
+                    )
+                    for instance, value in zip(instances, values)
+                ],
+                output_field=field,
+            )
+            if field.cast_db_type(connection) not in NOT_CASTABLE_DB_TYPES:
+                expression = Cast(expression, output_field=field)
+
+        expression = expression.resolve_expression(
+            query, allow_joins=False, for_save=True
+        )
+        expression_sql, expression_params = compiler.compile(expression)
+        assignments.append(
+            sql.SQL("{column} = {expression}").format(
+                column=sql.Identifier(field.column),
+                expression=sql.SQL(expression_sql),
+            )
+        )
+        params.extend(expression_params)
+    return assignments, params
+
+
+def update_many_to_many_relations(
+    model_field: ManyToManyField, relations: Dict[int, List[int]]
+) -> Dict[int, Set[int]]:
+    """
+    Replaces the relations of the provided rows using two set based statements. The
+    rows that are already related to the provided objects, in the same order, are
+    left untouched. The relations of the other rows are replaced while respecting
+    the order of the provided ids, because some related objects, like the select
+    options, are ordered by the id of the relation.
+
+    :param model_field: The many to many field of the rows.
+    :param relations: The ids of the related objects per row id. The existing
+        relations of every row in this dict that are not in its list are removed.
+    :return: The ids of the related objects that are not related anymore per row id.
+    """
+
+    if not relations:
+        return {}
+
+    row_ids, value_ids = [], []
+    for row_id, related_ids in relations.items():
+        for related_id in related_ids:
+            row_ids.append(row_id)
+            value_ids.append(related_id)
+
+    through = model_field.remote_field.through
+    identifiers = {
+        "through": sql.Identifier(through._meta.db_table),
+        "row_column": sql.Identifier(model_field.m2m_column_name()),
+        "value_column": sql.Identifier(model_field.m2m_reverse_name()),
+    }
+    new_relations = sql.SQL(
+        """
+        WITH new_relations AS (
+            SELECT row_id, value_id, min(position) AS position
+            FROM unnest(%s::int[], %s::int[]) WITH ORDINALITY
+                AS relation(row_id, value_id, position)
+            GROUP BY row_id, value_id
+        )
+        """
+    )
+    delete_query = sql.SQL(
+        """
+        {new_relations}
+        DELETE FROM {through}
+        WHERE {row_column} IN (
+            SELECT changed.row_id FROM unnest(%s::int[]) AS changed(row_id)
+            WHERE (
+                SELECT coalesce(array_agg({value_column} ORDER BY id), '{{}}')
+                FROM {through} WHERE {row_column} = changed.row_id
+            ) IS DISTINCT FROM (
+                SELECT coalesce(array_agg(value_id ORDER BY position), '{{}}')
+                FROM new_relations WHERE new_relations.row_id = changed.row_id
+            )
+        )
+        RETURNING {row_column}, {value_column}
+        """
+    ).format(new_relations=new_relations, **identifiers)
+    insert_query = sql.SQL(
+        """
+        {new_relations}
+        INSERT INTO {through} ({row_column}, {value_column})
+        SELECT new_relations.row_id, new_relations.value_id FROM new_relations
+        WHERE NOT EXISTS (
+            SELECT 1 FROM {through} AS existing
+            WHERE existing.{row_column} = new_relations.row_id
+            AND existing.{value_column} = new_relations.value_id
+        )
+        ORDER BY new_relations.row_id, new_relations.position
+        """
+    ).format(new_relations=new_relations, **identifiers)
+
+    deleted_relations = defaultdict(set)
+    with connection.cursor() as cursor:
+        cursor.execute(delete_query, [row_ids, value_ids, list(relations.keys())])
+        for row_id, value_id in cursor.fetchall():
+            if value_id not in relations[row_id]:
+                deleted_relations[row_id].add(value_id)
+        if row_ids:
+            cursor.execute(insert_query, [row_ids, value_ids])
+
+    return dict(deleted_relations)
@@ -2,15 +2,16 @@ import abc
 import time
 from typing import Any, Callable
 
-from django.core.paginator import Paginator
 from django.db.models import QuerySet
 
+import pyarrow.parquet as pq
 import unicodecsv as csv
 
 from baserow.contrib.database.export.exceptions import ExportJobCanceledException
 from baserow.contrib.database.table.models import FieldObject
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.core.db import chunked_iterator, get_estimated_count
 
 
 class FileWriter(abc.ABC):
@@ -58,15 +59,19 @@ class FileWriter(abc.ABC):
     def get_csv_dict_writer(self, headers, **kwargs):
         return csv.DictWriter(self._file, headers, **kwargs)
 
+    def get_parquet_writer(self, schema, **kwargs):
+        return pq.ParquetWriter(self._file, schema, **kwargs)
+
 
 class PaginatedExportJobFileWriter(FileWriter):
     """
-    Uses Django's built-in paginator to write querysets to files in a memory efficient
-    manner. Also updates the provided job as it progresses through any queryset writes
-    every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
+    Streams querysets to files in a memory efficient manner by reading the rows in
+    chunks from a server side cursor. Also updates the provided job as it progresses
+    through any queryset writes every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
     """
 
     EXPORT_JOB_UPDATE_FREQUENCY_SECONDS = 1
+    EXPORT_JOB_CHUNK_SIZE = 2000
 
     def __init__(self, file, job):
         super().__init__(file)
@@ -86,7 +91,8 @@ class PaginatedExportJobFileWriter(FileWriter):
         cancelled and if so stop writing to the file and will raise a
         ExportJobCanceledException. Finally will also update job.progress_percentage
         every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS as it progresses through writing
-        the queryset.
+        the queryset. The progress is based on the number of rows estimated by the
+        query planner, so that the rows don't have to be counted upfront.
 
         :param queryset: The queryset to write to the file.
         :param write_row: A callable function which takes each row from the queryset in
@@ -94,16 +100,21 @@ class PaginatedExportJobFileWriter(FileWriter):
         """
 
         self.last_check = time.perf_counter()
-        paginator = Paginator(queryset.all(), 2000)
+        estimated_total_rows = get_estimated_count(queryset)
+        rows = chunked_iterator(queryset.all(), self.EXPORT_JOB_CHUNK_SIZE)
+
+        # One row is read ahead to know if the current row is the last one.
+        previous_row = next(rows, None)
         i = 0
-        for page in paginator.page_range:
-            for row in paginator.page(page).object_list:
-                i = i + 1
-                is_last_row = i == paginator.count
-                write_row(row, is_last_row)
-                self._check_and_update_job(i, paginator.count)
+        while previous_row is not None:
+            row = next(rows, None)
+            i = i + 1
+            is_last_row = row is None
+            write_row(previous_row, is_last_row)
+            self._check_and_update_job(i, estimated_total_rows, is_last_row)
+            previous_row = row
 
-    def _check_and_update_job(self, current_row, total_rows):
+    def _check_and_update_job(self, current_row, estimated_total_rows, is_last_row):
         """
         Checks if enough time has passed and if so checks the state of the job and
         updates its progress percentage.
@@ -112,7 +123,10 @@ class PaginatedExportJobFileWriter(FileWriter):
 
         :param current_row: An int indicating the current row this export job has
             exported upto
-        :param total_rows: An int of the total number of rows this job is exporting.
+        :param estimated_total_rows: An int of the estimated number of rows this job
+            is exporting. The progress never reaches 100% before the last row
+            because the estimate can be lower than the real number of rows.
+        :param is_last_row: Indicates whether the current row is the last one.
         """
 
         current_time = time.perf_counter()
@@ -121,14 +135,19 @@ class PaginatedExportJobFileWriter(FileWriter):
         enough_time_has_passed = (
             current_time - self.last_check > self.EXPORT_JOB_UPDATE_FREQUENCY_SECONDS
         )
-        is_last_row = current_row == total_rows
         if enough_time_has_passed or is_last_row:
             self.last_check = time.perf_counter()
             self.job.refresh_from_db()
             if self.job.is_cancelled_or_expired():
                 raise ExportJobCanceledException()
             else:
-                self.job.progress_percentage = current_row / total_rows * 100
+                if is_last_row:
+                    progress_percentage = 100
+                else:
+                    progress_percentage = min(
+                        current_row / max(estimated_total_rows, 1) * 100, 99
+                    )
+                self.job.progress_percentage = progress_percentage
                 self.job.save()
 
 
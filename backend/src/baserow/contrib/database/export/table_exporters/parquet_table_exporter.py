@@ -0,0 +1,177 @@
+from typing import Any, Callable, List, Optional, Tuple, Type
+
+from django.db import models
+
+import pyarrow as pa
+
+from baserow.contrib.database.api.export.serializers import (
+    BaseExporterOptionsSerializer,
+    ParquetExporterOptionsSerializer,
+)
+from baserow.contrib.database.export.file_writer import FileWriter, QuerysetSerializer
+from baserow.contrib.database.export.registries import TableExporter
+from baserow.contrib.database.fields.fields import BaserowExpressionField
+from baserow.contrib.database.table.models import FieldObject
+from baserow.contrib.database.views.view_types import GridViewType
+
+# The precision of decimals that still fit in a 128 bits decimal column.
+MAX_DECIMAL128_PRECISION = 38
+
+
+class ParquetTableExporter(TableExporter):
+    type = "parquet"
+
+    @property
+    def option_serializer_class(self) -> Type[BaseExporterOptionsSerializer]:
+        return ParquetExporterOptionsSerializer
+
+    @property
+    def can_export_table(self) -> bool:
+        return True
+
+    @property
+    def supported_views(self) -> List[str]:
+        return [GridViewType.type]
+
+    @property
+    def file_extension(self) -> str:
+        return ".parquet"
+
+    @property
+    def queryset_serializer_class(self):
+        return ParquetQuerysetSerializer
+
+
+def get_arrow_type(model_field: models.Field) -> Optional[pa.DataType]:
+    """
+    Returns the arrow type of the column where the values of the provided model
+    field can be stored natively.
+
+    :param model_field: The model field of the exported field.
+    :return: The arrow type or None if the values must be exported as text.
+    """
+
+    if isinstance(model_field, BaserowExpressionField):
+        model_field = model_field.expression_field
+
+    if isinstance(model_field, models.BooleanField):
+        return pa.bool_()
+    elif isinstance(model_field, (models.IntegerField, models.AutoField)):
+        return pa.int64()
+    elif isinstance(model_field, models.FloatField):
+        return pa.float64()
+    elif isinstance(model_field, models.DecimalField):
+        if model_field.max_digits is None or model_field.decimal_places is None:
+            return None
+        elif model_field.max_digits > MAX_DECIMAL128_PRECISION:
+            return pa.decimal256(model_field.max_digits, model_field.decimal_places)
+        else:
+            return pa.decimal128(model_field.max_digits, model_field.decimal_places)
+    elif isinstance(model_field, models.DateTimeField):
+        return pa.timestamp("us", tz="UTC")
+    elif isinstance(model_field, models.DateField):
+        return pa.date32()
+    elif isinstance(model_field, (models.CharField, models.TextField)):
+        return pa.string()
+    else:
+        return None
+
+
+class ParquetQuerysetSerializer(QuerysetSerializer):
+    """
+    Writes the queryset to a columnar parquet file. The fields having a value that
+    can be stored natively, like numbers, booleans and dates, are exported to typed
+    columns. The other fields are exported to text columns containing the same
+    value as the csv export.
+    """
+
+    ROW_GROUP_SIZE = 10000
+
+    def __init__(self, queryset, ordered_field_objects):
+        super().__init__(queryset, ordered_field_objects)
+
+        self.columns = [("id", pa.int64(), lambda row: row.id)]
+        for field_object in ordered_field_objects:
+            self.columns.append(self._get_column(field_object))
+
+    def _get_column(
+        self, field_object: FieldObject
+    ) -> Tuple[str, pa.DataType, Callable[[Any], Any]]:
+        """
+        Returns the name, the arrow type and a function returning the value of the
+        column in which the provided field is exported.
+
+        :param field_object: The field object to export.
+        :return: The column name, type and value getter.
+        """
+
+        model_field = self.queryset.model._meta.get_field(field_object["name"])
+        arrow_type = get_arrow_type(model_field)
+
+        def get_native_value(row):
+            return getattr(row, field_object["name"])
+
+        def get_text_value(row):
+            value = getattr(row, field_object["name"])
+            if value is None:
+                return None
+            return str(
+                field_object["type"].get_export_value(
+                    value, field_object, rich_value=False
+                )
+            )
+
+        if arrow_type is None:
+            return field_object["field"].name, pa.string(), get_text_value
+        else:
+            return field_object["field"].name, arrow_type, get_native_value
+
+    def write_to_file(
+        self,
+        file_writer: FileWriter,
+        export_charset="utf-8",
+        parquet_compression="snappy",
+    ):
+        """
+        Writes the queryset to the provided file in the parquet format. The rows are
+        written in row groups of ROW_GROUP_SIZE rows, so that only one row group has
+        to be kept in memory.
+
+        :param file_writer: The file writer to use to do the writing.
+        :param export_charset: Ignored because parquet files always contain utf-8
+            strings.
+        :param parquet_compression: The compression codec of the columns.
+        """
+
+        schema = pa.schema(
+            [pa.field(name, arrow_type) for name, arrow_type, _ in self.columns]
+        )
+        parquet_writer = file_writer.get_parquet_writer(
+            schema, compression=parquet_compression
+        )
+        column_values = [[] for _ in self.columns]
+
+        def write_row_group():
+            parquet_writer.write_table(
+                pa.Table.from_arrays(
+                    [
+                        pa.array(values, type=arrow_type)
+                        for values, (_, arrow_type, _) in zip(
+                            column_values, self.columns
+                        )
+                    ],
+                    schema=schema,
+                )
+            )
+            for values in column_values:
+                values.clear()
+
+        def write_row(row, is_last_row):
+            for values, (_, _, get_value) in zip(column_values, self.columns):
+                values.append(get_value(row))
+
+            if is_last_row or len(column_values[0]) >= self.ROW_GROUP_SIZE:
+                write_row_group()
+
+        file_writer.write_rows(self.queryset, write_row)
+        parquet_writer.close()
@@ -4,8 +4,8 @@ class DatabaseExportSerializedStructure:
         return {"tables": tables}
 
     @staticmethod
-    def table(id, name, order, fields, views, rows):
-        return {
+    def table(id, name, order, fields, views, rows, copy_rows_from=None):
+        table = {
             "id": id,
             "name": name,
             "order": order,
@@ -13,6 +13,13 @@ class DatabaseExportSerializedStructure:
             "views": views,
             "rows": rows,
         }
+        if copy_rows_from is not None:
+            table["copy_rows_from"] = copy_rows_from
+        return table
+
+    @staticmethod
+    def copy_rows_from(table_id, field_ids):
+        return {"table_id": table_id, "field_ids": field_ids}
 
     @staticmethod
     def row(id, order, created_on, updated_on):
@@ -16,6 +16,7 @@ from baserow.contrib.database.fields.backup_handler import (
 )
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import Field, SpecificFieldForUpdate
+from baserow.contrib.database.fields.online_conversion import OnlineFieldConversion
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.table.models import Table
 from baserow.core.action.models import Action
@@ -64,6 +65,7 @@ class UpdateFieldActionType(UndoableActionCustomCleanupMixin, UndoableActionType
         user: AbstractUser,
         field: SpecificFieldForUpdate,
         new_type_name: Optional[str] = None,
+        online_conversion: Optional[OnlineFieldConversion] = None,
         **kwargs,
     ) -> Tuple[Field, List[Field]]:
 
@@ -76,6 +78,9 @@ class UpdateFieldActionType(UndoableActionCustomCleanupMixin, UndoableActionType
         :param user: The user on whose behalf the table is updated.
         :param field: The field instance that needs to be updated.
         :param new_type_name: If the type needs to be changed it can be provided here.
+        :param online_conversion: The online conversion that has already converted
+            the data of the field, if any. The original column is then kept as
+            backup instead of copying its data.
         :return: The updated field instance and any
             updated fields as a result of updated the field are returned in a list
             as the second tuple value.
@@ -93,12 +98,24 @@ class UpdateFieldActionType(UndoableActionCustomCleanupMixin, UndoableActionType
             from_field_type.get_request_kwargs_to_backup(field, kwargs)
         )
 
-        optional_backup_data = cls._backup_field_if_required(
-            field, kwargs, to_field_type_name, backup_uuid
-        )
+        if online_conversion is None:
+            optional_backup_data = cls._backup_field_if_required(
+                field, kwargs, to_field_type_name, backup_uuid
+            )
+        elif cls._should_backup_field(field, to_field_type_name, kwargs):
+            optional_backup_data = online_conversion.keep_original_column_as_backup(
+                cls._get_backup_identifier(field.id, backup_uuid, for_undo=False)
+            )
+        else:
+            optional_backup_data = None
 
         field, updated_fields = FieldHandler().update_field(
-            user, field, new_type_name, return_updated_fields=True, **kwargs
+            user,
+            field,
+            new_type_name,
+            return_updated_fields=True,
+            online_conversion=online_conversion,
+            **kwargs,
         )
 
         table = field.table
@@ -7,6 +7,7 @@ from baserow.contrib.database.fields.dependencies.exceptions import InvalidViaPa
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.signals import field_updated
+from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.table.models import Table
 from baserow.contrib.database.table.signals import table_updated
 
@@ -31,6 +32,7 @@ class PathBasedUpdateStatementCollector:
         """
 
         self.update_statements: Dict[str, Expression] = {}
+        self.search_vectors_outdated = False
         self.table = table
         self.sub_paths: Dict[str, PathBasedUpdateStatementCollector] = {}
         self.connection_here: Optional[LinkRowField] = connection_here
@@ -39,9 +41,15 @@ class PathBasedUpdateStatementCollector:
     def add_update_statement(
         self,
         field: Field,
-        update_statement: Expression,
+        update_statement: Optional[Expression],
         path_from_starting_table: Optional[List[LinkRowField]] = None,
     ):
+        """
+        Adds the update statement of the provided field to the collector of its
+        table. If no update statement is provided, the values of the field don't
+        change, but the search vectors of the rows are still refreshed.
+        """
+
         if not path_from_starting_table:
             if self.table != field.table:
                 # We have been given an update statement for a different table, but
@@ -61,6 +69,8 @@ class PathBasedUpdateStatementCollector:
                 collector.add_update_statement(
                     field, update_statement, path_from_starting_table
                 )
+            elif update_statement is None:
+                self.search_vectors_outdated = True
             else:
                 self.update_statements[field.db_column] = update_statement
         else:
@@ -114,7 +124,8 @@ class PathBasedUpdateStatementCollector:
         qs = model.objects_and_trash
         # If the connection is broken back to the starting table then there is no
         # way to join back to these starting rows. So we just update all cells.
-        if starting_row_ids is not None and not self.connection_is_broken:
+        update_all_rows = starting_row_ids is None or self.connection_is_broken
+        if not update_all_rows:
             if len(path_to_starting_table) == 0:
                 path_to_starting_table_id_column = "id"
             else:
@@ -133,6 +144,15 @@ class PathBasedUpdateStatementCollector:
             qs = qs.filter(filter_for_rows_connected_to_starting_row)
         qs.update(**self.update_statements)
 
+        # The searchable text of the starting rows has been changed by the caller
+        # and the one of the other rows by the update statements above.
+        rows_changed = bool(self.update_statements) or self.search_vectors_outdated
+        if update_all_rows:
+            if rows_changed:
+                SearchHandler.schedule_update_tsvector_columns(self.table)
+        elif rows_changed or len(path_to_starting_table) == 0:
+            SearchHandler.update_tsvector_columns_of_queryset(self.table, qs)
+
     def _include_rows_connected_to_deleted_m2m_relationships(
         self,
         deleted_m2m_rels_per_link_field: Dict[int, Set[int]],
@@ -238,6 +258,25 @@ class FieldUpdateCollector:
             field, update_statement, via_path_to_starting_table
         )
 
+    def add_field_with_outdated_search_vectors(
+        self,
+        field: Field,
+        via_path_to_starting_table: Optional[List[LinkRowField]] = None,
+    ):
+        """
+        Refreshes the search vectors of the rows of the field's table that join
+        back to the starting rows, without changing the values of the field. Used
+        by fields whose searchable text comes from related rows, like link rows.
+
+        :param field: The field of which the searchable text has changed.
+        :param via_path_to_starting_table: A list of link row fields which lead from
+            the self.starting_table to the table containing field.
+        """
+
+        self._update_statement_collector.add_update_statement(
+            field, None, via_path_to_starting_table
+        )
+
     def apply_updates_and_get_updated_fields(
         self, field_cache: FieldCache
     ) -> List[Field]:
@@ -214,6 +214,14 @@ class IncompatibleFieldTypeForUniqueValues(Exception):
     """Raised when the unique values of an incompatible field are requested."""
 
 
+class IncompatibleFieldTypeForOnlineConversion(Exception):
+    """
+    Raised when a field can't be converted to the requested field type in the
+    background, because the conversion needs to alter the table in a way that can't
+    be done without locking it.
+    """
+
+
 class FailedToLockFieldDueToConflict(LockConflict):
     """
     Raised when a user tried to update a field which was locked by another
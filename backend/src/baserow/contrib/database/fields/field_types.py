@@ -14,15 +14,27 @@ from django.contrib.postgres.aggregates import StringAgg
 from django.contrib.postgres.fields import JSONField
 from django.core.exceptions import ValidationError
 from django.core.files.storage import Storage, default_storage
-from django.db import OperationalError, models
-from django.db.models import CharField, DateTimeField, F, Func, Q, QuerySet, Value
-from django.db.models.functions import Coalesce
+from django.db import OperationalError, connection, models
+from django.db.models import (
+    CharField,
+    DateTimeField,
+    Expression,
+    F,
+    Func,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Cast, Coalesce
 from django.utils.timezone import make_aware
 
 import pytz
 from dateutil import parser
 from dateutil.parser import ParserError
 from loguru import logger
+from psycopg2 import sql
 from pytz import timezone
 from rest_framework import serializers
 
@@ -46,6 +58,10 @@ from baserow.contrib.database.api.fields.serializers import (
     MustBeEmptyField,
     SelectOptionSerializer,
 )
+from baserow.contrib.database.db.copy import (
+    copy_many_to_many_relations,
+    get_id_mapping_values,
+)
 from baserow.contrib.database.export_serialized import DatabaseExportSerializedStructure
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.formula import (
@@ -62,6 +78,17 @@ from baserow.contrib.database.formula import (
     BaserowFormulaType,
     FormulaHandler,
 )
+from baserow.contrib.database.formula.expression_generator.django_expressions import (
+    FileNamesExpr,
+    JoinedSubqueryValues,
+)
+from baserow.contrib.database.index_advisor.constants import (
+    INDEX_TYPE_BTREE,
+    INDEX_TYPE_TRIGRAM,
+    INDEX_USAGE_CONTAINS,
+    INDEX_USAGE_FILTER,
+    INDEX_USAGE_SORT,
+)
 from baserow.contrib.database.models import Table
 from baserow.contrib.database.table.cache import invalidate_table_in_model_cache
 from baserow.contrib.database.validators import UnicodeRegexValidator
@@ -143,6 +170,22 @@ if TYPE_CHECKING:
     )
     from baserow.contrib.database.table.models import GeneratedTableModel
 
+# A btree index entry can't be larger than about 2.7kB, so indexing an unbounded text
+# column would make writing a longer value fail. Only the text columns having a max
+# length can therefore be indexed with a btree.
+TEXT_INDEX_TYPES_PER_USAGE = {
+    INDEX_USAGE_CONTAINS: INDEX_TYPE_TRIGRAM,
+}
+BOUNDED_TEXT_INDEX_TYPES_PER_USAGE = {
+    INDEX_USAGE_FILTER: INDEX_TYPE_BTREE,
+    INDEX_USAGE_SORT: INDEX_TYPE_BTREE,
+    INDEX_USAGE_CONTAINS: INDEX_TYPE_TRIGRAM,
+}
+SORTABLE_INDEX_TYPES_PER_USAGE = {
+    INDEX_USAGE_FILTER: INDEX_TYPE_BTREE,
+    INDEX_USAGE_SORT: INDEX_TYPE_BTREE,
+}
+
 
 class TextFieldMatchingRegexFieldType(FieldType, ABC):
     """
@@ -159,6 +202,8 @@ class TextFieldMatchingRegexFieldType(FieldType, ABC):
           altering a column to being an email type.
     """
 
+    index_types_per_usage = TEXT_INDEX_TYPES_PER_USAGE
+
     @property
     @abstractmethod
     def regex(self):
@@ -212,6 +257,9 @@ class TextFieldMatchingRegexFieldType(FieldType, ABC):
             connection, from_field, to_field
         )
 
+    def get_search_expression(self, field, queryset) -> Expression:
+        return F(field.db_column)
+
     def contains_query(self, *args):
         return contains_filter(*args)
 
@@ -240,6 +288,8 @@ class CharFieldMatchingRegexFieldType(TextFieldMatchingRegexFieldType):
           altering a column to being an email type.
     """
 
+    index_types_per_usage = BOUNDED_TEXT_INDEX_TYPES_PER_USAGE
+
     @property
     @abstractmethod
     def max_length(self):
@@ -266,6 +316,7 @@ class CharFieldMatchingRegexFieldType(TextFieldMatchingRegexFieldType):
 class TextFieldType(FieldType):
     type = "text"
     model_class = TextField
+    index_types_per_usage = TEXT_INDEX_TYPES_PER_USAGE
     allowed_fields = ["text_default"]
     serializer_field_names = ["text_default"]
 
@@ -289,6 +340,9 @@ class TextFieldType(FieldType):
     def random_value(self, instance, fake, cache):
         return fake.name()
 
+    def get_search_expression(self, field, queryset) -> Expression:
+        return F(field.db_column)
+
     def contains_query(self, *args):
         return contains_filter(*args)
 
@@ -307,6 +361,7 @@ class TextFieldType(FieldType):
 class LongTextFieldType(FieldType):
     type = "long_text"
     model_class = LongTextField
+    index_types_per_usage = TEXT_INDEX_TYPES_PER_USAGE
 
     def get_serializer_field(self, instance, **kwargs):
         required = kwargs.get("required", False)
@@ -325,6 +380,9 @@ class LongTextFieldType(FieldType):
     def random_value(self, instance, fake, cache):
         return fake.text()
 
+    def get_search_expression(self, field, queryset) -> Expression:
+        return F(field.db_column)
+
     def contains_query(self, *args):
         return contains_filter(*args)
 
@@ -360,6 +418,7 @@ class NumberFieldType(FieldType):
 
     type = "number"
     model_class = NumberField
+    index_types_per_usage = SORTABLE_INDEX_TYPES_PER_USAGE
     allowed_fields = ["number_decimal_places", "number_negative"]
     serializer_field_names = ["number_decimal_places", "number_negative", "number_type"]
     serializer_field_overrides = {
@@ -399,6 +458,19 @@ class NumberFieldType(FieldType):
             }
         )
 
+    def get_response_value_encoder(self, instance, serializer_field):
+        exponent = -instance.number_decimal_places
+        to_representation = serializer_field.to_representation
+
+        def encode(value):
+            # The values fetched from the database already have the right number of
+            # decimal places, so they don't have to be quantized again.
+            if isinstance(value, Decimal) and value.as_tuple().exponent == exponent:
+                return "{:f}".format(value)
+            return to_representation(value)
+
+        return encode
+
     def get_export_value(self, value, field_object, rich_value=False):
         if value is None:
             return value if rich_value else ""
@@ -458,6 +530,9 @@ class NumberFieldType(FieldType):
     def force_same_type_alter_column(self, from_field, to_field):
         return not to_field.number_negative and from_field.number_negative
 
+    def get_search_expression(self, field, queryset) -> Expression:
+        return F(field.db_column)
+
     def contains_query(self, *args):
         return contains_filter(*args)
 
@@ -495,6 +570,7 @@ class NumberFieldType(FieldType):
 class RatingFieldType(FieldType):
     type = "rating"
     model_class = RatingField
+    index_types_per_usage = SORTABLE_INDEX_TYPES_PER_USAGE
     allowed_fields = ["max_value", "color", "style"]
     serializer_field_names = ["max_value", "color", "style"]
 
@@ -591,6 +667,9 @@ class RatingFieldType(FieldType):
     def random_value(self, instance, fake, cache):
         return fake.random_int(0, instance.max_value)
 
+    def get_search_expression(self, field, queryset) -> Expression:
+        return F(field.db_column)
+
     def contains_query(self, *args):
         return contains_filter(*args)
 
@@ -641,6 +720,9 @@ class BooleanFieldType(FieldType):
             **{"required": False, "default": False, **kwargs}
         )
 
+    def get_response_value_encoder(self, instance, serializer_field):
+        return bool
+
     def get_model_field(self, instance, **kwargs):
         return models.BooleanField(default=False, **kwargs)
 
@@ -668,6 +750,7 @@ class BooleanFieldType(FieldType):
 class DateFieldType(FieldType):
     type = "date"
     model_class = DateField
+    index_types_per_usage = SORTABLE_INDEX_TYPES_PER_USAGE
     allowed_fields = [
         "date_format",
         "date_include_time",
@@ -849,6 +932,9 @@ class DateFieldType(FieldType):
         else:
             return fake.date_object()
 
+    def get_search_expression(self, field, queryset) -> Expression:
+        return F(field.db_column)
+
     def contains_query(self, field_name, value, model_field, field):
         value = value.strip()
         # If an empty value has been provided we do not want to filter at all.
@@ -1177,17 +1263,43 @@ class LinkRowFieldType(FieldType):
         """
 
         remote_model = queryset.model._meta.get_field(name).remote_field.model
-        related_queryset = remote_model.objects.all()
+        related_queryset = self.enhance_related_queryset(remote_model.objects.all())
 
+        return queryset.prefetch_related(
+            models.Prefetch(name, queryset=related_queryset)
+        )
+
+    def enhance_queryset_with_related_rows_limit(self, queryset, field, name, limit):
+        """
+        Instead of prefetching all the related rows, only the first `limit` related
+        rows of every fetched row are selected with a window function, so that
+        cells linking to thousands of rows don't have to be fully loaded. The total
+        number of related rows is stored in the `related_rows_count` dict of every
+        row, by field id.
+        """
+
+        def prefetch_limited_related_rows(rows):
+            self.prefetch_limited_related_rows(rows, field, name, limit)
+
+        return queryset.on_rows_fetched(prefetch_limited_related_rows)
+
+    def enhance_related_queryset(self, related_queryset: QuerySet) -> QuerySet:
+        """
+        Because only the primary value of the related rows is needed for
+        serialization, only that one is selected and enhanced. This improves the
+        performance of large related tables significantly.
+
+        :param related_queryset: The queryset of the related table.
+        :return: The enhanced queryset.
+        """
+
+        remote_model = related_queryset.model
         try:
             primary_field_object = next(
                 object
                 for object in remote_model._field_objects.values()
                 if object["field"].primary
             )
-            # Because we only need the primary value for serialization, we only have
-            # to select and enhance that one. This will improve the performance of
-            # large related tables significantly.
             related_queryset = related_queryset.only(primary_field_object["name"])
             related_queryset = primary_field_object["type"].enhance_queryset(
                 related_queryset,
@@ -1199,10 +1311,120 @@ class LinkRowFieldType(FieldType):
             # need to enhance the queryset.
             pass
 
-        return queryset.prefetch_related(
-            models.Prefetch(name, queryset=related_queryset)
+        return related_queryset
+
+    def prefetch_limited_related_rows(
+        self,
+        rows: List["GeneratedTableModel"],
+        field: LinkRowField,
+        name: str,
+        limit: int,
+    ):
+        """
+        Fetches the first `limit` related rows, in the order of the related table,
+        and the total number of related rows of all the provided rows with one
+        query. The related rows are stored like prefetched objects, so that
+        `getattr(row, name).all()` doesn't execute a query, and the count is stored
+        in the `related_rows_count` dict of the row by field id.
+
+        :param rows: The rows of which the related rows must be fetched.
+        :param field: The link row field.
+        :param name: The name of the link row field in the model of the rows.
+        :param limit: The maximum number of related rows that must be fetched per
+            row.
+        """
+
+        if not rows:
+            return
+
+        model_field = rows[0]._meta.get_field(name)
+        remote_model = model_field.remote_field.model
+        through_model = model_field.remote_field.through
+
+        query = sql.SQL(
+            """
+            SELECT row_id, related_id, total FROM (
+                SELECT
+                    through.{row_column} AS row_id,
+                    through.{related_column} AS related_id,
+                    row_number() OVER (
+                        PARTITION BY through.{row_column}
+                        ORDER BY related."order", related.id
+                    ) AS position,
+                    count(*) OVER (PARTITION BY through.{row_column}) AS total
+                FROM {through_table} AS through
+                JOIN {related_table} AS related
+                    ON related.id = through.{related_column}
+                WHERE through.{row_column} = ANY(%s) AND NOT related.trashed
+            ) AS related_rows
+            WHERE position <= %s
+            ORDER BY row_id, position
+            """
+        ).format(
+            row_column=sql.Identifier(model_field.m2m_column_name()),
+            related_column=sql.Identifier(model_field.m2m_reverse_name()),
+            through_table=sql.Identifier(through_model._meta.db_table),
+            related_table=sql.Identifier(remote_model._meta.db_table),
         )
 
+        related_ids_per_row_id = defaultdict(list)
+        count_per_row_id = {}
+        with connection.cursor() as cursor:
+            cursor.execute(query, [[row.id for row in rows], limit])
+            for row_id, related_id, total in cursor.fetchall():
+                related_ids_per_row_id[row_id].append(related_id)
+                count_per_row_id[row_id] = total
+
+        related_row_ids = {
+            related_id
+            for related_ids in related_ids_per_row_id.values()
+            for related_id in related_ids
+        }
+        related_rows_by_id = (
+            {
+                related_row.id: related_row
+                for related_row in self.enhance_related_queryset(
+                    remote_model.objects.filter(id__in=related_row_ids)
+                )
+            }
+            if related_row_ids
+            else {}
+        )
+
+        for row in rows:
+            manager = getattr(row, name)
+            related_queryset = manager.get_queryset()
+            related_queryset._result_cache = [
+                related_rows_by_id[related_id]
+                for related_id in related_ids_per_row_id[row.id]
+                if related_id in related_rows_by_id
+            ]
+            related_queryset._prefetch_done = True
+            if not hasattr(row, "_prefetched_objects_cache"):
+                row._prefetched_objects_cache = {}
+            row._prefetched_objects_cache[
+                manager.prefetch_cache_name
+            ] = related_queryset
+
+            if not hasattr(row, "related_rows_count"):
+                row.related_rows_count = {}
+            row.related_rows_count[field.id] = count_per_row_id.get(row.id, 0)
+
+    def get_related_rows_queryset(
+        self, row: "GeneratedTableModel", name: str
+    ) -> QuerySet:
+        """
+        Returns the queryset of all the rows related to the provided row in the
+        order of the related table, enhanced so that they can be serialized with the
+        `LinkRowValueSerializer`.
+
+        :param row: The row of which the related rows must be returned.
+        :param name: The name of the link row field in the model of the row.
+        :return: The queryset of the related rows.
+        """
+
+        return self.enhance_related_queryset(getattr(row, name).all())
+
     def prepare_value_for_db(self, instance, value):
         return self.prepare_value_for_db_in_bulk(
             instance, {0: value}, continue_on_error=False
@@ -1464,6 +1686,42 @@ class LinkRowFieldType(FieldType):
         else:
             return primary_field_value is None
 
+    def get_search_expression(self, field, queryset) -> Optional[Expression]:
+        """
+        The primary values of the related rows are searchable, so the search text is
+        built by joining the search text of the primary field of every related row.
+        """
+
+        model_field = queryset.model._meta.get_field(field.db_column)
+        related_model = model_field.remote_field.model
+        primary_field_object = next(
+            (
+                field_object
+                for field_object in related_model._field_objects.values()
+                if field_object["field"].primary
+            ),
+            None,
+        )
+        if primary_field_object is None:
+            return None
+
+        related_queryset = related_model.objects.all().order_by()
+        expression = primary_field_object["type"].get_search_expression(
+            primary_field_object["field"], related_queryset
+        )
+        if expression is None:
+            return None
+
+        through_model = model_field.remote_field.through
+        related_row_ids = through_model.objects.filter(
+            **{model_field.m2m_field_name(): OuterRef(OuterRef("id"))}
+        ).values(model_field.m2m_reverse_field_name())
+        return JoinedSubqueryValues(
+            related_queryset.filter(id__in=related_row_ids)
+            .annotate(value=Cast(expression, output_field=models.TextField()))
+            .values("value")
+        )
+
     def get_serializer_field(self, instance, **kwargs):
         """
         If the value is going to be updated we want to accept a list of integers
@@ -1490,6 +1748,14 @@ class LinkRowFieldType(FieldType):
             child=LinkRowValueSerializer(), **{"required": False, **kwargs}
         )
 
+    def get_response_value_encoder(self, instance, serializer_field):
+        def encode(value):
+            if isinstance(value, models.Manager):
+                value = value.all()
+            return [{"id": row.id, "value": str(row)} for row in value]
+
+        return encode
+
     def get_serializer_help_text(self, instance):
         return (
             "This field accepts an `array` containing the ids or the names of the "
@@ -1989,6 +2255,21 @@ class LinkRowFieldType(FieldType):
     ):
         getattr(row, field_name).set(value)
 
+    def copy_relations_in_database(
+        self, field, source_model, new_field, target_model, id_mapping, cache
+    ):
+        source_model_field = source_model._meta.get_field(field.db_column)
+        target_model_field = target_model._meta.get_field(new_field.db_column)
+        # Both sides of a relationship share the same through table, so the relations
+        # must only be copied once.
+        copied_through_tables = cache.setdefault("copied_through_tables", set())
+        through_table_name = target_model_field.remote_field.through._meta.db_table
+        if through_table_name in copied_through_tables:
+            return
+        copied_through_tables.add(through_table_name)
+
+        copy_many_to_many_relations(source_model_field, target_model_field)
+
     def get_other_fields_to_trash_restore_always_together(self, field) -> List[Field]:
         fields = []
         if field.link_row_related_field is not None:
@@ -2027,6 +2308,76 @@ class LinkRowFieldType(FieldType):
         else:
             return []
 
+    def _refresh_search_vectors_of_related_rows(
+        self,
+        field: LinkRowField,
+        update_collector: "FieldUpdateCollector",
+        via_path_to_starting_table: Optional[List[LinkRowField]],
+    ):
+        # The values of the field don't change, but the searchable text contains the
+        # primary values of the related rows.
+        if via_path_to_starting_table:
+            update_collector.add_field_with_outdated_search_vectors(
+                field, via_path_to_starting_table
+            )
+
+    def row_of_dependency_created(
+        self,
+        field: LinkRowField,
+        starting_row: "StartingRowType",
+        update_collector: "FieldUpdateCollector",
+        field_cache: "FieldCache",
+        via_path_to_starting_table: Optional[List[LinkRowField]],
+    ):
+        self._refresh_search_vectors_of_related_rows(
+            field, update_collector, via_path_to_starting_table
+        )
+        super().row_of_dependency_created(
+            field,
+            starting_row,
+            update_collector,
+            field_cache,
+            via_path_to_starting_table,
+        )
+
+    def row_of_dependency_updated(
+        self,
+        field: LinkRowField,
+        starting_row: "StartingRowType",
+        update_collector: "FieldUpdateCollector",
+        field_cache: "FieldCache",
+        via_path_to_starting_table: Optional[List[LinkRowField]],
+    ):
+        self._refresh_search_vectors_of_related_rows(
+            field, update_collector, via_path_to_starting_table
+        )
+        super().row_of_dependency_updated(
+            field,
+            starting_row,
+            update_collector,
+            field_cache,
+            via_path_to_starting_table,
+        )
+
+    def row_of_dependency_deleted(
+        self,
+        field: LinkRowField,
+        starting_row: "StartingRowType",
+        update_collector: "FieldUpdateCollector",
+        field_cache: "FieldCache",
+        via_path_to_starting_table: Optional[List[LinkRowField]],
+    ):
+        self._refresh_search_vectors_of_related_rows(
+            field, update_collector, via_path_to_starting_table
+        )
+        super().row_of_dependency_deleted(
+            field,
+            starting_row,
+            update_collector,
+            field_cache,
+            via_path_to_starting_table,
+        )
+
     def should_backup_field_data_for_same_type_update(
         self, old_field: LinkRowField, new_field_attrs: Dict[str, Any]
     ) -> bool:
@@ -2270,6 +2621,9 @@ class FileFieldType(FieldType):
 
         return values
 
+    def get_search_expression(self, field, queryset) -> Expression:
+        return FileNamesExpr(F(field.db_column))
+
     def contains_query(self, *args):
         return filename_contains_filter(*args)
 
@@ -2411,6 +2765,13 @@ class SingleSelectFieldType(SelectOptionBaseFieldType):
             }
         )
 
+    def get_response_value_encoder(self, instance, serializer_field):
+        return lambda option: {
+            "id": option.id,
+            "value": option.value,
+            "color": option.color,
+        }
+
     def enhance_queryset(self, queryset, field, name):
         return queryset.prefetch_related(
             models.Prefetch(name, queryset=SelectOption.objects.using("default").all())
@@ -2637,6 +2998,9 @@ class SingleSelectFieldType(SelectOptionBaseFieldType):
 
         return select_options[random_choice]
 
+    def get_search_expression(self, field, queryset) -> Expression:
+        return F(f"{field.db_column}__value")
+
     def contains_query(self, field_name, value, model_field, field):
         value = value.strip()
         # If an empty value has been provided we do not want to filter at all.
@@ -2662,6 +3026,19 @@ class SingleSelectFieldType(SelectOptionBaseFieldType):
 
         setattr(row, field_name + "_id", select_option_mapping[value])
 
+    def get_sql_copy_select_expression(self, field, source_column, id_mapping):
+        select_option_mapping = id_mapping["database_field_select_options"]
+        if not select_option_mapping:
+            return sql.SQL("NULL")
+
+        return sql.SQL(
+            "(SELECT mapping.new_id FROM {values} AS mapping(old_id, new_id) "
+            "WHERE mapping.old_id = {column})"
+        ).format(
+            values=get_id_mapping_values(select_option_mapping),
+            column=source_column,
+        )
+
     def to_baserow_formula_type(self, field):
         return BaserowFormulaSingleSelectType(nullable=True)
 
@@ -2709,6 +3086,12 @@ class MultipleSelectFieldType(SelectOptionBaseFieldType):
             }
         )
 
+    def get_response_value_encoder(self, instance, serializer_field):
+        return lambda options: [
+            {"id": option.id, "value": option.value, "color": option.color}
+            for option in options.all()
+        ]
+
     def enhance_queryset(self, queryset, field, name):
         return queryset.prefetch_related(name)
 
@@ -2946,6 +3329,22 @@ class MultipleSelectFieldType(SelectOptionBaseFieldType):
         ]
         getattr(row, field_name).set(mapped_values)
 
+    def copy_relations_in_database(
+        self, field, source_model, new_field, target_model, id_mapping, cache
+    ):
+        copy_many_to_many_relations(
+            source_model._meta.get_field(field.db_column),
+            target_model._meta.get_field(new_field.db_column),
+            id_mapping["database_field_select_options"],
+        )
+
+    def get_search_expression(self, field, queryset) -> Expression:
+        return Subquery(
+            queryset.filter(id=OuterRef("id"))
+            .annotate(value=StringAgg(f"{field.db_column}__value", " "))
+            .values("value")[:1]
+        )
+
     def contains_query(self, field_name, value, model_field, field):
         value = value.strip()
         # If an empty value has been provided we do not want to filter at all.
@@ -3196,6 +3595,34 @@ class FormulaFieldType(ReadOnlyFieldType):
             rich_value=rich_value,
         )
 
+    def get_search_expression(
+        self, field: FormulaField, queryset
+    ) -> Optional[Expression]:
+        (
+            field_instance,
+            field_type,
+        ) = self._get_field_instance_and_type_from_formula_field(field)
+        if field_instance is field_type:
+            # Formula types without an equivalent field type work with the formula
+            # field directly.
+            return field_type.get_search_expression(field, queryset)
+
+        # The field instance is not stored, it needs the id of the formula field to
+        # reference the right column.
+        field_instance.id = field.id
+        return field_type.get_search_expression(field_instance, queryset)
+
+    def get_index_type(self, field: FormulaField, usage: str) -> Optional[str]:
+        (
+            field_instance,
+            field_type,
+        ) = self._get_field_instance_and_type_from_formula_field(field)
+        if field_instance is field_type:
+            # Formula types without an equivalent field type, like arrays, are not
+            # stored in a way that benefits from an index.
+            return None
+        return field_type.get_index_type(field_instance, usage)
+
     def contains_query(self, field_name, value, model_field, field: FormulaField):
         (
             field_instance,
@@ -3749,6 +4176,9 @@ class MultipleCollaboratorsFieldType(FieldType):
     model_class = MultipleCollaboratorsField
     can_get_unique_values = False
     can_be_in_form_view = False
+    # The collaborators are matched by email when imported, which is resolved in
+    # Python.
+    can_copy_rows_in_database = False
 
     def get_serializer_field(self, instance, **kwargs):
         required = kwargs.pop("required", False)
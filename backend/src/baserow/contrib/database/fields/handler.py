@@ -1,6 +1,7 @@
 import traceback
 from copy import deepcopy
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
@@ -87,6 +88,9 @@ from .signals import (
     field_updated,
 )
 
+if TYPE_CHECKING:
+    from .online_conversion import OnlineFieldConversion
+
 tracer = trace.get_tracer(__name__)
 
 
@@ -364,6 +368,7 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
         after_schema_change_callback: Optional[
             Callable[[SpecificFieldForUpdate], None]
         ] = None,
+        online_conversion: Optional["OnlineFieldConversion"] = None,
         **kwargs,
     ) -> Union[SpecificFieldForUpdate, Tuple[SpecificFieldForUpdate, List[Field]]]:
         """
@@ -383,6 +388,9 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
         :param after_schema_change_callback: If specified this callback is called
             after the field has had it's schema updated but before any dependant
             fields have been updated.
+        :param online_conversion: If the data of the field has already been
+            converted in the background, the started online conversion. Its converted
+            column then replaces the original one instead of altering the column.
         :param kwargs: The field values that need to be updated
         :raises ValueError: When the provided field is not an instance of Field.
         :raises CannotChangeFieldType: When the database server responds with an
@@ -478,7 +486,11 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
             from_model, old_field, field
         )
 
-        if converter:
+        if online_conversion is not None:
+            # The data has already been converted into a shadow column that only has
+            # to replace the original column.
+            online_conversion.swap(old_field, field)
+        elif converter:
             # If a field data converter is found we are going to use that one to alter
             # the field and maybe do some data conversion.
             converter.alter_field(
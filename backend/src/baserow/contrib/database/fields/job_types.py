@@ -1,17 +1,46 @@
+from contextlib import nullcontext
+from typing import Any, Dict, Tuple
+
+from django.db import transaction
+from django.utils.functional import lazy
+
 from rest_framework import serializers
 
 from baserow.api.errors import ERROR_GROUP_DOES_NOT_EXIST, ERROR_USER_NOT_IN_GROUP
+from baserow.api.utils import validate_data_custom_fields
+from baserow.contrib.database.api.fields.errors import (
+    ERROR_FIELD_DOES_NOT_EXIST,
+    ERROR_INCOMPATIBLE_FIELD_TYPE_FOR_ONLINE_CONVERSION,
+)
 from baserow.contrib.database.api.fields.serializers import (
     FieldSerializer,
     FieldSerializerWithRelatedFields,
+    UpdateFieldSerializer,
 )
 from baserow.contrib.database.db.atomic import (
     read_repeatable_read_single_table_transaction,
 )
-from baserow.contrib.database.fields.actions import DuplicateFieldActionType
+from baserow.contrib.database.fields.actions import (
+    DuplicateFieldActionType,
+    UpdateFieldActionType,
+)
+from baserow.contrib.database.fields.exceptions import (
+    CannotChangeFieldType,
+    FieldDoesNotExist,
+    IncompatibleFieldTypeForOnlineConversion,
+)
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.fields.models import DuplicateFieldJob
-from baserow.contrib.database.fields.operations import DuplicateFieldOperationType
+from baserow.contrib.database.fields.models import (
+    ConvertFieldJob,
+    DuplicateFieldJob,
+    Field,
+)
+from baserow.contrib.database.fields.online_conversion import OnlineFieldConversion
+from baserow.contrib.database.fields.operations import (
+    DuplicateFieldOperationType,
+    UpdateFieldOperationType,
+)
+from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.core.action.registries import action_type_registry
 from baserow.core.exceptions import UserNotInWorkspace, WorkspaceDoesNotExist
 from baserow.core.handler import CoreHandler
@@ -82,3 +111,122 @@ class DuplicateFieldJobType(JobType):
         job.save(update_fields=("duplicated_field",))
 
         return new_field_clone, updated_fields
+
+
+class ConvertFieldJobType(JobType):
+    type = "convert_field"
+    model_class = ConvertFieldJob
+    max_count = 1
+
+    api_exceptions_map = {
+        UserNotInWorkspace: ERROR_USER_NOT_IN_GROUP,
+        WorkspaceDoesNotExist: ERROR_GROUP_DOES_NOT_EXIST,
+        FieldDoesNotExist: ERROR_FIELD_DOES_NOT_EXIST,
+        IncompatibleFieldTypeForOnlineConversion: (
+            ERROR_INCOMPATIBLE_FIELD_TYPE_FOR_ONLINE_CONVERSION
+        ),
+    }
+
+    job_exceptions_map = {
+        CannotChangeFieldType: "The field has been changed while it was being "
+        "converted.",
+    }
+
+    request_serializer_field_names = ["field_id", "new_type", "field_values"]
+
+    request_serializer_field_overrides = {
+        "field_id": serializers.IntegerField(
+            help_text="The ID of the field to convert.",
+        ),
+        "new_type": serializers.ChoiceField(
+            choices=lazy(field_type_registry.get_types, list)(),
+            help_text="The field type the field must be converted to.",
+        ),
+        "field_values": serializers.DictField(
+            required=False,
+            default=dict,
+            help_text="The other field values that must be updated, like when "
+            "updating the field.",
+        ),
+    }
+
+    serializer_field_names = ["field"]
+    serializer_field_overrides = {
+        "field": FieldSerializer(read_only=True),
+    }
+
+    def transaction_atomic_context(self, job: ConvertFieldJob):
+        """
+        The online conversion commits the converted data in batches so that the
+        table is not locked while the rows are converted. Only the final update of
+        the field runs in a single transaction.
+        """
+
+        return nullcontext()
+
+    def get_online_conversion(
+        self, field: Field, new_type: str, field_values: Dict[str, Any]
+    ) -> Tuple[OnlineFieldConversion, Dict[str, Any]]:
+        """
+        Validates the field values and prepares the online conversion of the field.
+
+        :return: The online conversion and the validated field values.
+        """
+
+        field_values = validate_data_custom_fields(
+            new_type,
+            field_type_registry,
+            {**field_values, "type": new_type},
+            base_serializer_class=UpdateFieldSerializer,
+        )
+        field_values.pop("type", None)
+        return OnlineFieldConversion(field, new_type, **field_values), field_values
+
+    def prepare_values(self, values, user):
+        field = FieldHandler().get_field(values["field_id"]).specific
+        CoreHandler().check_permissions(
+            user,
+            UpdateFieldOperationType.type,
+            workspace=field.table.database.workspace,
+            context=field,
+        )
+
+        field_values = values.get("field_values", {})
+        self.get_online_conversion(field, values["new_type"], field_values)
+
+        return {
+            "field": field,
+            "new_type": values["new_type"],
+            "field_values": field_values,
+        }
+
+    def run(self, job, progress):
+        if job.field is None:
+            raise FieldDoesNotExist("The field has been deleted.")
+
+        conversion, field_values = self.get_online_conversion(
+            job.field.specific, job.new_type, job.field_values
+        )
+        conversion.start()
+        progress.increment(5)
+
+        try:
+            conversion.backfill(progress.create_child_builder(represents_progress=90))
+
+            with transaction.atomic():
+                field = FieldHandler().get_specific_field_for_update(job.field_id)
+                field, updated_fields = action_type_registry.get_by_type(
+                    UpdateFieldActionType
+                ).do(
+                    job.user,
+                    field,
+                    job.new_type,
+                    online_conversion=conversion,
+                    **field_values,
+                )
+        except BaseException:
+            conversion.clean_up()
+            raise
+
+        progress.increment(5)
+        return field, updated_fields
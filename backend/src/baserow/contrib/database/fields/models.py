@@ -594,4 +594,24 @@ class DuplicateFieldJob(
     )
 
 
+class ConvertFieldJob(
+    JobWithUserIpAddress, JobWithWebsocketId, JobWithUndoRedoIds, Job
+):
+    field = models.ForeignKey(
+        Field,
+        null=True,
+        related_name="converted_by_jobs",
+        on_delete=models.SET_NULL,
+        help_text="The Baserow field to convert.",
+    )
+    new_type = models.CharField(
+        max_length=32,
+        help_text="The field type the field must be converted to.",
+    )
+    field_values = models.JSONField(
+        default=dict,
+        help_text="The other values of the field that must be updated.",
+    )
+
+
 SpecificFieldForUpdate = NewType("SpecificFieldForUpdate", Field)
@@ -0,0 +1,462 @@
+from copy import deepcopy
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from django.db.models import ForeignKey, ManyToManyField
+
+from psycopg2 import sql
+
+from baserow.contrib.database.db.sql_queries import (
+    sql_create_field_conversion_function,
+    sql_drop_field_conversion_function,
+)
+from baserow.core.utils import ChildProgressBuilder, extract_allowed, set_allowed_attrs
+
+from .backup_handler import BackupData
+from .exceptions import CannotChangeFieldType, IncompatibleFieldTypeForOnlineConversion
+from .models import Field
+from .registries import field_converter_registry, field_type_registry
+
+
+class OnlineFieldConversion:
+    """
+    Converts the data of a field to another field type without keeping the table
+    locked while all the rows are converted. A regular conversion alters the type of
+    the column, which rewrites the whole table under an ACCESS EXCLUSIVE lock. An
+    online conversion instead:
+
+    1. Adds a shadow column having the new type and a trigger that converts the
+       value of every inserted or updated row into it.
+    2. Backfills the shadow column in id ranged batches, each one committed in its
+       own transaction, using the same conversion SQL as the lenient schema editor.
+    3. Swaps the columns when the field is updated with this conversion, which only
+       needs a short lock because the data is already converted.
+
+    The field types that need select options, relations or constraints that can't
+    be added without scanning the table are not supported.
+    """
+
+    def __init__(
+        self, field: Field, new_type_name: Optional[str] = None, **kwargs: Any
+    ):
+        """
+        :param field: The specific field instance that must be converted.
+        :param new_type_name: The name of the field type to convert to, if it changes.
+        :param kwargs: The new field values, like they will be provided to the
+            `update_field` method of the field handler.
+        :raises IncompatibleFieldTypeForOnlineConversion: If the field can't be
+            converted online.
+        """
+
+        self.field = field
+        self.from_field_type = field_type_registry.get_by_model(field)
+        self.to_field_type = field_type_registry.get(
+            new_type_name or self.from_field_type.type
+        )
+        if (
+            self.from_field_type.read_only
+            or self.to_field_type.read_only
+            or self.from_field_type.can_have_select_options
+            or self.to_field_type.can_have_select_options
+        ):
+            self._raise_incompatible()
+        self.new_field = self._get_new_field(kwargs)
+
+        self.from_model = field.table.get_model(
+            field_ids=[], fields=[field], add_dependencies=False
+        )
+        to_model = field.table.get_model(
+            field_ids=[], fields=[self.new_field], add_dependencies=False
+        )
+        self.from_model_field = self.from_model._meta.get_field(field.db_column)
+        self.to_model_field = to_model._meta.get_field(field.db_column)
+        self.new_type = self.to_model_field.db_parameters(connection)["type"]
+
+        self.table_name = field.table.get_database_table_name()
+        self.column = field.db_column
+        self.shadow_column = f"{field.db_column}_shadow"
+        self.function = f"baserow_convert_field_{field.id}"
+        self.trigger_function = f"baserow_convert_field_{field.id}_trigger"
+        self.trigger = f"baserow_convert_field_{field.id}"
+        self.not_null_constraint = f"baserow_convert_field_{field.id}_not_null"
+        self.backup_column = None
+
+        self._check_can_convert()
+        self.conversion_sql = self._get_conversion_sql(field, self.new_field)
+
+    def _get_new_field(self, field_values: Dict[str, Any]) -> Field:
+        """
+        Returns an unsaved instance of the field like it will be after the update,
+        which is needed to generate the new column and the conversion SQL.
+        """
+
+        if self.to_field_type.type == self.from_field_type.type:
+            new_field = deepcopy(self.field)
+        else:
+            new_field = self.to_field_type.model_class(
+                **{
+                    base_field.attname: getattr(self.field, base_field.attname)
+                    for base_field in Field._meta.concrete_fields
+                }
+            )
+            new_field.content_type = ContentType.objects.get_for_model(new_field)
+            new_field.table = self.field.table
+
+        allowed_fields = ["name"] + self.to_field_type.allowed_fields
+        return set_allowed_attrs(
+            extract_allowed(field_values, allowed_fields), allowed_fields, new_field
+        )
+
+    def _check_can_convert(self):
+        converter = field_converter_registry.find_applicable_converter(
+            self.from_model, self.field, self.new_field
+        )
+        type_changed = self.from_field_type.type != self.to_field_type.type
+        column_changed = (
+            type_changed
+            or self.from_model_field.db_parameters(connection)["type"] != self.new_type
+            or self.to_field_type.force_same_type_alter_column(
+                self.field, self.new_field
+            )
+        )
+        relation_classes = (ForeignKey, ManyToManyField)
+
+        if (
+            converter is not None
+            or not column_changed
+            or self.new_type is None
+            or isinstance(self.from_model_field, relation_classes)
+            or isinstance(self.to_model_field, relation_classes)
+            or self.to_model_field.db_parameters(connection)["check"] is not None
+            or self.to_model_field.db_index
+            or self.to_model_field.unique
+        ):
+            self._raise_incompatible()
+
+    def _raise_incompatible(self):
+        raise IncompatibleFieldTypeForOnlineConversion(
+            f"The field can't be converted online from {self.from_field_type.type} "
+            f"to {self.to_field_type.type}."
+        )
+
+    def _get_conversion_sql(
+        self, old_field: Field, new_field: Field
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Returns the SQL preparing the old and new values, and the variables that must
+        be injected into it, exactly like the lenient schema editor does.
+        """
+
+        variables = {}
+        prepared_values = []
+        for prepare_value in [
+            self.from_field_type.get_alter_column_prepare_old_value(
+                connection, old_field, new_field
+            ),
+            self.to_field_type.get_alter_column_prepare_new_value(
+                connection, old_field, new_field
+            ),
+        ]:
+            if isinstance(prepare_value, tuple):
+                prepare_value, prepare_variables = prepare_value
+                variables.update(
+                    {
+                        key: value.replace("$FUNCTION$", "")
+                        for key, value in prepare_variables.items()
+                    }
+                )
+            prepared_values.append(prepare_value or "")
+
+        return prepared_values[0], prepared_values[1], variables
+
+    def _get_default(self) -> Any:
+        """
+        Returns the value that must be used if a value can't be converted. It's the
+        default of the new column if it can't be null, like Django sets it when
+        altering the column.
+        """
+
+        if self.to_model_field.null:
+            return None
+        return self.to_model_field.get_db_prep_save(
+            self.to_model_field.get_default(), connection
+        )
+
+    def _get_converted_value_sql(self, column: sql.Composable) -> sql.Composable:
+        return sql.SQL(
+            "coalesce({function}({column}::text), %(default)s::{type})"
+        ).format(
+            function=sql.Identifier(self.function),
+            column=column,
+            type=sql.SQL(self.new_type),
+        )
+
+    def start(self):
+        """
+        Adds the shadow column, the conversion function and the trigger keeping the
+        shadow column in sync with the rows that are inserted or updated from now on.
+        Everything is committed right away so that the other connections start
+        converting the values they write. Whatever is left of a previous attempt that
+        didn't complete is removed first, so that the conversion can be started again.
+        """
+
+        prepare_old_value, prepare_new_value, variables = self.conversion_sql
+        function_sql = sql_create_field_conversion_function % {
+            "function": connection.ops.quote_name(self.function),
+            "type": self.new_type,
+            "alter_column_prepare_old_value": prepare_old_value,
+            "alter_column_prepare_new_value": prepare_new_value,
+        }
+        trigger_sql = sql.SQL(
+            """
+            CREATE OR REPLACE FUNCTION {trigger_function}() RETURNS trigger AS
+            $FUNCTION$
+            BEGIN
+                NEW.{shadow_column} = {converted_value};
+                RETURN NEW;
+            END;
+            $FUNCTION$
+            LANGUAGE plpgsql;
+
+            CREATE TRIGGER {trigger} BEFORE INSERT OR UPDATE OF {column} ON {table}
+            FOR EACH ROW EXECUTE PROCEDURE {trigger_function}();
+            """
+        ).format(
+            trigger_function=sql.Identifier(self.trigger_function),
+            shadow_column=sql.Identifier(self.shadow_column),
+            converted_value=self._get_converted_value_sql(
+                sql.SQL("NEW.{}").format(sql.Identifier(self.column))
+            ),
+            trigger=sql.Identifier(self.trigger),
+            column=sql.Identifier(self.column),
+            table=sql.Identifier(self.table_name),
+        )
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            self.clean_up()
+            cursor.execute(
+                sql.SQL("ALTER TABLE {table} ADD COLUMN {column} {type} NULL").format(
+                    table=sql.Identifier(self.table_name),
+                    column=sql.Identifier(self.shadow_column),
+                    type=sql.SQL(self.new_type),
+                )
+            )
+            cursor.execute(function_sql, variables)
+            cursor.execute(trigger_sql, {"default": self._get_default()})
+
+    def backfill(
+        self,
+        progress_builder: Optional[ChildProgressBuilder] = None,
+        batch_size: Optional[int] = None,
+    ):
+        """
+        Converts the values of all the existing rows into the shadow column. Every
+        batch of rows is committed separately, so the rows are only locked for the
+        duration of one batch.
+
+        :param progress_builder: An optional progress builder tracking the number of
+            converted batches.
+        :param batch_size: The size of the id ranges that are converted at once.
+        """
+
+        if batch_size is None:
+            batch_size = settings.BASEROW_ONLINE_FIELD_CONVERSION_BATCH_SIZE
+
+        table = sql.Identifier(self.table_name)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("SELECT min(id), max(id) FROM {table}").format(table=table)
+            )
+            min_id, max_id = cursor.fetchone()
+
+        batch_starts = [] if min_id is None else range(min_id, max_id + 1, batch_size)
+        progress = ChildProgressBuilder.build(
+            progress_builder, child_total=max(len(batch_starts), 1)
+        )
+        query = sql.SQL(
+            "UPDATE {table} SET {shadow_column} = {converted_value} "
+            "WHERE id >= %(start)s AND id < %(end)s"
+        ).format(
+            table=table,
+            shadow_column=sql.Identifier(self.shadow_column),
+            converted_value=self._get_converted_value_sql(sql.Identifier(self.column)),
+        )
+
+        default = self._get_default()
+        for start in batch_starts:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(
+                    query,
+                    {"default": default, "start": start, "end": start + batch_size},
+                )
+            progress.increment()
+
+        if not batch_starts:
+            progress.increment()
+
+        if not self.to_model_field.null:
+            self._add_not_null_constraint()
+
+    def _add_not_null_constraint(self):
+        """
+        Adds a validated check constraint making sure the shadow column doesn't
+        contain null values. Postgres then doesn't have to scan the table to set the
+        column to NOT NULL while it's locked when the columns are swapped. The
+        constraint is added without validating it first, which only locks the table
+        for a moment, and then validated in a separate transaction, which doesn't
+        block the writes while the table is scanned. All the values are converted by
+        then, and the trigger converts the ones that are written.
+        """
+
+        table = sql.Identifier(self.table_name)
+        constraint = sql.Identifier(self.not_null_constraint)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    "ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {constraint}"
+                ).format(table=table, constraint=constraint)
+            )
+            cursor.execute(
+                sql.SQL(
+                    "ALTER TABLE {table} ADD CONSTRAINT {constraint} "
+                    "CHECK ({shadow_column} IS NOT NULL) NOT VALID"
+                ).format(
+                    table=table,
+                    constraint=constraint,
+                    shadow_column=sql.Identifier(self.shadow_column),
+                )
+            )
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("ALTER TABLE {table} VALIDATE CONSTRAINT {constraint}").format(
+                    table=table, constraint=constraint
+                )
+            )
+
+    def keep_original_column_as_backup(
+        self, backup_column: str
+    ) -> Optional[BackupData]:
+        """
+        Renames the original column to the provided name instead of dropping it when
+        the columns are swapped, so that it can be used to undo the conversion
+        without copying the data.
+
+        :param backup_column: The name of the column containing the original data.
+        :return: The backup data that can be used with the FieldDataBackupHandler.
+        """
+
+        self.backup_column = backup_column
+        return {
+            "table_id_containing_backup_column": self.field.table_id,
+            "backed_up_column_name": backup_column,
+        }
+
+    def swap(self, old_field: Field, new_field: Field):
+        """
+        Replaces the original column with the converted shadow column. Must be called
+        by the field handler while updating the field, in the same transaction.
+
+        :param old_field: The field like it was before the update.
+        :param new_field: The updated field.
+        :raises CannotChangeFieldType: If the field has been changed in a way that
+            affects the conversion since the conversion started.
+        """
+
+        if (
+            old_field.id != self.field.id
+            or field_type_registry.get_by_model(old_field) != self.from_field_type
+            or field_type_registry.get_by_model(new_field) != self.to_field_type
+            or self._get_conversion_sql(old_field, new_field) != self.conversion_sql
+        ):
+            raise CannotChangeFieldType(
+                "The field has been changed while it was being converted."
+            )
+
+        table = sql.Identifier(self.table_name)
+        column = sql.Identifier(self.column)
+        self._drop_trigger_and_functions()
+
+        with connection.cursor() as cursor:
+            if self.backup_column is None:
+                cursor.execute(
+                    sql.SQL("ALTER TABLE {table} DROP COLUMN {column}").format(
+                        table=table, column=column
+                    )
+                )
+            else:
+                backup_column = sql.Identifier(self.backup_column)
+                cursor.execute(
+                    sql.SQL(
+                        "ALTER TABLE {table} RENAME COLUMN {column} TO {backup_column}"
+                    ).format(table=table, column=column, backup_column=backup_column)
+                )
+                cursor.execute(
+                    sql.SQL(
+                        "ALTER TABLE {table} ALTER COLUMN {backup_column} "
+                        "DROP NOT NULL"
+                    ).format(table=table, backup_column=backup_column)
+                )
+
+            cursor.execute(
+                sql.SQL(
+                    "ALTER TABLE {table} RENAME COLUMN {shadow_column} TO {column}"
+                ).format(
+                    table=table,
+                    shadow_column=sql.Identifier(self.shadow_column),
+                    column=column,
+                )
+            )
+            if not self.to_model_field.null:
+                # The validated check constraint added after the backfill proves that
+                # there are no null values, so the table isn't scanned here.
+                cursor.execute(
+                    sql.SQL(
+                        "ALTER TABLE {table} ALTER COLUMN {column} SET NOT NULL"
+                    ).format(table=table, column=column)
+                )
+                cursor.execute(
+                    sql.SQL(
+                        "ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {constraint}"
+                    ).format(
+                        table=table,
+                        constraint=sql.Identifier(self.not_null_constraint),
+                    )
+                )
+
+    def _drop_trigger_and_functions(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("DROP TRIGGER IF EXISTS {trigger} ON {table}").format(
+                    trigger=sql.Identifier(self.trigger),
+                    table=sql.Identifier(self.table_name),
+                )
+            )
+            cursor.execute(
+                sql.SQL("DROP FUNCTION IF EXISTS {trigger_function}()").format(
+                    trigger_function=sql.Identifier(self.trigger_function)
+                )
+            )
+            cursor.execute(
+                sql_drop_field_conversion_function
+                % {"function": connection.ops.quote_name(self.function)}
+            )
+
+    def clean_up(self):
+        """
+        Removes the trigger, the functions and the shadow column if the conversion
+        is not completed, so that it can be started again.
+        """
+
+        with transaction.atomic():
+            self._drop_trigger_and_functions()
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    sql.SQL(
+                        "ALTER TABLE {table} DROP COLUMN IF EXISTS {column}"
+                    ).format(
+                        table=sql.Identifier(self.table_name),
+                        column=sql.Identifier(self.shadow_column),
+                    )
+                )
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Dict, List, NoReturn, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NoReturn, Optional, Union
 from zipfile import ZipFile
 
 from django.contrib.postgres.fields import ArrayField, JSONField
@@ -8,6 +8,9 @@ from django.db import models as django_models
 from django.db.models import BooleanField, DurationField, Q, QuerySet
 from django.db.models.fields.related import ForeignKey, ManyToManyField
 
+from psycopg2 import sql
+from rest_framework import serializers
+
 from baserow.contrib.database.fields.constants import UPSERT_OPTION_DICT_KEY
 from baserow.core.registry import (
     APIUrlsInstanceMixin,
@@ -116,6 +119,19 @@ class FieldType(
     inside of the import process.
     """
 
+    can_copy_rows_in_database = True
+    """Indicates whether the cell values can be copied to a duplicate of the field
+    inside the database, using `get_sql_copy_select_expression` and
+    `copy_relations_in_database`, instead of being exported and imported one by one.
+    Set this to False if the values reference objects that can't be remapped in SQL.
+    """
+
+    index_types_per_usage: Dict[str, str] = {}
+    """A mapping of the index usages, like filtering or sorting by the field, to the
+    type of index that the index advisor can create on the column of the field to speed
+    them up. Usages that aren't in the mapping don't benefit from an index.
+    """
+
     def prepare_value_for_db(self, instance: Field, value: Any) -> Any:
         """
         When a row is created or updated all the values are going to be prepared for the
@@ -204,6 +220,25 @@ class FieldType(
 
         return queryset
 
+    def enhance_queryset_with_related_rows_limit(
+        self, queryset: QuerySet, field: Field, name: str, limit: int
+    ) -> QuerySet:
+        """
+        Same as `enhance_queryset`, but a field type referencing many related rows
+        per row, like the `link_row` field, should only fetch the first `limit`
+        related rows of every row. This is for example used by the grid view
+        endpoint when only a preview of the related rows is shown in the cells.
+
+        :param queryset: The queryset that can be enhanced.
+        :param field: The related field's instance.
+        :param name: The name of the field.
+        :param limit: The maximum number of related rows that must be fetched per
+            row.
+        :return: The enhanced queryset.
+        """
+
+        return self.enhance_queryset(queryset, field, name)
+
     def empty_query(
         self,
         field_name: str,
@@ -289,6 +324,37 @@ class FieldType(
 
         return Q()
 
+    def get_index_type(self, field: Field, usage: str) -> Optional[str]:
+        """
+        Returns the type of index that speeds up the provided usage of the field, or
+        `None` if the usage doesn't benefit from an index on the column of the field.
+
+        :param field: The related field's instance.
+        :param usage: How the field is used, one of the `INDEX_USAGE_*` constants of
+            the index advisor.
+        :return: One of the `INDEX_TYPE_*` constants of the index advisor or None.
+        """
+
+        return self.index_types_per_usage.get(usage, None)
+
+    def get_search_expression(
+        self, field: Field, queryset: QuerySet
+    ) -> Optional[django_models.Expression]:
+        """
+        Returns an expression resulting in the text of the provided field that must be
+        findable using the full-text search. The expression is evaluated for every row
+        of the table when the search vector of the row is computed. By default a field
+        is not searchable, which is indicated by returning `None`.
+
+        :param field: The related field's instance.
+        :param queryset: A queryset of the table's generated model which can be used to
+            construct a subquery, for example when the values are stored in a related
+            table.
+        :return: An expression resulting in the searchable text or None.
+        """
+
+        return None
+
     def get_serializer_field(self, instance, **kwargs):
         """
         Should return the serializer field based on the custom model instance
@@ -324,6 +390,27 @@ class FieldType(
 
         return self.get_serializer_field(instance, **kwargs)
 
+    def get_response_value_encoder(
+        self, instance: Field, serializer_field: serializers.Field
+    ) -> Callable[[Any], Any]:
+        """
+        Returns a function that converts a non null value of this field into the JSON
+        compatible value that is included in a response. It's used by the compiled
+        row encoders, which are used instead of the response serializer when many
+        rows must be listed. The returned function must therefore produce exactly the
+        same value as the `to_representation` method of the response serializer
+        field. It can be overridden to return a faster function that doesn't go
+        through the DRF serializer field machinery.
+
+        :param instance: The field instance for which to get the encoder.
+        :param serializer_field: The bound serializer field returned by the
+            `get_response_serializer_field` method.
+        :return: A function accepting the non null value of a row and returning the
+            JSON compatible value.
+        """
+
+        return serializer_field.to_representation
+
     def get_serializer_help_text(self, instance):
         """
         If some additional information in the documentation related to the field's type
@@ -860,6 +947,53 @@ class FieldType(
 
         pass
 
+    def get_sql_copy_select_expression(
+        self,
+        field: Field,
+        source_column: sql.Composable,
+        id_mapping: Dict[str, Any],
+    ) -> sql.Composable:
+        """
+        Returns the SQL expression selecting the value that must be inserted in the
+        column of the duplicated field when the rows are copied inside the database.
+        Only called if the field has a column in the table and if
+        `can_copy_rows_in_database` is True.
+
+        :param field: The original field of which the values are copied.
+        :param source_column: The column of the original field in the source table.
+        :param id_mapping: The map of exported ids to newly created ids.
+        :return: The expression selecting the value to insert. By default, the value
+            is copied as it is.
+        """
+
+        return source_column
+
+    def copy_relations_in_database(
+        self,
+        field: Field,
+        source_model: "GeneratedTableModel",
+        new_field: Field,
+        target_model: "GeneratedTableModel",
+        id_mapping: Dict[str, Any],
+        cache: Dict[str, Any],
+    ):
+        """
+        Copies the values of the field that are not stored in the table itself, like
+        the relations of a many to many field, to the duplicated field. This is called
+        after the rows of all the duplicated tables have been copied, only if
+        `can_copy_rows_in_database` is True.
+
+        :param field: The original field of which the values are copied.
+        :param source_model: The model of the table of the original field.
+        :param new_field: The newly created duplicate of the field.
+        :param target_model: The model of the table of the new field.
+        :param id_mapping: The map of exported ids to newly created ids.
+        :param cache: An in memory dictionary that is shared between all the fields
+            while copying the relations.
+        """
+
+        pass
+
     def get_export_serialized_value(
         self,
         row: "GeneratedTableModel",
@@ -1,12 +1,14 @@
+import time
 import traceback
-from typing import Optional
+from typing import List, Optional
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
 from django.db.models import QuerySet
 
 from loguru import logger
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 
 from baserow.config.celery import app
 from baserow.contrib.database.fields.registries import field_type_registry
@@ -14,6 +16,13 @@ from baserow.core.models import Workspace
 from baserow.core.telemetry.utils import add_baserow_trace_attrs, baserow_trace
 
 tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter(__name__)
+periodic_field_update_duration_histogram = meter.create_histogram(
+    "baserow.periodic_field_update_workspace_duration",
+    unit="s",
+    description="The time it took to update all the periodic fields of one "
+    "workspace.",
+)
 
 
 def filter_distinct_workspace_ids_per_fields(
@@ -34,30 +43,138 @@ def filter_distinct_workspace_ids_per_fields(
     return queryset.distinct().order_by("now")
 
 
+def get_workspace_ids_needing_periodic_update(
+    workspace_id: Optional[int] = None,
+) -> List[int]:
+    """
+    Returns the ids of the workspaces containing at least one field that needs to be
+    updated periodically. The workspaces that have not been updated for the longest
+    time come first.
+
+    :param workspace_id: Optionally only check the workspace with this id.
+    :return: The ordered list of workspace ids.
+    """
+
+    workspaces_now = {}
+    for field_type_instance in field_type_registry.get_all():
+        field_qs = field_type_instance.get_fields_needing_periodic_update()
+        if field_qs is None:
+            continue
+
+        workspace_qs = filter_distinct_workspace_ids_per_fields(field_qs, workspace_id)
+        for workspace_id_, now in workspace_qs.values_list("id", "now"):
+            workspaces_now[workspace_id_] = now
+
+    # Just like the database does, workspaces without a `now` value come last.
+    return sorted(
+        workspaces_now,
+        key=lambda id_: (workspaces_now[id_] is None, workspaces_now[id_] or 0),
+    )
+
+
+def split_workspace_ids_in_shards(
+    workspace_ids: List[int], max_shards: int
+) -> List[List[int]]:
+    """
+    Distributes the workspace ids over at most `max_shards` shards. The ids are
+    distributed in turns, so that every shard starts with the workspaces that have
+    not been updated for the longest time.
+
+    :param workspace_ids: The ordered workspace ids.
+    :param max_shards: The maximum number of shards.
+    :return: The list of shards.
+    """
+
+    shard_count = max(1, min(len(workspace_ids), max_shards))
+    return [
+        workspace_ids[index::shard_count]
+        for index in range(shard_count)
+        if workspace_ids[index::shard_count]
+    ]
+
+
+@app.task(bind=True, queue=settings.PERIODIC_FIELD_UPDATE_QUEUE_NAME)
+def run_periodic_fields_updates(
+    self, workspace_id: Optional[int] = None, update_now: bool = True
+):
+    """
+    Refreshes all the fields that need to be updated periodically for all
+    workspaces. The workspaces are split in shards and every shard is updated by a
+    separate subtask, so that the workspaces can be updated in parallel and that a
+    slow workspace can't prevent the other ones from being updated.
+    """
+
+    workspace_ids = get_workspace_ids_needing_periodic_update(workspace_id)
+    for shard in split_workspace_ids_in_shards(
+        workspace_ids, settings.PERIODIC_FIELD_UPDATE_MAX_PARALLEL_TASKS
+    ):
+        run_periodic_fields_updates_for_workspaces.delay(shard, update_now)
+
+
 @app.task(
     bind=True,
     queue=settings.PERIODIC_FIELD_UPDATE_QUEUE_NAME,
     soft_time_limit=settings.PERIODIC_FIELD_UPDATE_TIMEOUT_MINUTES * 60,
 )
-def run_periodic_fields_updates(
-    self, workspace_id: Optional[int] = None, update_now: bool = True
+def run_periodic_fields_updates_for_workspaces(
+    self, workspace_ids: List[int], update_now: bool = True
 ):
     """
-    Refreshes all the fields that need to be updated periodically for all
-    workspaces.
+    Refreshes all the fields that need to be updated periodically in the provided
+    workspaces, one workspace after the other.
     """
 
-    for field_type_instance in field_type_registry.get_all():
-        field_qs = field_type_instance.get_fields_needing_periodic_update()
-        if field_qs is None:
-            continue
+    workspaces = Workspace.objects.in_bulk(workspace_ids)
+    for workspace_id in workspace_ids:
+        if workspace_id in workspaces:
+            _run_periodic_fields_updates_per_workspace(
+                workspaces[workspace_id], update_now
+            )
 
-        workspace_qs = filter_distinct_workspace_ids_per_fields(field_qs, workspace_id)
 
-        for workspace in workspace_qs.all():
+def get_periodic_field_update_lock_key(workspace_id: int) -> str:
+    return f"periodic_field_update_workspace_{workspace_id}_lock"
+
+
+def _run_periodic_fields_updates_per_workspace(
+    workspace: Workspace, update_now: bool = True
+):
+    """
+    Updates all the periodic fields of the workspace. If the workspace is still
+    being updated by another task, because the previous run took longer than the
+    interval between two runs for example, then the workspace is skipped.
+    """
+
+    lock_key = get_periodic_field_update_lock_key(workspace.id)
+    if not cache.add(
+        lock_key, True, timeout=settings.PERIODIC_FIELD_UPDATE_TIMEOUT_MINUTES * 60
+    ):
+        logger.info(
+            "Skipping the periodic field update of workspace {workspace_id} because "
+            "it's still running.",
+            workspace_id=workspace.id,
+        )
+        return
+
+    start = time.monotonic()
+    try:
+        if update_now:
+            workspace.refresh_now()
+
+        for field_type_instance in field_type_registry.get_all():
             _run_periodic_field_type_update_per_workspace(
                 field_type_instance, workspace, update_now
             )
+    finally:
+        cache.delete(lock_key)
+        duration = time.monotonic() - start
+        periodic_field_update_duration_histogram.record(duration)
+        logger.info(
+            "Periodically updated the fields of workspace {workspace_id} in "
+            "{duration:.2f}s.",
+            workspace_id=workspace.id,
+            duration=duration,
+        )
 
 
 @baserow_trace(tracer)
@@ -69,8 +186,6 @@ def _run_periodic_field_type_update_per_workspace(
     if qs is None:
         return
 
-    if update_now:
-        workspace.refresh_now()
     add_baserow_trace_attrs(update_now=update_now, workspace_id=workspace.id)
 
     for field in qs.filter(table__database__workspace_id=workspace.id):
@@ -35,6 +35,7 @@ from baserow.core.action.registries import action_type_registry
 from baserow.core.jobs.registries import JobType
 
 from .models import FileImportJob
+from .readers import get_import_file_reader
 from .serializers import ReportSerializer
 
 BATCH_SIZE = 1024
@@ -89,17 +90,22 @@ class FileImportJobType(JobType):
         """
 
         filtered_dict = dict(**values)
-        filtered_dict.pop("data")
+        filtered_dict.pop("data", None)
+        filtered_dict.pop("file", None)
         return filtered_dict
 
     def after_job_creation(self, job, values):
         """
-        Save the data file for the newly created job.
+        Save the data file for the newly created job. This is either the raw
+        uploaded file, which is parsed when the job runs, or the already parsed data.
         """
 
-        data_file = ContentFile(
-            json.dumps(values["data"], ensure_ascii=False).encode("utf8")
-        )
+        if values.get("file") is not None:
+            data_file = values["file"]
+        else:
+            data_file = ContentFile(
+                json.dumps(values["data"], ensure_ascii=False).encode("utf8")
+            )
         job.data_file.save(None, data_file)
 
     def before_delete(self, job):
@@ -133,8 +139,42 @@ class FileImportJobType(JobType):
         creation of the table.
         """
 
-        with job.data_file.open("r") as fin:
-            data = json.load(fin)
+        if job.file_type:
+            # The raw file is streamed into the table instead of being loaded in
+            # memory at once.
+            with job.data_file.open("rb") as fin:
+                file_reader = get_import_file_reader(
+                    fin,
+                    job.file_type,
+                    first_row_header=job.first_row_header,
+                    encoding=job.encoding,
+                    column_separator=job.csv_column_separator,
+                ).scan()
+                error_report = self._import(job, progress, file_reader=file_reader)
+        else:
+            with job.data_file.open("r") as fin:
+                data = json.load(fin)
+            error_report = self._import(job, progress, data=data)
+
+        def after_commit():
+            """
+            Removes the data file to save space and save the error report.
+            """
+
+            job.refresh_from_db()
+            job.data_file.delete(save=False)
+            job.report = {"failing_rows": error_report}
+            job.save(update_fields=("report", "data_file"))
+
+        transaction.on_commit(after_commit)
+
+    def _import(self, job, progress, data=None, file_reader=None):
+        """
+        Creates the table or imports the rows in the existing table using either the
+        already parsed data or the file reader.
+
+        :return: The error report of the rows that could not be imported.
+        """
 
         if job.table is None:
             new_table, error_report = action_type_registry.get_by_type(
@@ -146,6 +186,7 @@ class FileImportJobType(JobType):
                 data=data,
                 first_row_header=job.first_row_header,
                 progress=progress,
+                file_reader=file_reader,
             )
 
             job.table = new_table
@@ -156,16 +197,7 @@ class FileImportJobType(JobType):
                 table=job.table,
                 data=data,
                 progress=progress,
+                file_reader=file_reader,
             )
 
-        def after_commit():
-            """
-            Removes the data file to save space and save the error report.
-            """
-
-            job.refresh_from_db()
-            job.data_file.delete(save=False)
-            job.report = {"failing_rows": error_report}
-            job.save(update_fields=("report", "data_file"))
-
-        transaction.on_commit(after_commit)
+        return error_report
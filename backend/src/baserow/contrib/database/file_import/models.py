@@ -52,6 +52,23 @@ class FileImportJob(JobWithUserIpAddress, JobWithWebsocketId, JobWithUndoRedoIds
     first_row_header = models.BooleanField(
         default=False, help_text="Is the first row of the provided data the header?"
     )
+    file_type = models.CharField(
+        max_length=16,
+        blank=True,
+        default="",
+        help_text="The type of the raw uploaded data file. If empty, the data file "
+        "contains the JSON array of rows that has already been parsed by the client.",
+    )
+    csv_column_separator = models.CharField(
+        max_length=1,
+        default=",",
+        help_text="The column separator of the data file if it's a CSV file.",
+    )
+    encoding = models.CharField(
+        max_length=32,
+        default="utf-8",
+        help_text="The encoding of the data file if it's a text file.",
+    )
     report = models.JSONField(
         default=default_report,
         help_text="The import error report.",
@@ -0,0 +1,376 @@
+"""
+Readers that incrementally parse a raw uploaded import file. None of them load the
+complete file in memory, the rows are parsed while they're being iterated over. Every
+reader reads the file twice: once when it's scanned to figure out the header and the
+number of columns and rows, and once more when the rows are actually imported.
+"""
+
+import codecs
+import csv
+import io
+import json
+import re
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterator, List, Optional
+from xml.etree import ElementTree
+from zipfile import BadZipFile, ZipFile
+
+from baserow.contrib.database.table.exceptions import InvalidInitialTableData
+
+FILE_TYPE_CSV = "csv"
+FILE_TYPE_XLSX = "xlsx"
+FILE_TYPE_JSON = "json"
+IMPORT_FILE_TYPES = [FILE_TYPE_CSV, FILE_TYPE_XLSX, FILE_TYPE_JSON]
+
+READ_CHUNK_SIZE = 64 * 1024
+# Prevents reading a complete invalid JSON file in memory while waiting for the end
+# of a value.
+JSON_MAX_VALUE_LENGTH = 16 * 1024 * 1024
+
+XLSX_NAMESPACE = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+XLSX_RELATIONSHIP_NAMESPACE = (
+    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+)
+XLSX_PACKAGE_RELATIONSHIP_NAMESPACE = (
+    "{http://schemas.openxmlformats.org/package/2006/relationships}"
+)
+XLSX_CELL_COLUMN_REGEX = re.compile(r"^([A-Z]+)")
+
+JSON_WHITESPACE_REGEX = re.compile(r"\s*")
+
+
+@contextmanager
+def get_text_stream(file: IO[bytes], encoding: str) -> Iterator[io.TextIOWrapper]:
+    """
+    Returns a stream decoding the provided binary file on the fly. Just like in the
+    web-frontend importers, the characters that can't be decoded are replaced
+    instead of failing the import. The newlines are not translated, because the
+    CSV reader must handle them itself to keep the line breaks inside quoted values.
+    """
+
+    if codecs.lookup(encoding).name == "utf-8":
+        # Makes sure that the byte order mark is not part of the first value.
+        encoding = "utf-8-sig"
+    text_stream = io.TextIOWrapper(
+        file, encoding=encoding, errors="replace", newline=""
+    )
+    try:
+        yield text_stream
+    finally:
+        # The wrapper would otherwise close the binary file, which is read again.
+        text_stream.detach()
+
+
+class ImportFileReader:
+    """
+    Base class of the readers. A reader must implement `read_rows`, which yields all
+    the rows of the file as lists of values, including the header row.
+    """
+
+    def __init__(
+        self, file: IO[bytes], first_row_header: bool = False, encoding: str = "utf-8"
+    ):
+        """
+        :param file: The binary file that must be read. It must be seekable.
+        :param first_row_header: Indicates whether the first row is the header.
+        :param encoding: The encoding of the file if it's a text file.
+        """
+
+        self.file = file
+        self.first_row_header = first_row_header
+        self.encoding = encoding
+        self.header: Optional[List[Any]] = None
+        self.column_count = 0
+        self.row_count = 0
+
+    def read_rows(self) -> Iterator[List[Any]]:
+        raise NotImplementedError(
+            "Each import file reader must implement the `read_rows` method."
+        )
+
+    def scan(self) -> "ImportFileReader":
+        """
+        Reads the complete file once to find the header, the highest number of
+        columns and the number of rows, without keeping the rows in memory.
+
+        :return: The reader itself so that calls can be chained.
+        """
+
+        self.header = None
+        self.column_count = 0
+        self.row_count = 0
+
+        rows = self.read_rows()
+        if self.first_row_header:
+            self.header = next(rows, None)
+            if self.header is not None:
+                self.column_count = len(self.header)
+
+        for row in rows:
+            self.row_count += 1
+            self.column_count = max(self.column_count, len(row))
+
+        return self
+
+    def iter_rows(self) -> Iterator[List[Any]]:
+        """
+        Yields the rows of the file, without the header row.
+        """
+
+        rows = self.read_rows()
+        if self.first_row_header:
+            next(rows, None)
+        yield from rows
+
+
+class CsvImportFileReader(ImportFileReader):
+    def __init__(self, *args, column_separator: str = ",", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.column_separator = column_separator
+
+    def read_rows(self) -> Iterator[List[Any]]:
+        self.file.seek(0)
+        with get_text_stream(self.file, self.encoding) as text_stream:
+            try:
+                yield from csv.reader(text_stream, delimiter=self.column_separator)
+            except csv.Error as e:
+                raise InvalidInitialTableData(f"The CSV file is not valid: {e}.")
+
+
+class XlsxImportFileReader(ImportFileReader):
+    """
+    Reads the values of the first sheet of an Office Open XML workbook. The values
+    are imported as they are stored in the file, so dates for example are imported
+    as their serial number.
+    """
+
+    def _get_first_sheet_path(self, zip_file: ZipFile) -> str:
+        workbook = ElementTree.fromstring(zip_file.read("xl/workbook.xml"))
+        sheet = workbook.find(f"{XLSX_NAMESPACE}sheets/{XLSX_NAMESPACE}sheet")
+        if sheet is None:
+            raise InvalidInitialTableData("The XLSX file doesn't contain a sheet.")
+
+        relationship_id = sheet.get(f"{XLSX_RELATIONSHIP_NAMESPACE}id")
+        relationships = ElementTree.fromstring(
+            zip_file.read("xl/_rels/workbook.xml.rels")
+        )
+        for relationship in relationships.iter(
+            f"{XLSX_PACKAGE_RELATIONSHIP_NAMESPACE}Relationship"
+        ):
+            if relationship.get("Id") == relationship_id:
+                target = relationship.get("Target")
+                if target.startswith("/"):
+                    return target[1:]
+                return f"xl/{target}"
+
+        raise InvalidInitialTableData("The XLSX file doesn't contain a sheet.")
+
+    def _get_shared_strings(self, zip_file: ZipFile) -> List[str]:
+        if "xl/sharedStrings.xml" not in zip_file.namelist():
+            return []
+
+        shared_strings = []
+        with zip_file.open("xl/sharedStrings.xml") as file:
+            for _, element in ElementTree.iterparse(file):
+                if element.tag == f"{XLSX_NAMESPACE}si":
+                    shared_strings.append(self._get_rich_text(element))
+                    element.clear()
+        return shared_strings
+
+    def _get_rich_text(self, element: ElementTree.Element) -> str:
+        texts = element.findall(f"{XLSX_NAMESPACE}t") + element.findall(
+            f"{XLSX_NAMESPACE}r/{XLSX_NAMESPACE}t"
+        )
+        return "".join(text.text or "" for text in texts)
+
+    def _get_column_index(self, cell_reference: str) -> int:
+        letters = XLSX_CELL_COLUMN_REGEX.match(cell_reference).group(1)
+        index = 0
+        for letter in letters:
+            index = index * 26 + ord(letter) - ord("A") + 1
+        return index - 1
+
+    def _get_cell_value(
+        self, cell: ElementTree.Element, shared_strings: List[str]
+    ) -> str:
+        cell_type = cell.get("t", "n")
+        if cell_type == "inlineStr":
+            inline_string = cell.find(f"{XLSX_NAMESPACE}is")
+            return "" if inline_string is None else self._get_rich_text(inline_string)
+
+        value = cell.find(f"{XLSX_NAMESPACE}v")
+        if value is None or value.text is None:
+            return ""
+        if cell_type == "s":
+            return shared_strings[int(value.text)]
+        return value.text
+
+    def read_rows(self) -> Iterator[List[Any]]:
+        self.file.seek(0)
+        try:
+            zip_file = ZipFile(self.file)
+            sheet_path = self._get_first_sheet_path(zip_file)
+            shared_strings = self._get_shared_strings(zip_file)
+            with zip_file.open(sheet_path) as sheet:
+                sheet_data = None
+                for event, element in ElementTree.iterparse(
+                    sheet, events=("start", "end")
+                ):
+                    if event == "start":
+                        if element.tag == f"{XLSX_NAMESPACE}sheetData":
+                            sheet_data = element
+                        continue
+                    if element.tag != f"{XLSX_NAMESPACE}row":
+                        continue
+
+                    values = []
+                    for cell in element.iter(f"{XLSX_NAMESPACE}c"):
+                        reference = cell.get("r")
+                        if reference:
+                            column_index = self._get_column_index(reference)
+                            values.extend([""] * (column_index - len(values)))
+                        values.append(self._get_cell_value(cell, shared_strings))
+                    yield values
+
+                    # Free the already parsed rows to keep the memory usage bounded.
+                    if sheet_data is not None:
+                        sheet_data.clear()
+        except (BadZipFile, KeyError, ElementTree.ParseError) as e:
+            raise InvalidInitialTableData(f"The XLSX file is not valid: {e}.")
+
+
+class JsonImportFileReader(ImportFileReader):
+    """
+    Reads a JSON file containing an array of objects or an array of arrays. If the
+    array contains objects, the header is made of all the keys of the objects.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.keys: Optional[List[str]] = None
+
+    def read_values(self) -> Iterator[Any]:
+        """
+        Incrementally decodes the values of the top level array of the file.
+        """
+
+        self.file.seek(0)
+        with get_text_stream(self.file, self.encoding) as text_stream:
+            yield from self._decode_values(text_stream)
+
+    def _decode_values(self, text_stream: io.TextIOWrapper) -> Iterator[Any]:
+        decoder = json.JSONDecoder()
+        buffer = ""
+        position = 0
+        end_of_file = False
+        expected = "start"
+
+        while True:
+            position = JSON_WHITESPACE_REGEX.match(buffer, position).end()
+            need_more_data = position >= len(buffer)
+
+            if not need_more_data:
+                character = buffer[position]
+                if expected == "start":
+                    if character != "[":
+                        raise InvalidInitialTableData(
+                            "The JSON file must contain an array."
+                        )
+                    position += 1
+                    expected = "first_value"
+                    continue
+                elif expected in ["first_value", "separator"] and character == "]":
+                    return
+                elif expected == "separator":
+                    if character != ",":
+                        raise InvalidInitialTableData("The JSON file is not valid.")
+                    position += 1
+                    expected = "value"
+                    continue
+
+                try:
+                    value, end = decoder.raw_decode(buffer, position)
+                    # A number at the end of the buffer could continue in the
+                    # next chunk, so the value is only complete if it isn't.
+                    need_more_data = end >= len(buffer) and not end_of_file
+                except json.JSONDecodeError:
+                    need_more_data = True
+
+                if not need_more_data:
+                    yield value
+                    position = end
+                    expected = "separator"
+                    continue
+
+            if end_of_file or len(buffer) - position > JSON_MAX_VALUE_LENGTH:
+                raise InvalidInitialTableData("The JSON file is not valid.")
+
+            chunk = text_stream.read(READ_CHUNK_SIZE)
+            end_of_file = chunk == ""
+            buffer = buffer[position:] + chunk
+            position = 0
+
+    def scan(self) -> "ImportFileReader":
+        self.keys = None
+        values = self.read_values()
+        first_value = next(values, None)
+        if not isinstance(first_value, dict):
+            return super().scan()
+
+        keys: Dict[str, None] = dict.fromkeys(first_value.keys())
+        self.row_count = 1
+        for value in values:
+            if not isinstance(value, dict):
+                raise InvalidInitialTableData(
+                    "All the values of the JSON array must be objects."
+                )
+            keys.update(dict.fromkeys(value.keys()))
+            self.row_count += 1
+
+        self.keys = list(keys.keys())
+        self.header = list(self.keys)
+        self.column_count = len(self.keys)
+        return self
+
+    def read_rows(self) -> Iterator[List[Any]]:
+        for value in self.read_values():
+            if isinstance(value, list):
+                yield value
+            elif isinstance(value, dict) and self.keys is not None:
+                yield [value.get(key, "") for key in self.keys]
+            else:
+                raise InvalidInitialTableData(
+                    "All the values of the JSON array must be objects or arrays."
+                )
+
+    def iter_rows(self) -> Iterator[List[Any]]:
+        if self.keys is not None:
+            # The header is made of the object keys, so all the rows contain data.
+            return self.read_rows()
+        return super().iter_rows()
+
+
+import_file_reader_classes = {
+    FILE_TYPE_CSV: CsvImportFileReader,
+    FILE_TYPE_XLSX: XlsxImportFileReader,
+    FILE_TYPE_JSON: JsonImportFileReader,
+}
+
+
+def get_import_file_reader(
+    file: IO[bytes], file_type: str, **kwargs
+) -> ImportFileReader:
+    """
+    Returns the reader of the provided file type.
+
+    :param file: The binary file that must be read.
+    :param file_type: One of the `IMPORT_FILE_TYPES`.
+    :param kwargs: The extra arguments passed to the reader like `first_row_header`,
+        `encoding` or `column_separator` for CSV files.
+    :return: The reader instance.
+    """
+
+    reader_class = import_file_reader_classes[file_type]
+    if reader_class is not CsvImportFileReader:
+        kwargs.pop("column_separator", None)
+    return reader_class(file, **kwargs)
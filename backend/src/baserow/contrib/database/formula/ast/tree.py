@@ -405,6 +405,11 @@ class BaserowFunctionDefinition(Instance, abc.ABC):
     is_wrapper = False
     try_coerce_nullable_args_to_not_null: bool = True
 
+    def __deepcopy__(self, memo):
+        # The function definitions are the registered instances and are shared by
+        # all the copies of an expression.
+        return self
+
     @property
     @abc.abstractmethod
     def type(self) -> str:
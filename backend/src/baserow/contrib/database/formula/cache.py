@@ -0,0 +1,205 @@
+"""
+Parsing a formula with the Antlr runtime and converting it into a BaserowExpression
+is slow, while the same formulas are parsed over and over again every time the formula
+fields are loaded from the database. That's why every process keeps a size bounded
+LRU cache of the parsed expressions, keyed by the formula and everything else that
+influences the resulting expression.
+
+The expressions are mutable because they are typed in place, so the cached
+expressions are never handed out directly. Every lookup returns a copy instead, which
+is still a lot faster than parsing the formula again.
+"""
+import copy
+import threading
+import typing
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
+
+from django.conf import settings
+
+from opentelemetry import metrics
+
+from baserow.contrib.database.formula.ast.tree import BaserowExpression
+from baserow.contrib.database.formula.exceptions import BaserowFormulaException
+from baserow.contrib.database.formula.types.formula_types import (
+    BASEROW_FORMULA_TYPE_ALLOWED_FIELDS,
+)
+
+if typing.TYPE_CHECKING:
+    from baserow.contrib.database.fields.models import FormulaField
+
+meter = metrics.get_meter(__name__)
+formula_expression_cache_hits_counter = meter.create_counter(
+    "baserow.formula_expression_cache_hits",
+    unit="1",
+    description="The number of formula expressions served from the in-process LRU "
+    "cache.",
+)
+formula_expression_cache_misses_counter = meter.create_counter(
+    "baserow.formula_expression_cache_misses",
+    unit="1",
+    description="The number of formula expressions that were not found in the "
+    "in-process LRU cache and had to be parsed.",
+)
+
+
+class FormulaExpressionLRUCache:
+    """
+    A thread safe and size bounded least recently used cache of parsed formula
+    expressions.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, BaserowExpression]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The ratio of lookups that were served from the cache.
+        """
+
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: Tuple) -> Optional[BaserowExpression]:
+        with self._lock:
+            expression = self._entries.get(key, None)
+            if expression is not None:
+                self._entries.move_to_end(key)
+            return expression
+
+    def set(self, key: Tuple, expression: BaserowExpression):
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = expression
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_parse(
+        self, key: Tuple, parse: Callable[[], BaserowExpression]
+    ) -> BaserowExpression:
+        """
+        Returns a copy of the cached expression, or parses, caches and returns a
+        copy of the expression if it's not in the cache yet. Formulas that can't be
+        parsed aren't cached, so the exception is raised on every call.
+
+        :param key: The key identifying the expression in the cache.
+        :param parse: A function that parses the expression if it's not cached.
+        :return: An expression that's safe to be changed by the caller.
+        """
+
+        expression = self.get(key)
+        if expression is not None:
+            self.record_hit()
+            try:
+                return copy.deepcopy(expression)
+            except RecursionError:
+                # Copying very deeply nested expressions can exceed the recursion
+                # limit, in that case they're parsed again instead.
+                return parse()
+
+        self.record_miss()
+        expression = parse()
+        self.set(key, expression)
+        try:
+            return copy.deepcopy(expression)
+        except RecursionError:
+            self.delete(key)
+            return parse()
+
+    def delete(self, key: Tuple):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def record_hit(self):
+        self.hits += 1
+        formula_expression_cache_hits_counter.add(1)
+
+    def record_miss(self):
+        self.misses += 1
+        formula_expression_cache_misses_counter.add(1)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+formula_expression_cache = FormulaExpressionLRUCache(
+    settings.BASEROW_FORMULA_EXPRESSION_CACHE_SIZE
+)
+
+
+def untyped_expression_cache_key(formula: str) -> Tuple[Hashable, ...]:
+    """
+    Returns the cache key of the untyped expression of the provided formula.
+    """
+
+    return ("untyped", formula)
+
+
+def typed_internal_expression_cache_key(
+    formula_field: "FormulaField",
+) -> Tuple[Hashable, ...]:
+    """
+    Returns the cache key of the typed internal expression of the formula field. The
+    references to the other fields have already been resolved in the internal
+    formula, so the types of the dependencies are captured by the persisted type of
+    the formula field.
+    """
+
+    return (
+        "typed",
+        formula_field.internal_formula,
+        formula_field.version,
+        formula_field.formula_type,
+        tuple(
+            getattr(formula_field, field_name)
+            for field_name in sorted(BASEROW_FORMULA_TYPE_ALLOWED_FIELDS)
+        ),
+    )
+
+
+def warm_up_formula_expression_cache(max_tables: int) -> int:
+    """
+    Parses the formula fields of the tables with the most rows and stores their
+    expressions in the cache, so that the first requests of a freshly started
+    process don't have to parse them.
+
+    :param max_tables: The maximum number of tables to warm up the cache for.
+    :return: The number of formula fields whose expressions have been cached.
+    """
+
+    from baserow.contrib.database.fields.models import FormulaField
+    from baserow.contrib.database.table.models import Table
+
+    if max_tables <= 0 or formula_expression_cache.max_size <= 0:
+        return 0
+
+    table_ids = (
+        Table.objects.filter(row_count__isnull=False)
+        .order_by("-row_count")
+        .values_list("id", flat=True)[:max_tables]
+    )
+    formula_fields = FormulaField.objects.filter(table_id__in=list(table_ids))
+
+    count = 0
+    for formula_field in formula_fields[: formula_expression_cache.max_size // 2]:
+        try:
+            formula_field.cached_untyped_expression
+            formula_field.cached_typed_internal_expression
+        except BaserowFormulaException:
+            continue
+        count += 1
+    return count
@@ -1,5 +1,14 @@
 from django.contrib.postgres.aggregates.mixins import OrderableAggMixin
-from django.db.models import Aggregate, Expression, F, Field, Transform, Value
+from django.db.models import (
+    Aggregate,
+    Expression,
+    F,
+    Field,
+    Subquery,
+    TextField,
+    Transform,
+    Value,
+)
 
 
 # noinspection PyAbstractClass
@@ -123,3 +132,74 @@ class FileNameContainsExpr(Expression):
             "value": sql_value,
         }
         return template % data, params_value
+
+
+class FileNamesExpr(Transform):
+    """
+    Joins the visible names of all the files in a file field JSONB array together
+    into a single space separated text value.
+    """
+
+    # fmt: off
+    template = (
+        """
+        (
+            SELECT STRING_AGG(attached_files ->> 'visible_name', ' ')
+            FROM JSONB_ARRAY_ELEMENTS(%(expressions)s) as attached_files
+        )
+        """
+    )
+    # fmt: on
+    arity = 1
+    output_field = TextField()
+
+
+class ArrayValuesExpr(Transform):
+    """
+    Joins the values of all the items in a lookup or array formula JSONB array
+    together into a single space separated text value. Items having an object as
+    value, like select options or files, contribute their value or visible name.
+    """
+
+    # fmt: off
+    template = (
+        """
+        (
+            SELECT STRING_AGG(
+                CASE JSONB_TYPEOF(array_items -> 'value')
+                    WHEN 'object' THEN COALESCE(
+                        array_items -> 'value' ->> 'value',
+                        array_items -> 'value' ->> 'visible_name'
+                    )
+                    ELSE array_items ->> 'value'
+                END,
+                ' '
+            )
+            FROM JSONB_ARRAY_ELEMENTS(%(expressions)s) as array_items
+        )
+        """
+    )
+    # fmt: on
+    arity = 1
+    output_field = TextField()
+
+
+class JoinedSubqueryValues(Subquery):
+    """
+    Joins the `value` column of all the rows selected by the subquery together into
+    a single space separated text value.
+    """
+
+    # fmt: off
+    template = (
+        """
+        (
+            SELECT STRING_AGG(subquery_values.value, ' ')
+            FROM (%(subquery)s) as subquery_values
+        )
+        """
+    )
+    # fmt: on
+
+    def __init__(self, queryset, **extra):
+        super().__init__(queryset, output_field=TextField(), **extra)
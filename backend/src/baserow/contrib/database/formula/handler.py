@@ -13,6 +13,11 @@ from baserow.contrib.database.formula.ast.tree import (
     BaserowFieldReference,
     BaserowFunctionDefinition,
 )
+from baserow.contrib.database.formula.cache import (
+    formula_expression_cache,
+    typed_internal_expression_cache_key,
+    untyped_expression_cache_key,
+)
 from baserow.contrib.database.formula.expression_generator.generator import (
     baserow_expression_to_insert_django_expression,
     baserow_expression_to_single_row_update_django_expression,
@@ -260,11 +265,17 @@ class FormulaHandler(metaclass=baserow_trace_methods(tracer)):
         objects. This form is much easier to inspect, transform and perform calculations
         on compared to the raw string.
 
+        The parsed expressions are cached in the process, so that the same formula
+        doesn't have to be parsed again.
+
         :param formula_string: A string containing a formula in the Baserow Formula
             expression language.
         """
 
-        return raw_formula_to_untyped_expression(formula_string)
+        return formula_expression_cache.get_or_parse(
+            untyped_expression_cache_key(formula_string),
+            lambda: raw_formula_to_untyped_expression(formula_string),
+        )
 
     @classmethod
     def get_formula_type_from_field(cls, formula_field) -> BaserowFormulaType:
@@ -314,10 +325,15 @@ class FormulaHandler(metaclass=baserow_trace_methods(tracer)):
         :return: A typed internal Baserow Expression.
         """
 
-        untyped_internal_expr = FormulaHandler.raw_formula_to_untyped_expression(
-            formula_field.internal_formula
+        def parse():
+            untyped_internal_expr = raw_formula_to_untyped_expression(
+                formula_field.internal_formula
+            )
+            return untyped_internal_expr.with_type(formula_field.cached_formula_type)
+
+        return formula_expression_cache.get_or_parse(
+            typed_internal_expression_cache_key(formula_field), parse
         )
-        return untyped_internal_expr.with_type(formula_field.cached_formula_type)
 
     @classmethod
     def recalculate_formula_field_cached_properties(cls, formula_field, field_cache):
@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.db import connections
+
+from celery.signals import worker_init
+from loguru import logger
+
+from baserow.contrib.database.formula.cache import warm_up_formula_expression_cache
+
+
+@worker_init.connect
+def warm_up_formula_expression_cache_on_worker_init(**kwargs):
+    """
+    Warms up the formula expression cache in the main process of a worker, before
+    the child processes are forked, so that they all start with the cached
+    expressions.
+    """
+
+    try:
+        count = warm_up_formula_expression_cache(
+            settings.BASEROW_FORMULA_EXPRESSION_CACHE_WARM_UP_TABLES
+        )
+        logger.info(f"Warmed up the formula expression cache with {count} fields.")
+    except Exception as e:
+        logger.warning(f"Failed to warm up the formula expression cache: {e}")
+    finally:
+        # The forked child processes must not share the database connections.
+        connections.close_all()
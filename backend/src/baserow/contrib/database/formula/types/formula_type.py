@@ -1,5 +1,5 @@
 import abc
-from typing import TYPE_CHECKING, List, Type, TypeVar
+from typing import TYPE_CHECKING, List, Optional, Type, TypeVar
 
 from django.db.models import Expression, Value
 from django.utils.functional import classproperty
@@ -254,6 +254,15 @@ class BaserowFormulaType(abc.ABC):
         field_instance = baserow_field_type.from_baserow_formula_type(self)
         return field_instance, baserow_field_type
 
+    def get_search_expression(self, field, queryset) -> Optional[Expression]:
+        """
+        Only called for formula types which return themselves from
+        `get_baserow_field_instance_and_type`, see
+        `FieldType.get_search_expression`.
+        """
+
+        return None
+
     def should_recreate_when_old_type_was(self, old_type: "BaserowFormulaType") -> bool:
         """
         :param old_type: The previous type of a formula field.
@@ -3,7 +3,7 @@ from decimal import Decimal
 from typing import Any, List, Optional, Type, Union
 
 from django.db import models
-from django.db.models import JSONField, Q, Value
+from django.db.models import Expression, F, JSONField, Q, Value
 from django.utils import timezone
 
 from dateutil import parser
@@ -19,6 +19,9 @@ from baserow.contrib.database.formula.ast.tree import (
     BaserowIntegerLiteral,
     BaserowStringLiteral,
 )
+from baserow.contrib.database.formula.expression_generator.django_expressions import (
+    ArrayValuesExpr,
+)
 from baserow.contrib.database.formula.registries import formula_function_registry
 from baserow.contrib.database.formula.types.exceptions import UnknownFormulaType
 from baserow.contrib.database.formula.types.formula_type import (
@@ -158,6 +161,9 @@ class BaserowFormulaLinkType(BaserowFormulaTextType):
         else:
             return ""
 
+    def get_search_expression(self, field, queryset) -> Expression:
+        return F(f"{field.db_column}__label")
+
     def contains_query(self, field_name, value, model_field, field):
         value = value.strip()
         # If an empty value has been provided we do not want to filter at all.
@@ -675,6 +681,9 @@ class BaserowFormulaArrayType(BaserowFormulaValidType):
         else:
             return list_to_comma_separated_string(result)
 
+    def get_search_expression(self, field, queryset) -> Expression:
+        return ArrayValuesExpr(F(field.db_column))
+
     def contains_query(self, field_name, value, model_field, field):
         return Q()
 
@@ -758,6 +767,9 @@ class BaserowFormulaSingleSelectType(BaserowFormulaValidType):
             return value if rich_value else ""
         return value["value"]
 
+    def get_search_expression(self, field, queryset) -> Expression:
+        return F(f"{field.db_column}__value")
+
     def contains_query(self, field_name, value, model_field, field):
         value = value.strip()
         # If an empty value has been provided we do not want to filter at all.
@@ -0,0 +1,35 @@
+# The ways in which a field can be used by the filters and sorts of the views and
+# API calls, which determine the type of index that speeds it up.
+INDEX_USAGE_FILTER = "filter"
+INDEX_USAGE_CONTAINS = "contains"
+INDEX_USAGE_SORT = "sort"
+INDEX_USAGES = [INDEX_USAGE_FILTER, INDEX_USAGE_CONTAINS, INDEX_USAGE_SORT]
+
+INDEX_TYPE_BTREE = "btree"
+INDEX_TYPE_TRIGRAM = "trigram"
+INDEX_TYPE_CHOICES = [
+    (INDEX_TYPE_BTREE, INDEX_TYPE_BTREE),
+    (INDEX_TYPE_TRIGRAM, INDEX_TYPE_TRIGRAM),
+]
+
+INDEX_DECISION_CREATED = "created"
+INDEX_DECISION_KEPT = "kept"
+INDEX_DECISION_DROPPED = "dropped"
+INDEX_DECISION_NOT_NEEDED = "not_needed"
+INDEX_DECISION_OVER_BUDGET = "over_budget"
+INDEX_DECISION_UNAVAILABLE = "unavailable"
+INDEX_DECISION_FAILED = "failed"
+INDEX_DECISION_CHOICES = [
+    (INDEX_DECISION_CREATED, INDEX_DECISION_CREATED),
+    (INDEX_DECISION_KEPT, INDEX_DECISION_KEPT),
+    (INDEX_DECISION_DROPPED, INDEX_DECISION_DROPPED),
+    (INDEX_DECISION_NOT_NEEDED, INDEX_DECISION_NOT_NEEDED),
+    (INDEX_DECISION_OVER_BUDGET, INDEX_DECISION_OVER_BUDGET),
+    (INDEX_DECISION_UNAVAILABLE, INDEX_DECISION_UNAVAILABLE),
+    (INDEX_DECISION_FAILED, INDEX_DECISION_FAILED),
+]
+
+# Every time the advisor runs, the usage score of the existing advices is multiplied
+# by this factor before the new usage is added, so that the indexes follow the
+# recent usage.
+USAGE_SCORE_DECAY = 0.5
@@ -0,0 +1,381 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.db.models import Q, QuerySet
+
+from loguru import logger
+from psycopg2 import sql
+
+from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.table.models import Table
+from baserow.core.db import specific_iterator
+
+from .constants import (
+    INDEX_DECISION_CREATED,
+    INDEX_DECISION_DROPPED,
+    INDEX_DECISION_FAILED,
+    INDEX_DECISION_KEPT,
+    INDEX_DECISION_NOT_NEEDED,
+    INDEX_DECISION_OVER_BUDGET,
+    INDEX_DECISION_UNAVAILABLE,
+    INDEX_TYPE_BTREE,
+    INDEX_TYPE_TRIGRAM,
+    INDEX_USAGES,
+    USAGE_SCORE_DECAY,
+)
+from .models import FieldIndexAdvice
+from .usage import pop_field_index_usage
+
+# Advices of indexes that don't exist and whose usage score has decayed below this
+# value are removed.
+MIN_USAGE_SCORE_TO_KEEP_ADVICE = 0.1
+
+
+class IndexAdvisorHandler:
+    """
+    Creates and drops indexes on the columns of the generated tables based on how
+    often the fields are filtered and sorted by the views and API calls. The usage is
+    counted in the cache by `record_field_index_usage` and is periodically turned
+    into a decaying usage score per field and index type. The indexes with the
+    highest scores are created on tables that are large enough, within the per table
+    budget, and the indexes that are not used enough anymore are dropped again.
+    """
+
+    def get_report(self, table_ids: Optional[Iterable[int]] = None) -> QuerySet:
+        """
+        Returns the advices, including what was decided the last time the advisor
+        ran, optionally limited to the provided tables.
+
+        :param table_ids: If provided, only the advices of these tables are returned.
+        :return: The queryset of the advices.
+        """
+
+        queryset = FieldIndexAdvice.objects.select_related("table", "field")
+        if table_ids is not None:
+            queryset = queryset.filter(table_id__in=list(table_ids))
+        return queryset
+
+    def advise_tables(self, dry_run: bool = False) -> List[FieldIndexAdvice]:
+        """
+        Runs the advisor for all the tables that are large enough to benefit from
+        indexes, and for the tables that have indexes created by the advisor.
+
+        :param dry_run: If True, nothing is changed and the returned advices contain
+            what would have been decided.
+        :return: The advices of all the tables.
+        """
+
+        tables = Table.objects.filter(
+            Q(row_count__gte=settings.BASEROW_INDEX_ADVISOR_MIN_ROWS)
+            | Q(index_advices__index_created=True)
+        ).distinct()
+
+        advices = []
+        for table in tables:
+            try:
+                advices.extend(self.advise_table(table, dry_run=dry_run))
+            except DatabaseError as e:
+                logger.warning(f"Failed to advise the indexes of table {table.id}: {e}")
+        return advices
+
+    def advise_table(
+        self, table: Table, dry_run: bool = False
+    ) -> List[FieldIndexAdvice]:
+        """
+        Updates the usage scores of the indexes of the table with the usage recorded
+        since the last run and creates or drops the indexes accordingly. Indexes are
+        created concurrently, unless this is called inside a transaction.
+
+        :param table: The table to advise the indexes of.
+        :param dry_run: If True, nothing is changed and the returned advices contain
+            what would have been decided.
+        :return: The advices of the table ordered by usage score.
+        """
+
+        fields = {
+            field.id: field
+            for field in specific_iterator(Field.objects.filter(table=table))
+        }
+        advices: Dict[Tuple[int, str], FieldIndexAdvice] = {
+            (advice.field_id, advice.index_type): advice
+            for advice in FieldIndexAdvice.objects.filter(table=table).select_related(
+                "field"
+            )
+        }
+
+        for advice in advices.values():
+            advice.usage_score *= USAGE_SCORE_DECAY
+
+        usage_counts = pop_field_index_usage(fields.keys(), peek=dry_run)
+        for (field_id, usage), count in usage_counts.items():
+            field = fields[field_id]
+            field_type = field_type_registry.get_by_model(field)
+            index_type = field_type.get_index_type(field, usage)
+            if index_type is None:
+                continue
+            key = (field_id, index_type)
+            if key not in advices:
+                advices[key] = FieldIndexAdvice(
+                    table=table, field=field, index_type=index_type
+                )
+            advices[key].usage_score += count
+
+        existing_indexes = self._get_existing_index_names(table)
+        for advice in advices.values():
+            advice.index_created = advice.get_index_name() in existing_indexes
+
+        ranked_advices = sorted(
+            advices.values(), key=lambda advice: advice.usage_score, reverse=True
+        )
+        self._decide(table, fields, ranked_advices, dry_run)
+
+        if dry_run:
+            return ranked_advices
+
+        for advice in ranked_advices:
+            self._apply(table, advice)
+            if (
+                not advice.index_created
+                and advice.usage_score < MIN_USAGE_SCORE_TO_KEEP_ADVICE
+            ):
+                if advice.id is not None:
+                    advice.delete()
+            else:
+                advice.save()
+
+        return [advice for advice in ranked_advices if advice.id is not None]
+
+    def drop_outdated_field_indexes(self, field: Field, old_field: Field) -> int:
+        """
+        Drops the indexes that the advisor created on the column of the updated field,
+        and removes their advices, if the field type has changed or if the field
+        doesn't benefit from that type of index anymore. The usage of the old field
+        type doesn't say anything about how the new one is going to be used, and an
+        index on the converted column would otherwise be kept until the advisor runs
+        again.
+
+        :param field: The updated field.
+        :param old_field: The field like it was before the update.
+        :return: The number of removed advices.
+        """
+
+        advices = FieldIndexAdvice.objects.filter(field_id=field.id)
+        if field_type_registry.get_by_model(field) == field_type_registry.get_by_model(
+            old_field
+        ):
+            advices = advices.exclude(index_type__in=self._get_index_types(field))
+
+        removed_advice_ids = []
+        for advice in advices:
+            if advice.index_created:
+                try:
+                    self._drop_index(advice.get_index_name())
+                except DatabaseError as e:
+                    # The advice is kept, so that the next run of the advisor tries to
+                    # drop the index again.
+                    logger.warning(
+                        f"Failed to drop the index {advice.get_index_name()}: {e}"
+                    )
+                    continue
+            removed_advice_ids.append(advice.id)
+
+        FieldIndexAdvice.objects.filter(id__in=removed_advice_ids).delete()
+        return len(removed_advice_ids)
+
+    def _decide(
+        self,
+        table: Table,
+        fields: Dict[int, Field],
+        ranked_advices: List[FieldIndexAdvice],
+        dry_run: bool,
+    ):
+        """
+        Sets the decision and reason of every advice, without changing anything in
+        the database yet. An index is wanted if it's used enough and if it fits in the
+        budget of the table. Existing indexes are kept as long as they're used at
+        least half as much as needed to create them, so that they're not constantly
+        created and dropped.
+        """
+
+        row_count = self._get_row_count(table)
+        min_rows = settings.BASEROW_INDEX_ADVISOR_MIN_ROWS
+        min_usage = settings.BASEROW_INDEX_ADVISOR_MIN_USAGE
+        budget = settings.BASEROW_INDEX_ADVISOR_MAX_INDEXES_PER_TABLE
+        trigram_available = None
+
+        for advice in ranked_advices:
+            field = fields.get(advice.field_id, None)
+            required_score = min_usage / 2 if advice.index_created else min_usage
+            decision, reason = None, ""
+
+            if field is None or advice.index_type not in self._get_index_types(field):
+                reason = "The field doesn't benefit from this type of index."
+            elif row_count < min_rows:
+                reason = f"The table has fewer than {min_rows} rows."
+            elif advice.usage_score < required_score:
+                reason = "The field isn't used enough by filters or sorts."
+            elif budget <= 0:
+                decision = INDEX_DECISION_OVER_BUDGET
+                reason = "The index budget of the table has been used by indexes that "
+                reason += "are used more."
+            else:
+                if (
+                    advice.index_type == INDEX_TYPE_TRIGRAM
+                    and trigram_available is None
+                ):
+                    trigram_available = self._is_trigram_available(install=not dry_run)
+                if advice.index_type == INDEX_TYPE_TRIGRAM and not trigram_available:
+                    decision = INDEX_DECISION_UNAVAILABLE
+                    reason = "The pg_trgm extension is not available."
+                else:
+                    budget -= 1
+                    decision = (
+                        INDEX_DECISION_KEPT
+                        if advice.index_created
+                        else INDEX_DECISION_CREATED
+                    )
+                    reason = f"The field has a usage score of {advice.usage_score:.1f}."
+
+            if decision is None:
+                decision = (
+                    INDEX_DECISION_DROPPED
+                    if advice.index_created
+                    else INDEX_DECISION_NOT_NEEDED
+                )
+            elif advice.index_created and decision not in (
+                INDEX_DECISION_KEPT,
+                INDEX_DECISION_CREATED,
+            ):
+                decision = INDEX_DECISION_DROPPED
+
+            advice.decision = decision
+            advice.reason = reason
+
+    def _apply(self, table: Table, advice: FieldIndexAdvice):
+        """
+        Creates or drops the index of the advice according to its decision.
+        """
+
+        try:
+            if advice.decision == INDEX_DECISION_CREATED:
+                self._create_index(table, advice)
+                advice.index_created = True
+            elif advice.decision == INDEX_DECISION_DROPPED:
+                self._drop_index(advice.get_index_name())
+                advice.index_created = False
+        except DatabaseError as e:
+            logger.warning(f"Failed to change the index {advice.get_index_name()}: {e}")
+            advice.decision = INDEX_DECISION_FAILED
+            advice.reason = str(e)
+            # A failed concurrent index creation leaves an invalid index behind.
+            try:
+                self._drop_index(advice.get_index_name())
+                advice.index_created = False
+            except DatabaseError:
+                pass
+
+    def _get_index_types(self, field: Field) -> Set[str]:
+        field_type = field_type_registry.get_by_model(field)
+        return {field_type.get_index_type(field, usage) for usage in INDEX_USAGES}
+
+    def _get_row_count(self, table: Table) -> int:
+        """
+        Returns the row count of the table that is periodically counted, or the
+        estimation of the database if it hasn't been counted yet.
+        """
+
+        if table.row_count is not None:
+            return table.row_count
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                [table.get_database_table_name()],
+            )
+            result = cursor.fetchone()
+        return max(result[0], 0) if result else 0
+
+    def _get_existing_index_names(self, table: Table) -> Set[str]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes WHERE tablename = %s",
+                [table.get_database_table_name()],
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+    def _is_trigram_available(self, install: bool = True) -> bool:
+        """
+        Checks if the pg_trgm extension is installed, and optionally tries to install
+        it if not. Installing it requires the privileges to create extensions.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            if cursor.fetchone() is not None:
+                return True
+
+        if not install:
+            return False
+
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        except DatabaseError:
+            return False
+        return True
+
+    def _create_index(self, table: Table, advice: FieldIndexAdvice):
+        """
+        Creates the index of the advice. A btree index also contains the `order` and
+        `id` columns, so that it can be used for the default sort order of the rows.
+        Nulls come first, just like when the rows are sorted ascending by the field.
+        A trigram index is created on the same expression the `icontains` lookup
+        uses, so that it's used to find the rows containing a text.
+        """
+
+        table_name = sql.Identifier(table.get_database_table_name())
+        column_name = sql.Identifier(advice.field.db_column)
+        if advice.index_type == INDEX_TYPE_BTREE:
+            definition = sql.SQL(
+                '{table} ({column} NULLS FIRST, "order", "id")'
+            ).format(table=table_name, column=column_name)
+        else:
+            definition = sql.SQL(
+                "{table} USING gin (UPPER({column}::text) gin_trgm_ops)"
+            ).format(table=table_name, column=column_name)
+
+        self._execute_index_statement(
+            sql.SQL(
+                "CREATE INDEX {concurrently} IF NOT EXISTS {index} ON {definition}"
+            ),
+            advice.get_index_name(),
+            definition=definition,
+        )
+
+    def _drop_index(self, index_name: str):
+        self._execute_index_statement(
+            sql.SQL("DROP INDEX {concurrently} IF EXISTS {index}"), index_name
+        )
+
+    def _execute_index_statement(self, statement: sql.SQL, index_name: str, **kwargs):
+        """
+        Executes the index statement concurrently, so that the table isn't locked
+        while the index is built, unless that's not possible because it's executed
+        inside a transaction. In that case a savepoint makes sure that a failure
+        doesn't break the transaction.
+        """
+
+        in_transaction = connection.in_atomic_block
+        query = statement.format(
+            concurrently=sql.SQL("" if in_transaction else "CONCURRENTLY"),
+            index=sql.Identifier(index_name),
+            **kwargs,
+        )
+        if in_transaction:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(query)
+        else:
+            with connection.cursor() as cursor:
+                cursor.execute(query)
@@ -0,0 +1,49 @@
+from django.db import models
+
+from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.table.models import Table
+from baserow.core.mixins import CreatedAndUpdatedOnMixin
+
+from .constants import (
+    INDEX_DECISION_CHOICES,
+    INDEX_DECISION_NOT_NEEDED,
+    INDEX_TYPE_CHOICES,
+)
+
+
+class FieldIndexAdvice(CreatedAndUpdatedOnMixin, models.Model):
+    """
+    Keeps track of how much an index of a certain type on the column of a field
+    would be used, and what the index advisor decided about it the last time it
+    ran.
+    """
+
+    table = models.ForeignKey(
+        Table, on_delete=models.CASCADE, related_name="index_advices"
+    )
+    field = models.ForeignKey(
+        Field, on_delete=models.CASCADE, related_name="index_advices"
+    )
+    index_type = models.CharField(max_length=32, choices=INDEX_TYPE_CHOICES)
+    usage_score = models.FloatField(
+        default=0,
+        help_text="The decaying number of times the field has been used by filters "
+        "or sorts that can be sped up by the index.",
+    )
+    index_created = models.BooleanField(
+        default=False, help_text="Indicates whether the index currently exists."
+    )
+    decision = models.CharField(
+        max_length=32,
+        choices=INDEX_DECISION_CHOICES,
+        default=INDEX_DECISION_NOT_NEEDED,
+        help_text="What the index advisor decided the last time it ran.",
+    )
+    reason = models.TextField(blank=True, default="")
+
+    class Meta:
+        unique_together = ("field", "index_type")
+        ordering = ("table_id", "-usage_score", "id")
+
+    def get_index_name(self) -> str:
+        return f"tbl_{self.table_id}_fld_{self.field_id}_{self.index_type}_idx"
@@ -0,0 +1,19 @@
+from django.dispatch import receiver
+
+from baserow.contrib.database.fields.signals import field_updated
+
+from .handler import IndexAdvisorHandler
+
+
+@receiver(field_updated)
+def drop_outdated_field_indexes_when_field_updated(
+    sender, field, old_field=None, **kwargs
+):
+    """
+    The fields updated because they depend on the updated field are sent without the
+    old field. The indexes they don't benefit from anymore are dropped by the next run
+    of the advisor.
+    """
+
+    if old_field is not None:
+        IndexAdvisorHandler().drop_outdated_field_indexes(field, old_field)
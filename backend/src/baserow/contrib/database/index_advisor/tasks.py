@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.conf import settings
+
+from baserow.config.celery import app
+
+
+@app.task(bind=True, queue="export")
+def advise_table_indexes(self):
+    """
+    Creates and drops the indexes of the tables based on the usage of the fields by
+    the filters and sorts since the last run.
+    """
+
+    if not settings.BASEROW_INDEX_ADVISOR_ENABLED:
+        return
+
+    from baserow.contrib.database.index_advisor.handler import IndexAdvisorHandler
+
+    IndexAdvisorHandler().advise_tables()
+
+
+@app.on_after_finalize.connect
+def setup_periodic_tasks(sender, **kwargs):
+    sender.add_periodic_task(
+        timedelta(minutes=settings.BASEROW_INDEX_ADVISOR_INTERVAL_MINUTES),
+        advise_table_indexes.s(),
+    )
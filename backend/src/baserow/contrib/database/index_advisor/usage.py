@@ -0,0 +1,73 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .constants import INDEX_USAGES
+
+# The usage counters of fields that are not picked up by the index advisor, because
+# their table is too small for example, expire after this many seconds.
+USAGE_COUNTER_TIMEOUT = 60 * 60 * 24
+
+
+def get_field_index_usage_cache_key(field_id: int, usage: str) -> str:
+    return f"database_field_{field_id}_index_usage_{usage}"
+
+
+def record_field_index_usage(usages: Iterable[Tuple[int, Optional[str]]]):
+    """
+    Counts the provided usages of the fields in the cache, so that the index advisor
+    can later decide which fields would benefit from an index. This is called every
+    time the rows are filtered or sorted by a view or an API call, and does nothing
+    if the index advisor is disabled.
+
+    :param usages: Tuples containing the id of the field and how it's used, which
+        is one of the `INDEX_USAGE_*` constants. Usages that are None are ignored.
+    """
+
+    if not settings.BASEROW_INDEX_ADVISOR_ENABLED:
+        return
+
+    for field_id, usage in set(usages):
+        if usage is None:
+            continue
+        cache_key = get_field_index_usage_cache_key(field_id, usage)
+        if not cache.add(cache_key, 1, timeout=USAGE_COUNTER_TIMEOUT):
+            try:
+                cache.incr(cache_key)
+            except ValueError:
+                # The counter expired in the meantime.
+                cache.add(cache_key, 1, timeout=USAGE_COUNTER_TIMEOUT)
+
+
+def pop_field_index_usage(
+    field_ids: Iterable[int], peek: bool = False
+) -> Dict[Tuple[int, str], int]:
+    """
+    Returns the usage counted since the last call and resets the counters. Only the
+    returned counts are subtracted, so that the usage recorded in the meantime is
+    returned by the next call.
+
+    :param field_ids: The ids of the fields to get the usage of.
+    :param peek: If True the counters are not reset.
+    :return: The number of times a field has been used per field id and usage.
+    """
+
+    cache_keys = {
+        get_field_index_usage_cache_key(field_id, usage): (field_id, usage)
+        for field_id in field_ids
+        for usage in INDEX_USAGES
+    }
+    counts = cache.get_many(list(cache_keys.keys()))
+
+    usage_counts = {}
+    for cache_key, count in counts.items():
+        if not count:
+            continue
+        usage_counts[cache_keys[cache_key]] = count
+        if not peek:
+            try:
+                cache.decr(cache_key, count)
+            except ValueError:
+                pass
+    return usage_counts
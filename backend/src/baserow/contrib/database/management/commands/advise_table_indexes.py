@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+
+from baserow.contrib.database.index_advisor.handler import IndexAdvisorHandler
+from baserow.contrib.database.table.models import Table
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates and drops the indexes of the tables based on how often their fields "
+        "have been filtered and sorted by since the last run, and prints what has "
+        "been decided for every index."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--table-id",
+            nargs="?",
+            type=int,
+            help="Only the indexes of the table with this id will be advised.",
+            default=None,
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Prints what would be decided without changing any index.",
+        )
+        parser.add_argument(
+            "--report",
+            action="store_true",
+            help="Only prints what has been decided the last time the advisor ran.",
+        )
+
+    def handle(self, *args, **options):
+        handler = IndexAdvisorHandler()
+        table_id = options["table_id"]
+
+        if options["report"]:
+            advices = handler.get_report(None if table_id is None else [table_id])
+        elif table_id is not None:
+            table = Table.objects.get(id=table_id)
+            advices = handler.advise_table(table, dry_run=options["dry_run"])
+        else:
+            advices = handler.advise_tables(dry_run=options["dry_run"])
+
+        count = 0
+        for advice in advices:
+            self.stdout.write(
+                f"table {advice.table_id} field {advice.field_id} "
+                f"{advice.index_type}: score {advice.usage_score:.1f}, "
+                f"created {advice.index_created}, {advice.decision}. {advice.reason}"
+            )
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS(f"{count} index advice(s)."))
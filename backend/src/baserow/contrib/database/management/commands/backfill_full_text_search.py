@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from baserow.contrib.database.search.handler import SearchHandler
+from baserow.contrib.database.table.models import Table
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates and fills the full-text search column of the tables that don't have "
+        "one yet, so that they can be searched using the full-text search mode."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--table-id",
+            nargs="?",
+            type=int,
+            help="Only the table with this id will be backfilled.",
+            default=None,
+        )
+
+    def handle(self, *args, **options):
+        tables = Table.objects.filter(tsvector_column_created=False).order_by("id")
+        if options["table_id"] is not None:
+            tables = tables.filter(id=options["table_id"])
+
+        count = 0
+        for table in tables.iterator():
+            # Every table is backfilled in its own transaction so that a failure
+            # doesn't revert the tables that have already been processed.
+            with transaction.atomic():
+                SearchHandler.create_tsvector_column(table)
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS(f"{count} table(s) have been backfilled."))
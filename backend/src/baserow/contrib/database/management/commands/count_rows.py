@@ -8,8 +8,16 @@ class Command(BaseCommand):
         "Runs the periodic count rows task without having to wait for the time trigger"
     )
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--exact",
+            action="store_true",
+            help="Counts the rows of every table instead of only the tables whose "
+            "row count deviates from the estimation of PostgreSQL.",
+        )
+
     def handle(self, *args, **options):
-        tables_counted = TableHandler.count_rows()
+        tables_counted = TableHandler.count_rows(exact=options["exact"])
         self.stdout.write(
             self.style.SUCCESS(f"{tables_counted} table(s) have been counted.")
         )
@@ -94,7 +94,7 @@ def fill_table_rows(limit, table):
                 if type(field) is not ForeignKey:
                     continue
 
-                if field.remote_field.model == model:
+                if field.remote_field.model == model._meta.concrete_model:
                     row_column = field.get_attname_column()[1]
                 else:
                     value_column = field.get_attname_column()[1]
@@ -1,7 +1,10 @@
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
-from baserow.contrib.database.fields.tasks import run_periodic_fields_updates
+from baserow.contrib.database.fields.tasks import (
+    get_workspace_ids_needing_periodic_update,
+    run_periodic_fields_updates_for_workspaces,
+)
 
 
 class Command(BaseCommand):
@@ -23,4 +26,9 @@ class Command(BaseCommand):
 
     @transaction.atomic
     def handle(self, *args, **options):
-        run_periodic_fields_updates(options["group_id"], not options["dont_update_now"])
+        # All the workspaces are updated in this process instead of in separate
+        # tasks.
+        run_periodic_fields_updates_for_workspaces(
+            get_workspace_ids_needing_periodic_update(options["group_id"]),
+            not options["dont_update_now"],
+        )
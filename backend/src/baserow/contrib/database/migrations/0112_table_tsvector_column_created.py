@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0111_alter_airtableimportjob_workspace"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="table",
+            name="tsvector_column_created",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether the full-text search column has been "
+                "created and filled for all the rows of the table.",
+            ),
+        ),
+    ]
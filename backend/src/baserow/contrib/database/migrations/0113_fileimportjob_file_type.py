@@ -0,0 +1,41 @@
+# Generated by Django 3.2.18 on 2026-10-18 07:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0112_table_tsvector_column_created"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="fileimportjob",
+            name="csv_column_separator",
+            field=models.CharField(
+                default=",",
+                help_text="The column separator of the data file if it's a CSV file.",
+                max_length=1,
+            ),
+        ),
+        migrations.AddField(
+            model_name="fileimportjob",
+            name="encoding",
+            field=models.CharField(
+                default="utf-8",
+                help_text="The encoding of the data file if it's a text file.",
+                max_length=32,
+            ),
+        ),
+        migrations.AddField(
+            model_name="fileimportjob",
+            name="file_type",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="The type of the raw uploaded data file. If empty, the data file contains the JSON array of rows that has already been parsed by the client.",
+                max_length=16,
+            ),
+        ),
+    ]
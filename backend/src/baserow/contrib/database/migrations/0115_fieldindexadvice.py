@@ -0,0 +1,89 @@
+# Generated by Django 3.2.18 on 2026-10-18 12:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0114_convertfieldjob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FieldIndexAdvice",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True)),
+                ("updated_on", models.DateTimeField(auto_now=True)),
+                (
+                    "index_type",
+                    models.CharField(
+                        choices=[("btree", "btree"), ("trigram", "trigram")],
+                        max_length=32,
+                    ),
+                ),
+                (
+                    "usage_score",
+                    models.FloatField(
+                        default=0,
+                        help_text="The decaying number of times the field has been used by filters or sorts that can be sped up by the index.",
+                    ),
+                ),
+                (
+                    "index_created",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Indicates whether the index currently exists.",
+                    ),
+                ),
+                (
+                    "decision",
+                    models.CharField(
+                        choices=[
+                            ("created", "created"),
+                            ("kept", "kept"),
+                            ("dropped", "dropped"),
+                            ("not_needed", "not_needed"),
+                            ("over_budget", "over_budget"),
+                            ("unavailable", "unavailable"),
+                            ("failed", "failed"),
+                        ],
+                        default="not_needed",
+                        help_text="What the index advisor decided the last time it ran.",
+                        max_length=32,
+                    ),
+                ),
+                ("reason", models.TextField(blank=True, default="")),
+                (
+                    "field",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="index_advices",
+                        to="database.field",
+                    ),
+                ),
+                (
+                    "table",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="index_advices",
+                        to="database.table",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("table_id", "-usage_score", "id"),
+                "unique_together": {("field", "index_type")},
+            },
+        ),
+    ]
@@ -14,6 +14,7 @@ from .fields.models import (
     TextField,
     URLField,
 )
+from .index_advisor.models import FieldIndexAdvice
 from .table.models import Table
 from .tokens.models import Token, TokenPermission
 from .views.models import (
@@ -62,6 +63,7 @@ __all__ = [
     "TableWebhookHeader",
     "TableWebhookCall",
     "FieldDependency",
+    "FieldIndexAdvice",
 ]
 
 
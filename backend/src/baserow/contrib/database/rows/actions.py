@@ -1,7 +1,7 @@
 import dataclasses
 from copy import deepcopy
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
 
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
@@ -26,6 +26,9 @@ from baserow.core.action.registries import (
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.utils import Progress
 
+if TYPE_CHECKING:
+    from baserow.contrib.database.file_import.readers import ImportFileReader
+
 
 class CreateRowActionType(UndoableActionType):
     type = "create_row"
@@ -208,9 +211,10 @@ class ImportRowsActionType(UndoableActionType):
         cls,
         user: AbstractUser,
         table: Table,
-        data=List[List[Any]],
+        data: Optional[List[List[Any]]] = None,
         progress: Optional[Progress] = None,
-    ) -> Tuple[List[GeneratedTableModel], Dict[str, Any]]:
+        file_reader: Optional["ImportFileReader"] = None,
+    ) -> Tuple[Union[List[GeneratedTableModel], List[int]], Dict[str, Any]]:
         """
         Creates rows for a given table with the provided values if the user
         belongs to the related workspace. It also calls the table_updated signal.
@@ -225,12 +229,28 @@ class ImportRowsActionType(UndoableActionType):
         :param table: The table for which the rows should be imported.
         :param data: List of rows values for rows that need to be created.
         :param progress: An optional progress object to track the task progress.
-        :return: The created list of rows instances and the error report.
+        :param file_reader: An optional scanned reader of an import file. If provided,
+            the rows are streamed from the file instead of the `data` parameter.
+        :return: The created list of rows instances and the error report. When the
+            rows are imported from a file, only the ids of the created rows are
+            returned to keep the memory usage bounded.
         """
 
-        created_rows, error_report = RowHandler().import_rows(
-            user, table, data, progress=progress, send_signal=False
-        )
+        if file_reader is not None:
+            created_rows, error_report = RowHandler().import_rows_in_chunks(
+                user,
+                table,
+                file_reader.iter_rows(),
+                row_count=file_reader.row_count,
+                progress=progress,
+                send_signal=False,
+            )
+            row_ids = created_rows
+        else:
+            created_rows, error_report = RowHandler().import_rows(
+                user, table, data, progress=progress, send_signal=False
+            )
+            row_ids = [row.id for row in created_rows]
 
         # Use table signal here instead of row signal because we can import a
         # big amount of data.
@@ -242,7 +262,7 @@ class ImportRowsActionType(UndoableActionType):
             table.name,
             table.database.id,
             table.database.name,
-            [row.id for row in created_rows],
+            row_ids,
         )
         cls.register_action(
             user, params, scope=cls.scope(table.id), workspace=workspace
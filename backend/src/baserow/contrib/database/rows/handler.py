@@ -2,21 +2,31 @@ import re
 from collections import defaultdict
 from copy import copy
 from decimal import Decimal
-from typing import Any, Dict, List, NewType, Optional, Set, Tuple, Type, cast
+from typing import Any, Dict, Iterable, List, NewType, Optional, Set, Tuple, Type, cast
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.db.models import Q, QuerySet
-from django.db.models.fields.related import ForeignKey, ManyToManyField
+from django.db.models.fields.related import ManyToManyField
 from django.utils.encoding import force_str
 
 from opentelemetry import metrics, trace
 
+from baserow.contrib.database.db.copy import copy_model_instances
+from baserow.contrib.database.db.update import (
+    update_many_to_many_relations,
+    update_model_instances,
+)
 from baserow.contrib.database.fields.dependencies.handler import FieldDependencyHandler
 from baserow.contrib.database.fields.dependencies.update_collector import (
     FieldUpdateCollector,
 )
+from baserow.contrib.database.fields.exceptions import (
+    FieldDoesNotExist,
+    IncompatibleField,
+)
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.field_filters import (
     FILTER_TYPE_OR,
@@ -30,6 +40,7 @@ from baserow.contrib.database.table.operations import (
     CreateRowDatabaseTableOperationType,
     ImportRowsDatabaseTableOperationType,
 )
+from baserow.contrib.database.table.row_counts import update_table_row_count
 from baserow.contrib.database.trash.models import TrashedRows
 from baserow.core.db import (
     get_highest_order_of_queryset,
@@ -44,7 +55,7 @@ from baserow.core.utils import Progress, get_non_unique_values, grouper
 
 from .constants import ROW_IMPORT_CREATION, ROW_IMPORT_VALIDATION
 from .error_report import RowErrorReport
-from .exceptions import RowDoesNotExist, RowIdsNotUnique
+from .exceptions import ReportMaxErrorCountExceeded, RowDoesNotExist, RowIdsNotUnique
 from .operations import (
     DeleteDatabaseRowOperationType,
     MoveRowDatabaseRowOperationType,
@@ -485,6 +496,46 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         return queryset_filtered.first()
 
+    def get_related_rows(
+        self,
+        user: AbstractUser,
+        table: Table,
+        row_id: int,
+        field_id: int,
+        model: Optional[Type[GeneratedTableModel]] = None,
+    ) -> QuerySet:
+        """
+        Returns all the rows related to a cell of a link row field, in the order of
+        the related table. It can be used to page through the related rows when
+        they're not all fetched with the row.
+
+        :param user: The user of whose behalf the related rows are requested.
+        :param table: The table of the row.
+        :param row_id: The id of the row of which the related rows are requested.
+        :param field_id: The id of the link row field.
+        :param model: If the correct model has already been generated it can be
+            provided so that it does not have to be generated for a second time.
+        :raises RowDoesNotExist: When the row with the provided id does not exist.
+        :raises FieldDoesNotExist: When the field doesn't exist in the table.
+        :raises IncompatibleField: When the field is not a link row field.
+        :return: The queryset of the related rows.
+        """
+
+        if model is None:
+            model = table.get_model()
+
+        row = self.get_row(user, table, row_id, model=model)
+
+        try:
+            field_object = model._field_objects[field_id]
+        except KeyError:
+            raise FieldDoesNotExist(f"The field with id {field_id} does not exist.")
+
+        if not isinstance(field_object["field"], LinkRowField):
+            raise IncompatibleField(f"The field {field_id} is not a link row field.")
+
+        return field_object["type"].get_related_rows_queryset(row, field_object["name"])
+
     def get_row_for_update(
         self,
         user: AbstractUser,
@@ -691,6 +742,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                 "baserow.database_id": table.database_id,
             },
         )
+        update_table_row_count(table.id, 1)
 
         for name, value in manytomany_values.items():
             getattr(instance, name).set(value)
@@ -934,6 +986,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         model: Optional[Type[GeneratedTableModel]] = None,
         send_signal=True,
         generate_error_report=False,
+        use_copy=False,
     ) -> List[GeneratedTableModel]:
         """
         Creates new rows for a given table if the user
@@ -946,6 +999,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             the before_row.
         :param model: If the correct model has already been generated it can be
             provided so that it does not have to be generated for a second time.
+        :param use_copy: If True, the rows are inserted using the PostgreSQL `COPY`
+            command, which is faster for big amounts of rows.
         :return: The created row instances.
         """
 
@@ -985,9 +1040,11 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             }
             rows_relationships.append((instance, relations))
 
-        inserted_rows = model.objects.bulk_create(
-            [row for (row, relations) in rows_relationships]
-        )
+        rows_to_insert = [row for (row, relations) in rows_relationships]
+        if use_copy:
+            inserted_rows = copy_model_instances(model, rows_to_insert)
+        else:
+            inserted_rows = model.objects.bulk_create(rows_to_insert)
         rows_created_counter.add(
             len(rows_relationships),
             {
@@ -995,51 +1052,15 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                 "baserow.database_id": table.database_id,
             },
         )
+        update_table_row_count(table.id, len(rows_relationships))
 
-        many_to_many = defaultdict(list)
-        for index, row in enumerate(inserted_rows):
-            _, manytomany_values = rows_relationships[index]
-            for field_name, value in manytomany_values.items():
-                through = getattr(model, field_name).through
-                through_fields = through._meta.get_fields()
-                value_column = None
-                row_column = None
-
-                model_field = model._meta.get_field(field_name)
-                is_referencing_the_same_table = (
-                    model_field.model == model_field.related_model
-                )
+        relations_per_field = defaultdict(dict)
+        for row, (_, relations) in zip(inserted_rows, rows_relationships):
+            for field_name, value in relations.items():
+                relations_per_field[field_name][row.id] = value
 
-                # Figure out which field in the many to many through table holds the row
-                # value and which one contains the value.
-                for field in through_fields:
-                    if type(field) is not ForeignKey:
-                        continue
-
-                    if is_referencing_the_same_table:
-                        # django creates 'from_tableXmodel' and 'to_tableXmodel'
-                        # columns for self-referencing many_to_many relations.
-                        row_column = field.get_attname_column()[1]
-                        value_column = row_column.replace("from", "to")
-                        break
-                    elif field.remote_field.model == model:
-                        row_column = field.get_attname_column()[1]
-                    else:
-                        value_column = field.get_attname_column()[1]
-
-                for i in value:
-                    many_to_many[field_name].append(
-                        getattr(model, field_name).through(
-                            **{
-                                row_column: row.id,
-                                value_column: i,
-                            }
-                        )
-                    )
-
-        for field_name, values in many_to_many.items():
-            through = getattr(model, field_name).through
-            through.objects.bulk_create(values)
+        for field_name, relations in relations_per_field.items():
+            update_many_to_many_relations(model._meta.get_field(field_name), relations)
 
         update_collector = FieldUpdateCollector(
             table, starting_row_ids=[row.id for row in inserted_rows]
@@ -1325,6 +1346,154 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         return created_rows, error_report.to_dict()
 
+    def import_rows_in_chunks(
+        self,
+        user: AbstractUser,
+        table: Table,
+        rows: Iterable[List[Any]],
+        row_count: Optional[int] = None,
+        validate: bool = True,
+        progress: Optional[Progress] = None,
+        send_signal: bool = True,
+    ) -> Tuple[List[int], Dict[int, Dict[str, Any]]]:
+        """
+        Imports the provided rows chunk by chunk. Contrary to `import_rows`, the rows
+        don't have to be in memory all at once, so they can be streamed from a big
+        file. Every chunk is validated, prepared and then inserted using the
+        PostgreSQL `COPY` command. When a row fails to import, it doesn't stop the
+        import. Instead an error report is created with the raised error for each
+        field of each failing rows.
+
+        :param user: The user of whose behalf the rows are created.
+        :param table: The table for which the rows should be created.
+        :param rows: An iterable yielding the values of every row.
+        :param row_count: The number of rows, used to track the progress.
+        :param validate: If True the data are validated before the import.
+        :param progress: Give a progress instance to track the progress of the import.
+        :param send_signal: If True a rows_created signal is sent for every chunk.
+        :raises ReportMaxErrorCountExceeded: If too many rows fail to import.
+        :return: The ids of the created rows and the error report.
+        """
+
+        from baserow.api.exceptions import RequestBodyValidationException
+        from baserow.api.utils import validate_data
+        from baserow.contrib.database.api.rows.serializers import (
+            get_row_serializer_class,
+        )
+
+        workspace = table.database.workspace
+        CoreHandler().check_permissions(
+            user,
+            ImportRowsDatabaseTableOperationType.type,
+            workspace=workspace,
+            context=table,
+        )
+
+        model = table.get_model()
+        fields = [
+            field_object["field"]
+            for field_object in model._field_objects.values()
+            if not field_object["type"].read_only
+        ]
+        # Sort by order then by id
+        fields.sort(key=lambda f: (f.order, f.id))
+        validation_serializer = get_row_serializer_class(model)
+
+        creation_sub_progress = None
+        if progress:
+            progress.increment(0, state=ROW_IMPORT_CREATION)
+            creation_sub_progress = progress.create_child(100, row_count or 1)
+
+        created_row_ids = []
+        report = {}
+        for count, chunk in enumerate(grouper(BATCH_SIZE, rows)):
+            row_start_index = count * BATCH_SIZE
+            chunk_report = {}
+            valid_rows = []
+            valid_row_indexes = []
+            for index, row in enumerate(chunk, start=row_start_index):
+                if len(row) > len(fields):
+                    chunk_report[index] = {
+                        "non_field_errors": ["Too many values in this line."]
+                    }
+                    continue
+
+                # Reshape data by field, the missing values are considered empty.
+                valid_rows.append(
+                    {
+                        f"field_{field.id}": row[field_index]
+                        if field_index < len(row)
+                        else None
+                        for field_index, field in enumerate(fields)
+                    }
+                )
+                valid_row_indexes.append(index)
+
+            if validate and valid_rows:
+                try:
+                    validate_data(validation_serializer, valid_rows, many=True)
+                except RequestBodyValidationException as e:
+                    for valid_index, error in enumerate(e.detail["detail"]):
+                        if error:
+                            chunk_report[valid_row_indexes[valid_index]] = error
+
+                    rows_and_indexes = [
+                        (row, index)
+                        for row, index in zip(valid_rows, valid_row_indexes)
+                        if index not in chunk_report
+                    ]
+                    valid_rows = [row for row, _ in rows_and_indexes]
+                    valid_row_indexes = [index for _, index in rows_and_indexes]
+
+            created_rows = []
+            if valid_rows:
+                created_rows, creation_report = self.create_rows(
+                    user=user,
+                    table=table,
+                    model=model,
+                    rows_values=valid_rows,
+                    generate_error_report=True,
+                    send_signal=False,
+                    use_copy=True,
+                )
+                created_row_ids.extend(row.id for row in created_rows)
+
+                for valid_index, field_errors in creation_report.items():
+                    chunk_report[
+                        valid_row_indexes[int(valid_index)]
+                    ] = prepare_field_errors(field_errors)
+
+            report.update(sorted(chunk_report.items()))
+            error_limit = settings.BASEROW_MAX_ROW_REPORT_ERROR_COUNT
+            if len(report) > error_limit:
+                # Just like the `RowErrorReport`, only the errors up to the limit are
+                # reported.
+                raise ReportMaxErrorCountExceeded(
+                    dict(list(report.items())[:error_limit])
+                )
+
+            if send_signal and created_rows:
+                rows_created.send(
+                    self,
+                    rows=list(
+                        model.objects.all()
+                        .enhance_by_fields()
+                        .filter(id__in=[row.id for row in created_rows])
+                    ),
+                    before=None,
+                    user=user,
+                    table=table,
+                    model=model,
+                )
+
+            if creation_sub_progress and row_count:
+                creation_sub_progress.increment(len(chunk))
+
+        if creation_sub_progress and not row_count:
+            creation_sub_progress.increment()
+
+        return created_row_ids, report
+
     def update_rows(
         self,
         user: AbstractUser,
@@ -1427,9 +1596,10 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                     model._meta.get_field(field_name).pre_save(obj, add=False),
                 )
 
-        many_to_many = defaultdict(list)
-        row_column_name = None
-        row_ids_change_m2m_per_field = defaultdict(set)
+        relations_per_field = defaultdict(dict)
+        for row, relations in zip(rows_to_update, rows_relationships):
+            for field_name, value in relations.items():
+                relations_per_field[field_name][row.id] = value
 
         # This update can remove link row connections with other rows. We need to keep
         # track of these so we can later update any dependant cells in those rows that
@@ -1438,96 +1608,36 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         # link to via that link row field.
         deleted_m2m_rels_per_link_field: Dict[int, Set[int]] = defaultdict(set)
 
-        for index, row in enumerate(rows_to_update):
-            manytomany_values = rows_relationships[index]
-            for field_name, value in manytomany_values.items():
-                through = getattr(model, field_name).through
-                through_fields = through._meta.get_fields()
-                value_column = None
-                row_column = None
-
-                model_field = model._meta.get_field(field_name)
-                is_referencing_the_same_table = (
-                    model_field.model == model_field.related_model
-                )
-
-                # Figure out which field in the many to many through table holds the row
-                # value and which one contains the value.
-                for field in through_fields:
-                    if type(field) is not ForeignKey:
-                        continue
-
-                    row_ids_change_m2m_per_field[field_name].add(row.id)
-
-                    if is_referencing_the_same_table:
-                        # django creates 'from_tableXmodel' and 'to_tableXmodel'
-                        # columns for self-referencing many_to_many relations.
-                        row_column = field.get_attname_column()[1]
-                        row_column_name = row_column
-                        value_column = row_column.replace("from", "to")
-                        break
-                    elif field.remote_field.model == model:
-                        row_column = field.get_attname_column()[1]
-                        row_column_name = row_column
-                    else:
-                        value_column = field.get_attname_column()[1]
-
-                # If this m2m field is a link row we need to find out all connections
-                # which will be removed by this update. This is so we can update
-                # rows which previously were connected to an updated row, but no
-                # longer are.
-                field = field_name_to_field[field_name]
-                if isinstance(field, LinkRowField):
-                    # Uses the existing prefetch cache and so doesn't run queries.
-                    m2m_rels_before_update = {
-                        r.id for r in getattr(row, field_name).all()
-                    }
-                    deleted_m2m_rels_per_link_field[field.id].update(
-                        m2m_rels_before_update
-                    )
-
-                if len(value) == 0:
-                    many_to_many[field_name].append(None)
-                else:
-                    for i in value:
-                        # After we have discarded all connections the user has provided
-                        # we will be left with only the deleted connections as desired.
-                        deleted_m2m_rels_per_link_field[field.id].discard(i)
-                        many_to_many[field_name].append(
-                            getattr(model, field_name).through(
-                                **{
-                                    row_column: row.id,
-                                    value_column: i,
-                                }
-                            )
-                        )
-
         # The many to many relations need to be updated first because they need to
         # exist when the rows are updated in bulk. Otherwise, the formula and lookup
         # fields can't see the relations.
-        for field_name, values in many_to_many.items():
-            through = getattr(model, field_name).through
-            filter = {
-                f"{row_column_name}__in": row_ids_change_m2m_per_field[field_name]
-            }
-            delete_qs = through.objects.all().filter(**filter)
-            delete_qs._raw_delete(delete_qs.db)
-            through.objects.bulk_create([v for v in values if v is not None])
+        for field_name, relations in relations_per_field.items():
+            deleted_relations = update_many_to_many_relations(
+                model._meta.get_field(field_name), relations
+            )
+            field = field_name_to_field[field_name]
+            if isinstance(field, LinkRowField):
+                for related_ids in deleted_relations.values():
+                    deleted_m2m_rels_per_link_field[field.id].update(related_ids)
 
+        # Only the provided fields and the fields that are computed from the other
+        # values of the row have to be written.
+        fields_to_update = {
+            model._field_objects[field_id]["name"] for field_id in updated_field_ids
+        }
+        fields_to_update.update(model.fields_requiring_refresh_after_update())
         bulk_update_fields = ["updated_on"]
         for field in model._field_objects.values():
             field_name = field["name"]
+            if field_name not in fields_to_update:
+                continue
             model_field = model._meta.get_field(field_name)
-            # For now all valid fields that don't represent a relationship will be
-            # used in the bulk_update() call. This could be optimized in the future
-            # if we can select just fields that need to be updated (fields that are
-            # passed in + read only fields that need updating too)
             not_m2m = not isinstance(model_field, ManyToManyField)
             if not_m2m and getattr(model_field, "valid_for_bulk_update", True):
                 bulk_update_fields.append(field_name)
 
         if len(bulk_update_fields) > 0:
-            model.objects.bulk_update(rows_to_update, bulk_update_fields)
+            update_model_instances(model, rows_to_update, bulk_update_fields)
             rows_updated_counter.add(
                 len(rows_to_update),
                 {
@@ -1769,6 +1879,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                 "baserow.database_id": table.database_id,
             },
         )
+        update_table_row_count(table.id, -1)
 
         update_collector = FieldUpdateCollector(table, starting_row_ids=[row.id])
         field_cache = FieldCache()
@@ -1872,6 +1983,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                 "baserow.database_id": table.database_id,
             },
         )
+        update_table_row_count(table.id, -len(row_ids))
 
         updated_field_ids = []
         updated_fields = []
@@ -0,0 +1,368 @@
+import re
+from typing import Iterable, List, Optional, Type
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import (
+    BooleanField,
+    Expression,
+    Func,
+    Max,
+    Min,
+    Q,
+    QuerySet,
+    TextField,
+    Value,
+)
+from django.db.models.functions import Cast, Left
+
+from opentelemetry import trace
+from psycopg2 import sql
+
+from baserow.contrib.database.table.models import GeneratedTableModel, Table
+from baserow.core.telemetry.utils import baserow_trace_methods
+
+from .tasks import update_tsvector_columns
+
+tracer = trace.get_tracer(__name__)
+
+SEARCH_MODE_COMPAT = "compat"
+SEARCH_MODE_FULL_TEXT = "full-text"
+SEARCH_MODES = [SEARCH_MODE_COMPAT, SEARCH_MODE_FULL_TEXT]
+
+TSVECTOR_COLUMN_NAME = "search_tsvector"
+# The `simple` configuration doesn't stem or remove stop words, which makes it work
+# the same way for every language.
+TSVECTOR_CONFIG = "simple"
+# PostgreSQL refuses to store tsvectors bigger than 1MB, so the searchable text of a
+# row is truncated to stay well below that limit.
+TSVECTOR_MAX_TEXT_LENGTH = 200000
+TSVECTOR_UPDATE_BATCH_SIZE = 5000
+# The background update of all the search vectors of a table is delayed, so that a
+# burst of changes to the same table results in only one rewrite of its rows.
+TSVECTOR_UPDATE_COUNTDOWN = 10
+TSVECTOR_UPDATE_SCHEDULED_TIMEOUT = 60 * 60
+
+
+class TsvectorMatches(Expression):
+    """
+    Checks whether the full-text search column of the table of the query matches
+    the provided PostgreSQL `tsquery`.
+    """
+
+    conditional = True
+
+    def __init__(self, tsquery: str):
+        super().__init__(output_field=BooleanField())
+        self.tsquery = tsquery
+
+    def as_sql(self, compiler, connection):
+        alias = compiler.quote_name_unless_alias(compiler.query.get_initial_alias())
+        column = compiler.quote_name_unless_alias(TSVECTOR_COLUMN_NAME)
+        return (
+            f"{alias}.{column} @@ to_tsquery(%s, %s)",
+            [TSVECTOR_CONFIG, self.tsquery],
+        )
+
+
+class SearchHandler(metaclass=baserow_trace_methods(tracer)):
+    @classmethod
+    def get_default_search_mode(cls) -> str:
+        if settings.BASEROW_USE_PG_FULLTEXT_SEARCH:
+            return SEARCH_MODE_FULL_TEXT
+        return SEARCH_MODE_COMPAT
+
+    @classmethod
+    def can_use_full_text_search(
+        cls,
+        table: Table,
+        search_mode: Optional[str] = None,
+        only_search_by_field_ids: Optional[Iterable[int]] = None,
+    ) -> bool:
+        """
+        Indicates whether the full-text search column can be used to search the
+        table. This is only the case if the column has been created and backfilled,
+        and if all the fields must be searched because the column contains the
+        searchable text of every field.
+
+        :param table: The table that must be searched.
+        :param search_mode: The requested search mode, the default one is used if not
+            provided.
+        :param only_search_by_field_ids: If provided, only these fields must be
+            searched.
+        :return: True if the full-text search can be used.
+        """
+
+        if search_mode is None:
+            search_mode = cls.get_default_search_mode()
+
+        return (
+            search_mode == SEARCH_MODE_FULL_TEXT
+            and table.tsvector_column_created
+            and only_search_by_field_ids is None
+        )
+
+    @classmethod
+    def get_tsquery(cls, search: str) -> Optional[str]:
+        """
+        Converts the user provided search query into a PostgreSQL `tsquery` where
+        every word must match as a prefix, so that the results update while the user
+        is typing.
+
+        :param search: The user provided search query.
+        :return: The tsquery or None if the search doesn't contain any word.
+        """
+
+        words = re.findall(r"\w+", search)
+        if not words:
+            return None
+        return " & ".join(f"'{word}':*" for word in words)
+
+    @classmethod
+    def get_full_text_search_filter(
+        cls, model: Type[GeneratedTableModel], search: str
+    ) -> Optional[Q]:
+        """
+        Returns the filter that matches the rows whose searchable text contains all
+        the words of the search query, or if the search query is a number, the row
+        with that id.
+
+        :param model: The generated table model that must be searched.
+        :param search: The user provided search query.
+        :return: The filter or None if the search doesn't contain any word.
+        """
+
+        tsquery = cls.get_tsquery(search)
+        if tsquery is None:
+            return None
+
+        search_filter = Q(TsvectorMatches(tsquery))
+        if search.strip().isdigit():
+            search_filter |= Q(id=int(search.strip()))
+        return search_filter
+
+    @classmethod
+    def get_search_vector_expression(
+        cls, model: Type[GeneratedTableModel]
+    ) -> Expression:
+        """
+        Builds the expression that computes the full-text search vector of a row
+        by combining the searchable text of every field of the model.
+
+        :param model: The generated table model containing all the fields.
+        :return: An expression resulting in a `tsvector`.
+        """
+
+        queryset = model.objects_and_trash.all().order_by()
+        expressions = []
+        for field_object in model._field_objects.values():
+            expression = field_object["type"].get_search_expression(
+                field_object["field"], queryset
+            )
+            if expression is not None:
+                expressions.append(Cast(expression, output_field=TextField()))
+
+        if not expressions:
+            expressions = [Value("")]
+
+        text = Func(
+            Value(" "), *expressions, function="CONCAT_WS", output_field=TextField()
+        )
+        # The text is split into words the same way as the search query in
+        # `get_tsquery`, otherwise the PostgreSQL parser would for example keep
+        # `a.txt` as one single token that can't be found by searching for `txt`.
+        words = Func(
+            Left(text, TSVECTOR_MAX_TEXT_LENGTH),
+            Value(r"\W+"),
+            Value(" "),
+            Value("g"),
+            function="REGEXP_REPLACE",
+            output_field=TextField(),
+        )
+        return Func(
+            Value(TSVECTOR_CONFIG),
+            words,
+            function="to_tsvector",
+            output_field=SearchVectorField(),
+        )
+
+    @classmethod
+    def _update_tsvectors_of_queryset(
+        cls, model: Type[GeneratedTableModel], queryset: QuerySet
+    ) -> int:
+        select_sql, select_params = (
+            queryset.annotate(search_vector=cls.get_search_vector_expression(model))
+            .order_by()
+            .values("id", "search_vector")
+            .query.sql_with_params()
+        )
+        table_name = sql.Identifier(model._meta.db_table)
+        update_sql = sql.SQL(
+            "UPDATE {table} SET {column} = search_vectors.search_vector "
+            "FROM ({select}) AS search_vectors "
+            "WHERE {table}.id = search_vectors.id"
+        ).format(
+            table=table_name,
+            column=sql.Identifier(TSVECTOR_COLUMN_NAME),
+            select=sql.SQL(select_sql),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(update_sql, select_params)
+            return cursor.rowcount
+
+    @classmethod
+    def update_tsvector_columns(
+        cls,
+        table: Table,
+        row_ids: Optional[List[int]] = None,
+        model: Optional[Type[GeneratedTableModel]] = None,
+        force: bool = False,
+    ) -> int:
+        """
+        Recomputes the full-text search vectors of the provided rows, or of all the
+        rows in batches if no row ids are provided. Does nothing if the full-text
+        search column has not been created for the table.
+
+        :param table: The table of which the search vectors must be updated.
+        :param row_ids: Only the search vectors of these rows are updated if
+            provided.
+        :param model: The generated table model containing all the fields. Will be
+            generated if not provided.
+        :param force: Updates the vectors even if the table is not yet marked as
+            having a full-text search column. Used while backfilling a new column.
+        :return: The number of updated rows.
+        """
+
+        if not (table.tsvector_column_created or force):
+            return 0
+
+        if row_ids is not None and len(row_ids) == 0:
+            return 0
+
+        if model is None:
+            model = table.get_model()
+
+        queryset = model.objects_and_trash.all()
+        if row_ids is not None:
+            return cls._update_tsvectors_of_queryset(
+                model, queryset.filter(id__in=row_ids)
+            )
+
+        id_range = queryset.aggregate(min_id=Min("id"), max_id=Max("id"))
+        if id_range["min_id"] is None:
+            return 0
+
+        updated = 0
+        for start in range(
+            id_range["min_id"], id_range["max_id"] + 1, TSVECTOR_UPDATE_BATCH_SIZE
+        ):
+            updated += cls._update_tsvectors_of_queryset(
+                model,
+                queryset.filter(
+                    id__gte=start, id__lt=start + TSVECTOR_UPDATE_BATCH_SIZE
+                ),
+            )
+        return updated
+
+    @classmethod
+    def update_tsvector_columns_of_queryset(
+        cls, table: Table, queryset: QuerySet
+    ) -> int:
+        """
+        Recomputes the full-text search vectors of the rows matching the provided
+        queryset. The queryset can filter on related rows because only the ids of
+        the matching rows are used. Does nothing if the full-text search column has
+        not been created for the table.
+
+        :param table: The table of which the search vectors must be updated.
+        :param queryset: A queryset of the generated model of the table selecting
+            the rows that must be updated.
+        :return: The number of updated rows.
+        """
+
+        if not table.tsvector_column_created:
+            return 0
+
+        model = queryset.model
+        return cls._update_tsvectors_of_queryset(
+            model,
+            model.objects_and_trash.filter(id__in=queryset.order_by().values("id")),
+        )
+
+    @classmethod
+    def get_tsvector_update_scheduled_cache_key(cls, table_id: int) -> str:
+        return f"database_table_{table_id}_tsvector_update_scheduled"
+
+    @classmethod
+    def schedule_update_tsvector_columns(cls, table: Table):
+        """
+        Schedules the full-text search vectors of all the rows of the table to be
+        recomputed in the background once the transaction has been committed. The
+        update is delayed and only scheduled once until it starts, so that all the
+        changes made to the table in the meantime are handled by the same update.
+
+        :param table: The table of which the search vectors must be updated.
+        """
+
+        if not table.tsvector_column_created:
+            return
+
+        table_id = table.id
+
+        def schedule():
+            if cache.add(
+                cls.get_tsvector_update_scheduled_cache_key(table_id),
+                True,
+                timeout=TSVECTOR_UPDATE_SCHEDULED_TIMEOUT,
+            ):
+                update_tsvector_columns.apply_async(
+                    (table_id,), countdown=TSVECTOR_UPDATE_COUNTDOWN
+                )
+
+        transaction.on_commit(schedule)
+
+    @classmethod
+    def get_tsvector_index_name(cls, table: Table) -> str:
+        return f"tbl_tsv_{table.id}_idx"
+
+    @classmethod
+    def create_tsvector_column(cls, table: Table, backfill: bool = True):
+        """
+        Adds the full-text search column to the table, fills it for all the existing
+        rows and creates the GIN index used when searching. The table is only marked
+        as having a full-text search column once everything is ready, so that
+        searches keep using the compat mode in the meantime.
+
+        :param table: The table to which the column must be added.
+        :param backfill: Indicates whether the search vectors of the existing rows
+            must be computed.
+        """
+
+        table_name = sql.Identifier(table.get_database_table_name())
+        column_name = sql.Identifier(TSVECTOR_COLUMN_NAME)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    "ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column} tsvector"
+                ).format(table=table_name, column=column_name)
+            )
+
+        if backfill:
+            cls.update_tsvector_columns(table, force=True)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    "CREATE INDEX IF NOT EXISTS {index} ON {table} "
+                    "USING gin ({column})"
+                ).format(
+                    index=sql.Identifier(cls.get_tsvector_index_name(table)),
+                    table=table_name,
+                    column=column_name,
+                )
+            )
+
+        table.tsvector_column_created = True
+        table.save(update_fields=["tsvector_column_created"])
@@ -0,0 +1,66 @@
+from django.dispatch import receiver
+
+from baserow.contrib.database.fields.field_types import SelectOptionBaseFieldType
+from baserow.contrib.database.fields.models import LinkRowField
+from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.fields.signals import (
+    field_created,
+    field_deleted,
+    field_restored,
+    field_updated,
+)
+
+from .handler import SearchHandler
+
+# Changing only these attributes of a field doesn't change the searchable text of the
+# rows, so the search vectors don't have to be recomputed.
+NON_SEARCHABLE_FIELD_ATTRIBUTES = {"name", "order", "updated_on"}
+
+
+def _searchable_text_can_change(field, old_field) -> bool:
+    if old_field is None or type(field) is not type(old_field):
+        return True
+
+    # The select options are stored in related rows, so the changes made to them
+    # can't be detected by comparing the field with the old one.
+    if isinstance(field_type_registry.get_by_model(field), SelectOptionBaseFieldType):
+        return True
+
+    changed_attributes = {
+        model_field.attname
+        for model_field in field._meta.concrete_fields
+        if getattr(field, model_field.attname)
+        != getattr(old_field, model_field.attname)
+    }
+    return bool(changed_attributes - NON_SEARCHABLE_FIELD_ATTRIBUTES)
+
+
+@receiver(field_created)
+@receiver(field_restored)
+@receiver(field_updated)
+@receiver(field_deleted)
+def update_tsvector_columns_when_fields_changed(
+    sender, field, related_fields=None, old_field=None, **kwargs
+):
+    """
+    The searchable text of the rows changes when a field is created, deleted,
+    restored or updated in a way that changes its values, so the full-text search
+    vectors of the affected tables are recomputed in the background.
+    """
+
+    if not _searchable_text_can_change(field, old_field):
+        return
+
+    tables = {field.table_id: field.table}
+    for related_field in related_fields or []:
+        tables.setdefault(related_field.table_id, related_field.table)
+
+    # The primary values are also searchable in the rows linking to them.
+    if field.primary:
+        for link_row_field in LinkRowField.objects.filter(
+            link_row_table_id=field.table_id
+        ).select_related("table"):
+            tables.setdefault(link_row_field.table_id, link_row_field.table)
+
+    for table in tables.values():
+        SearchHandler.schedule_update_tsvector_columns(table)
@@ -0,0 +1,29 @@
+from django.core.cache import cache
+
+from baserow.config.celery import app
+
+
+@app.task(queue="export")
+def update_tsvector_columns(table_id: int):
+    """
+    Recomputes the full-text search vectors of all the rows of the table. This is
+    needed when the fields of the table change because the searchable text of
+    every row changes with them. Scheduled by
+    `SearchHandler.schedule_update_tsvector_columns`.
+
+    :param table_id: The id of the table that must be updated.
+    """
+
+    from baserow.contrib.database.search.handler import SearchHandler
+    from baserow.contrib.database.table.models import Table
+
+    # Changes made from now on are not guaranteed to be picked up by this update,
+    # so another one can be scheduled for them.
+    cache.delete(SearchHandler.get_tsvector_update_scheduled_cache_key(table_id))
+
+    try:
+        table = Table.objects.get(id=table_id)
+    except Table.DoesNotExist:
+        return
+
+    SearchHandler.update_tsvector_columns(table)
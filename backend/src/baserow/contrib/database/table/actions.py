@@ -1,5 +1,5 @@
 import dataclasses
-from typing import Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
@@ -19,6 +19,9 @@ from baserow.core.action.scopes import ApplicationActionScopeType
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.utils import ChildProgressBuilder, Progress
 
+if TYPE_CHECKING:
+    from baserow.contrib.database.file_import.readers import ImportFileReader
+
 
 class CreateTableActionType(UndoableActionType):
     type = "create_table"
@@ -44,6 +47,7 @@ class CreateTableActionType(UndoableActionType):
         data: Optional[List[List[Any]]] = None,
         first_row_header: bool = True,
         progress: Optional[Progress] = None,
+        file_reader: Optional["ImportFileReader"] = None,
     ) -> Table:
         """
         Create a table in the specified database.
@@ -59,6 +63,8 @@ class CreateTableActionType(UndoableActionType):
             this options is ignored.
         :param progress: An optional progress instance if you want to track the progress
             of the task.
+        :param file_reader: An optional scanned reader of an import file containing
+            the data.
         :return: The created table and the error report.
         """
 
@@ -70,6 +76,7 @@ class CreateTableActionType(UndoableActionType):
             first_row_header=first_row_header,
             fill_example=True,
             progress=progress,
+            file_reader=file_reader,
         )
 
         workspace = database.workspace
@@ -12,22 +12,51 @@ When we construct a model we:
 3. Check if the version in the cache matches the latest table version in the db.
 4. If they differ, re-query for all the fields and save them in the cache.
 5. If they are the same use the cached field attrs.
+
+On top of that every process keeps a size bounded LRU cache of the fully generated
+model classes, keyed by the table id and the arguments that influence the generated
+model. Every entry stores the versions of the table and of the related tables whose
+models have been generated along with it. Because a table version changes every time
+the fields of the table change, an entry is only used if all of these versions still
+match the ones in the database, which only takes a single query. The cached model
+classes are shared by all the threads of the process, so they're never handed out
+directly. Every caller gets a thin proxy subclass bound to its own table instance and
+to its own copies of the field instances.
 """
+import threading
 import typing
 import uuid
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from copy import copy
+from typing import Any, Dict, Hashable, Optional, Tuple, Type
 
 from django.conf import settings
 from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
 
+from opentelemetry import metrics
+
 from baserow.version import VERSION as BASEROW_VERSION
 
 if typing.TYPE_CHECKING:
-    from baserow.contrib.database.table.models import Table
+    from baserow.contrib.database.table.models import GeneratedTableModel, Table
 
 generated_models_cache = caches[settings.GENERATED_MODEL_CACHE_NAME]
 
+meter = metrics.get_meter(__name__)
+model_lru_cache_hits_counter = meter.create_counter(
+    "baserow.generated_model_lru_cache_hits",
+    unit="1",
+    description="The number of generated table models served from the in-process "
+    "LRU cache.",
+)
+model_lru_cache_misses_counter = meter.create_counter(
+    "baserow.generated_model_lru_cache_misses",
+    unit="1",
+    description="The number of generated table models that were not found in the "
+    "in-process LRU cache and had to be generated.",
+)
+
 
 def table_model_cache_entry_key(table_id: int) -> str:
     return f"full_table_model_{table_id}_{BASEROW_VERSION}"
@@ -52,8 +81,204 @@ def set_cached_model_field_attrs(table: "Table", field_attrs: Dict[str, Any]):
     )
 
 
+class GeneratedModelLRUCache:
+    """
+    A thread safe and size bounded least recently used cache of generated table
+    model classes. Every entry contains the model and the versions of all the tables
+    whose fields have been used to generate it, which includes the related tables
+    of the link row fields, so that an entry can be validated before being used.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, GeneratedModelLRUCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Tuple) -> Optional["GeneratedModelLRUCacheEntry"]:
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Tuple, entry: "GeneratedModelLRUCacheEntry"):
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Tuple):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_table(self, table_id: int):
+        """
+        Removes all the entries that depend on the provided table.
+        """
+
+        with self._lock:
+            for key in [
+                key
+                for key, (_, table_versions) in self._entries.items()
+                if table_id in table_versions
+            ]:
+                del self._entries[key]
+
+    def record_hit(self):
+        self.hits += 1
+        model_lru_cache_hits_counter.add(1)
+
+    def record_miss(self):
+        self.misses += 1
+        model_lru_cache_misses_counter.add(1)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+GeneratedModelLRUCacheEntry = Tuple[Type["GeneratedTableModel"], Dict[int, str]]
+
+generated_models_lru_cache = GeneratedModelLRUCache(
+    settings.BASEROW_GENERATED_MODEL_LRU_CACHE_SIZE
+)
+
+
+def generated_model_lru_cache_key(table: "Table", *args: Hashable) -> Tuple:
+    """
+    Returns the key of the generated model of the table in the in-process LRU cache.
+    The provided args must contain every argument that influences the generated
+    model.
+    """
+
+    return (table.id, *args)
+
+
+def get_lru_cached_model(
+    table: "Table", cache_key: Tuple
+) -> Optional[Type["GeneratedTableModel"]]:
+    """
+    Returns the cached model if the versions of all the tables it has been generated
+    from still match the ones in the database. The version of the provided table is
+    updated in the process, so that it doesn't have to be refreshed separately.
+    """
+
+    from baserow.contrib.database.table.models import Table
+
+    entry = generated_models_lru_cache.get(cache_key)
+    if entry is not None:
+        model, table_versions = entry
+        current_versions = dict(
+            Table.objects_and_trash.filter(id__in=table_versions.keys())
+            .order_by()
+            .values_list("id", "version")
+        )
+        if table.id in current_versions:
+            table.version = current_versions[table.id]
+        if current_versions == table_versions:
+            generated_models_lru_cache.record_hit()
+            return model
+        generated_models_lru_cache.delete(cache_key)
+
+    generated_models_lru_cache.record_miss()
+    return None
+
+
+def set_lru_cached_model(
+    table: "Table",
+    cache_key: Tuple,
+    model: Type["GeneratedTableModel"],
+    related_models: Dict[int, Type["GeneratedTableModel"]],
+):
+    """
+    Stores the generated model in the in-process LRU cache together with the
+    versions of the table and of all the related tables whose models have been
+    generated along with it.
+
+    :param table: The table the model has been generated for. Its version must be
+        the one the model has been generated with.
+    :param cache_key: The key generated by `generated_model_lru_cache_key`.
+    :param model: The generated model.
+    :param related_models: The `manytomany_models` containing the generated models
+        of the related tables.
+    """
+
+    table_versions = {
+        related_model.baserow_table_id: related_model.baserow_table.version
+        for related_model in related_models.values()
+    }
+    table_versions[table.id] = table.version
+    generated_models_lru_cache.set(cache_key, (model, table_versions))
+
+
+def _copy_field_objects(field_objects: Dict[int, Dict]) -> Dict[int, Dict]:
+    """
+    Returns a copy of the field objects of a generated model with copies of the
+    field instances, so that changing them doesn't change the ones of the cached
+    model. The related and prefetched objects themselves are still shared.
+    """
+
+    copied_field_objects = {}
+    for field_id, field_object in field_objects.items():
+        field = copy(field_object["field"])
+        field._state = copy(field._state)
+        field._state.fields_cache = dict(field._state.fields_cache)
+        if hasattr(field, "_prefetched_objects_cache"):
+            field._prefetched_objects_cache = dict(field._prefetched_objects_cache)
+        copied_field_objects[field_id] = {**field_object, "field": field}
+    return copied_field_objects
+
+
+def bind_generated_model(
+    model: Type["GeneratedTableModel"], table: "Table"
+) -> Type["GeneratedTableModel"]:
+    """
+    Returns a proxy subclass of the cached generated model that is bound to the
+    provided table instance and that has its own copies of the field objects. It
+    shares the database fields, the relations and the managers with the cached
+    model, so it's much cheaper to create than generating the model again.
+
+    :param model: The generated model stored in the LRU cache.
+    :param table: The table instance of the caller.
+    :return: The proxy model that can safely be changed by the caller.
+    """
+
+    meta = type(
+        "Meta",
+        (),
+        {
+            "apps": model._meta.apps,
+            "app_label": model._meta.app_label,
+            "proxy": True,
+        },
+    )
+    return type(
+        model.__name__,
+        (model,),
+        {
+            "Meta": meta,
+            "__module__": model.__module__,
+            "baserow_table": table,
+            "_field_objects": _copy_field_objects(model._field_objects),
+            "_trashed_field_objects": _copy_field_objects(model._trashed_field_objects),
+        },
+    )
+
+
 def clear_generated_model_cache():
     print("Clearing Baserow's internal generated model cache...")
+    generated_models_lru_cache.clear()
     if hasattr(generated_models_cache, "delete_pattern"):
         generated_models_cache.delete_pattern("full_table_model_*")
     elif settings.TESTS:
@@ -75,3 +300,6 @@ def invalidate_table_in_model_cache(table_id: int):
     from baserow.contrib.database.table.models import Table
 
     Table.objects_and_trash.filter(id=table_id).update(version=new_version)
+    # The entries of other processes won't be used anymore because of the new
+    # version, but the ones of this process can already be freed.
+    generated_models_lru_cache.invalidate_table(table_id)
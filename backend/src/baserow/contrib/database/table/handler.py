@@ -1,9 +1,9 @@
 import traceback
-from typing import Any, Dict, List, NewType, Optional, Tuple, cast
+from typing import TYPE_CHECKING, Any, Dict, List, NewType, Optional, Tuple, cast
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
-from django.db import DatabaseError, ProgrammingError
+from django.db import DatabaseError, ProgrammingError, connection
 from django.db.models import QuerySet, Sum
 from django.utils import timezone, translation
 from django.utils.translation import gettext as _
@@ -28,13 +28,14 @@ from baserow.contrib.database.operations import (
     OrderTablesDatabaseTableOperationType,
 )
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.view_types import GridViewType
 from baserow.core.handler import CoreHandler
 from baserow.core.registries import application_type_registry
 from baserow.core.telemetry.utils import baserow_trace_methods
 from baserow.core.trash.handler import TrashHandler
-from baserow.core.utils import ChildProgressBuilder, Progress, find_unused_name
+from baserow.core.utils import ChildProgressBuilder, Progress, find_unused_name, grouper
 
 from .constants import TABLE_CREATION
 from .exceptions import (
@@ -51,10 +52,21 @@ from .operations import (
     DuplicateDatabaseTableOperationType,
     UpdateDatabaseTableOperationType,
 )
+from .row_counts import flush_table_row_counts
 from .signals import table_created, table_deleted, table_updated, tables_reordered
 
+if TYPE_CHECKING:
+    from baserow.contrib.database.file_import.readers import ImportFileReader
+
 BATCH_SIZE = 1024
 
+# The rows of a table are counted again by the periodic row count job when the
+# maintained row count deviates more than this from the estimation of PostgreSQL.
+# The estimation is only updated when the table is vacuumed or analyzed, which by
+# default happens after 10% of the rows have changed.
+ROW_COUNT_ESTIMATE_MIN_DRIFT = 100
+ROW_COUNT_ESTIMATE_MAX_DRIFT_RATIO = 0.2
+
 TableForUpdate = NewType("TableForUpdate", Table)
 
 tracer = trace.get_tracer(__name__)
@@ -135,6 +147,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         first_row_header: bool = True,
         fill_example: bool = False,
         progress: Optional[Progress] = None,
+        file_reader: Optional["ImportFileReader"] = None,
     ):
         """
         Creates a new table from optionally provided data. If no data is specified,
@@ -153,6 +166,9 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         :param fill_example: Fill the table with example field and data.
         :param progress: An optional progress instance if you want to track the progress
             of the task.
+        :param file_reader: An optional scanned reader of an import file. If provided,
+            the data are streamed from the file instead of the `data` parameter and
+            the `first_row_header` parameter of the reader is used.
         :return: The created table and the error report.
         """
 
@@ -166,6 +182,24 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         if progress:
             progress.increment(0, state=TABLE_CREATION)
 
+        if file_reader is not None:
+            fields = self.get_initial_table_fields_from_file(file_reader)
+            table = self.create_table_and_fields(user, database, name, fields)
+            rows = (
+                ["" if value is None else str(value) for value in row]
+                for row in file_reader.iter_rows()
+            )
+            _, error_report = RowHandler().import_rows_in_chunks(
+                user,
+                table,
+                rows,
+                row_count=file_reader.row_count,
+                progress=progress,
+                send_signal=False,
+            )
+            table_created.send(self, table=table, user=user)
+            return table, error_report
+
         if data is not None:
             (fields, data,) = self.normalize_initial_table_data(
                 data, first_row_header=first_row_header
@@ -208,10 +242,14 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         """
 
         last_order = Table.get_last_order(database)
+        # The table is empty, so the rows created from now on can be counted
+        # incrementally right away.
         table = Table.objects.create(
             database=database,
             order=last_order,
             name=name,
+            row_count=0,
+            row_count_updated_at=timezone.now(),
         )
 
         # Let's create the fields before creating the model so that the whole
@@ -255,6 +293,9 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             model = table.get_model(managed=True)
             schema_editor.create_model(model)
 
+        if settings.BASEROW_USE_PG_FULLTEXT_SEARCH:
+            SearchHandler.create_tsvector_column(table, backfill=False)
+
         return table
 
     def normalize_initial_table_data(
@@ -277,24 +318,70 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             the rows.
         """
 
-        if len(data) == 0:
+        self._check_initial_table_data_row_count(len(data))
+        largest_column_count = len(max(data, key=len))
+        fields = data.pop(0) if first_row_header else []
+        fields_with_type = self.get_initial_table_fields(fields, largest_column_count)
+        result = [[str(value) for value in row] for row in data]
+
+        return fields_with_type, result
+
+    def get_initial_table_fields_from_file(
+        self, file_reader: "ImportFileReader"
+    ) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Returns the fields that must be created for the data of a scanned import file
+        reader. Does the same checks as `normalize_initial_table_data` without
+        having to load the data of the file in memory.
+
+        :param file_reader: The scanned reader of the import file.
+        :return: A list containing the field names with a type.
+        """
+
+        header = file_reader.header
+        self._check_initial_table_data_row_count(
+            file_reader.row_count + (0 if header is None else 1)
+        )
+        return self.get_initial_table_fields(
+            [] if header is None else [str(name).strip() for name in header],
+            file_reader.column_count,
+        )
+
+    def _check_initial_table_data_row_count(self, row_count: int):
+        if row_count == 0:
             raise InvalidInitialTableData("At least one row should be provided.")
 
         limit = settings.INITIAL_TABLE_DATA_LIMIT
-        if limit and len(data) > limit:
+        if limit and row_count > limit:
             raise InitialTableDataLimitExceeded(
                 f"It is not possible to import more than "
                 f"{settings.INITIAL_TABLE_DATA_LIMIT} rows when creating a table."
             )
 
-        largest_column_count = len(max(data, key=len))
+    def get_initial_table_fields(
+        self, fields: List[Any], column_count: int
+    ) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Returns the text fields that must be created for the provided header. A
+        field named "Field N" is added for every column that is missing in the
+        header.
 
-        if largest_column_count == 0:
-            raise InvalidInitialTableData("At least one column should be provided.")
+        :param fields: The names of the header row, or an empty list if the data
+            doesn't have a header.
+        :param column_count: The highest number of columns of the data.
+        :raises InvalidInitialTableData: When the data doesn't contain a column.
+        :raises MaxFieldNameLengthExceeded: When the provided name is too long.
+        :raises InitialTableDataDuplicateName: When duplicates exit in field names.
+        :raises ReservedBaserowFieldNameException: When the field name is reserved by
+            Baserow.
+        :raises InvalidBaserowFieldName: When the field name is invalid (empty).
+        :return: A list containing the field names with a type.
+        """
 
-        fields = data.pop(0) if first_row_header else []
+        if column_count == 0:
+            raise InvalidInitialTableData("At least one column should be provided.")
 
-        for i in range(len(fields), largest_column_count):
+        for i in range(len(fields), column_count):
             fields.append(_("Field %d") % (i + 1,))
 
         if len(fields) > settings.MAX_FIELD_LIMIT:
@@ -322,10 +409,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         if "" in field_name_set:
             raise InvalidBaserowFieldName()
 
-        fields_with_type = [(field_name, "text", {}) for field_name in fields]
-        result = [[str(value) for value in row] for row in data]
-
-        return fields_with_type, result
+        return [(field_name, "text", {}) for field_name in fields]
 
     def get_example_table_field_and_data(self):
         """
@@ -593,45 +677,98 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         table_deleted.send(self, table_id=table.id, table=table, user=user)
 
     @classmethod
-    def count_rows(cls) -> int:
+    def count_rows(cls, exact: bool = False) -> int:
         """
-        Counts how many rows each user table has and stores the count
-        for later reference.
-        :returns: The number of tables counted.
+        Reconciles the row counts of the user tables. The row counts are maintained
+        incrementally when rows are created, deleted and restored, so first the
+        pending changes are flushed. After that, the rows of a table are only counted
+        again if the table hasn't been counted yet, or if its row count deviates too
+        much from the number of rows estimated by PostgreSQL, which is a lot cheaper
+        than counting the rows of every table.
+
+        :param exact: If True, the rows of every table are counted, regardless of
+            the estimation.
+        :returns: The number of tables checked.
         """
 
+        flush_table_row_counts()
+
         chunk_size = 200
         tables_to_store = []
         time = timezone.now()
         i = 0
-        for table in Table.objects.filter(
-            database__workspace__template__isnull=True
-        ).iterator(chunk_size=chunk_size):
-            try:
-                count = table.get_model(field_ids=[]).objects.count()
-                table.row_count = count
-                table.row_count_updated_at = time
-                tables_to_store.append(table)
-            except ProgrammingError as e:
-                if f'"database_table_{table.id}" does not exist' in str(e):
-                    logger.warning(f"Error while counting rows {e}")
-                else:
-                    raise e
+        tables = Table.objects.filter(database__workspace__template__isnull=True)
+        for chunk in grouper(chunk_size, tables.iterator(chunk_size=chunk_size)):
+            estimates = {} if exact else cls._get_estimated_row_counts(chunk)
+            for table in chunk:
+                i += 1
+                if not exact and not cls._row_count_needs_counting(
+                    table.row_count, estimates.get(table.id, None)
+                ):
+                    continue
+
+                try:
+                    count = table.get_model(field_ids=[]).objects.count()
+                    table.row_count = count
+                    table.row_count_updated_at = time
+                    tables_to_store.append(table)
+                except ProgrammingError as e:
+                    if f'"database_table_{table.id}" does not exist' in str(e):
+                        logger.warning(f"Error while counting rows {e}")
+                    else:
+                        raise e
 
             # This makes sure we don't pollute the memory
-            if i % chunk_size == 0:
+            if len(tables_to_store) > 0:
                 Table.objects.bulk_update(
                     tables_to_store, ["row_count", "row_count_updated_at"]
                 )
                 tables_to_store = []
-            i += 1
 
-        if len(tables_to_store) > 0:
-            Table.objects.bulk_update(
-                tables_to_store, ["row_count", "row_count_updated_at"]
+        return i
+
+    @classmethod
+    def _get_estimated_row_counts(cls, tables: List[Table]) -> Dict[int, int]:
+        """
+        Returns the number of rows PostgreSQL estimates the tables to have, based on
+        the statistics collected by the last vacuum or analyze. The estimation is
+        negative if the statistics haven't been collected yet.
+        """
+
+        table_ids_by_name = {
+            table.get_database_table_name(): table.id for table in tables
+        }
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT relname, reltuples FROM pg_class "
+                "WHERE relname = ANY(%s) AND relkind = 'r'",
+                [list(table_ids_by_name.keys())],
             )
+            return {
+                table_ids_by_name[name]: int(reltuples)
+                for name, reltuples in cursor.fetchall()
+            }
 
-        return i
+    @classmethod
+    def _row_count_needs_counting(
+        cls, row_count: Optional[int], estimate: Optional[int]
+    ) -> bool:
+        """
+        Indicates whether the rows of a table must be counted, because the
+        incrementally maintained row count is missing or deviates from the estimation
+        of PostgreSQL by more than the estimation can be off. The estimation also
+        includes the trashed rows, so tables with a lot of trashed rows are counted
+        every time.
+        """
+
+        if row_count is None or estimate is None or estimate < 0:
+            return True
+
+        drift = abs(estimate - row_count)
+        return drift > max(
+            ROW_COUNT_ESTIMATE_MIN_DRIFT,
+            ROW_COUNT_ESTIMATE_MAX_DRIFT_RATIO * max(estimate, row_count),
+        )
 
     @classmethod
     def get_total_row_count_of_workspace(cls, workspace_id: int) -> int:
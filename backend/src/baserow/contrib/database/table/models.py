@@ -1,10 +1,11 @@
 import re
-from typing import Any, Dict, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 from django.apps import apps
 from django.conf import settings
 from django.db import models
 from django.db.models import F, JSONField, Q, QuerySet
+from django.db.models.query import ModelIterable
 
 from opentelemetry import trace
 
@@ -21,9 +22,15 @@ from baserow.contrib.database.fields.field_filters import (
 from baserow.contrib.database.fields.field_sortings import AnnotatedOrder
 from baserow.contrib.database.fields.models import CreatedOnField, LastModifiedField
 from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.index_advisor.constants import INDEX_USAGE_SORT
+from baserow.contrib.database.index_advisor.usage import record_field_index_usage
 from baserow.contrib.database.table.cache import (
+    bind_generated_model,
+    generated_model_lru_cache_key,
     get_cached_model_field_attrs,
+    get_lru_cached_model,
     set_cached_model_field_attrs,
+    set_lru_cached_model,
 )
 from baserow.contrib.database.views.exceptions import ViewFilterTypeNotAllowedForField
 from baserow.contrib.database.views.registries import view_filter_type_registry
@@ -51,40 +58,109 @@ tracer = trace.get_tracer(__name__)
 
 
 class TableModelQuerySet(models.QuerySet):
-    def enhance_by_fields(self):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._rows_fetched_callbacks = []
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._rows_fetched_callbacks = list(self._rows_fetched_callbacks)
+        return clone
+
+    def _fetch_all(self):
+        already_fetched = self._result_cache is not None
+        super()._fetch_all()
+        if (
+            not already_fetched
+            and self._result_cache
+            and issubclass(self._iterable_class, ModelIterable)
+        ):
+            for callback in self._rows_fetched_callbacks:
+                callback(self._result_cache)
+
+    def on_rows_fetched(
+        self, callback: Callable[[List["GeneratedTableModel"]], None]
+    ) -> "TableModelQuerySet":
+        """
+        Registers a callback that is called with the list of fetched rows once the
+        queryset is evaluated, just like a `prefetch_related` lookup. This can be used
+        to fetch related data for all the rows at once in a way that can't be
+        expressed with a `Prefetch` object. The callback is not called when the rows
+        are fetched with `iterator()`.
+
+        :param callback: The function called with the list of fetched rows.
+        :return: The queryset having the callback.
+        """
+
+        clone = self._chain()
+        clone._rows_fetched_callbacks.append(callback)
+        return clone
+
+    def enhance_by_fields(self, related_rows_limit: Optional[int] = None):
         """
         Enhances the queryset based on the `enhance_queryset` for each field in the
         table. For example the `link_row` field adds the `prefetch_related` to prevent
         N queries per row. This helper should only be used when multiple rows are going
         to be fetched.
 
+        :param related_rows_limit: If provided, the fields referencing many related
+            rows, like the `link_row` field, only fetch this number of related rows
+            per row and the total count of related rows.
         :return: The enhanced queryset.
         :rtype: QuerySet
         """
 
         for field_object in self.model._field_objects.values():
-            self = field_object["type"].enhance_queryset(
-                self, field_object["field"], field_object["name"]
-            )
+            if related_rows_limit is None:
+                self = field_object["type"].enhance_queryset(
+                    self, field_object["field"], field_object["name"]
+                )
+            else:
+                self = field_object["type"].enhance_queryset_with_related_rows_limit(
+                    self,
+                    field_object["field"],
+                    field_object["name"],
+                    related_rows_limit,
+                )
         return self
 
-    def search_all_fields(self, search, only_search_by_field_ids=None):
+    def search_all_fields(
+        self, search, only_search_by_field_ids=None, search_mode=None
+    ):
         """
         Performs a very broad search across all supported fields with the given search
         query. If the primary key value matches then that result will be returned
         otherwise all field types other than link row and boolean fields are currently
         searched.
 
+        If the full-text search mode is used and the table has a full-text search
+        column, the search is done using that column and its GIN index instead of
+        doing a contains filter on every field.
+
         :param search: The search query.
         :type search: str
         :param only_search_by_field_ids: Only field ids in this iterable will be
             filtered by the search term. Other fields not in the iterable will be
             ignored and not be filtered.
         :type only_search_by_field_ids: Optional[Iterable[int]]
+        :param search_mode: Either `compat` or `full-text`. The default search mode
+            is used if not provided.
+        :type search_mode: Optional[str]
         :return: The queryset containing the search queries.
         :rtype: QuerySet
         """
 
+        from baserow.contrib.database.search.handler import SearchHandler
+
+        if SearchHandler.can_use_full_text_search(
+            self.model.baserow_table, search_mode, only_search_by_field_ids
+        ):
+            search_filter = SearchHandler.get_full_text_search_filter(
+                self.model, search
+            )
+            if search_filter is not None:
+                return self.filter(search_filter)
+
         filter_builder = FilterBuilder(filter_type=FILTER_TYPE_OR).filter(
             Q(id__contains=search)
         )
@@ -208,6 +284,10 @@ class TableModelQuerySet(models.QuerySet):
             user_field_name = field_object["field"].name
             error_display_name = user_field_name if user_field_names else field_name
 
+            if index == 0:
+                # Only the first sort can be served by an index on the column.
+                record_field_index_usage([(field.id, INDEX_USAGE_SORT)])
+
             if not field_object["type"].check_can_order_by(field_object["field"]):
                 raise OrderByFieldNotPossible(
                     error_display_name,
@@ -285,6 +365,7 @@ class TableModelQuerySet(models.QuerySet):
             raise ValueError(f"Unknown filter type {filter_type}.")
 
         filter_builder = FilterBuilder(filter_type=filter_type)
+        index_usages = []
 
         for key, values in filter_object.items():
             matches = deconstruct_filter_key_regex.match(key)
@@ -334,6 +415,10 @@ class TableModelQuerySet(models.QuerySet):
                     )
                 )
 
+            if field_instance.id is not None:
+                index_usages.append((field_instance.id, view_filter_type.index_usage))
+
+        record_field_index_usage(index_usages)
         return filter_builder.apply_to_queryset(self)
 
 
@@ -428,6 +513,11 @@ class Table(
     row_count = models.PositiveIntegerField(null=True)
     row_count_updated_at = models.DateTimeField(null=True)
     version = models.TextField(default="initial_version")
+    tsvector_column_created = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the full-text search column has been created "
+        "and filled for all the rows of the table.",
+    )
 
     class Meta:
         ordering = ("order",)
@@ -460,6 +550,8 @@ class Table(
         this table. Note that the model will not be registered with the apps because
         of the `DatabaseConfig.prevent_generated_model_for_registering` hack. We do
         not want to the model cached because models with the same name can differ.
+        Instead, the generated models are kept in an in-process LRU cache validated
+        using the table versions, see `baserow.contrib.database.table.cache`.
 
         :param fields: Extra table field instances that need to be added the model.
         :type fields: list
@@ -485,7 +577,8 @@ class Table(
             Only in very specific limited situations should this be enabled as
             generally Baserow itself manages most aspects of returned generated models.
         :type managed: bool
-        :param use_cache: Indicates whether a cached model can be used.
+        :param use_cache: Indicates whether a cached model or cached field
+            attributes can be used.
         :type use_cache: bool
         :return: The generated model.
         :rtype: Model
@@ -497,9 +590,36 @@ class Table(
         if fields is None:
             fields = []
 
+        # Models that are generated while generating the model of a related table,
+        # or that contain extra field instances, can't be shared and are therefore
+        # never stored in the in-process LRU cache.
+        use_lru_cache = (
+            use_cache
+            and len(fields) == 0
+            and not manytomany_models
+            and managed is False
+            and not settings.BASEROW_DISABLE_MODEL_CACHE
+        )
+
         if manytomany_models is None:
             manytomany_models = {}
 
+        lru_cache_key = None
+        if use_lru_cache:
+            lru_cache_key = generated_model_lru_cache_key(
+                self,
+                None if field_ids is None else tuple(sorted(field_ids)),
+                None if field_names is None else tuple(sorted(field_names)),
+                attribute_names,
+                add_dependencies,
+            )
+            model = get_lru_cached_model(self, lru_cache_key)
+            if model is not None:
+                # The cached model has been generated for the same table versions, so
+                # it only needs to be bound to the table instance of the caller.
+                return bind_generated_model(model, self)
+            self.refresh_from_db(fields=["version"])
+
         app_label = "database_table"
         meta = type(
             "Meta",
@@ -565,7 +685,8 @@ class Table(
         )
 
         if use_cache:
-            self.refresh_from_db(fields=["version"])
+            if not use_lru_cache:
+                self.refresh_from_db(fields=["version"])
             field_attrs = get_cached_model_field_attrs(self)
         else:
             field_attrs = None
@@ -599,6 +720,10 @@ class Table(
 
         self._after_model_generation(attrs, manytomany_models, model)
 
+        if lru_cache_key is not None:
+            set_lru_cached_model(self, lru_cache_key, model, manytomany_models)
+            return bind_generated_model(model, self)
+
         return model
 
     @baserow_trace(tracer)
@@ -0,0 +1,135 @@
+from typing import Dict, Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from baserow.core.cache import add_to_cached_id_set, pop_cached_id_set
+from baserow.core.utils import grouper
+
+from .models import Table
+
+TABLES_WITH_ROW_COUNT_DELTA_CACHE_KEY = "database_tables_with_row_count_delta"
+
+
+def get_table_row_count_delta_cache_key(table_id: int) -> str:
+    return f"database_table_{table_id}_row_count_delta"
+
+
+def _increment_table_row_count_delta(table_id: int, delta: int):
+    cache_key = get_table_row_count_delta_cache_key(table_id)
+    if not cache.add(cache_key, delta, timeout=None):
+        try:
+            cache.incr(cache_key, delta)
+        except ValueError:
+            # The counter has been removed in the meantime.
+            cache.add(cache_key, delta, timeout=None)
+
+
+def update_table_row_count(table_id: int, delta: int):
+    """
+    Adds the provided number of created, or removes the provided number of deleted,
+    rows to the row count of the table once the current transaction commits. To
+    avoid that all the requests changing the rows of the same table must wait for
+    the lock on the table row, the changes are accumulated in the cache and written
+    to the database periodically by `flush_table_row_counts`.
+
+    :param table_id: The id of the table whose rows have been created or deleted.
+    :param delta: The number of created rows, or the negative number of deleted
+        rows.
+    """
+
+    if not delta:
+        return
+
+    def increment():
+        _increment_table_row_count_delta(table_id, delta)
+        add_to_cached_id_set(TABLES_WITH_ROW_COUNT_DELTA_CACHE_KEY, [table_id])
+
+    transaction.on_commit(increment)
+
+
+def pop_table_row_count_deltas(table_ids: Iterable[int]) -> Dict[int, int]:
+    """
+    Returns the row count changes of the provided tables that have been accumulated
+    in the cache, and subtracts them from the counters. Only the returned deltas are
+    subtracted, so that the changes made in the meantime are returned by the next
+    call.
+
+    :param table_ids: The ids of the tables to get the row count changes of.
+    :return: The number of rows to add to the row count per table id.
+    """
+
+    cache_keys = {
+        get_table_row_count_delta_cache_key(table_id): table_id
+        for table_id in table_ids
+    }
+    counts = cache.get_many(list(cache_keys.keys()))
+
+    deltas = {}
+    for cache_key, delta in counts.items():
+        if not delta:
+            continue
+        deltas[cache_keys[cache_key]] = delta
+        try:
+            cache.decr(cache_key, delta)
+        except ValueError:
+            pass
+    return deltas
+
+
+def flush_table_row_counts(batch_size: int = 1000) -> int:
+    """
+    Writes the row count changes accumulated in the cache by `update_table_row_count`
+    to the tables in the database. The changes of tables that haven't been counted
+    yet are discarded, because they will be counted exactly by the next run of
+    `TableHandler.count_rows`. Only the tables of which rows have been created or
+    deleted since the last flush are checked.
+
+    :param batch_size: The number of tables of which the changes are checked at
+        once.
+    :return: The number of updated tables.
+    """
+
+    updated = 0
+    table_ids = sorted(pop_cached_id_set(TABLES_WITH_ROW_COUNT_DELTA_CACHE_KEY))
+    now = timezone.now()
+    deltas = {}
+
+    try:
+        for batch in grouper(batch_size, table_ids):
+            # Reset first, so that the already written changes of the previous
+            # batch are never added back if popping the next ones fails.
+            deltas = {}
+            deltas = pop_table_row_count_deltas(batch)
+            if not deltas:
+                continue
+
+            updated += Table.objects_and_trash.filter(
+                id__in=deltas.keys(), row_count__isnull=False
+            ).update(
+                row_count=Greatest(
+                    F("row_count")
+                    + Case(
+                        *[
+                            When(id=table_id, then=Value(delta))
+                            for table_id, delta in deltas.items()
+                        ],
+                        output_field=IntegerField(),
+                    ),
+                    0,
+                ),
+                row_count_updated_at=now,
+            )
+    except Exception:
+        # The changes of the batch that failed have already been subtracted from the
+        # counters, so they're added back together with the tables to be retried by
+        # the next flush.
+        for table_id, delta in deltas.items():
+            _increment_table_row_count_delta(table_id, delta)
+        add_to_cached_id_set(TABLES_WITH_ROW_COUNT_DELTA_CACHE_KEY, table_ids)
+        raise
+
+    return updated
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from datetime import timedelta
 
 from django.conf import settings
 
@@ -35,12 +36,27 @@ def run_row_count_job():
         TableHandler.count_rows()
 
 
+@app.task(queue="export")
+def flush_row_counts():
+    """
+    Writes the row count changes accumulated in the cache to the tables.
+    """
+
+    from baserow.contrib.database.table.row_counts import flush_table_row_counts
+
+    flush_table_row_counts()
+
+
 @app.on_after_finalize.connect
 def setup_periodic_tasks(sender, **kwargs):
     sender.add_periodic_task(
         settings.BASEROW_ROW_COUNT_JOB_CRONTAB,
         run_row_count_job.s(),
     )
+    sender.add_periodic_task(
+        timedelta(seconds=settings.BASEROW_ROW_COUNT_FLUSH_INTERVAL_SECONDS),
+        flush_row_counts.s(),
+    )
 
 
 def unsubscribe_subject_from_tables_currently_subscribed_to(
@@ -8,7 +8,6 @@ from baserow.core.usage.registries import UsageInBytes, WorkspaceStorageUsageIte
 from baserow.core.user_files.models import UserFile
 
 FILENAMES_PER_GROUP_PLPGSQL_FUNCTION = """
-drop function if exists filenames_per_group(integer);
 create or replace function
 filenames_per_group(workspace_id integer) returns table(filename text)
 as
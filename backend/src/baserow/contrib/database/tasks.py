@@ -1,3 +1,6 @@
+from baserow.contrib.database.formula.tasks import (
+    warm_up_formula_expression_cache_on_worker_init,
+)
 from baserow.contrib.database.table.tasks import setup_periodic_tasks
 
-__all__ = ["setup_periodic_tasks"]
+__all__ = ["setup_periodic_tasks", "warm_up_formula_expression_cache_on_worker_init"]
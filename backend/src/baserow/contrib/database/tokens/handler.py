@@ -1,5 +1,8 @@
-from typing import List, Union
+from typing import Iterable, List, Union
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
 
 from rest_framework.request import Request
@@ -11,10 +14,11 @@ from baserow.contrib.database.tokens.constants import (
     TOKEN_OPERATION_TYPES,
     TOKEN_TO_OPERATION_MAP,
 )
+from baserow.core.cache import add_to_cached_id_set, pop_cached_id_set
 from baserow.core.handler import CoreHandler
 from baserow.core.registries import object_scope_type_registry
 from baserow.core.types import PermissionCheck
-from baserow.core.utils import random_string
+from baserow.core.utils import grouper, random_string
 
 from .exceptions import (
     MaximumUniqueTokenTriesError,
@@ -30,10 +34,28 @@ from .operations import (
 )
 
 
+def get_token_cache_key(key: str) -> str:
+    return f"database_token_{key}"
+
+
+def get_token_usage_calls_cache_key(token_id: int) -> str:
+    return f"database_token_{token_id}_usage_calls"
+
+
+def get_token_usage_last_call_cache_key(token_id: int) -> str:
+    return f"database_token_{token_id}_usage_last_call"
+
+
+TOKENS_WITH_USAGE_CACHE_KEY = "database_tokens_with_usage"
+
+
 class TokenHandler:
     def get_by_key(self, key):
         """
-        Fetches a single token instance based on the key.
+        Fetches a single token instance based on the key. Because a token can be
+        used for many requests per second, the token, its workspace and its user are
+        cached for a short period of time. The cache is invalidated when the token
+        is changed or deleted, or when its workspace or user is changed.
 
         :param key: The unique token key.
         :param key: str
@@ -43,13 +65,39 @@ class TokenHandler:
         :rtype: Token
         """
 
+        cache_key = get_token_cache_key(key)
+        token = cache.get(cache_key)
+        if token is not None:
+            return token
+
         try:
-            token = Token.objects.select_related("workspace").get(key=key)
+            token = Token.objects.select_related("workspace", "user").get(key=key)
         except Token.DoesNotExist:
             raise TokenDoesNotExist(f"The token with key {key} does not exist.")
 
+        cache.set(
+            cache_key, token, timeout=settings.BASEROW_TOKEN_CACHE_TIMEOUT_SECONDS
+        )
         return token
 
+    def invalidate_token_cache(self, keys: Iterable[str]):
+        """
+        Removes the tokens having the provided keys from the cache used by
+        `get_by_key`. This must be called whenever a change can affect the
+        authentication with the token. The tokens are removed again when the
+        transaction commits because a concurrent request could have cached the old
+        state in the meantime.
+
+        :param keys: The keys of the tokens that must be removed from the cache.
+        """
+
+        cache_keys = [get_token_cache_key(key) for key in keys]
+        if not cache_keys:
+            return
+
+        cache.delete_many(cache_keys)
+        transaction.on_commit(lambda: cache.delete_many(cache_keys))
+
     def get_token(self, user, token_id, base_queryset=None):
         """
         Fetches a single token and checks if the user belongs to the workspace.
@@ -163,8 +211,10 @@ class TokenHandler:
                 "The user is not authorized to rotate the " "key."
             )
 
+        old_key = token.key
         token.key = self.generate_unique_key()
         token.save()
+        self.invalidate_token_cache([old_key])
 
         return token
 
@@ -354,6 +404,8 @@ class TokenHandler:
         if len(to_create) > 0:
             TokenPermission.objects.bulk_create(to_create)
 
+        self.invalidate_token_cache([token.key])
+
     def has_table_permission(
         self, token: Token, type_name: Union[str, List[str]], table: Table
     ) -> bool:
@@ -472,7 +524,9 @@ class TokenHandler:
     def update_token_usage(self, token):
         """
         Increases the amount of handled calls and updates the last call timestamp of
-        the token.
+        the token. To avoid that all the requests using the same token must wait for
+        the lock on the token row, the usage is accumulated in the cache and written
+        to the database periodically by `flush_token_usage`.
 
         :param token: The token instance that needs to be updated.
         :param token: Token
@@ -480,8 +534,78 @@ class TokenHandler:
         :rtype: Token
         """
 
+        now = timezone.now()
+        calls_cache_key = get_token_usage_calls_cache_key(token.id)
+        if not cache.add(calls_cache_key, 1, timeout=None):
+            cache.incr(calls_cache_key)
+        cache.set(get_token_usage_last_call_cache_key(token.id), now, timeout=None)
+        add_to_cached_id_set(TOKENS_WITH_USAGE_CACHE_KEY, [token.id])
+
         token.handled_calls += 1
-        token.last_call = timezone.now()
-        token.save()
+        token.last_call = now
 
         return token
+
+    def flush_token_usage(self, batch_size: int = 1000) -> int:
+        """
+        Writes the usage accumulated in the cache by `update_token_usage` to the
+        tokens in the database. Only the tokens that have been used since the last
+        flush are checked.
+
+        :param batch_size: The number of tokens of which the usage is checked at
+            once.
+        :return: The number of updated tokens.
+        """
+
+        updated = 0
+        token_ids = sorted(pop_cached_id_set(TOKENS_WITH_USAGE_CACHE_KEY))
+
+        try:
+            for batch in grouper(batch_size, token_ids):
+                cache_keys = {
+                    token_id: (
+                        get_token_usage_calls_cache_key(token_id),
+                        get_token_usage_last_call_cache_key(token_id),
+                    )
+                    for token_id in batch
+                }
+                usage = cache.get_many(
+                    [key for keys in cache_keys.values() for key in keys]
+                )
+                calls_per_token = {
+                    token_id: usage[calls_key]
+                    for token_id, (calls_key, _) in cache_keys.items()
+                    if usage.get(calls_key)
+                }
+                if not calls_per_token:
+                    continue
+
+                with transaction.atomic():
+                    tokens = list(
+                        Token.objects_and_trash.select_for_update(of=("self",))
+                        .filter(id__in=calls_per_token.keys())
+                        .only("id", "handled_calls", "last_call")
+                    )
+                    for token in tokens:
+                        token.handled_calls += calls_per_token[token.id]
+                        last_call = usage.get(cache_keys[token.id][1])
+                        if last_call and (
+                            token.last_call is None or last_call > token.last_call
+                        ):
+                            token.last_call = last_call
+                    Token.objects_and_trash.bulk_update(
+                        tokens, ["handled_calls", "last_call"]
+                    )
+
+                # Only the flushed calls are subtracted, so that the calls made in the
+                # meantime are written during the next flush.
+                for token_id, calls in calls_per_token.items():
+                    cache.decr(cache_keys[token_id][0], calls)
+                updated += len(tokens)
+        except Exception:
+            # The usage of the tokens is only written if they're checked again, so
+            # they're added back to be retried by the next flush.
+            add_to_cached_id_set(TOKENS_WITH_USAGE_CACHE_KEY, token_ids)
+            raise
+
+        return updated
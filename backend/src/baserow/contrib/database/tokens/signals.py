@@ -0,0 +1,46 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from baserow.core.models import Workspace
+
+from .handler import TokenHandler
+from .models import Token
+
+User = get_user_model()
+
+
+def _fields_updated(update_fields, field_names) -> bool:
+    return update_fields is None or any(
+        field_name in update_fields for field_name in field_names
+    )
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def invalidate_token_cache_when_token_changed(sender, instance, **kwargs):
+    TokenHandler().invalidate_token_cache([instance.key])
+
+
+@receiver(post_save, sender=Workspace)
+def invalidate_token_cache_when_workspace_trashed(
+    sender, instance, update_fields=None, **kwargs
+):
+    if _fields_updated(update_fields, ["trashed"]):
+        TokenHandler().invalidate_token_cache(
+            Token.objects_and_trash.filter(workspace_id=instance.id).values_list(
+                "key", flat=True
+            )
+        )
+
+
+@receiver(post_save, sender=User)
+def invalidate_token_cache_when_user_changed(
+    sender, instance, update_fields=None, **kwargs
+):
+    if _fields_updated(update_fields, ["is_active"]):
+        TokenHandler().invalidate_token_cache(
+            Token.objects_and_trash.filter(user_id=instance.id).values_list(
+                "key", flat=True
+            )
+        )
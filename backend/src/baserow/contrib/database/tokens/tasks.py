@@ -0,0 +1,24 @@
+from datetime import timedelta
+
+from django.conf import settings
+
+from baserow.config.celery import app
+
+
+@app.task(bind=True, queue="export")
+def flush_token_usage(self):
+    """
+    Writes the token usage accumulated in the cache to the database.
+    """
+
+    from baserow.contrib.database.tokens.handler import TokenHandler
+
+    TokenHandler().flush_token_usage()
+
+
+@app.on_after_finalize.connect
+def setup_periodic_tasks(sender, **kwargs):
+    sender.add_periodic_task(
+        timedelta(seconds=settings.BASEROW_TOKEN_USAGE_FLUSH_INTERVAL_SECONDS),
+        flush_token_usage.s(),
+    )
@@ -13,6 +13,7 @@ from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.signals import rows_created
 from baserow.contrib.database.table.models import GeneratedTableModel, Table
+from baserow.contrib.database.table.row_counts import update_table_row_count
 from baserow.contrib.database.table.signals import table_created, table_updated
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import View
@@ -277,6 +278,7 @@ class RowTrashableItemType(TrashableItemType):
         super().restore(trashed_item, trash_entry)
 
         table = self.get_parent(trashed_item, trash_entry.parent_trash_item_id)
+        update_table_row_count(table.id, 1)
 
         model = table.get_model()
 
@@ -405,7 +407,8 @@ class RowsTrashableItemType(TrashableItemType):
         rows_to_restore_queryset = table_model.objects_and_trash.filter(
             id__in=trashed_item.row_ids
         )
-        rows_to_restore_queryset.update(trashed=False)
+        restored_count = rows_to_restore_queryset.update(trashed=False)
+        update_table_row_count(table.id, restored_count)
         rows_to_restore = rows_to_restore_queryset.enhance_by_fields()
         trashed_item.delete()
 
@@ -431,6 +434,8 @@ class RowsTrashableItemType(TrashableItemType):
                 )
         update_collector.apply_updates_and_get_updated_fields(field_cache)
 
+        ViewHandler().field_value_updated(updated_fields)
+
         if len(rows_to_restore) < 50:
             rows_created.send(
                 self,
@@ -0,0 +1,159 @@
+from typing import Dict, Iterable, List, Optional, Set
+
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from baserow.contrib.database.fields.field_types import FileFieldType
+from baserow.contrib.database.fields.models import FileField
+from baserow.contrib.database.fields.signals import (
+    field_deleted,
+    field_restored,
+    field_updated,
+)
+from baserow.contrib.database.rows.signals import (
+    before_rows_update,
+    rows_created,
+    rows_updated,
+)
+from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.table.signals import table_created, table_deleted
+from baserow.contrib.database.views.models import FormView
+from baserow.contrib.database.views.signals import view_created, view_deleted
+from baserow.core.trash.signals import permanently_deleted
+from baserow.core.usage.handler import UsageHandler
+
+
+def _get_file_field_names(
+    model, field_ids: Optional[Iterable[int]] = None
+) -> List[str]:
+    return [
+        field_object["name"]
+        for field_id, field_object in model._field_objects.items()
+        if field_object["type"].type == FileFieldType.type
+        and (field_ids is None or field_id in field_ids)
+    ]
+
+
+def _get_file_names(rows, field_names: List[str]) -> Dict[int, Set[str]]:
+    return {
+        row.id: {
+            file["name"]
+            for field_name in field_names
+            for file in getattr(row, field_name) or []
+        }
+        for row in rows
+    }
+
+
+def _have_files(rows, field_names: List[str]) -> bool:
+    return any(getattr(row, field_name) for row in rows for field_name in field_names)
+
+
+def _mark_table_storage_usage_outdated(table: Table):
+    UsageHandler.mark_storage_usage_outdated(table.database.workspace_id)
+
+
+@receiver(rows_created)
+def mark_storage_usage_outdated_when_rows_created(sender, rows, table, model, **kwargs):
+    if _have_files(rows, _get_file_field_names(model)):
+        _mark_table_storage_usage_outdated(table)
+
+
+@receiver(before_rows_update)
+def get_file_names_before_rows_update(sender, rows, model, updated_field_ids, **kwargs):
+    return _get_file_names(rows, _get_file_field_names(model, updated_field_ids))
+
+
+@receiver(rows_updated)
+def mark_storage_usage_outdated_when_rows_updated(
+    sender, rows, table, model, before_return, updated_field_ids, **kwargs
+):
+    field_names = _get_file_field_names(model, updated_field_ids)
+    if not field_names:
+        return
+
+    file_names_before = dict(before_return).get(get_file_names_before_rows_update)
+    if file_names_before != _get_file_names(rows, field_names):
+        _mark_table_storage_usage_outdated(table)
+
+
+@receiver(permanently_deleted)
+def mark_storage_usage_outdated_when_rows_permanently_deleted(
+    sender, trash_item, parent_id, **kwargs
+):
+    """
+    Trashed rows keep using storage until they're permanently deleted, so only the
+    permanent deletion of rows in a table with file fields changes the storage usage
+    of the workspace.
+    """
+
+    if sender == "row":
+        model = type(trash_item)
+        if _have_files([trash_item], _get_file_field_names(model)):
+            _mark_table_storage_usage_outdated(model.baserow_table)
+    elif sender == "rows":
+        workspace_id = (
+            FileField.objects.filter(table_id=parent_id)
+            .values_list("table__database__workspace_id", flat=True)
+            .first()
+        )
+        UsageHandler.mark_storage_usage_outdated(workspace_id)
+
+
+@receiver(field_restored)
+@receiver(field_deleted)
+def mark_storage_usage_outdated_when_file_field_changed(sender, field, **kwargs):
+    if isinstance(field, FileField):
+        _mark_table_storage_usage_outdated(field.table)
+
+
+@receiver(field_updated)
+def mark_storage_usage_outdated_when_file_field_updated(
+    sender, field, old_field=None, **kwargs
+):
+    """
+    The values of a file field are only changed when it's converted from or to
+    another field type. The fields updated because they depend on the updated field
+    are sent without the old field, but they don't contain files.
+    """
+
+    if old_field is not None and (
+        isinstance(field, FileField) != isinstance(old_field, FileField)
+    ):
+        _mark_table_storage_usage_outdated(field.table)
+
+
+@receiver(table_created)
+@receiver(table_deleted)
+def mark_storage_usage_outdated_when_table_changed(sender, table, **kwargs):
+    _mark_table_storage_usage_outdated(table)
+
+
+def _has_images(view: FormView) -> bool:
+    return view.cover_image_id is not None or view.logo_image_id is not None
+
+
+@receiver(view_created)
+@receiver(view_deleted)
+def mark_storage_usage_outdated_when_form_view_changed(sender, view, **kwargs):
+    if isinstance(view, FormView) and _has_images(view):
+        _mark_table_storage_usage_outdated(view.table)
+
+
+@receiver(pre_save, sender=FormView)
+def mark_storage_usage_outdated_when_form_view_images_changed(
+    sender, instance, update_fields=None, **kwargs
+):
+    if instance.pk is None or (
+        update_fields is not None
+        and not {"cover_image", "logo_image"} & set(update_fields)
+    ):
+        return
+
+    images_before = (
+        FormView.objects_and_trash.filter(pk=instance.pk)
+        .values_list("cover_image_id", "logo_image_id")
+        .first()
+    )
+    if images_before != (instance.cover_image_id, instance.logo_image_id):
+        _mark_table_storage_usage_outdated(instance.table)
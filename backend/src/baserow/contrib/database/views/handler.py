@@ -10,6 +10,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import models as django_models
+from django.db import transaction
 from django.db.models import Count, F
 from django.db.models.query import QuerySet
 
@@ -24,6 +25,8 @@ from baserow.contrib.database.fields.field_sortings import AnnotatedOrder
 from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.fields.operations import ReadFieldOperationType
 from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.index_advisor.constants import INDEX_USAGE_SORT
+from baserow.contrib.database.index_advisor.usage import record_field_index_usage
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.rows.signals import rows_created
 from baserow.contrib.database.table.models import GeneratedTableModel, Table
@@ -97,6 +100,7 @@ from .models import (
     ViewSort,
 )
 from .registries import (
+    ViewAggregationType,
     decorator_type_registry,
     decorator_value_provider_type_registry,
     view_aggregation_type_registry,
@@ -821,6 +825,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             raise ValueError("A queryset of the table model is required.")
 
         filter_builder = FilterBuilder(filter_type=view.filter_type)
+        index_usages = []
         for view_filter in view.viewfilter_set.all():
             if view_filter.field_id not in model._field_objects:
                 raise ValueError(
@@ -836,7 +841,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                     field_name, view_filter.value, model_field, field_object["field"]
                 )
             )
+            index_usages.append((view_filter.field_id, view_filter_type.index_usage))
 
+        record_field_index_usage(index_usages)
         return filter_builder
 
     def apply_filters(self, view: View, queryset: QuerySet) -> QuerySet:
@@ -1160,6 +1167,10 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 else:
                     order = order.desc(nulls_last=True)
 
+            if not order_by:
+                # Only the first sort can be served by an index on the column.
+                record_field_index_usage([(view_sort.field_id, INDEX_USAGE_SORT)])
+
             order_by.append(order)
 
         order_by.append("order")
@@ -1640,6 +1651,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         model=None,
         only_sort_by_field_ids=None,
         only_search_by_field_ids=None,
+        search_mode=None,
+        related_rows_limit=None,
     ):
         """
         Returns a queryset for the provided view which is appropriately sorted,
@@ -1660,6 +1673,12 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
              not present in the iterable will not be searched and filtered down by the
              search term.
         :type only_search_by_field_ids: Optional[Iterable[int]]
+        :param search_mode: The mode used to match the search term, the default
+            search mode is used if not provided.
+        :type search_mode: Optional[str]
+        :param related_rows_limit: If provided, only this number of related rows
+            are fetched per `link_row` cell, see `enhance_by_fields`.
+        :type related_rows_limit: Optional[int]
         :return: The appropriate queryset for the provided view.
         :rtype: QuerySet
         """
@@ -1667,7 +1686,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         if model is None:
             model = view.table.get_model()
 
-        queryset = model.objects.all().enhance_by_fields()
+        queryset = model.objects.all().enhance_by_fields(
+            related_rows_limit=related_rows_limit
+        )
 
         view_type = view_type_registry.get_by_model(view.specific_class)
         if view_type.can_filter:
@@ -1675,7 +1696,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         if view_type.can_sort:
             queryset = self.apply_sorting(view, queryset, only_sort_by_field_ids)
         if search is not None:
-            queryset = queryset.search_all_fields(search, only_search_by_field_ids)
+            queryset = queryset.search_all_fields(
+                search, only_search_by_field_ids, search_mode=search_mode
+            )
         return queryset
 
     def _get_aggregation_lock_cache_key(self, view: View):
@@ -1699,6 +1722,54 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return f"aggregation_version__{view.pk}_{name}"
 
+    def _get_aggregation_state_cache_key(self, view: View, name: str):
+        """
+        Returns the cache key of the incremental aggregation state for the specified
+        view and name.
+        """
+
+        return f"aggregation_state__{view.pk}_{name}"
+
+    def _get_incremental_state_cache_keys(
+        self, view: View, names: Iterable[str]
+    ) -> List[str]:
+        return [
+            key
+            for name in names
+            for key in [
+                self._get_aggregation_value_cache_key(view, name),
+                self._get_aggregation_version_cache_key(view, name),
+                self._get_aggregation_state_cache_key(view, name),
+            ]
+        ]
+
+    def _get_cached_incremental_state(
+        self, view: View, name: str, cached: Dict[str, Any], bumped: bool
+    ) -> Tuple[Optional[Dict[str, Any]], int]:
+        """
+        Returns the cached incremental state of an aggregation if the cached value is
+        valid, and the current version of the aggregation.
+
+        :param cached: The result of a `cache.get_many` call containing the keys
+            returned by `_get_incremental_state_cache_keys`.
+        :param bumped: Indicates whether the version has been incremented once since
+            the cached value must have been computed.
+        """
+
+        cached_value = cached.get(self._get_aggregation_value_cache_key(view, name))
+        cached_state = cached.get(self._get_aggregation_state_cache_key(view, name))
+        version = cached.get(self._get_aggregation_version_cache_key(view, name), 1)
+        expected_version = version - 1 if bumped else version
+
+        if (
+            cached_value is None
+            or cached_state is None
+            or cached_value["version"] != expected_version
+            or cached_state["version"] != expected_version
+        ):
+            return None, version
+        return cached_state["state"], version
+
     def clear_full_aggregation_cache(self, view: View):
         """
         Clears the cache key for the specified view.
@@ -1725,6 +1796,309 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 # No cache key, we create one
                 cache.set(cache_key, 2)
 
+    def _get_incremental_state_aggregations(
+        self,
+        aggregation_type: ViewAggregationType,
+        field_name: str,
+        model_field: django_models.Field,
+        field: Field,
+    ) -> Dict[str, django_models.Aggregate]:
+        """
+        Returns the aggregations computing the incremental state of the provided
+        aggregation type keyed by `{field_name}__{state_key}`.
+        """
+
+        state_aggregations = aggregation_type.get_incremental_state_aggregations(
+            field_name, model_field, field
+        )
+        return {
+            f"{field_name}__{key}": aggregation
+            for key, aggregation in (state_aggregations or {}).items()
+        }
+
+    def _split_incremental_states(
+        self, result: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """
+        Separates the incremental states from the aggregation values of a result
+        computed by `get_field_aggregations`.
+
+        :return: A tuple containing the values and the states per field name.
+        """
+
+        values = {}
+        states = defaultdict(dict)
+        for key, value in result.items():
+            if "__" in key:
+                field_name, state_key = key.split("__", 1)
+                states[field_name][state_key] = value
+            else:
+                values[key] = value
+        return values, dict(states)
+
+    def _get_incrementally_updatable_aggregations(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        field_ids: Optional[Iterable[int]] = None,
+        bumped: bool = False,
+    ) -> List[Tuple[View, Dict[str, Tuple[Field, ViewAggregationType]], Dict]]:
+        """
+        Returns, per view of the table, the cached aggregations of the model fields
+        that can be updated incrementally. Only the aggregations having a cached
+        value that is valid are returned, because the other ones must be fully
+        recomputed anyway.
+
+        :param table: The table of which the views must be checked.
+        :param model: The model containing the fields that changed.
+        :param field_ids: If provided, only the aggregations of these fields are
+            returned.
+        :param bumped: Indicates whether the version of the aggregations has already
+            been incremented once by the change. If so, a cached value of the
+            previous version is considered as valid.
+        :return: A list of tuples containing the view, the aggregation field and
+            type per field name and the current version per field name.
+        """
+
+        if field_ids is not None:
+            field_ids = set(field_ids)
+
+        candidates = []
+        for view_type in view_type_registry.get_all():
+            if not view_type.can_aggregate_field:
+                continue
+            for view, aggregations in view_type.get_aggregations_of_table(table):
+                updatable = {}
+                for field_instance, aggregation_type_name in aggregations:
+                    if field_instance.id not in model._field_objects or (
+                        field_ids is not None and field_instance.id not in field_ids
+                    ):
+                        continue
+                    aggregation_type = view_aggregation_type_registry.get(
+                        aggregation_type_name
+                    )
+                    field_name = field_instance.db_column
+                    field = model._field_objects[field_instance.id]["field"]
+                    if aggregation_type.get_incremental_state_aggregations(
+                        field_name, model._meta.get_field(field_name), field
+                    ):
+                        updatable[field_name] = (field, aggregation_type)
+                if updatable:
+                    candidates.append((view, updatable))
+
+        if not candidates:
+            return []
+
+        cached = cache.get_many(
+            [
+                key
+                for view, updatable in candidates
+                for key in self._get_incremental_state_cache_keys(view, updatable)
+            ]
+        )
+
+        result = []
+        for view, updatable in candidates:
+            valid = {}
+            versions = {}
+            for name, aggregation in updatable.items():
+                state, version = self._get_cached_incremental_state(
+                    view, name, cached, bumped
+                )
+                if state is not None:
+                    valid[name] = aggregation
+                    versions[name] = version
+            if valid:
+                result.append((view, valid, versions))
+        return result
+
+    def _get_incremental_states_of_rows(
+        self,
+        view: View,
+        model: GeneratedTableModel,
+        aggregations: Dict[str, Tuple[Field, ViewAggregationType]],
+        row_ids: List[int],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Computes the incremental states of the provided aggregations for the rows
+        with the provided ids that are visible in the view.
+        """
+
+        queryset = model.objects.filter(id__in=row_ids).enhance_by_fields()
+        view_type = view_type_registry.get_by_model(view.specific_class)
+        if view_type.can_filter:
+            queryset = self.apply_filters(view, queryset)
+
+        aggregation_dict = {}
+        for field_name, (field, aggregation_type) in aggregations.items():
+            aggregation_dict.update(
+                self._get_incremental_state_aggregations(
+                    aggregation_type,
+                    field_name,
+                    model._meta.get_field(field_name),
+                    field,
+                )
+            )
+
+        _, states = self._split_incremental_states(
+            queryset.aggregate(**aggregation_dict)
+        )
+        return states
+
+    def get_aggregation_states_before_rows_change(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        row_ids: List[int],
+        field_ids: Optional[Iterable[int]] = None,
+    ) -> Dict[int, Dict[str, Dict[str, Any]]]:
+        """
+        Computes the incremental states of the valid cached aggregations for the
+        rows that are about to be updated or deleted. The result must be provided
+        to `update_aggregations_after_rows_change` once the rows have changed.
+
+        :param table: The table of the rows.
+        :param model: The model of the table.
+        :param row_ids: The ids of the rows that are going to change.
+        :param field_ids: If provided, only the aggregations of these fields are
+            considered.
+        :return: The states of the rows per field name, per view id.
+        """
+
+        return {
+            view.id: self._get_incremental_states_of_rows(
+                view, model, aggregations, row_ids
+            )
+            for view, aggregations, _ in self._get_incrementally_updatable_aggregations(
+                table, model, field_ids
+            )
+        }
+
+    def update_aggregations_after_rows_change(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        row_ids: List[int],
+        states_before: Optional[Dict[int, Dict[str, Dict[str, Any]]]] = None,
+        field_ids: Optional[Iterable[int]] = None,
+        rows_deleted: bool = False,
+    ):
+        """
+        Applies the change of the provided rows to the cached aggregation values that
+        can be updated incrementally, instead of letting them be fully recomputed.
+        Must be called after the aggregation cache of the changed fields has been
+        cleared once by the change. The cached values are only updated when the
+        transaction commits and if no other change happened in the meantime.
+
+        :param table: The table of the rows.
+        :param model: The model of the table.
+        :param row_ids: The ids of the rows that have changed.
+        :param states_before: The states computed by
+            `get_aggregation_states_before_rows_change` if the rows already existed
+            before the change. Only these aggregations are then updated.
+        :param field_ids: If provided, only the aggregations of these fields are
+            updated.
+        :param rows_deleted: Indicates whether the rows have been deleted, in which
+            case they don't have a state anymore.
+        """
+
+        for (
+            view,
+            aggregations,
+            versions,
+        ) in self._get_incrementally_updatable_aggregations(
+            table, model, field_ids, bumped=True
+        ):
+            removed_states = {}
+            if states_before is not None:
+                removed_states = states_before.get(view.id, {})
+                aggregations = {
+                    name: aggregation
+                    for name, aggregation in aggregations.items()
+                    if name in removed_states
+                }
+                if not aggregations:
+                    continue
+
+            added_states = {}
+            if not rows_deleted:
+                added_states = self._get_incremental_states_of_rows(
+                    view, model, aggregations, row_ids
+                )
+
+            updates = {
+                name: (
+                    aggregation_type,
+                    versions[name],
+                    removed_states.get(name, {}),
+                    added_states.get(name, {}),
+                )
+                for name, (_, aggregation_type) in aggregations.items()
+            }
+            transaction.on_commit(
+                lambda v=view, u=updates: self._apply_incremental_aggregation_updates(
+                    v, u
+                )
+            )
+
+    def _apply_incremental_aggregation_updates(
+        self,
+        view: View,
+        updates: Dict[str, Tuple[ViewAggregationType, int, Dict, Dict]],
+    ):
+        """
+        Updates the cached aggregation values of the view with the states of the
+        changed rows. A value is only updated if it's still the one that was cached
+        before the change and if the version hasn't been incremented by another
+        change since, otherwise it's left to be recomputed.
+
+        :param view: The view of which the aggregations must be updated.
+        :param updates: A dict keyed by field name containing the aggregation type,
+            the version after the change and the states of the removed and added
+            rows.
+        """
+
+        use_lock = hasattr(cache, "lock")
+        if use_lock:
+            cache_lock = cache.lock(
+                self._get_aggregation_lock_cache_key(view), timeout=10
+            )
+            cache_lock.acquire()
+
+        try:
+            cached = cache.get_many(
+                self._get_incremental_state_cache_keys(view, updates)
+            )
+
+            to_cache = {}
+            for name, (aggregation_type, version, removed, added) in updates.items():
+                state, current_version = self._get_cached_incremental_state(
+                    view, name, cached, bumped=True
+                )
+                if state is None or current_version != version:
+                    continue
+
+                state = aggregation_type.update_incremental_state(state, removed, added)
+                if state is None:
+                    continue
+
+                to_cache[self._get_aggregation_value_cache_key(view, name)] = {
+                    "value": aggregation_type.get_value_from_incremental_state(state),
+                    "version": version,
+                }
+                to_cache[self._get_aggregation_state_cache_key(view, name)] = {
+                    "state": state,
+                    "version": version,
+                }
+
+            cache.set_many(to_cache)
+        finally:
+            if use_lock:
+                try:
+                    cache_lock.release()
+                except LockNotOwnedError:
+                    pass
+
     def _get_aggregations_to_compute(
         self,
         view: View,
@@ -1864,17 +2238,25 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 model,
                 with_total=with_total,
                 search=search,
+                with_incremental_states=not search,
             )
 
+            db_result, incremental_states = self._split_incremental_states(db_result)
+
             if not search:
                 to_cache = {}
                 for key, value in db_result.items():
                     # We don't cache total value
                     if key != "total":
+                        version = need_computation[key]["version"]
                         to_cache[self._get_aggregation_value_cache_key(view, key)] = {
                             "value": value,
-                            "version": need_computation[key]["version"],
+                            "version": version,
                         }
+                        if key in incremental_states:
+                            to_cache[
+                                self._get_aggregation_state_cache_key(view, key)
+                            ] = {"state": incremental_states[key], "version": version}
 
                 # Let's cache the newly computed values
                 cache.set_many(to_cache)
@@ -1900,6 +2282,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         model: Union[GeneratedTableModel, None] = None,
         with_total: bool = False,
         search: Union[str, None] = None,
+        with_incremental_states: bool = False,
     ) -> Dict[str, Any]:
         """
         Returns a dict of aggregation for given (field, aggregation_type) couple list.
@@ -1915,6 +2298,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param with_total: Whether the total row count should be returned in the
             result.
         :param search: the search string to considerate.
+        :param with_incremental_states: Whether the states of the aggregations that
+            can be computed incrementally should be included in the result. They are
+            keyed by `{field_name}__{state_key}`.
         :raises FieldAggregationNotSupported: When the view type doesn't support
             field aggregation.
         :raises FieldNotInTable: When one of the field doesn't belong to the specified
@@ -1950,6 +2336,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             queryset = queryset.search_all_fields(search)
 
         aggregation_dict = {}
+        state_aggregation_dict = {}
 
         for (field_instance, aggregation_type_name) in aggregations:
             field_name = field_instance.db_column
@@ -1970,11 +2357,21 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 field_name, model_field, field
             )
 
+            if with_incremental_states:
+                state_aggregation_dict.update(
+                    self._get_incremental_state_aggregations(
+                        aggregation_type, field_name, model_field, field
+                    )
+                )
+
         # Add total to allow further calculation on the client if required
         if with_total:
             aggregation_dict["total"] = Count("id", distinct=True)
 
-        return queryset.aggregate(**aggregation_dict)
+        # The state aggregations must come first because once an aggregation is
+        # named like a field, the other references to that field point to the
+        # aggregation instead of the column.
+        return queryset.aggregate(**state_aggregation_dict, **aggregation_dict)
 
     def rotate_view_slug(self, user: AbstractUser, view: View) -> View:
         """
@@ -2386,7 +2783,9 @@ class CachingPublicViewRowChecker:
     A helper class to check which public views a row is visible in. Will pre-calculate
     upfront for a specific table which public views are always visible, which public
     views can have row check results cached for and finally will pre-construct and
-    reuse querysets for performance reasons.
+    reuse querysets for performance reasons. When possible the filters are checked in
+    Python against the row instance, the remaining filters of all the views are
+    checked in one single query.
     """
 
     def __init__(
@@ -2396,6 +2795,7 @@ class CachingPublicViewRowChecker:
         only_include_views_which_want_realtime_events: bool,
         updated_field_ids: Optional[Iterable[int]] = None,
     ):
+        self._model = model
         self._public_views = (
             table.view_set.filter(public=True).prefetch_related("viewfilter_set").all()
         )
@@ -2410,7 +2810,7 @@ class CachingPublicViewRowChecker:
                 if not view_type.when_shared_publicly_requires_realtime_events:
                     continue
 
-            if len(view.viewfilter_set.all()) == 0:
+            if len(view.viewfilter_set.all()) == 0 or view.filters_disabled:
                 # If there are no view filters for this view then any row must always
                 # be visible in this view
                 self._always_visible_views.append(view)
@@ -2421,6 +2821,7 @@ class CachingPublicViewRowChecker:
                         view,
                         filter_qs,
                         self._view_row_checks_can_be_cached(view),
+                        self._get_python_filters(view),
                     )
                 )
 
@@ -2439,19 +2840,10 @@ class CachingPublicViewRowChecker:
         :return: A list of views where the row is visible for this checkers table.
         """
 
-        views = []
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                if row.id not in self._view_row_check_cache[view.id]:
-                    self._view_row_check_cache[view.id][
-                        row.id
-                    ] = self._check_row_visible(filter_qs, row)
-                if self._view_row_check_cache[view.id][row.id]:
-                    views.append(view)
-            elif self._check_row_visible(filter_qs, row):
-                views.append(view)
-
-        return views + self._always_visible_views
+        return [
+            public_view_rows.view
+            for public_view_rows in self.get_public_views_where_rows_are_visible([row])
+        ]
 
     def get_public_views_where_rows_are_visible(self, rows) -> List[PublicViewRows]:
         """
@@ -2469,26 +2861,39 @@ class CachingPublicViewRowChecker:
             are visible for this checkers table.
         """
 
-        visible_views_rows = []
-        row_ids = {row.id for row in rows}
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                for id in row_ids:
-                    if id not in self._view_row_check_cache[view.id]:
-                        visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                        for visible_id in visible_ids:
-                            self._view_row_check_cache[view.id][visible_id] = True
-                        break
-                else:
-                    visible_ids = row_ids
+        visible_ids_per_view = {}
+        row_ids_to_check_per_view = defaultdict(set)
+        for view, _, can_use_cache, python_filters in self._views_with_filters:
+            visible_ids = set()
+            view_cache = self._view_row_check_cache[view.id]
+            for row in rows:
+                # Only the rows that are visible are cached, the other ones are
+                # checked again because a formula field depending on an updated
+                # field could have changed.
+                if can_use_cache and view_cache.get(row.id, False):
+                    visible_ids.add(row.id)
+                    continue
 
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
+                visible = self._check_row_visible_in_python(view, python_filters, row)
+                if visible is None:
+                    row_ids_to_check_per_view[view.id].add(row.id)
+                elif visible:
+                    visible_ids.add(row.id)
+                    if can_use_cache:
+                        view_cache[row.id] = True
+            visible_ids_per_view[view.id] = visible_ids
 
-            else:
-                visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
+        for view_id, visible_ids in self._check_rows_visible(
+            row_ids_to_check_per_view
+        ).items():
+            visible_ids_per_view[view_id].update(visible_ids)
+
+        visible_views_rows = []
+        for view, _, _, _ in self._views_with_filters:
+            if len(visible_ids_per_view[view.id]) > 0:
+                visible_views_rows.append(
+                    PublicViewRows(view, visible_ids_per_view[view.id])
+                )
 
         for visible_view in self._always_visible_views:
             visible_views_rows.append(
@@ -2497,16 +2902,95 @@ class CachingPublicViewRowChecker:
 
         return visible_views_rows
 
-    # noinspection PyMethodMayBeStatic
-    def _check_row_visible(self, filter_qs, row):
-        return filter_qs.filter(id=row.id).exists()
+    def _get_python_filters(self, view: View) -> List[Tuple[Any, str, str, Field]]:
+        """
+        Returns the view filter type, field name, value and field of every filter of
+        the view, so that they can be checked in Python.
+        """
+
+        return [
+            (
+                view_filter_type_registry.get(view_filter.type),
+                self._model._field_objects[view_filter.field_id]["name"],
+                view_filter.value,
+                self._model._field_objects[view_filter.field_id]["field"],
+            )
+            for view_filter in view.viewfilter_set.all()
+        ]
 
     # noinspection PyMethodMayBeStatic
-    def _check_rows_visible(self, filter_qs, rows):
-        return filter_qs.filter(id__in=[row.id for row in rows]).values_list(
-            "id", flat=True
+    def _check_row_visible_in_python(
+        self, view: View, python_filters: List[Tuple[Any, str, str, Field]], row
+    ) -> Optional[bool]:
+        """
+        Checks if the row matches the filters of the view without querying the
+        database. Returns None if one of the filters can't be checked in Python.
+        """
+
+        matches = []
+        for view_filter_type, field_name, value, field in python_filters:
+            # Deferred values are not loaded because that would need a query.
+            if field_name not in row.__dict__:
+                return None
+            match = view_filter_type.matches_row_value(
+                getattr(row, field_name), value, field
+            )
+            if match is None:
+                return None
+            matches.append(match)
+
+        if view.filter_type == FILTER_TYPE_AND:
+            return all(matches)
+        return any(matches)
+
+    def _check_rows_visible(
+        self, row_ids_per_view: Dict[int, Set[int]]
+    ) -> Dict[int, Set[int]]:
+        """
+        Checks which rows are visible in which views with one single query containing
+        a boolean column per view.
+
+        :param row_ids_per_view: The ids of the rows that must be checked per view id.
+        :return: The ids of the visible rows per view id.
+        """
+
+        if len(row_ids_per_view) == 0:
+            return {}
+
+        annotations = {
+            f"view_{view.id}_visible": django_models.Exists(
+                filter_qs.filter(id=django_models.OuterRef("id"))
+            )
+            for view, filter_qs, _, _ in self._views_with_filters
+            if view.id in row_ids_per_view
+        }
+        row_ids = set().union(*row_ids_per_view.values())
+        results = (
+            self._model.objects.filter(id__in=row_ids)
+            .order_by()
+            .annotate(**annotations)
+            .values_list("id", *annotations.keys())
         )
 
+        visible_ids_per_view = defaultdict(set)
+        view_ids = [
+            view.id
+            for view, _, _, _ in self._views_with_filters
+            if view.id in row_ids_per_view
+        ]
+        can_use_cache = {
+            view.id: can_use_cache
+            for view, _, can_use_cache, _ in self._views_with_filters
+        }
+        for row_id, *visible_per_view in results:
+            for view_id, visible in zip(view_ids, visible_per_view):
+                if visible and row_id in row_ids_per_view[view_id]:
+                    visible_ids_per_view[view_id].add(row_id)
+                    if can_use_cache[view_id]:
+                        self._view_row_check_cache[view_id][row_id] = True
+
+        return visible_ids_per_view
+
     def _view_row_checks_can_be_cached(self, view):
         if self._updated_field_ids is None:
             return True
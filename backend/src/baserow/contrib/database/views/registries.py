@@ -22,6 +22,7 @@ from rest_framework.fields import CharField
 from rest_framework.serializers import Serializer
 
 from baserow.contrib.database.fields.field_filters import OptionallyAnnotatedQ
+from baserow.contrib.database.index_advisor.constants import INDEX_USAGE_FILTER
 from baserow.core.models import Workspace, WorkspaceUser
 from baserow.core.registry import (
     APIUrlsInstanceMixin,
@@ -580,6 +581,21 @@ class ViewType(
             "`get_aggregations` method."
         )
 
+    def get_aggregations_of_table(
+        self, table: "Table"
+    ) -> List[Tuple["View", List[Tuple[django_models.Field, str]]]]:
+        """
+        Should return the aggregation list of every view of this type in the
+        provided table. Views without aggregations can be left out.
+
+        returns a list of tuple (View, [(Field, aggregation_type)])
+        """
+
+        raise NotImplementedError(
+            "If the view supports field aggregation it must implement "
+            "`get_aggregations_of_table` method."
+        )
+
     def after_field_value_update(
         self, updated_fields: Union[Iterable["Field"], "Field"]
     ):
@@ -743,6 +759,14 @@ class ViewFilterType(Instance):
     checked and returns True if compatible or False if not.
     """
 
+    index_usage: Optional[str] = INDEX_USAGE_FILTER
+    """
+    Indicates how the filter uses the column of the field, so that the index advisor
+    can create the index that speeds up the filter. None means that the filter
+    doesn't benefit from an index, for example because it matches most of the rows or
+    because it filters on an expression instead of on the column itself.
+    """
+
     def default_filter_on_exception(self):
         """The default Q to use when the filter value is of an incompatible type."""
 
@@ -767,6 +791,23 @@ class ViewFilterType(Instance):
 
         raise NotImplementedError("Each must have his own get_filter method.")
 
+    def matches_row_value(self, row_value: Any, value: str, field) -> Optional[bool]:
+        """
+        Optionally checks in Python if the value of a row matches the filter,
+        without querying the database. This is for example used to figure out in
+        which public views a changed row is visible. The result must be exactly the
+        same as the one of the filter returned by `get_filter`.
+
+        :param row_value: The value of the field in the row instance.
+        :param value: The value that the field must be compared to.
+        :param field: The instance of the underlying baserow field.
+        :return: True or False if the row value does or doesn't match the filter, or
+            None if it can't be determined in Python in which case the database is
+            queried instead.
+        """
+
+        return None
+
     def get_preload_values(self, view_filter) -> dict:
         """
         Optionally a view filter type can preload certain values for displaying
@@ -877,6 +918,64 @@ class ViewAggregationType(Instance):
             "Each aggregation type must have his own get_aggregation method."
         )
 
+    def get_incremental_state_aggregations(
+        self,
+        field_name: str,
+        model_field: django_models.Field,
+        field: "Field",
+    ) -> Optional[Dict[str, django_models.Aggregate]]:
+        """
+        Decomposable aggregations can return here the django aggregation objects
+        computing their state. A state can be computed for any set of rows and the
+        states of the rows that changed can then be combined with the state of all
+        the rows using `update_incremental_state`. This allows to keep a cached
+        aggregation value up to date without aggregating all the rows of the view
+        again every time a row changes.
+
+        :param field_name: The name of the field that needs to be aggregated.
+        :param model_field: The field extracted from the model.
+        :param field: The instance of the underlying baserow field.
+        :return: A dict of django aggregation objects keyed by state key, or None if
+            the aggregation can't be computed incrementally.
+        """
+
+        return None
+
+    def update_incremental_state(
+        self,
+        state: Dict[str, Any],
+        removed_state: Dict[str, Any],
+        added_state: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Computes the new state of the aggregation after rows have been replaced. The
+        state of the rows before the change is provided as `removed_state` and the
+        state after the change as `added_state`. A key is missing from these states
+        if no row has been removed or added.
+
+        :param state: The state of all the rows before the change.
+        :param removed_state: The state of the changed rows before the change.
+        :param added_state: The state of the changed rows after the change.
+        :return: The new state or None if the aggregation must be fully recomputed,
+            for example when the minimum value has been removed.
+        """
+
+        raise NotImplementedError(
+            "An aggregation type that can be computed incrementally must implement "
+            "the `update_incremental_state` method."
+        )
+
+    def get_value_from_incremental_state(self, state: Dict[str, Any]) -> Any:
+        """
+        Returns the aggregation value corresponding to the provided state.
+
+        :param state: The state computed with `get_incremental_state_aggregations`
+            or `update_incremental_state`.
+        :return: The aggregation value.
+        """
+
+        return state["value"]
+
     def field_is_compatible(self, field: "Field") -> bool:
         """
         Given a particular instance of a field returns whether the field is supported
@@ -2,6 +2,7 @@ from django.dispatch import Signal, receiver
 
 from baserow.contrib.database.fields import signals as field_signals
 from baserow.contrib.database.fields.models import FileField
+from baserow.contrib.database.rows import signals as row_signals
 
 from .models import GalleryView
 
@@ -41,3 +42,62 @@ def field_deleted(sender, field, **kwargs):
         decorator_value_provider_type
     ) in decorator_value_provider_type_registry.get_all():
         decorator_value_provider_type.after_field_delete(field)
+
+
+@receiver(row_signals.rows_created)
+def update_aggregations_after_rows_created(sender, rows, table, model, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    ViewHandler().update_aggregations_after_rows_change(
+        table, model, [row.id for row in rows]
+    )
+
+
+@receiver(row_signals.before_rows_update)
+def get_aggregation_states_before_rows_update(
+    sender, rows, table, model, updated_field_ids, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    return ViewHandler().get_aggregation_states_before_rows_change(
+        table, model, [row.id for row in rows], updated_field_ids
+    )
+
+
+@receiver(row_signals.rows_updated)
+def update_aggregations_after_rows_updated(
+    sender, rows, table, model, before_return, updated_field_ids, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    ViewHandler().update_aggregations_after_rows_change(
+        table,
+        model,
+        [row.id for row in rows],
+        states_before=dict(before_return)[get_aggregation_states_before_rows_update],
+        field_ids=updated_field_ids,
+    )
+
+
+@receiver(row_signals.before_rows_delete)
+def get_aggregation_states_before_rows_delete(sender, rows, table, model, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    return ViewHandler().get_aggregation_states_before_rows_change(
+        table, model, [row.id for row in rows]
+    )
+
+
+@receiver(row_signals.rows_deleted)
+def update_aggregations_after_rows_deleted(
+    sender, rows, table, model, before_return, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    ViewHandler().update_aggregations_after_rows_change(
+        table,
+        model,
+        [row.id for row in rows],
+        states_before=dict(before_return)[get_aggregation_states_before_rows_delete],
+        rows_deleted=True,
+    )
@@ -34,6 +34,24 @@ from .registries import ViewAggregationType
 # https://docs.djangoproject.com/en/4.0/ref/models/querysets/#aggregation-functions
 
 
+def update_extreme_value_state(state, removed_state, added_state, pick):
+    """
+    Updates the state of a min or max aggregation. The new extreme value can only be
+    computed if the removed rows didn't contain the current extreme value, otherwise
+    None is returned because the aggregation must be recomputed.
+
+    :param pick: Either the `min` or `max` builtin function.
+    """
+
+    value = state["value"]
+    removed = removed_state.get("value")
+    if removed is not None and (value is None or pick(removed, value) == removed):
+        return None
+
+    candidates = [v for v in [value, added_state.get("value")] if v is not None]
+    return {"value": pick(candidates) if candidates else None}
+
+
 class EmptyCountViewAggregationType(ViewAggregationType):
     """
     The empty count aggregation counts how many values are considered empty for
@@ -75,6 +93,16 @@ class EmptyCountViewAggregationType(ViewAggregationType):
             filter=field_type.empty_query(field_name, model_field, field),
         )
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        return {"value": self.get_aggregation(field_name, model_field, field)}
+
+    def update_incremental_state(self, state, removed_state, added_state):
+        return {
+            "value": state["value"]
+            - (removed_state.get("value") or 0)
+            + (added_state.get("value") or 0)
+        }
+
 
 class NotEmptyCountViewAggregationType(EmptyCountViewAggregationType):
     """
@@ -151,6 +179,12 @@ class MinViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Min(field_name)
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        return {"value": Min(field_name)}
+
+    def update_incremental_state(self, state, removed_state, added_state):
+        return update_extreme_value_state(state, removed_state, added_state, min)
+
 
 class MaxViewAggregationType(ViewAggregationType):
     """
@@ -175,6 +209,12 @@ class MaxViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Max(field_name)
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        return {"value": Max(field_name)}
+
+    def update_incremental_state(self, state, removed_state, added_state):
+        return update_extreme_value_state(state, removed_state, added_state, max)
+
 
 class SumViewAggregationType(ViewAggregationType):
     """
@@ -194,6 +234,26 @@ class SumViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Sum(field_name)
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        # The count is needed to know when the sum becomes empty again.
+        return {"value": Sum(field_name), "count": Count(field_name)}
+
+    def update_incremental_state(self, state, removed_state, added_state):
+        count = (
+            state["count"]
+            - (removed_state.get("count") or 0)
+            + (added_state.get("count") or 0)
+        )
+        if count == 0:
+            return {"value": None, "count": 0}
+
+        value = (
+            (state["value"] or 0)
+            - (removed_state.get("value") or 0)
+            + (added_state.get("value") or 0)
+        )
+        return {"value": value, "count": count}
+
 
 class AverageViewAggregationType(ViewAggregationType):
     """
@@ -218,6 +278,28 @@ class AverageViewAggregationType(ViewAggregationType):
             filter=~field_type.empty_query(field_name, model_field, field),
         )
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        field_type = field_type_registry.get_by_model(field)
+        not_empty = ~field_type.empty_query(field_name, model_field, field)
+
+        return {
+            "sum": Sum(field_name, filter=not_empty),
+            "count": Count("id", filter=not_empty),
+        }
+
+    def update_incremental_state(self, state, removed_state, added_state):
+        return {
+            key: (state[key] or 0)
+            - (removed_state.get(key) or 0)
+            + (added_state.get(key) or 0)
+            for key in ["sum", "count"]
+        }
+
+    def get_value_from_incremental_state(self, state):
+        if not state["count"]:
+            return None
+        return state["sum"] / state["count"]
+
 
 class StdDevViewAggregationType(ViewAggregationType):
     """
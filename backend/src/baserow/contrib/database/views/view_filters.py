@@ -47,6 +47,7 @@ from baserow.contrib.database.formula import (
     BaserowFormulaNumberType,
     BaserowFormulaTextType,
 )
+from baserow.contrib.database.index_advisor.constants import INDEX_USAGE_CONTAINS
 from baserow.core.models import WorkspaceUser
 
 from .registries import ViewFilterType
@@ -56,12 +57,19 @@ DATE_FILTER_TIMEZONE_SEPARATOR = "?"
 
 
 class NotViewFilterTypeMixin:
+    # Negated filters match most of the rows, so an index doesn't help.
+    index_usage = None
+
     def default_filter_on_exception(self):
         return Q()
 
     def get_filter(self, *args, **kwargs):
         return ~super().get_filter(*args, **kwargs)
 
+    def matches_row_value(self, *args, **kwargs):
+        matches = super().matches_row_value(*args, **kwargs)
+        return None if matches is None else not matches
+
 
 class EqualViewFilterType(ViewFilterType):
     """
@@ -101,6 +109,26 @@ class EqualViewFilterType(ViewFilterType):
         except Exception:
             return self.default_filter_on_exception()
 
+    def matches_row_value(self, row_value, value, field):
+        value = value.strip()
+
+        # Only the text values are compared in Python because they're compared
+        # exactly like in the database.
+        if value == "" or field_type_registry.get_by_model(field).type not in [
+            TextFieldType.type,
+            LongTextFieldType.type,
+            URLFieldType.type,
+            EmailFieldType.type,
+            PhoneNumberFieldType.type,
+        ]:
+            return None
+
+        if row_value is None:
+            return False
+        if not isinstance(row_value, str):
+            return None
+        return row_value == value
+
 
 class NotEqualViewFilterType(NotViewFilterTypeMixin, EqualViewFilterType):
     type = "not_equal"
@@ -153,6 +181,7 @@ class ContainsViewFilterType(ViewFilterType):
     """
 
     type = "contains"
+    index_usage = INDEX_USAGE_CONTAINS
     compatible_field_types = [
         TextFieldType.type,
         LongTextFieldType.type,
@@ -190,6 +219,7 @@ class ContainsWordViewFilterType(ViewFilterType):
     """
 
     type = "contains_word"
+    index_usage = None
     compatible_field_types = [
         TextFieldType.type,
         LongTextFieldType.type,
@@ -229,6 +259,7 @@ class LengthIsLowerThanViewFilterType(ViewFilterType):
     """
 
     type = "length_is_lower_than"
+    index_usage = None
     compatible_field_types = [
         TextFieldType.type,
         LongTextFieldType.type,
@@ -525,6 +556,7 @@ class DateEqualsDayOfMonthViewFilterType(TimezoneAwareDateViewFilterType):
     """
 
     type = "date_equals_day_of_month"
+    index_usage = None
 
     def get_filter(
         self, field_name: str, value: str, model_field, field: Field
@@ -820,9 +852,8 @@ class BooleanViewFilterType(ViewFilterType):
         ),
     ]
 
-    def get_filter(self, field_name, value, model_field, field):
-        value = value.strip().lower()
-        value = value in [
+    def _parse_value(self, value: str) -> bool:
+        return value.strip().lower() in [
             "y",
             "t",
             "o",
@@ -832,6 +863,9 @@ class BooleanViewFilterType(ViewFilterType):
             "1",
         ]
 
+    def get_filter(self, field_name, value, model_field, field):
+        value = self._parse_value(value)
+
         # Check if the model_field accepts the value.
         # noinspection PyBroadException
         try:
@@ -840,6 +874,13 @@ class BooleanViewFilterType(ViewFilterType):
         except Exception:
             return Q()
 
+    def matches_row_value(self, row_value, value, field):
+        if field_type_registry.get_by_model(field).type != BooleanFieldType.type:
+            return None
+        if not isinstance(row_value, bool):
+            return None
+        return row_value is self._parse_value(value)
+
 
 class ManyToManyHasBaseViewFilter(ViewFilterType):
     """
@@ -254,6 +254,28 @@ class GridViewType(ViewType):
         )
         return [(option.field, option.aggregation_raw_type) for option in field_options]
 
+    def get_aggregations_of_table(self, table):
+        """
+        Returns the (GridView, [(Field, aggregation_type)]) list of all the grid views
+        of the table having at least one aggregation, computed in a single query.
+        """
+
+        field_options = (
+            GridViewFieldOptions.objects.filter(grid_view__table=table)
+            .exclude(aggregation_raw_type="")
+            .select_related("grid_view", "field")
+            .order_by("grid_view_id", "id")
+        )
+
+        views = {}
+        aggregations = defaultdict(list)
+        for option in field_options:
+            views[option.grid_view_id] = option.grid_view
+            aggregations[option.grid_view_id].append(
+                (option.field, option.aggregation_raw_type)
+            )
+        return [(views[view_id], aggregations[view_id]) for view_id in views]
+
     def after_field_value_update(self, updated_fields):
         """
         When a field value change, we need to invalidate the aggregation cache for this
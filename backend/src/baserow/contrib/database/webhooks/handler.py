@@ -1,12 +1,14 @@
 import json
 import uuid
-from typing import List
+from typing import Callable, List
 
 from django.conf import settings
 from django.contrib.auth.models import User as DjangoUser
+from django.core.cache import cache
 from django.db.models import Q
 from django.db.models.query import QuerySet
 
+from redis.exceptions import LockNotOwnedError
 from requests import PreparedRequest, Response
 
 from baserow.contrib.database.table.models import Table
@@ -31,6 +33,12 @@ from .operations import (
 from .registries import webhook_event_type_registry
 from .validators import get_webhook_request_function
 
+# The event type of the calls containing multiple events.
+WEBHOOK_BATCH_EVENT_TYPE = "batch"
+# The pending calls are normally sent after the batch window, this only prevents
+# keeping them forever if the task is lost.
+WEBHOOK_PENDING_CALLS_CACHE_TIMEOUT = 60 * 60
+
 
 class WebhookHandler:
     def find_webhooks_to_call(self, table_id: int, event_type: str) -> QuerySet:
@@ -349,6 +357,141 @@ class WebhookHandler:
 
         return first_request, response
 
+    def _get_pending_calls_cache_key(self, webhook_id: int) -> str:
+        return f"webhook_{webhook_id}_pending_calls"
+
+    def _get_pending_calls_scheduled_cache_key(self, webhook_id: int) -> str:
+        return f"webhook_{webhook_id}_pending_calls_scheduled"
+
+    def _update_pending_calls(self, webhook_id: int, update: Callable):
+        """
+        Atomically updates the pending calls of the webhook stored in the cache.
+
+        :param webhook_id: The id of the webhook of which the pending calls must be
+            updated.
+        :param update: A function receiving the list of pending calls. It can modify
+            the list in place.
+        :return: The pending calls as they were before the update.
+        """
+
+        cache_key = self._get_pending_calls_cache_key(webhook_id)
+        use_lock = hasattr(cache, "lock")
+        if use_lock:
+            cache_lock = cache.lock(f"{cache_key}_lock", timeout=10)
+            cache_lock.acquire()
+        try:
+            pending_calls = cache.get(cache_key, [])
+            updated_pending_calls = list(pending_calls)
+            update(updated_pending_calls)
+            if updated_pending_calls:
+                cache.set(
+                    cache_key,
+                    updated_pending_calls,
+                    timeout=WEBHOOK_PENDING_CALLS_CACHE_TIMEOUT,
+                )
+            else:
+                cache.delete(cache_key)
+            return pending_calls
+        finally:
+            if use_lock:
+                try:
+                    cache_lock.release()
+                except LockNotOwnedError:
+                    pass
+
+    def add_pending_call(
+        self, webhook: TableWebhook, event_type: str, event_id: str, payload: dict
+    ):
+        """
+        Buffers the call of the webhook for an event during the
+        BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS window, so that all the events
+        triggering the webhook within the window are sent together by the
+        `call_webhook_batch` task. The task is scheduled when the first event of the
+        window is added.
+
+        :param webhook: The webhook that must be called.
+        :param event_type: The event type related to the webhook trigger.
+        :param event_id: The unique id of the event.
+        :param payload: The JSON serializable payload of the event.
+        """
+
+        from .tasks import call_webhook_batch
+
+        pending_call = {
+            "event_id": str(event_id),
+            "event_type": event_type,
+            "payload": payload,
+        }
+        self._update_pending_calls(
+            webhook.id, lambda pending_calls: pending_calls.append(pending_call)
+        )
+
+        window = settings.BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS
+        if cache.add(
+            self._get_pending_calls_scheduled_cache_key(webhook.id),
+            True,
+            timeout=window,
+        ):
+            call_webhook_batch.apply_async(
+                kwargs={"webhook_id": webhook.id}, countdown=window
+            )
+
+    def send_pending_calls(self, webhook_id: int):
+        """
+        Sends the calls buffered by `add_pending_call` for the webhook. Consecutive
+        events are grouped in batches of maximum BASEROW_WEBHOOKS_MAX_BATCH_SIZE
+        events. A batch only containing one event is sent exactly like it would
+        have been sent without batching.
+
+        :param webhook_id: The id of the webhook of which the calls must be sent.
+        """
+
+        from .tasks import call_webhook
+
+        # Events added from now on will schedule a new task, so that they can't be
+        # lost if they're added after the pending calls have been taken.
+        cache.delete(self._get_pending_calls_scheduled_cache_key(webhook_id))
+        pending_calls = self._update_pending_calls(
+            webhook_id, lambda pending_calls: pending_calls.clear()
+        )
+
+        webhook = (
+            TableWebhook.objects.filter(id=webhook_id, active=True)
+            .prefetch_related("headers")
+            .first()
+        )
+        if webhook is None or not pending_calls:
+            return
+
+        batch_size = max(settings.BASEROW_WEBHOOKS_MAX_BATCH_SIZE, 1)
+        for start in range(0, len(pending_calls), batch_size):
+            batch = pending_calls[start : start + batch_size]
+            if len(batch) == 1:
+                event_id = batch[0]["event_id"]
+                event_type = batch[0]["event_type"]
+                payload = batch[0]["payload"]
+            else:
+                event_id = str(uuid.uuid4())
+                event_type = WEBHOOK_BATCH_EVENT_TYPE
+                payload = {
+                    "table_id": webhook.table_id,
+                    "event_id": event_id,
+                    "event_type": event_type,
+                    "events": [pending_call["payload"] for pending_call in batch],
+                }
+
+            headers = webhook.header_dict
+            headers.update(**self.get_headers(event_type, event_id))
+            call_webhook.delay(
+                webhook_id=webhook.id,
+                event_id=event_id,
+                event_type=event_type,
+                method=webhook.request_method,
+                url=webhook.url,
+                headers=headers,
+                payload=payload,
+            )
+
     def get_headers(self, event_type: str, event_id: str):
         """Returns the default headers that must be added to every request."""
 
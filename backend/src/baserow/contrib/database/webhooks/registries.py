@@ -1,5 +1,6 @@
 import uuid
 
+from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.db import transaction
 from django.dispatch.dispatcher import Signal
@@ -121,6 +122,10 @@ class WebhookEventType(Instance):
         event_id = uuid.uuid4()
         for webhook in webhooks:
             payload = self.get_payload(event_id, webhook, **kwargs)
+            if settings.BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS > 0:
+                webhook_handler.add_pending_call(webhook, self.type, event_id, payload)
+                continue
+
             headers = webhook.header_dict
             headers.update(**webhook_handler.get_headers(self.type, event_id))
             call_webhook.delay(
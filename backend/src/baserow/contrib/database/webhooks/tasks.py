@@ -44,9 +44,30 @@ def call_webhook(
     from .handler import WebhookHandler
     from .models import TableWebhook, TableWebhookCall
 
-    with transaction.atomic():
-        handler = WebhookHandler()
+    if not TableWebhook.objects.filter(id=webhook_id).exists():
+        # If the webhook has been deleted, we don't want to continue trying to call
+        # the URL because we can't update the state of the webhook.
+        return
+
+    handler = WebhookHandler()
+    request = None
+    response = None
+    success = False
+    error = ""
 
+    # The request is made outside of the transaction, so that the webhook row isn't
+    # locked while waiting for the response.
+    try:
+        request, response = handler.make_request(method, url, headers, payload)
+        success = response.ok
+    except RequestException as exception:
+        request = exception.request
+        response = exception.response
+        error = str(exception)
+    except UnacceptableAddressException as exception:
+        error = f"UnacceptableAddressException: {exception}"
+
+    with transaction.atomic():
         try:
             webhook = TableWebhook.objects.select_for_update(of=("self",)).get(
                 id=webhook_id
@@ -56,21 +77,6 @@ def call_webhook(
             # trying to call the URL because we can't update the state of the webhook.
             return
 
-        request = None
-        response = None
-        success = False
-        error = ""
-
-        try:
-            request, response = handler.make_request(method, url, headers, payload)
-            success = response.ok
-        except RequestException as exception:
-            request = exception.request
-            response = exception.response
-            error = str(exception)
-        except UnacceptableAddressException as exception:
-            error = f"UnacceptableAddressException: {exception}"
-
         TableWebhookCall.objects.update_or_create(
             event_id=event_id,
             event_type=event_type,
@@ -125,3 +131,19 @@ def call_webhook(
         # If the task is still operating within the max retries per call limit,
         # then we want to retry the task with an exponential backoff.
         self.retry(countdown=2**self.request.retries)
+
+
+@app.task(bind=True, queue="export")
+def call_webhook_batch(self, webhook_id: int):
+    """
+    Sends the events that have been buffered for the webhook during the batch window
+    by the `WebhookHandler.add_pending_call` method. A single event is sent as it
+    is, multiple events are sent in batched calls containing up to
+    BASEROW_WEBHOOKS_MAX_BATCH_SIZE events.
+
+    :param webhook_id: The id of the webhook of which the pending calls must be sent.
+    """
+
+    from .handler import WebhookHandler
+
+    WebhookHandler().send_pending_calls(webhook_id)
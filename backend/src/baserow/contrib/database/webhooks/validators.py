@@ -1,6 +1,7 @@
 from http.client import _is_illegal_header_value, _is_legal_header_name
+from http.cookiejar import DefaultCookiePolicy
 from socket import gaierror, timeout
-from typing import Callable
+from typing import Callable, Dict, Tuple
 from urllib.parse import urlparse
 
 from django.conf import settings
@@ -12,10 +13,17 @@ from advocate.connection import (
     UnacceptableAddressException,
     validating_create_connection,
 )
+from requests import Session
+from requests.adapters import HTTPAdapter
 
 INVALID_URL_CODE = "invalid_url"
 
 
+# The sessions are kept for the lifetime of the process, so that the connections to
+# the webhook hosts are kept alive and reused by the next calls.
+_webhook_sessions: Dict[Tuple, Session] = {}
+
+
 def get_webhook_request_function() -> Callable:
     """
     Return the appropriate request function based on production environment
@@ -25,17 +33,48 @@ def get_webhook_request_function() -> Callable:
     setting BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS.
     """
 
-    if settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True:
-        from requests import request
+    return get_webhook_session().request
+
+
+def get_webhook_session() -> Session:
+    """
+    Returns the requests session shared by all the webhook calls of the process. It
+    keeps a pool of connections per destination host. The number of concurrent
+    connections to one host is limited by the BASEROW_WEBHOOKS_MAX_CONNECTIONS_PER_HOST
+    setting, a call waits for a connection to be released if the limit is reached.
+    """
 
-        return request
-    else:
-        from advocate import request
+    adapter_kwargs = {
+        "pool_maxsize": settings.BASEROW_WEBHOOKS_MAX_CONNECTIONS_PER_HOST,
+        "pool_block": True,
+    }
+    allow_private_address = settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True
+    session_key = (
+        allow_private_address,
+        settings.BASEROW_WEBHOOKS_MAX_CONNECTIONS_PER_HOST,
+        tuple(settings.BASEROW_WEBHOOKS_IP_BLACKLIST),
+        tuple(settings.BASEROW_WEBHOOKS_IP_WHITELIST),
+        tuple(r.pattern for r in settings.BASEROW_WEBHOOKS_URL_REGEX_BLACKLIST),
+    )
+
+    session = _webhook_sessions.get(session_key)
+    if session is None:
+        if allow_private_address:
+            session = Session()
+            adapter = HTTPAdapter(**adapter_kwargs)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        else:
+            addr_validator = get_advocate_address_validator()
+            baserow_advocate = RequestsAPIWrapper(addr_validator)
+            session = baserow_advocate.Session(_adapter_kwargs=adapter_kwargs)
 
-        addr_validator = get_advocate_address_validator()
-        baserow_advocate = RequestsAPIWrapper(addr_validator)
+        # The session is shared by the webhooks of all the users, so the cookies
+        # set by one endpoint must never be sent with the next calls.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _webhook_sessions[session_key] = session
 
-        return baserow_advocate.request
+    return session
 
 
 def get_advocate_address_validator() -> AddrValidator:
@@ -1,13 +1,9 @@
 from typing import Any, Dict, List, Optional
 
-from django.db import transaction
 from django.dispatch import receiver
 
 from baserow.contrib.database.api.constants import PUBLIC_PLACEHOLDER_ENTITY_ID
-from baserow.contrib.database.api.rows.serializers import (
-    RowSerializer,
-    get_row_serializer_class,
-)
+from baserow.contrib.database.api.rows.serializers import serialize_rows_for_response
 from baserow.contrib.database.rows import signals as row_signals
 from baserow.contrib.database.table.models import GeneratedTableModel
 from baserow.contrib.database.views.handler import PublicViewRows, ViewHandler
@@ -16,15 +12,10 @@ from baserow.contrib.database.ws.rows.signals import (
     RealtimeRowMessages,
     before_rows_update,
 )
+from baserow.ws.coalescer import page_event_coalescer
 from baserow.ws.registries import page_registry
 
 
-def _serialize_row(model, row, many=False):
-    return get_row_serializer_class(model, RowSerializer, is_response=True)(
-        row, many=many
-    ).data
-
-
 def _send_rows_created_event_to_views(
     serialized_rows: List[Dict[Any, Any]],
     before: Optional[GeneratedTableModel],
@@ -80,9 +71,9 @@ def public_rows_created(sender, rows, before, user, table, model, **kwargs):
     row_checker = ViewHandler().get_public_views_row_checker(
         table, model, only_include_views_which_want_realtime_events=True
     )
-    transaction.on_commit(
+    page_event_coalescer.on_commit(
         lambda: _send_rows_created_event_to_views(
-            _serialize_row(model, rows, many=True),
+            serialize_rows_for_response(rows, model),
             before,
             row_checker.get_public_views_where_rows_are_visible(rows),
         ),
@@ -98,7 +89,7 @@ def public_before_rows_delete(sender, rows, user, table, model, **kwargs):
         "deleted_rows_public_views": (
             row_checker.get_public_views_where_rows_are_visible(rows)
         ),
-        "deleted_rows": _serialize_row(model, rows, many=True),
+        "deleted_rows": serialize_rows_for_response(rows, model),
     }
 
 
@@ -110,7 +101,7 @@ def public_rows_deleted(sender, rows, user, table, model, before_return, **kwarg
     serialized_deleted_rows = dict(before_return)[public_before_rows_delete][
         "deleted_rows"
     ]
-    transaction.on_commit(
+    page_event_coalescer.on_commit(
         lambda: _send_rows_deleted_event_to_views(serialized_deleted_rows, public_views)
     )
 
@@ -139,7 +130,7 @@ def public_rows_updated(
 ):
     before_return_dict = dict(before_return)[public_before_rows_update]
     serialized_old_rows = dict(before_return)[before_rows_update]
-    serialized_updated_rows = _serialize_row(model, rows, many=True)
+    serialized_updated_rows = serialize_rows_for_response(rows, model)
 
     old_row_public_views: List[PublicViewRows] = before_return_dict[
         "old_rows_public_views"
@@ -246,4 +237,4 @@ def public_rows_updated(
                 slug=public_view.slug,
             )
 
-    transaction.on_commit(_send_created_updated_deleted_row_signals_to_views)
+    page_event_coalescer.on_commit(_send_created_updated_deleted_row_signals_to_views)
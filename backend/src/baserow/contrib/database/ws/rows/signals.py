@@ -1,28 +1,29 @@
 from typing import Any, Dict, List, Optional
 
-from django.db import transaction
 from django.dispatch import receiver
 
-from baserow.contrib.database.api.rows.serializers import (
-    RowSerializer,
-    get_row_serializer_class,
-)
+from baserow.contrib.database.api.rows.serializers import serialize_rows_for_response
 from baserow.contrib.database.rows import signals as row_signals
 from baserow.contrib.database.rows.registries import row_metadata_registry
 from baserow.contrib.database.table.models import GeneratedTableModel
+from baserow.ws.coalescer import page_event_coalescer
 from baserow.ws.registries import page_registry
 
+MAX_COALESCED_ROWS = 1000
+"""
+The maximum number of rows in a payload resulting from merging row events that are
+broadcast in the same transaction.
+"""
+
 
 @receiver(row_signals.rows_created)
 def rows_created(sender, rows, before, user, table, model, **kwargs):
     table_page_type = page_registry.get("table")
-    transaction.on_commit(
+    page_event_coalescer.on_commit(
         lambda: table_page_type.broadcast(
             RealtimeRowMessages.rows_created(
                 table_id=table.id,
-                serialized_rows=get_row_serializer_class(
-                    model, RowSerializer, is_response=True
-                )(rows, many=True).data,
+                serialized_rows=serialize_rows_for_response(rows, model),
                 metadata=row_metadata_registry.generate_and_merge_metadata_for_rows(
                     table, [row.id for row in rows]
                 ),
@@ -36,9 +37,7 @@ def rows_created(sender, rows, before, user, table, model, **kwargs):
 
 @receiver(row_signals.before_rows_update)
 def before_rows_update(sender, rows, user, table, model, updated_field_ids, **kwargs):
-    return get_row_serializer_class(model, RowSerializer, is_response=True)(
-        rows, many=True
-    ).data
+    return serialize_rows_for_response(rows, model)
 
 
 @receiver(row_signals.rows_updated)
@@ -46,14 +45,12 @@ def rows_updated(
     sender, rows, user, table, model, before_return, updated_field_ids, **kwargs
 ):
     table_page_type = page_registry.get("table")
-    transaction.on_commit(
+    page_event_coalescer.on_commit(
         lambda: table_page_type.broadcast(
             RealtimeRowMessages.rows_updated(
                 table_id=table.id,
                 serialized_rows_before_update=dict(before_return)[before_rows_update],
-                serialized_rows=get_row_serializer_class(
-                    model, RowSerializer, is_response=True
-                )(rows, many=True).data,
+                serialized_rows=serialize_rows_for_response(rows, model),
                 metadata=row_metadata_registry.generate_and_merge_metadata_for_rows(
                     table, [row.id for row in rows]
                 ),
@@ -66,15 +63,13 @@ def rows_updated(
 
 @receiver(row_signals.before_rows_delete)
 def before_rows_delete(sender, rows, user, table, model, **kwargs):
-    return get_row_serializer_class(model, RowSerializer, is_response=True)(
-        rows, many=True
-    ).data
+    return serialize_rows_for_response(rows, model)
 
 
 @receiver(row_signals.rows_deleted)
 def rows_deleted(sender, rows, user, table, model, before_return, **kwargs):
     table_page_type = page_registry.get("table")
-    transaction.on_commit(
+    page_event_coalescer.on_commit(
         lambda: table_page_type.broadcast(
             RealtimeRowMessages.rows_deleted(
                 table_id=table.id,
@@ -89,7 +84,7 @@ def rows_deleted(sender, rows, user, table, model, before_return, **kwargs):
 @receiver(row_signals.row_orders_recalculated)
 def row_orders_recalculated(sender, table, **kwargs):
     table_page_type = page_registry.get("table")
-    transaction.on_commit(
+    page_event_coalescer.on_commit(
         lambda: table_page_type.broadcast(
             RealtimeRowMessages.row_orders_recalculated(table_id=table.id),
             table_id=table.id,
@@ -153,3 +148,98 @@ class RealtimeRowMessages:
             "type": "row_orders_recalculated",
             "table_id": table_id,
         }
+
+    @staticmethod
+    def merge_rows_created(
+        previous: Dict[str, Any], payload: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Merges two consecutive `rows_created` payloads if both rows are not created
+        before another row.
+        """
+
+        if (
+            previous["table_id"] != payload["table_id"]
+            or previous["before_row_id"] is not None
+            or payload["before_row_id"] is not None
+            or len(previous["rows"]) + len(payload["rows"]) > MAX_COALESCED_ROWS
+        ):
+            return None
+
+        return {
+            **previous,
+            "rows": [*previous["rows"], *payload["rows"]],
+            "metadata": {**previous["metadata"], **payload["metadata"]},
+        }
+
+    @staticmethod
+    def merge_rows_updated(
+        previous: Dict[str, Any], payload: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Merges two consecutive `rows_updated` payloads. If a row has been updated in
+        both, then only the latest update is kept, but with the values the row had
+        before the first update, so that the clients can still find the row.
+        """
+
+        if previous["table_id"] != payload["table_id"]:
+            return None
+
+        rows_before_update = {}
+        rows = {}
+        for payload_to_merge in (previous, payload):
+            for row_before_update, row in zip(
+                payload_to_merge["rows_before_update"], payload_to_merge["rows"]
+            ):
+                rows_before_update.setdefault(row["id"], row_before_update)
+                rows[row["id"]] = row
+
+        if len(rows) > MAX_COALESCED_ROWS:
+            return None
+
+        return {
+            **previous,
+            "rows_before_update": list(rows_before_update.values()),
+            "rows": list(rows.values()),
+            "metadata": {**previous["metadata"], **payload["metadata"]},
+        }
+
+    @staticmethod
+    def merge_rows_deleted(
+        previous: Dict[str, Any], payload: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Merges two consecutive `rows_deleted` payloads.
+        """
+
+        if (
+            previous["table_id"] != payload["table_id"]
+            or len(previous["rows"]) + len(payload["rows"]) > MAX_COALESCED_ROWS
+        ):
+            return None
+
+        return {
+            **previous,
+            "row_ids": [*previous["row_ids"], *payload["row_ids"]],
+            "rows": [*previous["rows"], *payload["rows"]],
+        }
+
+    @staticmethod
+    def merge_row_orders_recalculated(
+        previous: Dict[str, Any], payload: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        return previous if previous["table_id"] == payload["table_id"] else None
+
+
+page_event_coalescer.register_payload_merger(
+    "rows_created", RealtimeRowMessages.merge_rows_created
+)
+page_event_coalescer.register_payload_merger(
+    "rows_updated", RealtimeRowMessages.merge_rows_updated
+)
+page_event_coalescer.register_payload_merger(
+    "rows_deleted", RealtimeRowMessages.merge_rows_deleted
+)
+page_event_coalescer.register_payload_merger(
+    "row_orders_recalculated", RealtimeRowMessages.merge_row_orders_recalculated
+)
@@ -251,6 +251,8 @@ class CoreConfig(AppConfig):
         # Create all operations from registry
         post_migrate.connect(sync_operations_after_migrate, sender=self)
 
+        import baserow.core.usage.signals  # noqa: F401
+
 
 # noinspection PyPep8Naming
 def start_sync_templates_task_after_migrate(sender, **kwargs):
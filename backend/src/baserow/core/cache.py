@@ -0,0 +1,70 @@
+from contextlib import contextmanager
+from typing import Iterable, Set
+
+from django.core.cache import cache
+
+from redis.exceptions import LockNotOwnedError
+
+
+def _get_member_cache_key(cache_key: str, member_id: int) -> str:
+    return f"{cache_key}_{member_id}"
+
+
+@contextmanager
+def _cache_lock(cache_key: str):
+    use_lock = hasattr(cache, "lock")
+    if use_lock:
+        cache_lock = cache.lock(f"{cache_key}_lock", timeout=10)
+        cache_lock.acquire()
+    try:
+        yield
+    finally:
+        if use_lock:
+            try:
+                cache_lock.release()
+            except LockNotOwnedError:
+                pass
+
+
+def add_to_cached_id_set(cache_key: str, ids: Iterable[int]):
+    """
+    Adds the provided ids to the set of ids stored in the cache, so that a periodic
+    task only has to process the objects that have changed instead of checking all of
+    them. Every id is marked with a separate key first, so that the lock of the set
+    is only acquired the first time an id is added after the set has been popped.
+
+    The value the ids refer to must be written to the cache before the ids are
+    added, and only be read by the periodic task after popping the set, so that
+    no changes are missed.
+
+    :param cache_key: The key of the set in the cache.
+    :param ids: The ids that must be added to the set.
+    """
+
+    new_ids = [
+        id_
+        for id_ in set(ids)
+        if cache.add(_get_member_cache_key(cache_key, id_), True, timeout=None)
+    ]
+    if not new_ids:
+        return
+
+    with _cache_lock(cache_key):
+        cache.set(cache_key, cache.get(cache_key, set()) | set(new_ids), timeout=None)
+
+
+def pop_cached_id_set(cache_key: str) -> Set[int]:
+    """
+    Returns and removes the set of ids that have been added to the cache by
+    `add_to_cached_id_set`.
+
+    :param cache_key: The key of the set in the cache.
+    :return: The ids that have been added since the set was popped last.
+    """
+
+    with _cache_lock(cache_key):
+        ids = cache.get(cache_key, set())
+        cache.delete(cache_key)
+
+    cache.delete_many([_get_member_cache_key(cache_key, id_) for id_ in ids])
+    return ids
@@ -1,12 +1,14 @@
 import contextlib
+import json
 from collections import defaultdict
 from decimal import Decimal
 from math import ceil
 from typing import Any, Callable, Iterable, List, Optional, Tuple, TypeVar
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import EmptyResultSet
 from django.db import DEFAULT_DB_ALIAS, connection, transaction
-from django.db.models import Max, Model, QuerySet
+from django.db.models import Max, Model, QuerySet, prefetch_related_objects
 from django.db.models.sql.query import LOOKUP_SEP
 from django.db.transaction import Atomic, get_connection
 
@@ -167,6 +169,57 @@ def specific_iterator(
     return ordered_specific_objects
 
 
+def chunked_iterator(queryset: QuerySet[T], chunk_size: int = 2000) -> Iterable[T]:
+    """
+    Iterates over the given queryset using a server side cursor, so that the rows
+    are streamed from the database instead of being paginated with increasingly
+    expensive `OFFSET` queries. Contrary to `queryset.iterator()`, the prefetch
+    related lookups of the queryset are respected because they're executed for
+    every chunk of fetched objects.
+
+    :param queryset: The queryset to iterate over.
+    :param chunk_size: The number of objects fetched from the cursor at once and
+        for which the related objects are prefetched together.
+    """
+
+    prefetch_related_lookups = queryset._prefetch_related_lookups
+    chunk = []
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        chunk.append(obj)
+        if len(chunk) == chunk_size:
+            prefetch_related_objects(chunk, *prefetch_related_lookups)
+            yield from chunk
+            chunk = []
+
+    if chunk:
+        prefetch_related_objects(chunk, *prefetch_related_lookups)
+        yield from chunk
+
+
+def get_estimated_count(queryset: QuerySet) -> int:
+    """
+    Returns the number of rows the PostgreSQL planner expects the queryset to
+    return. Contrary to `queryset.count()`, the rows don't have to be counted, so
+    this is cheap for large tables, but the result is only an estimate.
+
+    :param queryset: The queryset to estimate the number of rows of.
+    :return: The estimated number of rows.
+    """
+
+    try:
+        query, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {query}", params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
 class IsolationLevel:
     READ_COMMITTED = "READ COMMITTED"
     REPEATABLE_READ = "REPEATABLE READ"
@@ -1,4 +1,4 @@
-from django.db.models import DateTimeField, Expression, Value
+from django.db.models import BooleanField, DateTimeField, Expression, Value
 
 
 class Timezone(Expression):
@@ -44,3 +44,66 @@ class Timezone(Expression):
         params.extend(field_params)
         params.extend(timezone_params)
         return f"{field_sql} at time zone {timezone_sql}", params
+
+
+class RowValueComparison(Expression):
+    """
+    Compares a tuple of expressions with a tuple of values using a PostgreSQL row value
+    comparison. Contrary to combining the individual comparisons with `AND` and `OR`,
+    this can be answered by a single index range scan if there is a matching composite
+    index. It can for example be used like this:
+
+    ```
+    SomeModel.objects.filter(
+        RowValueComparison(["order", "id"], [Value(1), Value(10)], ">")
+    )
+    ```
+
+    It will eventually result in `("order", "id") > (1, 10)`.
+    """
+
+    operators = {">", ">=", "<", "<="}
+
+    def __init__(self, expressions, values, operator):
+        if len(expressions) != len(values):
+            raise ValueError("The number of expressions and values must be equal.")
+
+        if operator not in self.operators:
+            raise ValueError(f"The operator {operator} is not supported.")
+
+        super().__init__(output_field=BooleanField())
+        self.source_expressions = self._parse_expressions(*expressions)
+        self.values = self._parse_expressions(*values)
+        self.operator = operator
+
+    def get_source_expressions(self):
+        return [*self.source_expressions, *self.values]
+
+    def set_source_expressions(self, expressions):
+        split_at = len(self.source_expressions)
+        self.source_expressions = expressions[:split_at]
+        self.values = expressions[split_at:]
+
+    def __repr__(self):
+        return "{}({}, {}, {})".format(
+            self.__class__.__name__,
+            self.source_expressions,
+            self.values,
+            self.operator,
+        )
+
+    def as_sql(self, compiler, connection):
+        params = []
+        lhs_sql, rhs_sql = [], []
+        for expression in self.source_expressions:
+            sql, expression_params = compiler.compile(expression)
+            lhs_sql.append(sql)
+            params.extend(expression_params)
+        for value in self.values:
+            sql, value_params = compiler.compile(value)
+            rhs_sql.append(sql)
+            params.extend(value_params)
+        return (
+            f"({', '.join(lhs_sql)}) {self.operator} ({', '.join(rhs_sql)})",
+            params,
+        )
@@ -1356,7 +1356,9 @@ class CoreHandler(metaclass=baserow_trace_methods(tracer)):
         specific_application = application.specific
         application_type = application_type_registry.get_by_model(specific_application)
         try:
-            serialized = application_type.export_serialized(specific_application)
+            serialized = application_type.export_serialized(
+                specific_application, copy_data_in_database=True
+            )
         except OperationalError as e:
             # Detect if this `OperationalError` is due to us exceeding the
             # lock count in `max_locks_per_transaction`. If it is, we'll
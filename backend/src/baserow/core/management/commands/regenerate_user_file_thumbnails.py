@@ -1,12 +1,30 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+
 from django.core.files.storage import default_storage
 from django.core.management.base import BaseCommand
 
-from PIL import Image
-
 from baserow.core.user_files.handler import UserFileHandler
 from baserow.core.user_files.models import UserFile
 
 
+def regenerate_thumbnails(user_file, only_with_name=None):
+    """
+    Regenerates the thumbnails of the provided user file. This runs in a separate
+    process and must therefore not use the database connection.
+    """
+
+    try:
+        UserFileHandler().generate_and_save_user_file_thumbnails(
+            user_file, storage=default_storage, only_with_name=only_with_name
+        )
+    except IOError:
+        pass
+
+
 class Command(BaseCommand):
     help = (
         "Regenerates all the user file thumbnails based on the current settings. "
@@ -21,39 +39,41 @@ class Command(BaseCommand):
             help="The name of the thumbnails to regenerate (tiny, small or card_cover).",
             default=None,
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="The number of processes regenerating the thumbnails in parallel. "
+            "Defaults to the number of CPUs.",
+            default=os.cpu_count(),
+        )
 
     def handle(self, *args, **options):
         """
         Regenerates the thumbnails of all image user files. If the USER_THUMBNAILS
         setting ever changes then this file can be used to fix all the thumbnails.
+        The images are processed in parallel by a pool of processes.
         """
 
         i = 0
-        handler = UserFileHandler()
         buffer_size = 100
-        queryset = UserFile.objects.filter(is_image=True)
-        count = queryset.count()
-
-        while i < count:
-            user_files = queryset[i : min(count, i + buffer_size)]
-            for user_file in user_files:
-                i += 1
-
-                full_path = handler.user_file_path(user_file)
-                stream = default_storage.open(full_path)
-
-                try:
-                    image = Image.open(stream)
-                    handler.generate_and_save_image_thumbnails(
-                        image,
-                        user_file,
-                        storage=default_storage,
-                        only_with_name=options["name"],
-                    )
-                    image.close()
-                except IOError:
-                    pass
-
-                stream.close()
+        queryset = UserFile.objects.filter(is_image=True).order_by("id")
+        user_files = queryset.iterator(chunk_size=buffer_size)
+        regenerate = partial(regenerate_thumbnails, only_with_name=options["name"])
+
+        # The processes are forked, so that they inherit the configured storage. They
+        # only receive the user files and don't need a database connection.
+        with ProcessPoolExecutor(
+            max_workers=options["workers"],
+            mp_context=multiprocessing.get_context("fork"),
+        ) as executor:
+            while True:
+                # The user files are sent to the processes in batches, so that they
+                # don't all have to be kept in memory.
+                batch = list(islice(user_files, buffer_size * options["workers"]))
+                if not batch:
+                    break
+
+                for _ in executor.map(regenerate, batch, chunksize=buffer_size):
+                    i += 1
 
         self.stdout.write(self.style.SUCCESS(f"{i} thumbnails have been regenerated."))
@@ -276,6 +276,7 @@ class ApplicationType(
         application: "Application",
         files_zip: Optional[ZipFile] = None,
         storage: Optional[Storage] = None,
+        copy_data_in_database: bool = False,
     ):
         """
         Exports the application to a serialized dict that can be imported by the
@@ -288,6 +289,11 @@ class ApplicationType(
         :type files_zip: ZipFile
         :param storage: The storage where the files can be loaded from.
         :type storage: Storage or None
+        :param copy_data_in_database: Indicates that the export is going to be
+            imported right away in the same database and transaction, like when
+            duplicating or snapshotting an application. If supported, the data is then
+            not serialized, but copied inside the database when importing.
+        :type copy_data_in_database: bool
         :return: The exported and serialized application.
         :rtype: dict
         """
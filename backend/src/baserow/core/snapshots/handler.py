@@ -382,7 +382,7 @@ class SnapshotHandler:
         application_type = application_type_registry.get_by_model(application)
         try:
             exported_application = application_type.export_serialized(
-                application, None, default_storage
+                application, None, default_storage, copy_data_in_database=True
             )
         except OperationalError as e:
             # Detect if this `OperationalError` is due to us exceeding the
@@ -432,7 +432,7 @@ class SnapshotHandler:
         application = snapshot.snapshot_to_application.specific
         application_type = application_type_registry.get_by_model(application)
         exported_application = application_type.export_serialized(
-            application, None, default_storage
+            application, None, default_storage, copy_data_in_database=True
         )
         progress.increment(by=50)
 
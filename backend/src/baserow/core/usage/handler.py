@@ -1,46 +1,144 @@
+from typing import Iterable, List, Optional
+
+from django.db import transaction
 from django.db.models import OuterRef, PositiveIntegerField, Subquery, Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from baserow.contrib.database.table.models import Table
+from baserow.core.cache import add_to_cached_id_set, pop_cached_id_set
 from baserow.core.models import Workspace
 from baserow.core.usage.registries import workspace_storage_usage_item_registry
 from baserow.core.utils import grouper
 
+# The number of workspaces of which the storage usage is calculated at once.
+STORAGE_USAGE_CHUNK_SIZE = 256
+
+# The key of the set of ids of the workspaces whose storage usage is outdated.
+OUTDATED_STORAGE_USAGE_CACHE_KEY = "workspaces_with_outdated_storage_usage"
+
 
 class UsageHandler:
     @classmethod
-    def calculate_storage_usage(cls) -> int:
+    def register_plpgsql_functions(cls):
         """
-        Calculates the storage usage of every workspace.
-        :return: The amount of workspaces that have been updated.
+        Item types might need to register some plpgsql functions to speedup the
+        calculations.
         """
 
-        # Item types might need to register some plpgsql functions
-        # to speedup the calculations.
         for item in workspace_storage_usage_item_registry.get_all():
             if hasattr(item, "register_plpgsql_functions"):
                 item.register_plpgsql_functions()
 
-        count, chunk_size = 0, 256
-        workspaces_queryset = Workspace.objects.filter(template__isnull=True).iterator(
-            chunk_size=chunk_size
+    @classmethod
+    def calculate_storage_usage(cls) -> int:
+        """
+        Calculates the storage usage of every workspace.
+        :return: The amount of workspaces that have been updated.
+        """
+
+        cls.register_plpgsql_functions()
+
+        count = 0
+        for workspace_ids in cls.get_workspace_ids_in_chunks():
+            count += cls.calculate_storage_usage_of_workspaces(workspace_ids)
+
+        return count
+
+    @classmethod
+    def get_workspace_ids_in_chunks(
+        cls, chunk_size: Optional[int] = None
+    ) -> Iterable[List[int]]:
+        """
+        Returns the ids of all the workspaces whose storage usage is tracked, in
+        chunks of the provided size or `STORAGE_USAGE_CHUNK_SIZE` by default.
+        """
+
+        chunk_size = chunk_size or STORAGE_USAGE_CHUNK_SIZE
+
+        workspace_ids = (
+            Workspace.objects.filter(template__isnull=True)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        for chunk in grouper(chunk_size, workspace_ids.iterator(chunk_size=chunk_size)):
+            yield list(chunk)
+
+    @classmethod
+    def calculate_storage_usage_of_workspaces(cls, workspace_ids: List[int]) -> int:
+        """
+        Calculates the storage usage of the provided workspaces. The plpgsql
+        functions of the item types must have been registered already.
+
+        :param workspace_ids: The ids of the workspaces to calculate the usage of.
+        :return: The amount of workspaces that have been updated.
+        """
+
+        workspaces = list(
+            Workspace.objects.filter(id__in=workspace_ids, template__isnull=True)
         )
 
-        for workspaces in grouper(chunk_size, workspaces_queryset):
-            now = timezone.now()
-            for workspace in workspaces:
-                usage_in_bytes = 0
-                for item in workspace_storage_usage_item_registry.get_all():
-                    usage_in_bytes += item.calculate_storage_usage(workspace.id)
+        now = timezone.now()
+        for workspace in workspaces:
+            usage_in_bytes = 0
+            for item in workspace_storage_usage_item_registry.get_all():
+                usage_in_bytes += item.calculate_storage_usage(workspace.id)
+
+            workspace.storage_usage = usage_in_bytes / (1024 * 1024)  # in MB
+            workspace.storage_usage_updated_at = now
+
+        Workspace.objects.bulk_update(
+            workspaces, ["storage_usage", "storage_usage_updated_at"]
+        )
+        return len(workspaces)
+
+    @classmethod
+    def mark_storage_usage_outdated(cls, workspace_id: Optional[int]):
+        """
+        Marks the storage usage of the workspace as outdated once the current
+        transaction commits, because files have been added to or removed from it.
+        The usage of the outdated workspaces is recalculated periodically by
+        `update_outdated_storage_usage`, so that the usage of all the workspaces
+        doesn't have to be recalculated to keep it up to date.
+
+        :param workspace_id: The id of the workspace whose files have changed.
+        """
 
-                workspace.storage_usage = usage_in_bytes / (1024 * 1024)  # in MB
-                workspace.storage_usage_updated_at = now
+        if workspace_id is None:
+            return
 
-            Workspace.objects.bulk_update(
-                workspaces, ["storage_usage", "storage_usage_updated_at"]
+        transaction.on_commit(
+            lambda: add_to_cached_id_set(
+                OUTDATED_STORAGE_USAGE_CACHE_KEY, [workspace_id]
             )
-            count += len(workspaces)
+        )
+
+    @classmethod
+    def update_outdated_storage_usage(cls, batch_size: int = 1000) -> int:
+        """
+        Recalculates the storage usage of the workspaces that have been marked as
+        outdated by `mark_storage_usage_outdated`.
+
+        :param batch_size: The number of workspaces of which the usage is
+            calculated at once.
+        :return: The amount of workspaces that have been updated.
+        """
+
+        # The ids are popped before recalculating, so that the workspaces changed in
+        # the meantime are recalculated again during the next run.
+        workspace_ids = sorted(pop_cached_id_set(OUTDATED_STORAGE_USAGE_CACHE_KEY))
+        if not workspace_ids:
+            return 0
+
+        cls.register_plpgsql_functions()
+
+        count = 0
+        try:
+            for chunk in grouper(batch_size, workspace_ids):
+                count += cls.calculate_storage_usage_of_workspaces(list(chunk))
+        except Exception:
+            add_to_cached_id_set(OUTDATED_STORAGE_USAGE_CACHE_KEY, workspace_ids)
+            raise
 
         return count
 
@@ -0,0 +1,17 @@
+from django.dispatch import receiver
+
+from baserow.core.signals import application_created, application_deleted
+
+from .handler import UsageHandler
+
+
+@receiver(application_created)
+@receiver(application_deleted)
+def mark_storage_usage_outdated_when_application_changed(sender, application, **kwargs):
+    """
+    The files of an application don't count towards the storage usage of the
+    workspace while it's trashed, so creating, duplicating, restoring and trashing
+    an application changes the usage.
+    """
+
+    UsageHandler.mark_storage_usage_outdated(application.workspace_id)
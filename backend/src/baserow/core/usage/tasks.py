@@ -1,3 +1,6 @@
+from datetime import timedelta
+from typing import List
+
 from django.conf import settings
 
 from baserow.config.celery import app
@@ -8,13 +11,42 @@ from baserow.core.handler import CoreHandler
 def run_calculate_storage():
     """
     Runs the calculate storage job to keep track of how many mb of memory has been used
-    via files by a group
+    via files by a group. Because the usage is kept up to date by
+    `update_outdated_storage_usage`, this is a consistency check that recalculates the
+    usage of all the workspaces. The workspaces are split into chunks which are
+    calculated in parallel by the available workers.
+    """
+
+    from baserow.core.usage.handler import UsageHandler
+
+    if CoreHandler().get_settings().track_workspace_usage:
+        UsageHandler.register_plpgsql_functions()
+        for workspace_ids in UsageHandler.get_workspace_ids_in_chunks():
+            calculate_storage_usage_of_workspaces.delay(workspace_ids)
+
+
+@app.task(queue=settings.BASEROW_GROUP_STORAGE_USAGE_QUEUE)
+def calculate_storage_usage_of_workspaces(workspace_ids: List[int]):
+    """
+    Calculates the storage usage of a chunk of workspaces.
+    """
+
+    from baserow.core.usage.handler import UsageHandler
+
+    UsageHandler.calculate_storage_usage_of_workspaces(workspace_ids)
+
+
+@app.task(queue=settings.BASEROW_GROUP_STORAGE_USAGE_QUEUE)
+def update_outdated_storage_usage():
+    """
+    Recalculates the storage usage of the workspaces whose files have changed since
+    the last run.
     """
 
     from baserow.core.usage.handler import UsageHandler
 
     if CoreHandler().get_settings().track_workspace_usage:
-        UsageHandler.calculate_storage_usage()
+        UsageHandler.update_outdated_storage_usage()
 
 
 @app.on_after_finalize.connect
@@ -23,3 +55,7 @@ def setup_periodic_tasks(sender, **kwargs):
         settings.BASEROW_STORAGE_USAGE_JOB_CRONTAB,
         run_calculate_storage.s(),
     )
+    sender.add_periodic_task(
+        timedelta(seconds=settings.BASEROW_STORAGE_USAGE_UPDATE_INTERVAL_SECONDS),
+        update_outdated_storage_usage.s(),
+    )
@@ -1,14 +1,19 @@
 import mimetypes
 import pathlib
+from datetime import datetime, timedelta
 from io import BytesIO
 from os.path import join
-from typing import Optional
+from typing import Optional, Union
 from urllib.parse import urlparse
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
 from django.db.models import QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 import advocate
 from advocate.exceptions import UnacceptableAddressException
@@ -26,6 +31,11 @@ from .exceptions import (
 )
 from .models import UserFile
 
+THUMBNAILS_PENDING_CACHE_KEY_PREFIX = "user_file_thumbnails_pending_"
+# The maximum time the thumbnails of a user file are considered to be pending. This
+# prevents a failed task from hiding the thumbnails forever.
+THUMBNAILS_PENDING_TIMEOUT = 60 * 10
+
 
 class UserFileHandler:
     def get_user_file_by_name(
@@ -145,6 +155,7 @@ class UserFileHandler:
         image_width = user_file.image_width
         image_height = user_file.image_height
 
+        sizes = {}
         for name, size in settings.USER_THUMBNAILS.items():
             if only_with_name and only_with_name != name:
                 continue
@@ -157,7 +168,25 @@ class UserFileHandler:
             elif size_copy[1] is None and size_copy[0] is not None:
                 size_copy[1] = round(image_height / image_width * size_copy[0])
 
-            thumbnail = ImageOps.fit(image.copy(), size_copy, Image.ANTIALIAS)
+            sizes[name] = size_copy
+
+        if not sizes:
+            return
+
+        # JPEG images can be decoded at a reduced scale, which is a lot faster than
+        # decoding the full image and then downscaling it. The image is never reduced
+        # below the largest thumbnail size. This does nothing for other formats or
+        # when the image has already been loaded.
+        image.draft(
+            image.mode,
+            (
+                max(size[0] for size in sizes.values()),
+                max(size[1] for size in sizes.values()),
+            ),
+        )
+
+        for name, size in sizes.items():
+            thumbnail = ImageOps.fit(image.copy(), size, Image.ANTIALIAS)
             thumbnail_stream = BytesIO()
             thumbnail.save(thumbnail_stream, image.format)
             thumbnail_stream.seek(0)
@@ -167,6 +196,88 @@ class UserFileHandler:
             del thumbnail
             del thumbnail_stream
 
+    def generate_and_save_user_file_thumbnails(
+        self, user_file, storage=None, only_with_name=None
+    ):
+        """
+        Opens the original image of the provided user file from the storage and
+        generates the thumbnails based on the current settings.
+
+        :param user_file: The user file for which the thumbnails must be generated
+            and saved.
+        :type user_file: UserFile
+        :param storage: The storage where the original file is stored and where the
+            thumbnails must be saved to.
+        :type storage: Storage or None
+        :param only_with_name: If provided, then only thumbnail types with that name
+            will be regenerated.
+        :type only_with_name: None or String
+        :raises IOError: If the original file can't be opened as image.
+        """
+
+        storage = storage or default_storage
+
+        with storage.open(self.user_file_path(user_file)) as stream:
+            with Image.open(stream) as image:
+                self.generate_and_save_image_thumbnails(
+                    image, user_file, storage=storage, only_with_name=only_with_name
+                )
+
+    def _get_thumbnails_pending_cache_key(self, user_file_name: str) -> str:
+        return f"{THUMBNAILS_PENDING_CACHE_KEY_PREFIX}{user_file_name}"
+
+    def generate_user_file_thumbnails_async(self, user_file: UserFile):
+        """
+        Marks the thumbnails of the provided user file as pending and starts a task
+        generating them once the current transaction commits. Until the task
+        finishes, the original file is used as thumbnail.
+
+        :param user_file: The image user file for which the thumbnails must be
+            generated. The original file must be saved in the default storage.
+        """
+
+        from .tasks import generate_user_file_thumbnails
+
+        cache.set(
+            self._get_thumbnails_pending_cache_key(user_file.name),
+            True,
+            timeout=THUMBNAILS_PENDING_TIMEOUT,
+        )
+        transaction.on_commit(lambda: generate_user_file_thumbnails.delay(user_file.id))
+
+    def mark_thumbnails_as_generated(self, user_file: UserFile):
+        """
+        Indicates that the thumbnails of the provided user file exist.
+
+        :param user_file: The user file of which the thumbnails have been generated.
+        """
+
+        cache.delete(self._get_thumbnails_pending_cache_key(user_file.name))
+
+    def are_thumbnails_pending(
+        self, user_file_name: str, uploaded_at: Union[datetime, str, None]
+    ) -> bool:
+        """
+        Checks whether the thumbnails of the provided user file are still being
+        generated. Only recently uploaded files can have pending thumbnails, so the
+        cache doesn't have to be checked for the other ones.
+
+        :param user_file_name: The name of the user file.
+        :param uploaded_at: The datetime or ISO formatted string indicating when the
+            user file was uploaded.
+        :return: Whether the thumbnails don't exist yet.
+        """
+
+        if isinstance(uploaded_at, str):
+            uploaded_at = parse_datetime(uploaded_at)
+
+        if uploaded_at is None or timezone.now() - uploaded_at > timedelta(
+            seconds=THUMBNAILS_PENDING_TIMEOUT
+        ):
+            return False
+
+        return bool(cache.get(self._get_thumbnails_pending_cache_key(user_file_name)))
+
     def upload_user_file(self, user, file_name, stream, storage=None):
         """
         Saves the provided uploaded file in the provided storage. If no storage is
@@ -243,14 +354,17 @@ class UserFileHandler:
         )
 
         # If the uploaded file is an image we need to generate the configurable
-        # thumbnails for it. We want to generate them before the file is saved to the
-        # storage because some storages close the stream after saving.
-        if image:
+        # thumbnails for it. This is done by a task to keep the upload fast, but the
+        # task can only access the default storage. For other storages, we generate
+        # them before the file is saved to the storage because some storages close
+        # the stream after saving.
+        generate_thumbnails_async = image is not None and storage is default_storage
+        if image and not generate_thumbnails_async:
             self.generate_and_save_image_thumbnails(image, user_file, storage=storage)
 
-            # When all the thumbnails have been generated, the image can be deleted
-            # from memory.
-            del image
+        # When all the thumbnails have been generated, the image can be deleted
+        # from memory.
+        del image
 
         # Save the file to the storage.
         full_path = self.user_file_path(user_file)
@@ -259,6 +373,9 @@ class UserFileHandler:
         # Close the stream because we don't need it anymore.
         stream.close()
 
+        if generate_thumbnails_async:
+            self.generate_user_file_thumbnails_async(user_file)
+
         return user_file
 
     def upload_user_file_by_url(self, user, url, storage=None):
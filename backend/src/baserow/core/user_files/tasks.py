@@ -0,0 +1,25 @@
+from baserow.config.celery import app
+
+
+@app.task(bind=True, queue="export")
+def generate_user_file_thumbnails(self, user_file_id: int):
+    """
+    Generates the thumbnails of the provided image user file. The user file might
+    have been deleted in the meantime, in which case nothing happens.
+
+    :param user_file_id: The id of the user file.
+    """
+
+    from .handler import UserFileHandler
+    from .models import UserFile
+
+    try:
+        user_file = UserFile.objects.get(id=user_file_id)
+    except UserFile.DoesNotExist:
+        return
+
+    handler = UserFileHandler()
+    try:
+        handler.generate_and_save_user_file_thumbnails(user_file)
+    finally:
+        handler.mark_thumbnails_as_generated(user_file)
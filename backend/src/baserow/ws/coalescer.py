@@ -0,0 +1,170 @@
+import threading
+from collections import defaultdict
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from weakref import WeakSet
+
+from django.db import transaction
+
+if TYPE_CHECKING:
+    from baserow.ws.registries import PageType
+
+Payload = Dict[str, Any]
+PayloadMerger = Callable[[Payload, Payload], Optional[Payload]]
+
+
+class PageEventCoalescer:
+    """
+    Coalesces the payloads that are broadcast to the page groups by the callbacks
+    registered with the `on_commit` method. Instead of sending a channel layer message
+    for every payload right away, the payloads are collected until all the callbacks
+    of the committed transaction have run. Consecutive payloads of the same type sent
+    to the same group can then be merged by the registered payload mergers, which for
+    example drop the superseded updates of a row. Finally all the payloads of a group
+    are sent using a single channel layer message.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._payload_mergers: Dict[str, PayloadMerger] = {}
+
+    def register_payload_merger(self, payload_type: str, merger: PayloadMerger):
+        """
+        Registers a function that merges two consecutive payloads of the provided
+        type that are broadcast to the same group and ignore the same web socket id.
+        The function must return the merged payload, or None if the payloads can't be
+        merged.
+
+        :param payload_type: The `type` of the payloads that can be merged.
+        :param merger: The function accepting the previous and the next payload.
+        """
+
+        self._payload_mergers[payload_type] = merger
+
+    def _get_state(self) -> threading.local:
+        local = self._local
+        if not hasattr(local, "buffer"):
+            local.buffer = []
+            local.collecting = 0
+            local.pending_flushes = WeakSet()
+        return local
+
+    def is_collecting(self) -> bool:
+        """
+        Indicates whether the payloads that are broadcast right now must be added to
+        the buffer instead of being sent.
+        """
+
+        return self._get_state().collecting > 0
+
+    def on_commit(self, callback: Callable[[], None]):
+        """
+        Registers a callback that is called when the current transaction commits, just
+        like `transaction.on_commit`. The payloads broadcast by the page types while
+        the callback runs are collected and sent together after all the other
+        callbacks of the transaction have run.
+
+        :param callback: The function broadcasting the payloads.
+        """
+
+        state = self._get_state()
+        if state.buffer and not state.collecting and not state.pending_flushes:
+            # The payloads left behind by a transaction of which not all the commit
+            # callbacks have run, because one of them failed, must not be sent
+            # together with the payloads of this transaction.
+            state.buffer = []
+
+        transaction.on_commit(partial(self._collect, callback))
+        flush = _Flush(self._flush_if_last)
+        state.pending_flushes.add(flush)
+        transaction.on_commit(flush)
+
+    def add(
+        self,
+        page_type: "PageType",
+        payload: Payload,
+        ignore_web_socket_id: Optional[str],
+        page_parameters: Dict[str, Any],
+    ):
+        """
+        Adds a payload that must be broadcast to the page group to the buffer.
+        """
+
+        group_name = page_type.get_group_name(**page_parameters)
+        self._get_state().buffer.append(
+            (group_name, page_type, page_parameters, payload, ignore_web_socket_id)
+        )
+
+    def _collect(self, callback: Callable[[], None]):
+        state = self._get_state()
+        state.collecting += 1
+        try:
+            callback()
+        except Exception:
+            # The remaining commit callbacks, including the flush callbacks, don't
+            # run anymore, so the collected payloads would otherwise be left behind.
+            state.buffer = []
+            state.pending_flushes.clear()
+            raise
+        finally:
+            state.collecting -= 1
+
+    def _flush_if_last(self, flush: "_Flush"):
+        state = self._get_state()
+        state.pending_flushes.discard(flush)
+        # Only the last flush callback that still has to run sends the payloads. The
+        # flush callbacks that are discarded because their savepoint or transaction
+        # is rolled back aren't referenced anymore, so they disappear from the weak
+        # set and don't prevent the payloads of the others from being sent.
+        if not state.pending_flushes:
+            self.flush()
+
+    def flush(self):
+        """
+        Merges and sends all the collected payloads, using one channel layer message
+        per page group.
+        """
+
+        state = self._get_state()
+        buffer, state.buffer = state.buffer, []
+
+        groups: Dict[str, Tuple["PageType", Dict[str, Any]]] = {}
+        payloads_per_group: Dict[
+            str, List[Tuple[Payload, Optional[str]]]
+        ] = defaultdict(list)
+        for group_name, page_type, page_parameters, payload, ignore in buffer:
+            groups[group_name] = (page_type, page_parameters)
+            payloads = payloads_per_group[group_name]
+            if payloads and payloads[-1][1] == ignore:
+                merged_payload = self._merge(payloads[-1][0], payload)
+                if merged_payload is not None:
+                    payloads[-1] = (merged_payload, ignore)
+                    continue
+            payloads.append((payload, ignore))
+
+        for group_name, payloads in payloads_per_group.items():
+            page_type, page_parameters = groups[group_name]
+            page_type.broadcast_many(payloads, **page_parameters)
+
+    def _merge(self, previous: Payload, payload: Payload) -> Optional[Payload]:
+        payload_type = payload.get("type", None)
+        merger = self._payload_mergers.get(payload_type, None)
+        if merger is None or previous.get("type", None) != payload_type:
+            return None
+        return merger(previous, payload)
+
+
+class _Flush:
+    """
+    The flush callback registered for every `on_commit` call. A separate object is
+    needed, so that a weak reference to it can be kept.
+    """
+
+    def __init__(self, flush_if_last: Callable[["_Flush"], None]):
+        self._flush_if_last = flush_if_last
+
+    def __call__(self):
+        self._flush_if_last(self)
+
+
+page_event_coalescer = PageEventCoalescer()
@@ -166,6 +166,24 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
         if not ignore_web_socket_id or ignore_web_socket_id != web_socket_id:
             await self.send_json(payload)
 
+    async def broadcast_many_to_group(self, event):
+        """
+        Broadcasts multiple messages to all the users that are in the provided group
+        name. The payloads are sent one after the other and every send is awaited, so
+        that a slow connection doesn't get more payloads queued than it can handle.
+
+        :param event: The event containing the messages, which contain the payload and
+            the web socket id that must be ignored.
+        :type event: dict
+        """
+
+        web_socket_id = self.scope["web_socket_id"]
+
+        for message in event["messages"]:
+            ignore_web_socket_id = message["ignore_web_socket_id"]
+            if not ignore_web_socket_id or ignore_web_socket_id != web_socket_id:
+                await self.send_json(message["payload"])
+
     async def remove_user_from_group(self, event):
         user_ids_to_remove = event["user_ids_to_remove"]
         user_id = self.scope["user"].id
@@ -1,5 +1,8 @@
+from typing import Any, Dict, List, Optional, Tuple
+
 from baserow.core.registry import Instance, Registry
-from baserow.ws.tasks import broadcast_to_channel_group
+from baserow.ws.coalescer import page_event_coalescer
+from baserow.ws.tasks import broadcast_many_to_channel_group, broadcast_to_channel_group
 
 
 class PageType(Instance):
@@ -74,10 +77,45 @@ class PageType(Instance):
         :type kwargs: dict
         """
 
+        if page_event_coalescer.is_collecting():
+            page_event_coalescer.add(self, payload, ignore_web_socket_id, kwargs)
+            return
+
+        # The payloads that have been collected before must be sent first to keep
+        # the order in which the clients receive the payloads.
+        page_event_coalescer.flush()
+
         broadcast_to_channel_group.delay(
             self.get_group_name(**kwargs), payload, ignore_web_socket_id
         )
 
+    def broadcast_many(
+        self, payloads: List[Tuple[Dict[str, Any], Optional[str]]], **kwargs
+    ):
+        """
+        Broadcasts multiple payloads to everyone within the group using a single
+        channel layer message. The payloads are sent in the provided order.
+
+        :param payloads: A list containing tuples of the payload and the optional web
+            socket id to which the payload must not be sent.
+        :param kwargs: The additional parameters including their provided values.
+        """
+
+        group_name = self.get_group_name(**kwargs)
+
+        if len(payloads) == 1:
+            payload, ignore_web_socket_id = payloads[0]
+            broadcast_to_channel_group.delay(group_name, payload, ignore_web_socket_id)
+            return
+
+        broadcast_many_to_channel_group.delay(
+            group_name,
+            [
+                {"payload": payload, "ignore_web_socket_id": ignore_web_socket_id}
+                for payload, ignore_web_socket_id in payloads
+            ],
+        )
+
 
 class PageRegistry(Registry):
     name = "ws_page"
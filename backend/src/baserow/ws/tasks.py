@@ -181,6 +181,31 @@ def broadcast_to_channel_group(self, workspace, payload, ignore_web_socket_id=No
     )
 
 
+@app.task(bind=True)
+def broadcast_many_to_channel_group(self, workspace: str, messages: List[Dict]):
+    """
+    Broadcasts multiple JSON payloads to all the users within the channel workspace
+    having the provided name, using a single channel layer message. The consumers
+    send the payloads in the provided order.
+
+    :param workspace: The name of the channel workspace where the payloads must be
+        broadcast to.
+    :param messages: A list of dicts containing the `payload` that must be broadcast
+        and the optional `ignore_web_socket_id` to which the payload must not be
+        sent.
+    """
+
+    from asgiref.sync import async_to_sync
+    from channels.layers import get_channel_layer
+
+    channel_layer = get_channel_layer()
+    async_to_sync(closing_group_send)(
+        channel_layer,
+        workspace,
+        {"type": "broadcast_many_to_group", "messages": messages},
+    )
+
+
 @app.task(bind=True)
 def broadcast_to_group(self, workspace_id, payload, ignore_web_socket_id=None):
     """
@@ -0,0 +1,31 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.renderers import JSONRenderer
+
+from baserow.api.renderers import OrjsonRenderer
+
+
+def test_orjson_renderer_renders_like_the_json_renderer():
+    data = {
+        "text": "Unicode \u2028 \u2029 \u2713",
+        "decimal": Decimal("1.50"),
+        "datetime": datetime(2020, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc),
+        "lazy": _("Text"),
+        1: [True, None, 1.5, (1, 2)],
+        "big": 2**70,
+    }
+
+    rendered = OrjsonRenderer().render(data)
+    assert rendered == JSONRenderer().render(data)
+    assert json.loads(rendered)["datetime"] == "2020-01-01T12:00:00.123456Z"
+
+    del data["big"]
+    assert json.loads(OrjsonRenderer().render(data)) == json.loads(
+        JSONRenderer().render(data)
+    )
+    assert b"\\u2028" in OrjsonRenderer().render(data)
+    assert OrjsonRenderer().render(None) == b""
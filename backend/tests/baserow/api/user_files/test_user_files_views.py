@@ -20,7 +20,9 @@ from baserow.core.models import UserFile
 
 
 @pytest.mark.django_db
-def test_upload_file_with_jwt_auth(api_client, data_fixture, tmpdir):
+def test_upload_file_with_jwt_auth(
+    api_client, data_fixture, tmpdir, django_capture_on_commit_callbacks
+):
     user, token = data_fixture.create_user_and_token(
         email="test@test.nl", password="password", first_name="Test1"
     )
@@ -115,12 +117,13 @@ def test_upload_file_with_jwt_auth(api_client, data_fixture, tmpdir):
     file.seek(0)
 
     with patch("baserow.core.user_files.handler.default_storage", new=storage):
-        response = api_client.post(
-            reverse("api:user_files:upload_file"),
-            data={"file": file},
-            format="multipart",
-            HTTP_AUTHORIZATION=f"JWT {token}",
-        )
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(
+                reverse("api:user_files:upload_file"),
+                data={"file": file},
+                format="multipart",
+                HTTP_AUTHORIZATION=f"JWT {token}",
+            )
 
     response_json = response.json()
     assert response.status_code == HTTP_200_OK
@@ -130,7 +133,9 @@ def test_upload_file_with_jwt_auth(api_client, data_fixture, tmpdir):
     assert response_json["image_height"] == 140
     assert len(response_json["thumbnails"]) == 1
     assert "localhost:8000" in response_json["thumbnails"]["tiny"]["url"]
-    assert "tiny" in response_json["thumbnails"]["tiny"]["url"]
+    # The thumbnails are generated after the response has been created, so the
+    # original image is used until then.
+    assert response_json["thumbnails"]["tiny"]["url"] == response_json["url"]
     assert response_json["thumbnails"]["tiny"]["width"] == 21
     assert response_json["thumbnails"]["tiny"]["height"] == 21
     assert response_json["original_name"] == "test.png"
@@ -146,7 +151,9 @@ def test_upload_file_with_jwt_auth(api_client, data_fixture, tmpdir):
 
 
 @pytest.mark.django_db
-def test_upload_file_with_token_auth(api_client, data_fixture, tmpdir):
+def test_upload_file_with_token_auth(
+    api_client, data_fixture, tmpdir, django_capture_on_commit_callbacks
+):
     user, jwt_token = data_fixture.create_user_and_token(
         email="test@test.nl", password="password", first_name="Test1"
     )
@@ -243,12 +250,13 @@ def test_upload_file_with_token_auth(api_client, data_fixture, tmpdir):
     file.seek(0)
 
     with patch("baserow.core.user_files.handler.default_storage", new=storage):
-        response = api_client.post(
-            reverse("api:user_files:upload_file"),
-            data={"file": file},
-            format="multipart",
-            HTTP_AUTHORIZATION=f"Token {token.key}",
-        )
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(
+                reverse("api:user_files:upload_file"),
+                data={"file": file},
+                format="multipart",
+                HTTP_AUTHORIZATION=f"Token {token.key}",
+            )
 
     response_json = response.json()
     assert response.status_code == HTTP_200_OK
@@ -258,7 +266,9 @@ def test_upload_file_with_token_auth(api_client, data_fixture, tmpdir):
     assert response_json["image_height"] == 140
     assert len(response_json["thumbnails"]) == 1
     assert "localhost:8000" in response_json["thumbnails"]["tiny"]["url"]
-    assert "tiny" in response_json["thumbnails"]["tiny"]["url"]
+    # The thumbnails are generated after the response has been created, so the
+    # original image is used until then.
+    assert response_json["thumbnails"]["tiny"]["url"] == response_json["url"]
     assert response_json["thumbnails"]["tiny"]["width"] == 21
     assert response_json["thumbnails"]["tiny"]["height"] == 21
     assert response_json["original_name"] == "test.png"
@@ -1,12 +1,14 @@
 import json
 import os
 from copy import deepcopy
+from io import BytesIO
 from pathlib import Path
 from unittest.mock import patch
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from django.conf import settings
 from django.core.files.storage import FileSystemStorage
+from django.test.utils import override_settings
 
 import pytest
 import responses
@@ -280,6 +282,32 @@ def test_to_baserow_database_export():
     ]
 
 
+@pytest.mark.django_db
+@responses.activate
+@override_settings(BASEROW_AIRTABLE_IMPORT_CONCURRENCY=2)
+def test_download_files_as_zip():
+    files_to_download = {}
+    for index in range(10):
+        url = f"https://dl.airtable.com/.attachments/{index}/file.txt"
+        responses.add(responses.GET, url, status=200, body=f"file {index}" * 10000)
+        files_to_download[f"file_{index}.txt"] = url
+
+    progress = Progress(100)
+    files_buffer = AirtableHandler.download_files_as_zip(
+        files_to_download, progress.create_child_builder(represents_progress=100)
+    )
+
+    # The files are stored in a temporary file on disk instead of in memory.
+    assert not isinstance(files_buffer, BytesIO)
+    assert progress.progress == 100
+    with ZipFile(files_buffer, "r", ZIP_DEFLATED, False) as zip_file:
+        assert zip_file.namelist() == list(files_to_download.keys())
+        for index in range(10):
+            assert (
+                zip_file.read(f"file_{index}.txt") == f"file {index}".encode() * 10000
+            )
+
+
 @pytest.mark.django_db
 @responses.activate
 def test_to_baserow_database_export_without_primary_value():
@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 from django.conf import settings
 from django.shortcuts import reverse
 
@@ -785,6 +787,77 @@ def test_create_field_returns_with_error_if_cant_lock_table_if_locked_for_key_sh
     assert response_json["error"] == "ERROR_FAILED_TO_LOCK_TABLE_DUE_TO_CONFLICT"
 
 
+@pytest.mark.django_db(transaction=True)
+def test_async_convert_field(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    _, token_2 = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    model = table.get_model()
+    model.objects.create(**{f"field_{text_field.id}": "1.54"})
+    model.objects.create(**{f"field_{text_field.id}": "not a number"})
+
+    response = api_client.post(
+        reverse("api:jobs:list"),
+        {"type": "convert_field", "field_id": text_field.id, "new_type": "number"},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token_2}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
+
+    response = api_client.post(
+        reverse("api:jobs:list"),
+        {
+            "type": "convert_field",
+            "field_id": text_field.id,
+            "new_type": "single_select",
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert (
+        response.json()["error"]
+        == "ERROR_INCOMPATIBLE_FIELD_TYPE_FOR_ONLINE_CONVERSION"
+    )
+
+    response = api_client.post(
+        reverse("api:jobs:list"),
+        {
+            "type": "convert_field",
+            "field_id": text_field.id,
+            "new_type": "number",
+            "field_values": {"number_decimal_places": 1},
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    job = response.json()
+    assert job["type"] == "convert_field"
+    assert job["state"] == "pending"
+
+    response = api_client.get(
+        reverse("api:jobs:item", kwargs={"job_id": job["id"]}),
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    job = response.json()
+    assert job["state"] == "finished"
+    assert job["progress_percentage"] == 100
+    assert job["field"]["id"] == text_field.id
+    assert job["field"]["type"] == "number"
+
+    field = Field.objects.get(id=text_field.id).specific
+    assert isinstance(field, NumberField)
+    assert field.number_decimal_places == 1
+    assert list(
+        table.get_model()
+        .objects.order_by("id")
+        .values_list(f"field_{field.id}", flat=True)
+    ) == [Decimal("1.5"), None]
+
+
 @pytest.mark.django_db(transaction=True)
 def test_async_duplicate_field(api_client, data_fixture):
     user_1, token_1 = data_fixture.create_user_and_token(
@@ -17,6 +17,7 @@ from rest_framework.status import (
 
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import SelectOption
+from baserow.contrib.database.table.cache import generated_models_lru_cache
 from baserow.contrib.database.tokens.handler import TokenHandler
 from baserow.test_utils.helpers import is_dict_subset
 
@@ -703,6 +704,9 @@ def test_batch_create_rows_num_of_queries(api_client, data_fixture):
 
     url = reverse("api:database:rows:batch", kwargs={"table_id": table_b.id})
 
+    # Both requests must start with a cold model cache, otherwise the second one
+    # reuses the model generated by the first one.
+    generated_models_lru_cache.clear()
     with CaptureQueriesContext(connection) as create_one_row_ctx:
         request_body = {
             "items": [
@@ -729,6 +733,7 @@ def test_batch_create_rows_num_of_queries(api_client, data_fixture):
             HTTP_AUTHORIZATION=f"JWT {jwt_token}",
         )
 
+    generated_models_lru_cache.clear()
     with CaptureQueriesContext(connection) as create_multiple_rows_ctx:
         request_body2 = {
             "items": [
@@ -1760,6 +1765,9 @@ def test_batch_update_rows_num_of_queries(api_client, data_fixture):
     url = reverse("api:database:rows:batch", kwargs={"table_id": table_b.id})
 
     related_link_field = link_field.link_row_related_field
+    # Both requests must start with a cold model cache, otherwise the second one
+    # reuses the model generated by the first one.
+    generated_models_lru_cache.clear()
     with CaptureQueriesContext(connection) as update_one_row_ctx:
         request_body = {
             "items": [
@@ -1788,6 +1796,7 @@ def test_batch_update_rows_num_of_queries(api_client, data_fixture):
             HTTP_AUTHORIZATION=f"JWT {jwt_token}",
         )
 
+    generated_models_lru_cache.clear()
     with CaptureQueriesContext(connection) as update_multiple_rows_ctx:
         request_body2 = {
             "items": [
@@ -6,8 +6,10 @@ from rest_framework import serializers
 from baserow.contrib.database.api.rows.serializers import (
     RowSerializer,
     get_example_row_serializer_class,
+    get_row_response_encoder,
     get_row_serializer_class,
     remap_serialized_row_to_user_field_names,
+    serialize_rows_for_response,
 )
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import SelectOption
@@ -396,3 +398,61 @@ def test_remap_serialized_row_to_user_field_names(data_fixture):
         "Link": [{"id": 1, "value": "Lookup 1"}],
         "Test 1": "Test value",
     }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("user_field_names", [True, False])
+def test_serialize_rows_for_response_matches_row_serializer(
+    data_fixture, user_field_names
+):
+    table, user, row, _, context = setup_interesting_test_table(data_fixture)
+    model = table.get_model()
+    rows = list(model.objects.all().enhance_by_fields())
+
+    serializer_class = get_row_serializer_class(
+        model, RowSerializer, is_response=True, user_field_names=user_field_names
+    )
+    expected = serializer_class(rows, many=True).data
+    assert serialize_rows_for_response(
+        rows, model, user_field_names=user_field_names
+    ) == json.loads(json.dumps(expected))
+
+    field_ids = [field.id for field in table.field_set.all()[:5]]
+    serializer_class = get_row_serializer_class(
+        model, RowSerializer, is_response=True, field_ids=field_ids
+    )
+    expected = serializer_class(rows, many=True).data
+    assert serialize_rows_for_response(rows, model, field_ids=field_ids) == (
+        json.loads(json.dumps(expected))
+    )
+
+
+@pytest.mark.django_db
+def test_get_row_response_encoder_is_cached_per_table_model(data_fixture):
+    table = data_fixture.create_database_table()
+    field = data_fixture.create_number_field(table=table, number_decimal_places=2)
+    model = table.get_model()
+    row = model.objects.create(**{f"field_{field.id}": "1.1"})
+    row.refresh_from_db()
+
+    encoder = get_row_response_encoder(model)
+    # Every call to `get_model` returns a new class, but the encoder compiled for
+    # the same table version must be reused.
+    other_model = table.get_model()
+    assert other_model is not model
+    assert get_row_response_encoder(other_model) is encoder
+    assert get_row_response_encoder(
+        other_model, field_ids=[field.id]
+    ) is get_row_response_encoder(model, field_ids=[field.id])
+    assert get_row_response_encoder(model, field_ids=[field.id]) is not encoder
+    assert get_row_response_encoder(model, user_field_names=True) is not encoder
+    assert encoder(row) == {
+        "id": row.id,
+        "order": "1.00000000000000000000",
+        f"field_{field.id}": "1.10",
+    }
+
+    # Values that are not fetched from the database are quantized like the
+    # serializer does.
+    setattr(row, f"field_{field.id}", 2)
+    assert encoder(row)[f"field_{field.id}"] == "2.00"
@@ -616,6 +616,7 @@ def test_create_row(api_client, data_fixture):
     assert response_json_row_4[f"field_{text_field_2.id}"] == ""
     assert response_json_row_4["order"] == "4.00000000000000000000"
 
+    TokenHandler().flush_token_usage()
     token.refresh_from_db()
     assert token.handled_calls == 1
 
@@ -639,6 +640,7 @@ def test_create_row(api_client, data_fixture):
     assert response_json_row_5[f"field_{text_field_2.id}"] == ""
     assert response_json_row_5["order"] == "2.50000000000000000000"
 
+    TokenHandler().flush_token_usage()
     token.refresh_from_db()
     assert token.handled_calls == 2
 
@@ -1655,6 +1657,184 @@ def test_list_rows_returns_https_next_url(api_client, data_fixture, settings):
     )
 
 
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(name="Name", table=table, primary=True)
+
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{field.id}": name}, order=Decimal(order))
+        for name, order in [("b", "1"), ("a", "2"), ("c", "3"), ("a", "4")]
+    ]
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    ids = []
+    next_url = f"{url}?cursor=&size=1"
+    while next_url:
+        response = api_client.get(next_url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+        assert response.status_code == HTTP_200_OK
+        response_json = response.json()
+        assert len(response_json["results"]) == 1
+        ids.append(response_json["results"][0]["id"])
+        next_url = response_json["next"]
+    assert ids == [row.id for row in rows]
+
+    ids = []
+    next_url = f"{url}?cursor=&size=3&order_by=field_{field.id}"
+    while next_url:
+        response = api_client.get(next_url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+        assert response.status_code == HTTP_200_OK
+        response_json = response.json()
+        ids.extend(row["id"] for row in response_json["results"])
+        next_url = response_json["next"]
+    assert ids == [rows[1].id, rows[3].id, rows[0].id, rows[2].id]
+
+    # An invalid page size falls back to the default one.
+    for size in ["0", "-1", "a"]:
+        response = api_client.get(
+            f"{url}?cursor=&size={size}", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+        )
+        assert response.status_code == HTTP_200_OK
+        assert len(response.json()["results"]) == 4
+
+
+@pytest.mark.django_db
+@pytest.mark.field_link_row
+def test_list_rows_with_related_rows_limit(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    related_table = data_fixture.create_database_table(
+        user=user, database=table.database
+    )
+    related_primary_field = data_fixture.create_text_field(
+        name="Name", table=related_table, primary=True
+    )
+    link_row_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=related_table
+    )
+
+    related_model = related_table.get_model()
+    related_rows = [
+        related_model.objects.create(**{f"field_{related_primary_field.id}": name})
+        for name in ["a", "b", "c"]
+    ]
+    model = table.get_model()
+    row_1 = model.objects.create()
+    getattr(row_1, f"field_{link_row_field.id}").set(
+        [related_row.id for related_row in related_rows]
+    )
+    row_2 = model.objects.create()
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert len(response_json["results"][0][f"field_{link_row_field.id}"]) == 3
+    assert "related_rows_count" not in response_json
+
+    response = api_client.get(
+        f"{url}?related_rows_limit=2&user_field_names=true",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["results"][0]["Link"] == [
+        {"id": related_rows[0].id, "value": "a"},
+        {"id": related_rows[1].id, "value": "b"},
+    ]
+    assert response_json["results"][1]["Link"] == []
+    assert response_json["related_rows_count"] == {
+        str(row_1.id): {"Link": 3},
+        str(row_2.id): {"Link": 0},
+    }
+
+    # A limit of 0 would make every `related_rows_count` 0.
+    for invalid_limit in [-1, 0]:
+        response = api_client.get(
+            f"{url}?related_rows_limit={invalid_limit}",
+            HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+        )
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert response.json()["error"] == "ERROR_QUERY_PARAMETER_VALIDATION"
+
+
+@pytest.mark.django_db
+@pytest.mark.field_link_row
+def test_list_row_related_rows(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    related_table = data_fixture.create_database_table(
+        user=user, database=table.database
+    )
+    related_primary_field = data_fixture.create_text_field(
+        name="Name", table=related_table, primary=True
+    )
+    text_field = data_fixture.create_text_field(table=table)
+    link_row_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=related_table
+    )
+
+    related_model = related_table.get_model()
+    related_rows = [
+        related_model.objects.create(**{f"field_{related_primary_field.id}": name})
+        for name in ["a", "b", "c"]
+    ]
+    row = table.get_model().objects.create()
+    getattr(row, f"field_{link_row_field.id}").set(
+        [related_row.id for related_row in related_rows]
+    )
+
+    def get_url(row_id, field_id):
+        return reverse(
+            "api:database:rows:related_rows",
+            kwargs={"table_id": table.id, "row_id": row_id, "field_id": field_id},
+        )
+
+    response = api_client.get(
+        f"{get_url(row.id, link_row_field.id)}?size=2",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["count"] == 3
+    assert response_json["results"] == [
+        {"id": related_rows[0].id, "value": "a"},
+        {"id": related_rows[1].id, "value": "b"},
+    ]
+
+    response = api_client.get(
+        f"{get_url(row.id, link_row_field.id)}?size=2&page=2",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.json()["results"] == [{"id": related_rows[2].id, "value": "c"}]
+
+    response = api_client.get(
+        get_url(row.id, text_field.id), HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INCOMPATIBLE_FIELD"
+
+    response = api_client.get(get_url(row.id, 0), HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_FIELD_DOES_NOT_EXIST"
+
+    response = api_client.get(
+        get_url(row.id + 1, link_row_field.id), HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_ROW_DOES_NOT_EXIST"
+
+    _, other_jwt_token = data_fixture.create_user_and_token()
+    response = api_client.get(
+        get_url(row.id, link_row_field.id),
+        HTTP_AUTHORIZATION=f"JWT {other_jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
+
+
 @pytest.mark.django_db
 def test_list_row_names(api_client, data_fixture):
     user, jwt_token = data_fixture.create_user_and_token(
@@ -1,6 +1,7 @@
 import json
 from unittest.mock import patch
 
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db import connection
 from django.shortcuts import reverse
 from django.test.utils import CaptureQueriesContext, override_settings
@@ -278,6 +279,126 @@ def test_create_table_with_data_sync(api_client, data_fixture, patch_filefield_s
     assert model.objects.count() == 2
 
 
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.core.jobs.handler.run_async_job")
+def test_create_table_from_file(
+    mock_run_async_job, api_client, data_fixture, patch_filefield_storage
+):
+    user, token = data_fixture.create_user_and_token()
+    database = data_fixture.create_database_application(user=user)
+    database_2 = data_fixture.create_database_application()
+
+    def post(database_id, **data):
+        url = reverse(
+            "api:database:tables:async_create_from_file",
+            kwargs={"database_id": database_id},
+        )
+        return api_client.post(
+            url, data, format="multipart", HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+
+    def get_file():
+        return SimpleUploadedFile("data.csv", b"A;B\n1-1;1-2\n2-1;2-2\n")
+
+    response = post(database_2.id, name="Test 1", file=get_file(), file_type="csv")
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
+
+    response = post(9999, name="Test 1", file=get_file(), file_type="csv")
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_APPLICATION_DOES_NOT_EXIST"
+
+    response = post(
+        database.id,
+        name="Test 1",
+        file=get_file(),
+        file_type="pdf",
+        encoding="unknown",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response_json["error"] == "ERROR_REQUEST_BODY_VALIDATION"
+    assert response_json["detail"]["file_type"][0]["code"] == "invalid_choice"
+    assert response_json["detail"]["encoding"][0]["code"] == "invalid"
+
+    with patch_filefield_storage():
+        response = post(
+            database.id,
+            name="Test 1",
+            file=get_file(),
+            file_type="csv",
+            first_row_header=True,
+            csv_column_separator=";",
+        )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    mock_run_async_job.delay.assert_called_with(response_json["id"])
+
+    job = FileImportJob.objects.get(id=response_json["id"])
+    assert job.table is None
+    assert job.name == "Test 1"
+    assert job.database == database
+    assert job.first_row_header
+    assert job.file_type == "csv"
+    assert job.csv_column_separator == ";"
+    assert job.encoding == "utf-8"
+
+    with patch_filefield_storage():
+        with job.data_file.open("rb") as fin:
+            assert fin.read() == b"A;B\n1-1;1-2\n2-1;2-2\n"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_import_file_in_table(api_client, data_fixture, patch_filefield_storage):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, order=0)
+    number_field = data_fixture.create_number_field(table=table, order=1)
+    table_2 = data_fixture.create_database_table()
+
+    def post(table_id, **data):
+        url = reverse(
+            "api:database:tables:import_file_async", kwargs={"table_id": table_id}
+        )
+        return api_client.post(
+            url, data, format="multipart", HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+
+    def get_file():
+        return SimpleUploadedFile(
+            "data.json", b'[["a", 1], ["b", "not a number"], ["c", 3]]'
+        )
+
+    response = post(table_2.id, file=get_file(), file_type="json")
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
+
+    response = post(9999, file=get_file(), file_type="json")
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_TABLE_DOES_NOT_EXIST"
+
+    response = post(table.id, file_type="json")
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_REQUEST_BODY_VALIDATION"
+
+    with patch_filefield_storage():
+        response = post(table.id, file=get_file(), file_type="json")
+    assert response.status_code == HTTP_200_OK
+
+    job = FileImportJob.objects.get(id=response.json()["id"])
+    assert job.table_id == table.id
+
+    rows = table.get_model().objects.all().order_by("id")
+    assert [
+        (
+            getattr(row, f"field_{text_field.id}"),
+            getattr(row, f"field_{number_field.id}"),
+        )
+        for row in rows
+    ] == [("a", 1), ("c", 3)]
+    assert list(job.report["failing_rows"].keys()) == ["1"]
+
+
 @pytest.mark.django_db
 def test_get_table(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token()
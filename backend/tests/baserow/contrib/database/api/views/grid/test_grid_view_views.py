@@ -204,6 +204,55 @@ def test_list_rows(api_client, data_fixture):
     assert response.status_code == HTTP_200_OK
 
 
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    grid = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid, field=number_field, order="DESC")
+
+    model = grid.table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{number_field.id}": value})
+        for value in [2, None, 3, 2, None, 1]
+    ]
+    expected_ids = [
+        rows[2].id,
+        rows[0].id,
+        rows[3].id,
+        rows[5].id,
+        rows[1].id,
+        rows[4].id,
+    ]
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(
+        url, {"cursor": "", "size": 4}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert "count" not in response_json
+    assert [row["id"] for row in response_json["results"]] == expected_ids[:4]
+    assert response_json["next"] is not None
+
+    response = api_client.get(
+        f"{response_json['next']}&include_count=true",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["count"] == 6
+    assert [row["id"] for row in response_json["results"]] == expected_ids[4:]
+    assert response_json["next"] is None
+
+    response = api_client.get(
+        url, {"cursor": "invalid"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+
 @pytest.mark.django_db
 def test_list_rows_include_field_options(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token(
@@ -286,6 +335,74 @@ def test_list_rows_include_row_metadata(api_client, data_fixture):
         }
 
 
+@pytest.mark.django_db
+@pytest.mark.field_link_row
+def test_list_rows_with_related_rows_limit(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    related_table = data_fixture.create_database_table(
+        user=user, database=table.database
+    )
+    link_row_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=related_table
+    )
+    grid = data_fixture.create_grid_view(table=table)
+
+    related_rows = [related_table.get_model().objects.create() for _ in range(3)]
+    row = table.get_model().objects.create()
+    getattr(row, f"field_{link_row_field.id}").set(
+        [related_row.id for related_row in related_rows]
+    )
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(
+        url, {"related_rows_limit": 1}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert [
+        related_row["id"]
+        for related_row in response_json["results"][0][f"field_{link_row_field.id}"]
+    ] == [related_rows[0].id]
+    assert response_json["related_rows_count"] == {
+        str(row.id): {f"field_{link_row_field.id}": 3}
+    }
+
+    response = api_client.get(
+        url, {"related_rows_limit": "a"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_QUERY_PARAMETER_VALIDATION"
+
+
+@pytest.mark.django_db
+def test_list_rows_with_search_mode(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    grid = data_fixture.create_grid_view(table=table)
+    row = table.get_model().objects.create(**{text_field.db_column: "Something"})
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(
+        url,
+        {"search": "thing", "search_mode": "compat"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    assert [r["id"] for r in response.json()["results"]] == [row.id]
+
+    response = api_client.get(
+        url,
+        {"search": "thing", "search_mode": "unknown"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    response_json = response.json()
+    assert response_json["error"] == "ERROR_QUERY_PARAMETER_VALIDATION"
+    assert response_json["detail"]["search_mode"][0]["code"] == "invalid_choice"
+
+
 @pytest.mark.django_db
 def test_list_filtered_rows(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token(
@@ -0,0 +1,131 @@
+import datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from baserow.contrib.database.db.copy import copy_model_instances, to_copy_text
+from baserow.test_utils.helpers import setup_interesting_test_table
+
+
+def test_to_copy_text():
+    assert to_copy_text(None) == "\\N"
+    assert to_copy_text(True) == "t"
+    assert to_copy_text(False) == "f"
+    assert to_copy_text(10) == "10"
+    assert to_copy_text(Decimal("1.50")) == "1.50"
+    assert to_copy_text(datetime.date(2020, 1, 2)) == "2020-01-02"
+    assert (
+        to_copy_text(datetime.datetime(2020, 1, 2, 3, 4, tzinfo=datetime.timezone.utc))
+        == "2020-01-02T03:04:00+00:00"
+    )
+    assert to_copy_text({"a": "b\tc"}) == '{"a": "b\\\\tc"}'
+    assert to_copy_text("a\tb\nc\\d\re") == "a\\tb\\nc\\\\d\\re"
+
+    with pytest.raises(TypeError):
+        to_copy_text(object())
+
+
+@pytest.mark.django_db
+def test_copy_model_instances(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=2
+    )
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    model = table.get_model()
+
+    existing_row = model.objects.create()
+    rows = copy_model_instances(
+        model,
+        [
+            model(
+                **{
+                    f"field_{text_field.id}": "Tab\\t and \\\\N\nnew line",
+                    f"field_{number_field.id}": Decimal("1.25"),
+                    f"field_{boolean_field.id}": True,
+                }
+            ),
+            model(),
+        ],
+        batch_size=1,
+    )
+
+    assert [row.id for row in rows] == [existing_row.id + 1, existing_row.id + 2]
+    assert all(not row._state.adding for row in rows)
+
+    row_1, row_2 = model.objects.filter(id__in=[row.id for row in rows]).order_by("id")
+    assert getattr(row_1, f"field_{text_field.id}") == "Tab\\t and \\\\N\nnew line"
+    assert getattr(row_1, f"field_{number_field.id}") == Decimal("1.25")
+    assert getattr(row_1, f"field_{boolean_field.id}") is True
+    assert row_1.created_on is not None
+    assert getattr(row_2, f"field_{text_field.id}") is None
+
+    assert model.objects.create().id == existing_row.id + 3
+
+
+@pytest.mark.django_db
+def test_copy_model_instances_with_values_computed_by_the_database(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    formula_field = data_fixture.create_formula_field(
+        table=table, formula="concat(field('text'), '!')", formula_type="text"
+    )
+    model = table.get_model()
+
+    with patch.object(
+        model.objects, "bulk_create", wraps=model.objects.bulk_create
+    ) as bulk_create:
+        rows = copy_model_instances(
+            model, [model(**{f"field_{text_field.id}": "a"}), model()]
+        )
+        assert bulk_create.call_count == 1
+
+    row_1, row_2 = model.objects.filter(id__in=[row.id for row in rows]).order_by("id")
+    assert getattr(row_1, f"field_{formula_field.id}") == "a!"
+    assert getattr(row_2, f"field_{formula_field.id}") == "!"
+
+
+@pytest.mark.django_db
+def test_copy_model_instances_with_all_field_types(data_fixture):
+    table, user, row, blank_row, context = setup_interesting_test_table(data_fixture)
+    # The values of the read only fields are computed by the database, so they can't
+    # be copied.
+    model = table.get_model(
+        field_ids=[
+            field_object["field"].id
+            for field_object in table.get_model()._field_objects.values()
+            if not field_object["type"].read_only
+        ]
+    )
+
+    fields = [
+        field
+        for field in model._meta.local_concrete_fields
+        if field.name != "id"
+        and not getattr(field, "auto_now", False)
+        and not getattr(field, "auto_now_add", False)
+    ]
+    source_rows = list(model.objects.filter(id__in=[row.id, blank_row.id]))
+
+    # The `bulk_create` fallback must not be used for any of these field types.
+    with patch.object(model.objects, "bulk_create") as bulk_create:
+        copies = copy_model_instances(
+            model,
+            [
+                model(
+                    **{
+                        field.attname: getattr(source, field.attname)
+                        for field in fields
+                    }
+                )
+                for source in source_rows
+            ],
+        )
+        bulk_create.assert_not_called()
+
+    for source, copy in zip(source_rows, copies):
+        copy = model.objects.get(id=copy.id)
+        for field in fields:
+            assert getattr(copy, field.attname) == getattr(source, field.attname)
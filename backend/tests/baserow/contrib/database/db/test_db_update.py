@@ -0,0 +1,192 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.db.models import F, Value
+from django.db.models.functions import Concat
+
+import pytest
+
+from baserow.contrib.database.db.update import (
+    update_many_to_many_relations,
+    update_model_instances,
+)
+from baserow.test_utils.helpers import setup_interesting_test_table
+
+
+@pytest.mark.django_db
+def test_update_model_instances(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=2
+    )
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    model = table.get_model()
+
+    row_1 = model.objects.create(**{f"field_{text_field.id}": "a"})
+    row_2 = model.objects.create(**{f"field_{text_field.id}": "b"})
+    row_3 = model.objects.create(**{f"field_{text_field.id}": "c"})
+
+    setattr(row_1, f"field_{text_field.id}", "It's")
+    setattr(row_1, f"field_{number_field.id}", Decimal("1.25"))
+    setattr(row_1, f"field_{boolean_field.id}", True)
+    setattr(row_2, f"field_{text_field.id}", None)
+    # Only the provided fields must be written.
+    setattr(row_2, f"field_{boolean_field.id}", True)
+
+    with patch.object(model.objects, "bulk_update") as bulk_update:
+        updated = update_model_instances(
+            model,
+            [row_1, row_2],
+            [f"field_{text_field.id}", f"field_{number_field.id}"],
+            batch_size=1,
+        )
+        bulk_update.assert_not_called()
+
+    assert updated == 2
+    row_1.refresh_from_db()
+    row_2.refresh_from_db()
+    row_3.refresh_from_db()
+    assert getattr(row_1, f"field_{text_field.id}") == "It's"
+    assert getattr(row_1, f"field_{number_field.id}") == Decimal("1.25")
+    assert getattr(row_1, f"field_{boolean_field.id}") is False
+    assert getattr(row_2, f"field_{text_field.id}") is None
+    assert getattr(row_2, f"field_{boolean_field.id}") is False
+    assert getattr(row_3, f"field_{text_field.id}") == "c"
+
+    assert update_model_instances(model, [], [f"field_{text_field.id}"]) == 0
+
+
+@pytest.mark.django_db
+def test_update_model_instances_with_values_computed_by_the_database(
+    data_fixture, django_assert_num_queries
+):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    formula_field = data_fixture.create_formula_field(
+        table=table, formula="concat(field('text'), '!')", formula_type="text"
+    )
+    model = table.get_model()
+    rows = [model.objects.create() for _ in range(3)]
+
+    model_field = model._meta.get_field(f"field_{formula_field.id}")
+    for row, value in zip(rows, ["a", "b", "c"]):
+        setattr(row, f"field_{text_field.id}", value)
+        setattr(row, model_field.name, model_field.pre_save(row, add=False))
+
+    # The formula values are computed in the same statement as the other values.
+    with patch.object(model.objects, "bulk_update") as bulk_update:
+        with django_assert_num_queries(2):
+            updated = update_model_instances(
+                model,
+                rows,
+                [f"field_{text_field.id}", f"field_{formula_field.id}"],
+                batch_size=2,
+            )
+        bulk_update.assert_not_called()
+
+    assert updated == 3
+    for row, value in zip(rows, ["a", "b", "c"]):
+        row.refresh_from_db()
+        assert getattr(row, f"field_{text_field.id}") == value
+        assert getattr(row, f"field_{formula_field.id}") == f"{value}!"
+
+    # An expression shared by all the rows is set without a `CASE` expression.
+    for row in rows:
+        setattr(
+            row,
+            f"field_{text_field.id}",
+            Concat(F(f"field_{text_field.id}"), Value("?")),
+        )
+    with django_assert_num_queries(1) as captured:
+        assert update_model_instances(model, rows, [f"field_{text_field.id}"]) == 3
+    assert "CASE" not in captured.captured_queries[0]["sql"]
+    assert [
+        getattr(row, f"field_{text_field.id}") for row in model.objects.order_by("id")
+    ] == ["a?", "b?", "c?"]
+
+
+@pytest.mark.django_db
+def test_update_model_instances_with_all_field_types(data_fixture):
+    table, user, row, blank_row, context = setup_interesting_test_table(data_fixture)
+    model = table.get_model(
+        field_ids=[
+            field_object["field"].id
+            for field_object in table.get_model()._field_objects.values()
+            if not field_object["type"].read_only
+        ]
+    )
+
+    fields = [
+        field
+        for field in model._meta.local_concrete_fields
+        if field.name not in ["id", "order"]
+        and not getattr(field, "auto_now", False)
+        and not getattr(field, "auto_now_add", False)
+    ]
+    source = model.objects.get(id=row.id)
+    target = model.objects.get(id=blank_row.id)
+    for field in fields:
+        setattr(target, field.attname, getattr(source, field.attname))
+
+    # The `bulk_update` fallback must not be used for any of these field types.
+    with patch.object(model.objects, "bulk_update") as bulk_update:
+        update_model_instances(model, [target], [field.name for field in fields])
+        bulk_update.assert_not_called()
+
+    target = model.objects.get(id=blank_row.id)
+    for field in fields:
+        assert getattr(target, field.attname) == getattr(source, field.attname)
+
+
+@pytest.mark.django_db
+def test_update_many_to_many_relations(data_fixture):
+    table, table_b, link_field = data_fixture.create_two_linked_tables()
+    model = table.get_model()
+    model_b = table_b.get_model()
+    related_1, related_2, related_3 = [model_b.objects.create() for _ in range(3)]
+    row_1 = model.objects.create()
+    row_2 = model.objects.create()
+    row_3 = model.objects.create()
+    getattr(row_1, f"field_{link_field.id}").set([related_1.id, related_2.id])
+    getattr(row_2, f"field_{link_field.id}").set([related_1.id])
+    getattr(row_3, f"field_{link_field.id}").set([related_3.id])
+
+    model_field = model._meta.get_field(f"field_{link_field.id}")
+    through = model_field.remote_field.through
+    kept_relation_id = through.objects.get(
+        **{
+            model_field.m2m_column_name(): row_3.id,
+            model_field.m2m_reverse_name(): related_3.id,
+        }
+    ).id
+
+    deleted = update_many_to_many_relations(
+        model_field,
+        {
+            row_1.id: [related_1.id, related_3.id, related_3.id],
+            row_2.id: [],
+            row_3.id: [related_3.id],
+        },
+    )
+
+    assert deleted == {row_1.id: {related_2.id}, row_2.id: {related_1.id}}
+
+    def related_ids(row):
+        return sorted(r.id for r in getattr(row, f"field_{link_field.id}").all())
+
+    assert related_ids(row_1) == [related_1.id, related_3.id]
+    assert related_ids(row_2) == []
+    assert related_ids(row_3) == [related_3.id]
+    # The relations of the rows that didn't change are not recreated.
+    assert through.objects.filter(id=kept_relation_id).exists()
+
+    # The relations are recreated in the provided order if only the order changed.
+    update_many_to_many_relations(model_field, {row_1.id: [related_3.id, related_1.id]})
+    assert list(
+        through.objects.filter(**{model_field.m2m_column_name(): row_1.id})
+        .order_by("id")
+        .values_list(model_field.m2m_reverse_name(), flat=True)
+    ) == [related_3.id, related_1.id]
+
+    assert update_many_to_many_relations(model_field, {}) == {}
@@ -1,3 +1,5 @@
+from datetime import date, datetime
+from decimal import Decimal
 from io import BytesIO
 from typing import List
 from unittest.mock import patch
@@ -8,6 +10,8 @@ from django.utils import timezone
 from django.utils.dateparse import parse_date, parse_datetime
 from django.utils.timezone import make_aware, utc
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from freezegun import freeze_time
 
@@ -37,6 +41,7 @@ from baserow.contrib.database.export.registries import (
 )
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.table.cache import generated_models_lru_cache
 from baserow.contrib.database.views.exceptions import ViewNotInTable
 from baserow.contrib.database.views.models import GridView, GridViewFieldOptions
 from baserow.test_utils.helpers import setup_interesting_test_table
@@ -252,6 +257,60 @@ def test_can_export_every_interesting_different_field_to_csv(
     assert contents == expected
 
 
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+@patch(
+    "baserow.contrib.database.export.table_exporters.parquet_table_exporter"
+    ".ParquetQuerysetSerializer.ROW_GROUP_SIZE",
+    1,
+)
+def test_can_export_every_interesting_different_field_to_parquet(
+    storage_mock, data_fixture
+):
+    table, user, _, _, context = setup_interesting_test_table(data_fixture)
+    grid_view = data_fixture.create_grid_view(table=table)
+    stub_file = BytesIO()
+    storage_mock.open.return_value = stub_file
+    stub_file.close = lambda: None
+    handler = ExportHandler()
+    job = handler.create_pending_export_job(
+        user, table, grid_view, {"exporter_type": "parquet"}
+    )
+    handler.run_export_job(job)
+
+    parquet_file = pq.ParquetFile(BytesIO(stub_file.getvalue()))
+    assert parquet_file.metadata.num_row_groups == 2
+    parquet_table = parquet_file.read()
+    schema = parquet_table.schema
+    assert schema.field("id").type == pa.int64()
+    assert schema.field("text").type == pa.string()
+    assert schema.field("positive_decimal").type == pa.decimal256(51, 1)
+    assert schema.field("rating").type == pa.int64()
+    assert schema.field("boolean").type == pa.bool_()
+    assert schema.field("datetime_us").type == pa.timestamp("us", tz="UTC")
+    assert schema.field("date_us").type == pa.date32()
+    assert schema.field("link_row").type == pa.string()
+    assert schema.field("formula_bool").type == pa.bool_()
+    assert schema.field("formula_decimal").type == pa.decimal256(60, 10)
+    assert schema.field("formula_date").type == pa.date32()
+
+    first_row, second_row = parquet_table.to_pylist()
+    assert first_row["id"] == 1
+    assert first_row["text"] is None
+    assert first_row["negative_decimal"] is None
+    assert first_row["single_select"] is None
+    assert second_row["text"] == "text"
+    assert second_row["negative_decimal"] == Decimal("-1.2")
+    assert second_row["rating"] == 3
+    assert second_row["boolean"] is True
+    assert second_row["datetime_us"] == datetime(2020, 2, 1, 1, 23, tzinfo=utc)
+    assert second_row["date_us"] == date(2020, 2, 1)
+    assert second_row["link_row"] == "linked_row_1,linked_row_2,unnamed row 3"
+    assert second_row["single_select"] == "A"
+    assert second_row["multiple_select"] == "D,C,E"
+    assert second_row["formula_decimal"] == Decimal("33.3333333333")
+
+
 def run_export_job_over_interesting_table(data_fixture, storage_mock, options):
     table, user, _, _, context = setup_interesting_test_table(data_fixture)
     grid_view = data_fixture.create_grid_view(table=table)
@@ -599,6 +658,60 @@ def test_can_export_csv_without_header(storage_mock, data_fixture):
     assert expected == contents
 
 
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+@patch(
+    "baserow.contrib.database.export.file_writer.PaginatedExportJobFileWriter"
+    ".EXPORT_JOB_CHUNK_SIZE",
+    1,
+)
+def test_export_streams_rows_in_chunks(storage_mock, data_fixture):
+    job, contents = setup_table_and_run_export_decoding_result(
+        data_fixture,
+        storage_mock,
+        options={"exporter_type": "csv", "csv_include_header": False},
+    )
+    expected = (
+        "\ufeff"
+        f"2,atest,A,02/01/2020 01:23,,-10.20,linked_row_1\r\n"
+        f'1,test,B,02/01/2020 01:23,,10.20,"linked_row_1,linked_row_2"\r\n'
+    )
+    assert expected == contents
+    job.refresh_from_db()
+    assert job.progress_percentage == 100
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+@patch("baserow.contrib.database.export.file_writer.get_estimated_count")
+def test_export_progress_is_based_on_estimated_row_count(
+    get_estimated_count_mock, storage_mock, data_fixture
+):
+    get_estimated_count_mock.return_value = 1
+    updated_progress = []
+
+    def save(job, *args, **kwargs):
+        updated_progress.append(job.progress_percentage)
+        return original_save(job, *args, **kwargs)
+
+    original_save = ExportJob.save
+    with patch(
+        "baserow.contrib.database.export.file_writer.PaginatedExportJobFileWriter"
+        ".EXPORT_JOB_UPDATE_FREQUENCY_SECONDS",
+        -1,
+    ), patch.object(ExportJob, "save", save):
+        setup_table_and_run_export_decoding_result(
+            data_fixture,
+            storage_mock,
+            options={"exporter_type": "csv", "csv_include_header": False},
+        )
+
+    # The estimate is lower than the real number of rows, so the progress must not
+    # reach 100% before the last row has been written.
+    assert 99 in updated_progress
+    assert updated_progress.index(99) < updated_progress.index(100)
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.export.handler.default_storage")
 def test_can_export_csv_with_different_charsets(storage_mock, data_fixture):
@@ -674,6 +787,9 @@ def test_adding_more_rows_doesnt_increase_number_of_queries_run(
         [linked_row_1.id],
     )
 
+    # Both exports must generate the table model, otherwise the second one reuses
+    # the model generated by the first one.
+    generated_models_lru_cache.clear()
     with CaptureQueriesContext(connection) as captured:
         run_export_job_with_mock_storage(table, grid_view, storage_mock, user)
 
@@ -688,6 +804,7 @@ def test_adding_more_rows_doesnt_increase_number_of_queries_run(
         ],
         [linked_row_1.id],
     )
+    generated_models_lru_cache.clear()
     with django_assert_num_queries(len(captured.captured_queries)):
         run_export_job_with_mock_storage(table, grid_view, storage_mock, user)
 
@@ -1,5 +1,8 @@
 from datetime import datetime
+from unittest.mock import patch
 
+from django.core.cache import cache
+from django.test.utils import override_settings
 from django.utils import timezone
 
 import pytest
@@ -7,7 +10,11 @@ import pytz
 from freezegun import freeze_time
 
 from baserow.contrib.database.fields.field_types import FormulaFieldType
-from baserow.contrib.database.fields.tasks import run_periodic_fields_updates
+from baserow.contrib.database.fields.tasks import (
+    get_periodic_field_update_lock_key,
+    run_periodic_fields_updates,
+    split_workspace_ids_in_shards,
+)
 
 
 @pytest.mark.django_db
@@ -276,3 +283,76 @@ def test_all_formula_that_needs_updates_are_periodically_updated(data_fixture):
         )
 
         assert FormulaFieldType().get_fields_needing_periodic_update().count() == 3
+
+
+def test_split_workspace_ids_in_shards():
+    assert split_workspace_ids_in_shards([], 4) == []
+    assert split_workspace_ids_in_shards([1, 2], 4) == [[1], [2]]
+    assert split_workspace_ids_in_shards([1, 2, 3, 4, 5], 2) == [[1, 3, 5], [2, 4]]
+    assert split_workspace_ids_in_shards([1, 2, 3], 0) == [[1, 2, 3]]
+
+
+@pytest.mark.django_db
+@override_settings(PERIODIC_FIELD_UPDATE_MAX_PARALLEL_TASKS=2)
+@patch(
+    "baserow.contrib.database.fields.tasks."
+    "run_periodic_fields_updates_for_workspaces.delay"
+)
+def test_run_periodic_fields_updates_dispatches_a_task_per_shard(
+    mock_delay, data_fixture
+):
+    workspaces = []
+    for days_ago in [1, 3, 2]:
+        workspace = data_fixture.create_workspace()
+        workspace.now = timezone.now() - timezone.timedelta(days=days_ago)
+        workspace.save()
+        database = data_fixture.create_database_application(workspace=workspace)
+        table = data_fixture.create_database_table(database=database)
+        data_fixture.create_formula_field(
+            table=table, formula="now()", date_include_time=True
+        )
+        workspaces.append(workspace)
+    # A workspace without periodic fields is not updated.
+    data_fixture.create_workspace()
+
+    run_periodic_fields_updates(update_now=False)
+
+    assert [c.args for c in mock_delay.call_args_list] == [
+        ([workspaces[1].id, workspaces[0].id], False),
+        ([workspaces[2].id], False),
+    ]
+
+
+@pytest.mark.django_db
+def test_run_periodic_fields_updates_skips_workspaces_still_being_updated(
+    data_fixture,
+):
+    with freeze_time("2023-02-27 10:00"):
+        workspace = data_fixture.create_workspace()
+        database = data_fixture.create_database_application(workspace=workspace)
+        table = data_fixture.create_database_table(database=database)
+        field = data_fixture.create_formula_field(
+            table=table, formula="now()", date_include_time=True
+        )
+        row = table.get_model().objects.create()
+
+    lock_key = get_periodic_field_update_lock_key(workspace.id)
+    cache.set(lock_key, True)
+    with freeze_time("2023-02-27 10:30"):
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    row.refresh_from_db()
+    assert getattr(row, f"field_{field.id}") == datetime(
+        2023, 2, 27, 10, 0, 0, tzinfo=pytz.UTC
+    )
+
+    cache.delete(lock_key)
+    with freeze_time("2023-02-27 10:30"):
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    row.refresh_from_db()
+    assert getattr(row, f"field_{field.id}") == datetime(
+        2023, 2, 27, 10, 30, 0, tzinfo=pytz.UTC
+    )
+    # The lock is released once the workspace has been updated.
+    assert cache.get(lock_key) is None
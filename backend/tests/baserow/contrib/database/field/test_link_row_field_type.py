@@ -525,6 +525,111 @@ def test_link_row_enhance_queryset(data_fixture, django_assert_num_queries):
             list(getattr(row, f"field_{link_row_field.id}").all())
 
 
+@pytest.mark.django_db
+@pytest.mark.field_link_row
+def test_link_row_enhance_queryset_with_related_rows_limit(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user, name="Placeholder")
+    example_table = data_fixture.create_database_table(
+        name="Example", database=database
+    )
+    customers_table = data_fixture.create_database_table(
+        name="Customers", database=database
+    )
+    customers_primary_field = data_fixture.create_text_field(
+        table=customers_table, name="Name", primary=True
+    )
+
+    field_handler = FieldHandler()
+    row_handler = RowHandler()
+
+    link_row_field = field_handler.create_field(
+        user=user,
+        table=example_table,
+        name="Link Row",
+        type_name="link_row",
+        link_row_table=customers_table,
+    )
+    self_link_row_field = field_handler.create_field(
+        user=user,
+        table=example_table,
+        name="Self Link Row",
+        type_name="link_row",
+        link_row_table=example_table,
+        has_related_field=False,
+    )
+
+    customers_row_1, customers_row_2, customers_row_3, trashed_row = [
+        row_handler.create_row(
+            user=user,
+            table=customers_table,
+            values={f"field_{customers_primary_field.id}": name},
+        )
+        for name in ["a", "b", "c", "d"]
+    ]
+    row_handler.delete_row_by_id(user, customers_table, trashed_row.id)
+
+    row_1 = row_handler.create_row(
+        user=user,
+        table=example_table,
+        values={
+            f"field_{link_row_field.id}": [
+                trashed_row.id,
+                customers_row_3.id,
+                customers_row_1.id,
+                customers_row_2.id,
+            ],
+        },
+    )
+    row_2 = row_handler.create_row(
+        user=user,
+        table=example_table,
+        values={
+            f"field_{link_row_field.id}": [customers_row_2.id],
+            f"field_{self_link_row_field.id}": [row_1.id],
+        },
+    )
+    row_3 = row_handler.create_row(user=user, table=example_table)
+
+    model = example_table.get_model()
+    queryset = model.objects.all().enhance_by_fields(related_rows_limit=2)
+
+    # One query for the rows, and two per link row field.
+    with django_assert_num_queries(5):
+        rows = list(queryset)
+
+    with django_assert_num_queries(0):
+        related_values = {
+            row.id: [
+                str(related_row)
+                for related_row in getattr(row, f"field_{link_row_field.id}").all()
+            ]
+            for row in rows
+        }
+        self_related_ids = {
+            row.id: [
+                related_row.id
+                for related_row in getattr(row, f"field_{self_link_row_field.id}").all()
+            ]
+            for row in rows
+        }
+
+    assert related_values == {row_1.id: ["a", "b"], row_2.id: ["b"], row_3.id: []}
+    assert self_related_ids == {row_1.id: [], row_2.id: [row_1.id], row_3.id: []}
+    assert {row.id: row.related_rows_count for row in rows} == {
+        row_1.id: {link_row_field.id: 3, self_link_row_field.id: 0},
+        row_2.id: {link_row_field.id: 1, self_link_row_field.id: 1},
+        row_3.id: {link_row_field.id: 0, self_link_row_field.id: 0},
+    }
+
+    related_rows = row_handler.get_related_rows(
+        user, example_table, row_1.id, link_row_field.id
+    )
+    assert [str(related_row) for related_row in related_rows] == ["a", "b", "c"]
+
+
 @pytest.mark.django_db
 @pytest.mark.field_link_row
 def test_link_row_field_type_api_views(api_client, data_fixture):
@@ -0,0 +1,195 @@
+from decimal import Decimal
+
+from django.db import connection
+
+import pytest
+
+from baserow.contrib.database.fields.actions import UpdateFieldActionType
+from baserow.contrib.database.fields.exceptions import (
+    CannotChangeFieldType,
+    IncompatibleFieldTypeForOnlineConversion,
+)
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import NumberField, TextField
+from baserow.contrib.database.fields.online_conversion import OnlineFieldConversion
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.core.action.handler import ActionHandler
+from baserow.core.action.registries import action_type_registry
+from baserow.test_utils.helpers import assert_undo_redo_actions_are_valid
+
+
+def get_column_names(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT column_name FROM information_schema.columns WHERE table_name = %s",
+            [table.get_database_table_name()],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+def get_check_constraints(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT conname, convalidated FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype = 'c'",
+            [table.get_database_table_name()],
+        )
+        return dict(cursor.fetchall())
+
+
+@pytest.mark.django_db
+@pytest.mark.undo_redo
+def test_online_field_conversion(data_fixture):
+    session_id = "session-id"
+    user = data_fixture.create_user(session_id=session_id)
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, name="text")
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{field.id}": value})
+        for value in ["1.24", "abc", None, "10"]
+    ]
+
+    conversion = OnlineFieldConversion(
+        field, "number", number_decimal_places=1, number_negative=True
+    )
+    conversion.start()
+    assert f"field_{field.id}_shadow" in get_column_names(table)
+
+    # The rows written during the conversion are converted by the trigger.
+    RowHandler().update_rows(
+        user, table, [{"id": rows[3].id, f"field_{field.id}": "-2.51"}]
+    )
+    new_row = RowHandler().create_row(user, table, {f"field_{field.id}": "7"})
+
+    conversion.backfill(batch_size=2)
+
+    field = FieldHandler().get_specific_field_for_update(field.id)
+    field, _ = action_type_registry.get_by_type(UpdateFieldActionType).do(
+        user,
+        field,
+        "number",
+        online_conversion=conversion,
+        number_decimal_places=1,
+        number_negative=True,
+    )
+
+    assert isinstance(field, NumberField)
+    assert field.number_decimal_places == 1
+    column_names = get_column_names(table)
+    assert f"field_{field.id}_shadow" not in column_names
+    assert f"field_{field.id}" in column_names
+
+    model = table.get_model()
+    assert list(
+        model.objects.order_by("id").values_list(f"field_{field.id}", flat=True)
+    ) == [Decimal("1.2"), None, None, Decimal("-2.5"), Decimal("7.0")]
+    assert model.objects.get(id=new_row.id).id == new_row.id
+
+    # The original column is kept as backup, so the conversion can be undone.
+    actions = ActionHandler.undo(
+        user, [UpdateFieldActionType.scope(table.id)], session_id
+    )
+    assert_undo_redo_actions_are_valid(actions, [UpdateFieldActionType])
+    field = FieldHandler().get_field(field.id).specific
+    assert isinstance(field, TextField)
+    model = table.get_model()
+    assert list(
+        model.objects.order_by("id").values_list(f"field_{field.id}", flat=True)
+    ) == ["1.24", "abc", None, "-2.51", "7"]
+
+
+@pytest.mark.django_db
+def test_online_field_conversion_to_not_nullable_column(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, name="text")
+    model = table.get_model()
+    model.objects.create(**{f"field_{field.id}": "true"})
+    model.objects.create(**{f"field_{field.id}": None})
+
+    conversion = OnlineFieldConversion(field, "boolean")
+    conversion.start()
+    conversion.backfill()
+    # The validated check constraint allows setting the column to NOT NULL without
+    # scanning the table while it's locked.
+    constraint = f"baserow_convert_field_{field.id}_not_null"
+    assert get_check_constraints(table) == {constraint: True}
+
+    field = FieldHandler().update_field(
+        user, field, "boolean", online_conversion=conversion
+    )
+    assert get_check_constraints(table) == {}
+
+    model = table.get_model()
+    assert list(
+        model.objects.order_by("id").values_list(f"field_{field.id}", flat=True)
+    ) == [True, False]
+    assert model.objects.create().id > 0
+    assert getattr(model.objects.create(), f"field_{field.id}") is False
+
+
+@pytest.mark.django_db
+def test_online_field_conversion_not_supported(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+
+    with pytest.raises(IncompatibleFieldTypeForOnlineConversion):
+        OnlineFieldConversion(text_field, "single_select")
+
+    with pytest.raises(IncompatibleFieldTypeForOnlineConversion):
+        OnlineFieldConversion(text_field, "text", name="Other name")
+
+    with pytest.raises(IncompatibleFieldTypeForOnlineConversion):
+        OnlineFieldConversion(text_field, "formula", formula="'a'")
+
+
+@pytest.mark.django_db
+def test_online_field_conversion_of_changed_field(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, name="text")
+    table.get_model().objects.create(**{f"field_{field.id}": "1"})
+
+    conversion = OnlineFieldConversion(field, "number", number_decimal_places=1)
+    conversion.start()
+    conversion.backfill()
+
+    # The number of decimal places is different than the ones the data has been
+    # converted to.
+    with pytest.raises(CannotChangeFieldType):
+        FieldHandler().update_field(
+            user, field, "number", online_conversion=conversion, number_decimal_places=2
+        )
+
+    conversion.clean_up()
+    assert f"field_{field.id}_shadow" not in get_column_names(table)
+    # The trigger is removed, so the rows can still be written.
+    table.get_model().objects.create(**{f"field_{field.id}": "2"})
+
+
+@pytest.mark.django_db
+def test_online_field_conversion_can_be_started_again(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, name="text")
+    table.get_model().objects.create(**{f"field_{field.id}": "1.26"})
+
+    # A previous attempt left its shadow column and trigger behind.
+    OnlineFieldConversion(field, "boolean").start()
+
+    conversion = OnlineFieldConversion(field, "number", number_decimal_places=1)
+    conversion.start()
+    conversion.start()
+    table.get_model().objects.create(**{f"field_{field.id}": "2"})
+    conversion.backfill()
+
+    field = FieldHandler().update_field(
+        user, field, "number", online_conversion=conversion, number_decimal_places=1
+    )
+    assert f"field_{field.id}_shadow" not in get_column_names(table)
+    assert list(
+        table.get_model()
+        .objects.order_by("id")
+        .values_list(f"field_{field.id}", flat=True)
+    ) == [Decimal("1.3"), Decimal("2.0")]
@@ -0,0 +1,167 @@
+from io import BytesIO
+from unittest.mock import patch
+from zipfile import ZipFile
+
+import pytest
+
+from baserow.contrib.database.file_import.readers import (
+    CsvImportFileReader,
+    JsonImportFileReader,
+    XlsxImportFileReader,
+    get_import_file_reader,
+)
+from baserow.contrib.database.table.exceptions import InvalidInitialTableData
+
+XLSX_WORKBOOK = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+  <sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>
+</workbook>"""
+
+XLSX_WORKBOOK_RELATIONSHIPS = """<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Target="worksheets/sheet1.xml"
+    Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>
+</Relationships>"""
+
+XLSX_SHARED_STRINGS = """<?xml version="1.0" encoding="UTF-8"?>
+<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+  <si><t>Name</t></si>
+  <si><t>Count</t></si>
+  <si><r><t>Rich </t></r><r><t>text</t></r></si>
+</sst>"""
+
+XLSX_SHEET = """<?xml version="1.0" encoding="UTF-8"?>
+<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+  <sheetData>
+    <row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c></row>
+    <row r="2"><c r="A2" t="s"><v>2</v></c><c r="B2"><v>10</v></c></row>
+    <row r="3"><c r="B3"><v>1.5</v></c><c r="D3" t="inlineStr"><is><t>x</t></is></c></row>
+  </sheetData>
+</worksheet>"""
+
+
+def create_xlsx_file():
+    file = BytesIO()
+    with ZipFile(file, "w") as zip_file:
+        zip_file.writestr("xl/workbook.xml", XLSX_WORKBOOK)
+        zip_file.writestr("xl/_rels/workbook.xml.rels", XLSX_WORKBOOK_RELATIONSHIPS)
+        zip_file.writestr("xl/sharedStrings.xml", XLSX_SHARED_STRINGS)
+        zip_file.writestr("xl/worksheets/sheet1.xml", XLSX_SHEET)
+    return file
+
+
+def test_csv_import_file_reader():
+    file = BytesIO('﻿Name;Notes\nA;"multi\nline"\nB;x;y\n'.encode("utf-8"))
+
+    reader = CsvImportFileReader(
+        file, first_row_header=True, column_separator=";"
+    ).scan()
+    assert reader.header == ["Name", "Notes"]
+    assert reader.row_count == 2
+    assert reader.column_count == 3
+    assert list(reader.iter_rows()) == [["A", "multi\nline"], ["B", "x", "y"]]
+
+    reader = CsvImportFileReader(file, column_separator=";").scan()
+    assert reader.header is None
+    assert reader.row_count == 3
+    assert len(list(reader.iter_rows())) == 3
+
+
+def test_csv_import_file_reader_keeps_unicode_line_separators_in_values():
+    file = BytesIO('a,b\n"x\x0cy",z\nu\u2028v,w\r\n'.encode("utf-8"))
+
+    reader = CsvImportFileReader(file).scan()
+    assert reader.row_count == 3
+    assert list(reader.iter_rows()) == [
+        ["a", "b"],
+        ["x\x0cy", "z"],
+        ["u\u2028v", "w"],
+    ]
+    assert not file.closed
+
+
+def test_csv_import_file_reader_encoding():
+    file = BytesIO("Ärger,été\n".encode("latin-1"))
+
+    reader = CsvImportFileReader(file, encoding="latin-1").scan()
+    assert list(reader.iter_rows()) == [["Ärger", "été"]]
+
+    # Invalid characters are replaced instead of failing.
+    reader = CsvImportFileReader(file).scan()
+    assert list(reader.iter_rows()) == [["�rger", "�t�"]]
+
+
+def test_xlsx_import_file_reader():
+    reader = XlsxImportFileReader(create_xlsx_file(), first_row_header=True).scan()
+    assert reader.header == ["Name", "Count"]
+    assert reader.row_count == 2
+    assert reader.column_count == 4
+    assert list(reader.iter_rows()) == [["Rich text", "10"], ["", "1.5", "", "x"]]
+
+
+def test_xlsx_import_file_reader_invalid_file():
+    with pytest.raises(InvalidInitialTableData):
+        XlsxImportFileReader(BytesIO(b"not a zip file")).scan()
+
+    file = BytesIO()
+    with ZipFile(file, "w") as zip_file:
+        zip_file.writestr("something.xml", "<xml/>")
+    with pytest.raises(InvalidInitialTableData):
+        XlsxImportFileReader(file).scan()
+
+
+def test_json_import_file_reader_with_arrays():
+    file = BytesIO(b' [["a", 1], ["b", 2.5, true], [null] ] ')
+
+    reader = JsonImportFileReader(file, first_row_header=True).scan()
+    assert reader.header == ["a", 1]
+    assert reader.row_count == 2
+    assert reader.column_count == 3
+    assert list(reader.iter_rows()) == [["b", 2.5, True], [None]]
+
+
+def test_json_import_file_reader_with_objects():
+    file = BytesIO(b'[{"a": "1", "b": 2}, {"c": "3"}, {"a": {"d": 4}}]')
+
+    # The header is always made of the object keys.
+    reader = JsonImportFileReader(file, first_row_header=False).scan()
+    assert reader.header == ["a", "b", "c"]
+    assert reader.row_count == 3
+    assert reader.column_count == 3
+    assert list(reader.iter_rows()) == [
+        ["1", 2, ""],
+        ["", "", "3"],
+        [{"d": 4}, "", ""],
+    ]
+
+
+@patch("baserow.contrib.database.file_import.readers.READ_CHUNK_SIZE", 3)
+def test_json_import_file_reader_reads_values_across_chunks():
+    file = BytesIO(b'[[12345, "long value"], [67890], []]')
+
+    reader = JsonImportFileReader(file).scan()
+    assert list(reader.iter_rows()) == [[12345, "long value"], [67890], []]
+
+    assert list(JsonImportFileReader(BytesIO(b"[]")).scan().iter_rows()) == []
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"{}", b"[", b'[["a"] ["b"]]', b'[["a"], "b"]', b'[{"a": 1}, ["b"]]'],
+)
+def test_json_import_file_reader_invalid_file(content):
+    with pytest.raises(InvalidInitialTableData):
+        reader = JsonImportFileReader(BytesIO(content)).scan()
+        list(reader.iter_rows())
+
+
+def test_get_import_file_reader():
+    file = BytesIO(b"a|b\n")
+
+    reader = get_import_file_reader(file, "csv", column_separator="|")
+    assert isinstance(reader, CsvImportFileReader)
+    assert list(reader.scan().iter_rows()) == [["a", "b"]]
+
+    reader = get_import_file_reader(file, "json", column_separator="|")
+    assert isinstance(reader, JsonImportFileReader)
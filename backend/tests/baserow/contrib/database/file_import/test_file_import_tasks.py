@@ -1,4 +1,7 @@
+import json
+
 from django.conf import settings
+from django.core.files.base import ContentFile
 from django.test.utils import override_settings
 from django.utils import timezone
 
@@ -573,6 +576,152 @@ def test_run_file_import_limit(data_fixture, patch_filefield_storage):
     assert len(job.report["failing_rows"]) == max_error
 
 
+@pytest.mark.django_db(transaction=True)
+def test_run_file_import_task_from_csv_file(data_fixture, patch_filefield_storage):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+
+    content = 'A;B;C\n1-1;1-2;1-3;1-4\n2-1;"2\n2"\n\n3-1\n'.encode("latin-1")
+
+    with override_settings(
+        INITIAL_TABLE_DATA_LIMIT=3
+    ), patch_filefield_storage(), pytest.raises(InitialTableDataLimitExceeded):
+        job = data_fixture.create_file_import_job(
+            user=user,
+            database=database,
+            data_file=ContentFile(content),
+            file_type="csv",
+            csv_column_separator=";",
+            encoding="latin-1",
+        )
+        run_async_job(job.id)
+
+    with patch_filefield_storage():
+        job = data_fixture.create_file_import_job(
+            user=user,
+            database=database,
+            data_file=ContentFile(content),
+            file_type="csv",
+            csv_column_separator=";",
+            encoding="latin-1",
+        )
+        run_async_job(job.id)
+
+    job.refresh_from_db()
+    assert job.state == JOB_FINISHED
+    assert job.progress_percentage == 100
+    assert job.report == {"failing_rows": {}}
+    assert not job.data_file
+
+    fields = list(job.table.field_set.all().order_by("order", "id"))
+    assert [field.name for field in fields] == ["A", "B", "C", "Field 4"]
+    assert fields[0].primary
+
+    model = job.table.get_model()
+    values = [
+        [getattr(row, f"field_{field.id}") for field in fields]
+        for row in model.objects.all().order_by("id")
+    ]
+    assert values == [
+        ["1-1", "1-2", "1-3", "1-4"],
+        ["2-1", "2\n2", None, None],
+        [None, None, None, None],
+        ["3-1", None, None, None],
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_run_file_import_task_from_json_file_in_chunks(
+    data_fixture, patch_filefield_storage
+):
+    row_count = 1024 + 5
+
+    user = data_fixture.create_user()
+
+    table, _, _ = data_fixture.build_table(
+        columns=[
+            (f"col1", "text"),
+            (f"col2", "number"),
+        ],
+        rows=[],
+        user=user,
+    )
+    single_select_field = data_fixture.create_single_select_field(table=table, order=4)
+    single_select_option = SelectOption.objects.create(
+        field=single_select_field,
+        order=1,
+        value="Option 1",
+        color="blue",
+    )
+
+    data = [["test", 1, single_select_option.id]] * row_count
+    data[5] = ["test", "bad", single_select_option.id]
+    data[50] = ["test", 2, 0]
+    data[1024] = ["test", 2, 99999]
+    data[1027] = ["test", 2, single_select_option.id, "too many"]
+
+    with patch_filefield_storage():
+        job = data_fixture.create_file_import_job(
+            table=table,
+            user=user,
+            first_row_header=False,
+            data_file=ContentFile(json.dumps(data)),
+            file_type="json",
+        )
+        run_async_job(job.id)
+
+    job.refresh_from_db()
+    assert job.state == JOB_FINISHED
+    assert job.progress_percentage == 100
+
+    model = job.table.get_model()
+    assert model.objects.count() == row_count - 4
+    assert (
+        model.objects.filter(**{f"field_{single_select_field.id}": None}).count() == 0
+    )
+    assert sorted(job.report["failing_rows"].keys(), key=int) == [
+        "5",
+        "50",
+        "1024",
+        "1027",
+    ]
+
+    # The rows are inserted with reserved ids, so the next rows get new ids.
+    row = model.objects.create()
+    assert row.id > max(model.objects.exclude(id=row.id).values_list("id", flat=True))
+
+
+@pytest.mark.django_db()
+def test_run_file_import_from_file_limit(data_fixture, patch_filefield_storage):
+    max_error = settings.BASEROW_MAX_ROW_REPORT_ERROR_COUNT
+
+    user = data_fixture.create_user()
+    table, _, _ = data_fixture.build_table(
+        columns=[(f"col1", "text"), (f"col2", "number")], rows=[], user=user
+    )
+
+    content = "test,1\n" * 100 + "test,bad\n" * (max_error + 5)
+
+    with patch_filefield_storage():
+        job = data_fixture.create_file_import_job(
+            table=table,
+            user=user,
+            first_row_header=False,
+            data_file=ContentFile(content.encode("utf-8")),
+            file_type="csv",
+        )
+
+        with pytest.raises(ReportMaxErrorCountExceeded):
+            run_async_job(job.id)
+
+    job.refresh_from_db()
+
+    assert table.get_model().objects.count() == 0
+    assert job.state == JOB_FAILED
+    assert job.human_readable_error == "This file import has raised too many errors."
+    assert len(job.report["failing_rows"]) == max_error
+
+
 @pytest.mark.django_db(transaction=True)
 @pytest.mark.disabled_in_ci
 # You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
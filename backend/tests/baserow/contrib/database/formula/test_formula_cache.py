@@ -0,0 +1,92 @@
+import pytest
+
+from baserow.contrib.database.fields.models import FormulaField
+from baserow.contrib.database.formula import (
+    BaserowFormulaException,
+    BaserowFormulaNumberType,
+    FormulaHandler,
+)
+from baserow.contrib.database.formula.cache import (
+    FormulaExpressionLRUCache,
+    formula_expression_cache,
+    warm_up_formula_expression_cache,
+)
+
+
+def test_formula_expression_lru_cache_returns_copies():
+    cache = FormulaExpressionLRUCache(max_size=2)
+
+    def parse():
+        return FormulaHandler.raw_formula_to_untyped_expression("1 + 1")
+
+    expression = cache.get_or_parse(("a",), parse)
+    assert cache.misses == 1
+    assert cache.hits == 0
+
+    expression.with_valid_type(BaserowFormulaNumberType(0))
+    other_expression = cache.get_or_parse(("a",), parse)
+    assert cache.hits == 1
+    assert cache.hit_rate == 0.5
+    assert other_expression is not expression
+    assert other_expression.expression_type is None
+    assert str(other_expression) == str(expression)
+    assert other_expression.function_def is expression.function_def
+
+    cache.get_or_parse(("b",), parse)
+    cache.get_or_parse(("c",), parse)
+    assert len(cache) == 2
+    assert cache.get(("a",)) is None
+
+
+def test_formula_expression_lru_cache_does_not_cache_invalid_formulas():
+    cache = FormulaExpressionLRUCache(max_size=2)
+
+    for _ in range(2):
+        with pytest.raises(BaserowFormulaException):
+            cache.get_or_parse(
+                ("invalid",),
+                lambda: FormulaHandler.raw_formula_to_untyped_expression("1 +"),
+            )
+
+    assert cache.misses == 2
+    assert len(cache) == 0
+
+
+@pytest.mark.django_db
+def test_formula_field_expressions_are_served_from_the_cache(data_fixture):
+    formula_field = data_fixture.create_formula_field(formula="concat('a', 'b')")
+    formula_expression_cache.clear()
+
+    for _ in range(2):
+        formula_field = FormulaField.objects.get(id=formula_field.id)
+        assert str(formula_field.cached_typed_internal_expression) == (
+            "error_to_null(concat('a','b'))"
+        )
+        assert formula_field.cached_untyped_expression
+
+    assert formula_expression_cache.misses == 2
+    assert formula_expression_cache.hits == 2
+
+    formula_field.number_decimal_places = 2
+    formula_field.formula = "1"
+    formula_field.save()
+    formula_field = FormulaField.objects.get(id=formula_field.id)
+    assert formula_field.cached_typed_internal_expression.expression_type.type == (
+        "number"
+    )
+
+
+@pytest.mark.django_db
+def test_warm_up_formula_expression_cache(data_fixture):
+    table = data_fixture.create_database_table()
+    other_table = data_fixture.create_database_table()
+    data_fixture.create_formula_field(table=table, formula="'a'")
+    data_fixture.create_formula_field(table=other_table, formula="'b'")
+    table.row_count = 10
+    table.save()
+    formula_expression_cache.clear()
+
+    assert warm_up_formula_expression_cache(0) == 0
+    assert warm_up_formula_expression_cache(1) == 1
+    assert len(formula_expression_cache) == 2
+    assert formula_expression_cache.misses == 2
@@ -0,0 +1,268 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import override_settings
+
+import pytest
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.index_advisor.constants import (
+    INDEX_DECISION_CREATED,
+    INDEX_DECISION_DROPPED,
+    INDEX_DECISION_KEPT,
+    INDEX_DECISION_OVER_BUDGET,
+    INDEX_DECISION_UNAVAILABLE,
+    INDEX_TYPE_BTREE,
+    INDEX_TYPE_TRIGRAM,
+    INDEX_USAGE_CONTAINS,
+    INDEX_USAGE_FILTER,
+    INDEX_USAGE_SORT,
+)
+from baserow.contrib.database.index_advisor.handler import IndexAdvisorHandler
+from baserow.contrib.database.index_advisor.models import FieldIndexAdvice
+from baserow.contrib.database.index_advisor.usage import (
+    pop_field_index_usage,
+    record_field_index_usage,
+)
+from baserow.contrib.database.views.handler import ViewHandler
+
+index_advisor_settings = override_settings(
+    BASEROW_INDEX_ADVISOR_ENABLED=True,
+    BASEROW_INDEX_ADVISOR_MIN_ROWS=0,
+    BASEROW_INDEX_ADVISOR_MIN_USAGE=2,
+    BASEROW_INDEX_ADVISOR_MAX_INDEXES_PER_TABLE=5,
+)
+
+
+def get_index_names(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexname FROM pg_indexes WHERE tablename = %s",
+            [table.get_database_table_name()],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+@pytest.mark.django_db
+def test_record_and_pop_field_index_usage(data_fixture):
+    field = data_fixture.create_text_field()
+
+    record_field_index_usage([(field.id, INDEX_USAGE_FILTER)])
+    assert pop_field_index_usage([field.id]) == {}
+
+    with index_advisor_settings:
+        record_field_index_usage(
+            [(field.id, INDEX_USAGE_FILTER), (field.id, None)],
+        )
+        record_field_index_usage(
+            [(field.id, INDEX_USAGE_FILTER), (field.id, INDEX_USAGE_SORT)]
+        )
+
+    assert pop_field_index_usage([field.id], peek=True) == {
+        (field.id, INDEX_USAGE_FILTER): 2,
+        (field.id, INDEX_USAGE_SORT): 1,
+    }
+    assert pop_field_index_usage([field.id]) == {
+        (field.id, INDEX_USAGE_FILTER): 2,
+        (field.id, INDEX_USAGE_SORT): 1,
+    }
+    assert pop_field_index_usage([field.id]) == {}
+
+
+@pytest.mark.django_db
+def test_view_filters_and_sorts_record_field_index_usage(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    other_text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="contains", value="a"
+    )
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="higher_than", value="1"
+    )
+    data_fixture.create_view_filter(
+        view=grid_view, field=other_text_field, type="not_equal", value="a"
+    )
+    data_fixture.create_view_sort(view=grid_view, field=number_field, order="DESC")
+    data_fixture.create_view_sort(view=grid_view, field=text_field, order="ASC")
+
+    with index_advisor_settings:
+        list(ViewHandler().get_queryset(grid_view))
+        list(
+            table.get_model()
+            .objects.all()
+            .filter_by_fields_object({f"filter__field_{number_field.id}__equal": "1"})
+        )
+
+    assert pop_field_index_usage([text_field.id, number_field.id]) == {
+        (text_field.id, INDEX_USAGE_CONTAINS): 1,
+        (number_field.id, INDEX_USAGE_FILTER): 2,
+        (number_field.id, INDEX_USAGE_SORT): 1,
+    }
+    assert pop_field_index_usage([other_text_field.id]) == {}
+
+
+@pytest.mark.django_db
+@index_advisor_settings
+def test_advise_table_creates_keeps_and_drops_indexes(data_fixture):
+    table = data_fixture.create_database_table()
+    number_field = data_fixture.create_number_field(table=table)
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    handler = IndexAdvisorHandler()
+
+    record_field_index_usage([(boolean_field.id, INDEX_USAGE_FILTER)])
+    for _ in range(4):
+        record_field_index_usage([(number_field.id, INDEX_USAGE_FILTER)])
+
+    advices = handler.advise_table(table)
+    assert len(advices) == 1
+    advice = advices[0]
+    assert advice.field_id == number_field.id
+    assert advice.index_type == INDEX_TYPE_BTREE
+    assert advice.decision == INDEX_DECISION_CREATED
+    assert advice.index_created
+    assert advice.get_index_name() in get_index_names(table)
+
+    # The index is kept until the usage score has decayed below half of the
+    # minimum usage.
+    for expected_decision in [INDEX_DECISION_KEPT, INDEX_DECISION_KEPT]:
+        [advice] = handler.advise_table(table)
+        assert advice.decision == expected_decision
+        assert advice.get_index_name() in get_index_names(table)
+
+    [advice] = handler.advise_table(table)
+    assert advice.decision == INDEX_DECISION_DROPPED
+    assert not advice.index_created
+    assert advice.get_index_name() not in get_index_names(table)
+
+    for _ in range(3):
+        handler.advise_table(table)
+    assert not FieldIndexAdvice.objects.filter(table=table).exists()
+
+
+@pytest.mark.django_db
+@index_advisor_settings
+def test_advise_table_respects_the_index_budget_and_min_rows(data_fixture):
+    table = data_fixture.create_database_table()
+    field_1 = data_fixture.create_number_field(table=table)
+    field_2 = data_fixture.create_date_field(table=table)
+    for _ in range(3):
+        record_field_index_usage([(field_1.id, INDEX_USAGE_SORT)])
+    for _ in range(2):
+        record_field_index_usage([(field_2.id, INDEX_USAGE_FILTER)])
+
+    with override_settings(BASEROW_INDEX_ADVISOR_MIN_ROWS=10):
+        advices = IndexAdvisorHandler().advise_table(table, dry_run=True)
+    assert [advice.decision for advice in advices] == ["not_needed", "not_needed"]
+
+    with override_settings(BASEROW_INDEX_ADVISOR_MAX_INDEXES_PER_TABLE=1):
+        advices = IndexAdvisorHandler().advise_table(table)
+
+    assert [(advice.field_id, advice.decision) for advice in advices] == [
+        (field_1.id, INDEX_DECISION_CREATED),
+        (field_2.id, INDEX_DECISION_OVER_BUDGET),
+    ]
+    assert get_index_names(table) & {a.get_index_name() for a in advices} == {
+        advices[0].get_index_name()
+    }
+
+
+@pytest.mark.django_db
+@index_advisor_settings
+def test_advise_table_only_creates_btree_indexes_on_bounded_text(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    email_field = data_fixture.create_email_field(table=table)
+    for _ in range(2):
+        record_field_index_usage(
+            [
+                (text_field.id, INDEX_USAGE_FILTER),
+                (text_field.id, INDEX_USAGE_SORT),
+                (email_field.id, INDEX_USAGE_FILTER),
+            ]
+        )
+
+    # A btree index on an unbounded text column would make writing a value larger
+    # than the maximum index entry size fail.
+    advices = IndexAdvisorHandler().advise_table(table, dry_run=True)
+    assert [(advice.field_id, advice.index_type) for advice in advices] == [
+        (email_field.id, INDEX_TYPE_BTREE)
+    ]
+
+
+@pytest.mark.django_db
+@index_advisor_settings
+def test_field_conversion_drops_the_indexes_of_the_old_field_type(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    email_field = data_fixture.create_email_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    for _ in range(2):
+        record_field_index_usage(
+            [(email_field.id, INDEX_USAGE_FILTER), (number_field.id, INDEX_USAGE_SORT)]
+        )
+    advices = IndexAdvisorHandler().advise_table(table)
+    assert all(advice.index_created for advice in advices)
+    email_index, number_index = [advice.get_index_name() for advice in advices]
+
+    # The btree index of the email field would otherwise be kept on the unbounded
+    # text column until the advisor runs again.
+    FieldHandler().update_field(user, email_field, "text")
+    FieldHandler().update_field(user, number_field, name="Renamed")
+
+    assert email_index not in get_index_names(table)
+    assert number_index in get_index_names(table)
+    assert list(
+        FieldIndexAdvice.objects.filter(table=table).values_list("field_id", flat=True)
+    ) == [number_field.id]
+
+
+@pytest.mark.django_db
+@index_advisor_settings
+def test_advise_table_without_trigram_extension(data_fixture):
+    table = data_fixture.create_database_table()
+    field = data_fixture.create_long_text_field(table=table)
+    for _ in range(2):
+        record_field_index_usage(
+            [(field.id, INDEX_USAGE_CONTAINS), (field.id, INDEX_USAGE_SORT)]
+        )
+
+    with patch.object(IndexAdvisorHandler, "_is_trigram_available", return_value=False):
+        [advice] = IndexAdvisorHandler().advise_table(table)
+
+    assert advice.index_type == INDEX_TYPE_TRIGRAM
+    assert advice.decision == INDEX_DECISION_UNAVAILABLE
+    assert not advice.index_created
+
+
+@pytest.mark.django_db
+@index_advisor_settings
+def test_advise_table_dry_run_and_management_command(data_fixture):
+    table = data_fixture.create_database_table()
+    field = data_fixture.create_number_field(table=table)
+    for _ in range(2):
+        record_field_index_usage([(field.id, INDEX_USAGE_FILTER)])
+
+    out = StringIO()
+    call_command(
+        "advise_table_indexes", "--table-id", table.id, "--dry-run", stdout=out
+    )
+    assert f"field {field.id} btree: score 2.0, created False, created." in (
+        out.getvalue()
+    )
+    assert not FieldIndexAdvice.objects.filter(table=table).exists()
+    assert pop_field_index_usage([field.id], peek=True) == {
+        (field.id, INDEX_USAGE_FILTER): 2
+    }
+
+    call_command("advise_table_indexes", "--table-id", table.id, stdout=StringIO())
+    out = StringIO()
+    call_command("advise_table_indexes", "--table-id", table.id, "--report", stdout=out)
+    assert f"field {field.id} btree: score 2.0, created True, created." in (
+        out.getvalue()
+    )
+    assert "1 index advice(s)." in out.getvalue()
@@ -0,0 +1,387 @@
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test.utils import override_settings
+
+import pytest
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.search.handler import (
+    SEARCH_MODE_COMPAT,
+    SEARCH_MODE_FULL_TEXT,
+    TSVECTOR_COLUMN_NAME,
+    TSVECTOR_UPDATE_COUNTDOWN,
+    SearchHandler,
+)
+from baserow.contrib.database.search.tasks import update_tsvector_columns
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.test_utils.helpers import setup_interesting_test_table
+
+
+def search_full_text(table, query):
+    return list(
+        table.get_model()
+        .objects.all()
+        .search_all_fields(query, search_mode=SEARCH_MODE_FULL_TEXT)
+        .values_list("id", flat=True)
+        .order_by("id")
+    )
+
+
+def get_table_column_names(table):
+    with connection.cursor() as cursor:
+        return [
+            column.name
+            for column in connection.introspection.get_table_description(
+                cursor, table.get_database_table_name()
+            )
+        ]
+
+
+@pytest.mark.django_db
+def test_get_tsquery():
+    assert SearchHandler.get_tsquery("") is None
+    assert SearchHandler.get_tsquery("  !? ") is None
+    assert SearchHandler.get_tsquery("hello") == "'hello':*"
+    assert SearchHandler.get_tsquery("hello, wor'ld") == (
+        "'hello':* & 'wor':* & 'ld':*"
+    )
+
+
+@pytest.mark.django_db
+def test_create_tsvector_column_backfills_existing_rows(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table)
+    option_field = data_fixture.create_single_select_field(table=table)
+    option = data_fixture.create_select_option(field=option_field, value="Amsterdam")
+
+    model = table.get_model()
+    row_1 = model.objects.create(
+        **{
+            f"field_{text_field.id}": "The quick brown fox",
+            f"field_{number_field.id}": 42,
+            f"field_{option_field.id}_id": option.id,
+        }
+    )
+    row_2 = model.objects.create(**{f"field_{text_field.id}": "Lazy dog"})
+
+    assert TSVECTOR_COLUMN_NAME not in get_table_column_names(table)
+
+    SearchHandler.create_tsvector_column(table)
+
+    table.refresh_from_db()
+    assert table.tsvector_column_created
+    assert TSVECTOR_COLUMN_NAME in get_table_column_names(table)
+
+    model = table.get_model()
+
+    def search(query):
+        return list(
+            model.objects.all()
+            .search_all_fields(query, search_mode=SEARCH_MODE_FULL_TEXT)
+            .values_list("id", flat=True)
+            .order_by("id")
+        )
+
+    assert search("quick") == [row_1.id]
+    assert search("qui bro") == [row_1.id]
+    assert search("42") == [row_1.id]
+    assert search("amster") == [row_1.id]
+    assert search("dog") == [row_2.id]
+    assert search(str(row_2.id)) == [row_2.id]
+    assert search("cat") == []
+
+
+@pytest.mark.django_db
+def test_create_tsvector_column_with_all_field_types(data_fixture):
+    table, user, row, blank_row, context = setup_interesting_test_table(data_fixture)
+
+    SearchHandler.create_tsvector_column(table)
+
+    model = table.get_model()
+
+    def search(query):
+        return list(
+            model.objects.all()
+            .search_all_fields(query, search_mode=SEARCH_MODE_FULL_TEXT)
+            .values_list("id", flat=True)
+        )
+
+    assert search("a.txt") == [row.id]
+    assert search("E") == [row.id]
+
+
+@pytest.mark.django_db
+def test_search_all_fields_uses_compat_mode_if_full_text_not_available(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    model = table.get_model()
+    row = model.objects.create(**{f"field_{text_field.id}": "Something"})
+
+    def search(query, search_mode, only_search_by_field_ids=None):
+        return list(
+            table.get_model()
+            .objects.all()
+            .search_all_fields(query, only_search_by_field_ids, search_mode)
+            .values_list("id", flat=True)
+        )
+
+    # The column has not been created, so the compat mode is used and a contains
+    # filter matches a part of a word.
+    assert search("thing", SEARCH_MODE_FULL_TEXT) == [row.id]
+
+    SearchHandler.create_tsvector_column(table)
+
+    assert search("thing", SEARCH_MODE_FULL_TEXT) == []
+    assert search("thing", SEARCH_MODE_COMPAT) == [row.id]
+    # Searching only some fields always falls back to the compat mode.
+    assert search("thing", SEARCH_MODE_FULL_TEXT, [text_field.id]) == [row.id]
+
+
+@pytest.mark.django_db
+def test_rows_created_and_updated_by_the_row_handler_are_searchable(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    SearchHandler.create_tsvector_column(table)
+
+    name = f"field_{text_field.id}"
+
+    handler = RowHandler()
+    row = handler.create_row(user, table, {name: "Apple"})
+    rows = handler.create_rows(user, table, [{name: "Banana"}, {name: "Cherry"}])
+
+    model = table.get_model()
+
+    def search(query):
+        return list(
+            model.objects.all()
+            .search_all_fields(query, search_mode=SEARCH_MODE_FULL_TEXT)
+            .values_list("id", flat=True)
+            .order_by("id")
+        )
+
+    assert search("apple") == [row.id]
+    assert search("banana") == [rows[0].id]
+
+    handler.update_row_by_id(user, table, row.id, {name: "Orange"})
+    handler.update_rows(user, table, [{"id": rows[1].id, name: "Lemon"}])
+
+    assert search("apple") == []
+    assert search("orange") == [row.id]
+    assert search("cherry") == []
+    assert search("lemon") == [rows[1].id]
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_USE_PG_FULLTEXT_SEARCH=True)
+def test_create_table_creates_tsvector_column(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+
+    table, _ = TableHandler().create_table(
+        user, database, name="Table", fill_example=True
+    )
+
+    assert table.tsvector_column_created
+    assert TSVECTOR_COLUMN_NAME in get_table_column_names(table)
+
+
+@pytest.mark.django_db
+def test_rows_depending_on_changed_rows_in_other_tables_are_searchable(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(user=user, database=database)
+    other_table = data_fixture.create_database_table(user=user, database=database)
+    data_fixture.create_text_field(table=table, primary=True)
+    data_fixture.create_text_field(table=other_table, primary=True)
+    other_field = data_fixture.create_text_field(table=other_table)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=other_table
+    )
+    FieldHandler().create_field(
+        user,
+        table,
+        "formula",
+        name="Joined",
+        formula=f"join(lookup('Link', '{other_field.name}'), ',')",
+    )
+    SearchHandler.create_tsvector_column(table)
+    SearchHandler.create_tsvector_column(other_table)
+    table.refresh_from_db()
+    other_table.refresh_from_db()
+
+    handler = RowHandler()
+    other_row = handler.create_row(user, other_table, {other_field.db_column: "Apple"})
+    row = handler.create_row(user, table, {link_field.db_column: [other_row.id]})
+
+    assert search_full_text(table, "apple") == [row.id]
+
+    handler.update_row_by_id(
+        user, other_table, other_row.id, {other_field.db_column: "Orange"}
+    )
+
+    assert search_full_text(table, "apple") == []
+    assert search_full_text(table, "orange") == [row.id]
+
+    handler.delete_row_by_id(user, other_table, other_row.id)
+
+    assert search_full_text(table, "orange") == []
+
+
+@pytest.mark.django_db
+@pytest.mark.field_link_row
+def test_link_row_and_lookup_values_are_searchable(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(user=user, database=database)
+    other_table = data_fixture.create_database_table(user=user, database=database)
+    data_fixture.create_text_field(table=table, primary=True)
+    other_primary_field = data_fixture.create_text_field(
+        table=other_table, primary=True
+    )
+    other_field = data_fixture.create_text_field(table=other_table)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=other_table
+    )
+    FieldHandler().create_field(
+        user,
+        table,
+        "lookup",
+        name="Lookup",
+        through_field_id=link_field.id,
+        target_field_id=other_field.id,
+    )
+    SearchHandler.create_tsvector_column(table)
+    SearchHandler.create_tsvector_column(other_table)
+    table.refresh_from_db()
+    other_table.refresh_from_db()
+
+    handler = RowHandler()
+    other_row = handler.create_row(
+        user,
+        other_table,
+        {other_primary_field.db_column: "Apple", other_field.db_column: "Red"},
+    )
+    row = handler.create_row(user, table, {link_field.db_column: [other_row.id]})
+
+    assert search_full_text(table, "apple") == [row.id]
+    assert search_full_text(table, "red") == [row.id]
+
+    handler.update_row_by_id(
+        user, other_table, other_row.id, {other_primary_field.db_column: "Pear"}
+    )
+
+    assert search_full_text(table, "apple") == []
+    assert search_full_text(table, "pear") == [row.id]
+
+    handler.delete_row_by_id(user, other_table, other_row.id)
+
+    assert search_full_text(table, "pear") == []
+    assert search_full_text(table, "red") == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_select_option_changes_are_searchable(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, primary=True)
+    field = data_fixture.create_single_select_field(table=table)
+    option = data_fixture.create_select_option(field=field, value="Apple")
+    SearchHandler.create_tsvector_column(table)
+    table.refresh_from_db()
+
+    row = RowHandler().create_row(user, table, {field.db_column: option.id})
+
+    assert search_full_text(table, "apple") == [row.id]
+
+    FieldHandler().update_field(
+        user,
+        field,
+        select_options=[{"id": option.id, "value": "Pear", "color": "blue"}],
+    )
+
+    assert search_full_text(table, "apple") == []
+    assert search_full_text(table, "pear") == [row.id]
+
+
+@pytest.mark.django_db(transaction=True)
+@patch.object(SearchHandler, "update_tsvector_columns")
+def test_tsvector_columns_updated_when_field_changes(mock_update, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, primary=True)
+
+    FieldHandler().create_field(user, table, "text", name="Not tracked")
+    mock_update.assert_not_called()
+
+    SearchHandler.create_tsvector_column(table)
+    mock_update.reset_mock()
+    field = FieldHandler().create_field(user, table, "text", name="Tracked")
+    mock_update.assert_called_once_with(table)
+
+    # Renaming a field doesn't change the searchable text of the rows.
+    mock_update.reset_mock()
+    field = FieldHandler().update_field(user, field, name="Renamed")
+    mock_update.assert_not_called()
+
+    field = FieldHandler().update_field(user, field, new_type_name="number")
+    mock_update.assert_called_once_with(table)
+
+    mock_update.reset_mock()
+    FieldHandler().delete_field(user, field)
+    mock_update.assert_called_once_with(table)
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.contrib.database.search.handler.update_tsvector_columns.apply_async")
+def test_schedule_update_tsvector_columns_is_debounced(mock_apply_async, data_fixture):
+    table = data_fixture.create_database_table()
+
+    SearchHandler.schedule_update_tsvector_columns(table)
+    mock_apply_async.assert_not_called()
+
+    SearchHandler.create_tsvector_column(table)
+    with transaction.atomic():
+        SearchHandler.schedule_update_tsvector_columns(table)
+        SearchHandler.schedule_update_tsvector_columns(table)
+        mock_apply_async.assert_not_called()
+    SearchHandler.schedule_update_tsvector_columns(table)
+
+    mock_apply_async.assert_called_once_with(
+        (table.id,), countdown=TSVECTOR_UPDATE_COUNTDOWN
+    )
+
+    # Once the update has started, the changes made afterwards need a new update.
+    update_tsvector_columns(table.id)
+    SearchHandler.schedule_update_tsvector_columns(table)
+    assert mock_apply_async.call_count == 2
+
+    update_tsvector_columns(table.id)
+
+
+@pytest.mark.django_db
+def test_backfill_full_text_search_command(data_fixture):
+    table_1 = data_fixture.create_database_table()
+    table_2 = data_fixture.create_database_table()
+
+    call_command("backfill_full_text_search", "--table-id", table_1.id)
+
+    table_1.refresh_from_db()
+    table_2.refresh_from_db()
+    assert table_1.tsvector_column_created
+    assert not table_2.tsvector_column_created
+
+    call_command("backfill_full_text_search")
+
+    table_2.refresh_from_db()
+    assert table_2.tsvector_column_created
@@ -3,7 +3,11 @@ from django.test.utils import override_settings
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.table.cache import get_cached_model_field_attrs
+from baserow.contrib.database.table.cache import (
+    GeneratedModelLRUCache,
+    generated_models_lru_cache,
+    get_cached_model_field_attrs,
+)
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -204,3 +208,126 @@ def test_deleting_field_invalidates_tables_model_cache(data_fixture):
 
     table.refresh_from_db()
     assert get_cached_model_field_attrs(table) is None
+
+
+def cached(model):
+    return model._meta.concrete_model
+
+
+@pytest.mark.django_db
+def test_generated_model_is_served_from_the_lru_cache(data_fixture):
+    field = data_fixture.create_text_field()
+    table = field.table
+    generated_models_lru_cache.clear()
+
+    model = table.get_model()
+    assert generated_models_lru_cache.misses == 1
+    assert generated_models_lru_cache.hits == 0
+
+    # Every caller gets its own proxy of the cached model bound to its own table
+    # and field instances, so that they don't change each other's.
+    other_table_instance = table.__class__.objects.get(id=table.id)
+    other_model = other_table_instance.get_model()
+    assert other_model is not model
+    assert cached(other_model) is cached(model)
+    assert other_model.baserow_table is other_table_instance
+    assert model.baserow_table is table
+    assert other_model._field_objects[field.id]["field"] is not (
+        model._field_objects[field.id]["field"]
+    )
+    other_model._field_objects[field.id]["field"].name = "Changed"
+    assert model._field_objects[field.id]["field"].name != "Changed"
+    assert generated_models_lru_cache.hits == 1
+
+    assert other_model.objects.all().model is other_model
+    assert other_model._meta.db_table == model._meta.db_table
+
+    # Models generated with other arguments are cached separately.
+    filtered_model = table.get_model(field_ids=[field.id])
+    assert cached(filtered_model) is not cached(model)
+    assert cached(table.get_model(field_ids=[field.id])) is cached(filtered_model)
+    assert cached(table.get_model(attribute_names=True)) is not cached(model)
+
+    # Models with extra fields or generated without the cache are never cached.
+    assert cached(table.get_model(use_cache=False)) is not cached(model)
+    assert cached(table.get_model(fields=[field])) is not cached(model)
+
+
+@pytest.mark.django_db
+def test_changing_a_field_invalidates_the_lru_cached_model(data_fixture):
+    user = data_fixture.create_user()
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables(user=user)
+    unrelated_table = data_fixture.create_database_table(user=user)
+    generated_models_lru_cache.clear()
+
+    model_a = table_a.get_model()
+    model_b = table_b.get_model()
+    unrelated_model = unrelated_table.get_model()
+
+    field = FieldHandler().create_field(user, table_a, "text", name="New")
+
+    new_model_a = table_a.get_model()
+    assert cached(new_model_a) is not cached(model_a)
+    assert new_model_a._meta.get_field(field.db_column)
+    assert cached(unrelated_table.get_model()) is cached(unrelated_model)
+
+    FieldHandler().delete_field(user, link_field)
+
+    assert cached(table_a.get_model()) is not cached(new_model_a)
+    assert cached(table_b.get_model()) is not cached(model_b)
+    assert cached(unrelated_table.get_model()) is cached(unrelated_model)
+
+
+@pytest.mark.django_db
+def test_changing_a_related_table_invalidates_the_lru_cached_model(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables(user=user)
+    generated_models_lru_cache.clear()
+
+    model_a = table_a.get_model()
+    with django_assert_num_queries(1):
+        assert cached(table_a.get_model()) is cached(model_a)
+
+    # The model of table A contains the model of table B to query the relations,
+    # so it must be regenerated even though the version of table A didn't change.
+    field = data_fixture.create_text_field(table=table_b)
+
+    new_model_a = table_a.get_model()
+    assert cached(new_model_a) is not cached(model_a)
+    related_model = new_model_a._meta.get_field(link_field.db_column).related_model
+    assert related_model._meta.get_field(field.db_column)
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_DISABLE_MODEL_CACHE=True)
+def test_lru_cache_is_not_used_if_the_model_cache_is_disabled(data_fixture):
+    table = data_fixture.create_database_table()
+    generated_models_lru_cache.clear()
+
+    assert cached(table.get_model()) is not cached(table.get_model())
+    assert len(generated_models_lru_cache) == 0
+
+
+def test_generated_model_lru_cache_evicts_least_recently_used_entries():
+    cache = GeneratedModelLRUCache(max_size=2)
+
+    cache.set((1,), ("model_1", {1: "v1"}))
+    cache.set((2,), ("model_2", {2: "v1", 1: "v1"}))
+    assert cache.get((1,)) == ("model_1", {1: "v1"})
+
+    cache.set((3,), ("model_3", {3: "v1"}))
+    assert cache.get((2,)) is None
+    assert cache.get((1,)) is not None
+    assert cache.get((3,)) is not None
+
+    cache.set((2,), ("model_2", {2: "v1", 1: "v1"}))
+    cache.invalidate_table(1)
+    assert cache.get((2,)) is None
+    assert cache.get((3,)) is not None
+    assert len(cache) == 1
+
+    disabled_cache = GeneratedModelLRUCache(max_size=0)
+    disabled_cache.set((1,), ("model_1", {1: "v1"}))
+    assert disabled_cache.get((1,)) is None
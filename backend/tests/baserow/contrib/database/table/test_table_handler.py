@@ -4,6 +4,7 @@ from decimal import Decimal
 from unittest.mock import patch
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.storage import FileSystemStorage
 from django.db import connection
 from django.test.utils import override_settings
@@ -23,6 +24,7 @@ from baserow.contrib.database.fields.models import (
     TextField,
 )
 from baserow.contrib.database.management.commands.fill_table_rows import fill_table_rows
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.table.exceptions import (
     InitialTableDataLimitExceeded,
     InvalidInitialTableData,
@@ -31,6 +33,10 @@ from baserow.contrib.database.table.exceptions import (
 )
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.table.row_counts import (
+    TABLES_WITH_ROW_COUNT_DELTA_CACHE_KEY,
+    flush_table_row_counts,
+)
 from baserow.contrib.database.views.models import GridView, GridViewFieldOptions
 from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.handler import CoreHandler
@@ -558,6 +564,92 @@ def test_count_rows_table_gets_deleted(data_fixture):
     assert table_deleted.row_count is None
 
 
+@pytest.mark.django_db
+def test_row_count_is_maintained_incrementally(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table, _ = TableHandler().create_table(user, database, name="Table", data=None)
+    not_counted_table = data_fixture.create_database_table(user=user)
+    assert table.row_count == 0
+
+    handler = RowHandler()
+    with django_capture_on_commit_callbacks(execute=True):
+        row = handler.create_row(user, table)
+        rows = handler.create_rows(user, table, [{}, {}, {}])
+        handler.delete_row(user, table, row)
+        trashed_rows = handler.delete_rows(user, table, [rows[0].id, rows[1].id])
+        handler.create_row(user, not_counted_table)
+
+    # Only the tables of which the rows have changed are checked by the flush.
+    assert {table.id, not_counted_table.id} <= cache.get(
+        TABLES_WITH_ROW_COUNT_DELTA_CACHE_KEY
+    )
+    assert flush_table_row_counts() == 1
+    table.refresh_from_db()
+    assert table.row_count == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        TrashHandler.restore_item(user, "row", row.id, parent_trash_item_id=table.id)
+        TrashHandler.restore_item(
+            user, "rows", trashed_rows.id, parent_trash_item_id=table.id
+        )
+
+    assert flush_table_row_counts() == 1
+    table.refresh_from_db()
+    assert table.row_count == 4
+    assert table.row_count == table.get_model().objects.count()
+    assert flush_table_row_counts() == 0
+
+    not_counted_table.refresh_from_db()
+    assert not_counted_table.row_count is None
+
+
+@pytest.mark.django_db
+def test_row_count_deltas_are_kept_if_the_flush_fails(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user, row_count=0)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().create_rows(user, table, [{}, {}])
+
+    with patch(
+        "baserow.contrib.database.table.row_counts.Greatest",
+        side_effect=Exception("Database unavailable"),
+    ):
+        with pytest.raises(Exception, match="Database unavailable"):
+            flush_table_row_counts()
+
+    table.refresh_from_db()
+    assert table.row_count == 0
+
+    assert flush_table_row_counts() == 1
+    table.refresh_from_db()
+    assert table.row_count == 2
+
+
+@pytest.mark.django_db
+def test_count_rows_only_counts_tables_deviating_from_the_estimation(data_fixture):
+    table = data_fixture.create_database_table(row_count=5)
+    drifted_table = data_fixture.create_database_table(row_count=500)
+    with connection.cursor() as cursor:
+        for t in [table, drifted_table]:
+            cursor.execute(f"ANALYZE {t.get_database_table_name()}")
+
+    assert TableHandler.count_rows() == 2
+    table.refresh_from_db()
+    drifted_table.refresh_from_db()
+    assert table.row_count == 5
+    assert drifted_table.row_count == 0
+
+    TableHandler.count_rows(exact=True)
+    table.refresh_from_db()
+    assert table.row_count == 0
+
+
 @pytest.mark.django_db
 def test_exception_is_raised_if_something_goes_wrong(data_fixture):
     data_fixture.create_database_table()
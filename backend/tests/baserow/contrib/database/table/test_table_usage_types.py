@@ -1,11 +1,19 @@
+from unittest.mock import patch
+
 import pytest
 from pyinstrument import Profiler
 
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.table.usage_types import (
     TableWorkspaceStorageUsageItemType,
 )
+from baserow.contrib.database.views.handler import ViewHandler
+from baserow.core.models import Workspace
 from baserow.core.trash.handler import TrashHandler
+from baserow.core.usage.handler import UsageHandler
+from baserow.core.usage.tasks import run_calculate_storage
 
 
 @pytest.mark.django_db
@@ -194,3 +202,88 @@ def test_table_workspace_storage_usage_item_type_performance(data_fixture):
     print(profiler.output_text(unicode=True, color=True))
 
     assert usage == files_amount * file_size_each
+
+
+@pytest.mark.django_db(transaction=True)
+def test_workspace_storage_usage_is_updated_when_files_change(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(user=user, database=database)
+    text_field = data_fixture.create_text_field(table=table)
+    user_file = data_fixture.create_user_file(
+        original_name="test.png", is_image=True, size=1024 * 1024
+    )
+    UsageHandler.update_outdated_storage_usage()
+
+    row = RowHandler().create_row(user, table, {text_field.id: "a"})
+    assert UsageHandler.update_outdated_storage_usage() == 0
+
+    # The workspace is only marked as outdated when file values actually change.
+    file_field = FieldHandler().create_field(user, table, "file", name="File")
+    assert UsageHandler.update_outdated_storage_usage() == 0
+    RowHandler().update_row_by_id(user, table, row.id, {text_field.id: "b"})
+    RowHandler().create_row(user, table, {text_field.id: "c"})
+    assert UsageHandler.update_outdated_storage_usage() == 0
+
+    RowHandler().update_row_by_id(
+        user, table, row.id, {file_field.id: [{"name": user_file.name}]}
+    )
+    assert UsageHandler.update_outdated_storage_usage() == 1
+    workspace.refresh_from_db()
+    assert workspace.storage_usage == 1
+    assert UsageHandler.update_outdated_storage_usage() == 0
+
+    RowHandler().update_row_by_id(
+        user, table, row.id, {file_field.id: [{"name": user_file.name}]}
+    )
+    FieldHandler().update_field(user, file_field, name="Files")
+    TableHandler().update_table(user, table, name="Renamed")
+    assert UsageHandler.update_outdated_storage_usage() == 0
+
+    form_view = data_fixture.create_form_view(table=table)
+    ViewHandler().update_view(user, form_view, name="Form")
+    assert UsageHandler.update_outdated_storage_usage() == 0
+    ViewHandler().update_view(user, form_view, cover_image=user_file)
+    assert UsageHandler.update_outdated_storage_usage() == 1
+    workspace.refresh_from_db()
+    assert workspace.storage_usage == 2
+
+    TableHandler().delete_table(user, table)
+    assert UsageHandler.update_outdated_storage_usage() == 1
+    workspace.refresh_from_db()
+    assert workspace.storage_usage == 0
+
+    TrashHandler.restore_item(user, "table", table.id)
+    assert UsageHandler.update_outdated_storage_usage() == 1
+    workspace.refresh_from_db()
+    assert workspace.storage_usage == 2
+
+
+@pytest.mark.django_db
+def test_run_calculate_storage_calculates_all_workspaces(data_fixture):
+    data_fixture.update_settings(track_workspace_usage=True)
+    user = data_fixture.create_user()
+    workspaces = [data_fixture.create_workspace(user=user) for _ in range(3)]
+    database = data_fixture.create_database_application(workspace=workspaces[1])
+    table = data_fixture.create_database_table(user=user, database=database)
+    file_field = data_fixture.create_file_field(table=table)
+    user_file = data_fixture.create_user_file(
+        original_name="test.png", is_image=True, size=1024 * 1024
+    )
+    RowHandler().create_row(user, table, {file_field.id: [{"name": user_file.name}]})
+
+    with patch("baserow.core.usage.handler.STORAGE_USAGE_CHUNK_SIZE", 2), patch.object(
+        UsageHandler,
+        "calculate_storage_usage_of_workspaces",
+        wraps=UsageHandler.calculate_storage_usage_of_workspaces,
+    ) as calculate:
+        run_calculate_storage()
+
+    assert calculate.call_count == 2
+    assert [
+        workspace.storage_usage
+        for workspace in Workspace.objects.filter(
+            id__in=[workspace.id for workspace in workspaces]
+        ).order_by("id")
+    ] == [0, 1, 0]
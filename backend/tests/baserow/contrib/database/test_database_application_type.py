@@ -4,10 +4,18 @@ import pytest
 from freezegun import freeze_time
 from pytz import UTC
 
+from baserow.contrib.database.api.rows.serializers import (
+    RowSerializer,
+    get_row_serializer_class,
+)
 from baserow.contrib.database.fields.models import FormulaField, TextField
 from baserow.contrib.database.table.models import Table
 from baserow.core.handler import CoreHandler
 from baserow.core.registries import application_type_registry
+from baserow.test_utils.helpers import (
+    assert_serialized_rows_contain_same_values,
+    setup_interesting_test_table,
+)
 
 
 @pytest.mark.django_db
@@ -104,6 +112,80 @@ def test_import_export_database(data_fixture):
     assert row_3.id == 3
 
 
+@pytest.mark.django_db
+def test_import_export_database_copying_data_in_database(data_fixture):
+    table, user, row, blank_row, context = setup_interesting_test_table(data_fixture)
+    database = table.database
+    trashed_row = table.get_model().objects.create(trashed=True)
+
+    database_type = application_type_registry.get("database")
+    serialized = database_type.export_serialized(
+        database, None, None, copy_data_in_database=True
+    )
+
+    serialized_table = next(t for t in serialized["tables"] if t["id"] == table.id)
+    assert serialized_table["copy_rows_from"]["table_id"] == table.id
+    # Only the values that can't be copied inside the database are serialized.
+    collaborator_field_names = {
+        f"field_{f['id']}"
+        for f in serialized_table["fields"]
+        if f["type"] == "multiple_collaborators"
+    }
+    assert len(collaborator_field_names) > 0
+    for serialized_row in serialized_table["rows"]:
+        assert (
+            set(serialized_row.keys())
+            == {
+                "id",
+                "order",
+                "created_on",
+                "updated_on",
+            }
+            | collaborator_field_names
+        )
+    assert trashed_row.id not in [r["id"] for r in serialized_table["rows"]]
+
+    id_mapping = {}
+    imported_database = database_type.import_serialized(
+        database.workspace, serialized, id_mapping, None, None
+    )
+
+    imported_table = imported_database.table_set.get(name=table.name)
+    for original_table, duplicated_table in [
+        (table, imported_table),
+        *[
+            (t, imported_database.table_set.get(name=t.name))
+            for t in database.table_set.exclude(id=table.id)
+        ],
+    ]:
+        original_model = original_table.get_model()
+        duplicated_model = duplicated_table.get_model()
+        original_rows = get_row_serializer_class(
+            original_model, RowSerializer, is_response=True, user_field_names=True
+        )(original_model.objects.all().order_by("id"), many=True).data
+        duplicated_rows = get_row_serializer_class(
+            duplicated_model, RowSerializer, is_response=True, user_field_names=True
+        )(duplicated_model.objects.all().order_by("id"), many=True).data
+        assert len(original_rows) == len(duplicated_rows)
+        for original_row, duplicated_row in zip(original_rows, duplicated_rows):
+            assert_serialized_rows_contain_same_values(original_row, duplicated_row)
+
+    duplicated_model = imported_table.get_model()
+    assert not duplicated_model.objects_and_trash.filter(id=trashed_row.id).exists()
+    # The sequence must have been reset after copying the rows.
+    assert duplicated_model.objects.create().id == max(row.id, blank_row.id) + 1
+
+    # The select options must reference the options of the duplicated fields.
+    single_select_field = next(
+        field_object["field"]
+        for field_object in duplicated_model._field_objects.values()
+        if field_object["type"].type == "single_select"
+    )
+    duplicated_row = duplicated_model.objects.get(id=row.id)
+    option = getattr(duplicated_row, f"field_{single_select_field.id}")
+    assert option.field_id == single_select_field.id
+
+
 @pytest.mark.django_db
 def test_create_application_and_init_with_data(data_fixture):
     core_handler = CoreHandler()
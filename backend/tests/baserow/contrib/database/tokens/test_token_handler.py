@@ -1,6 +1,7 @@
 import string
 from datetime import datetime
 
+from django.core.cache import cache
 from django.http import HttpRequest
 
 import pytest
@@ -17,7 +18,10 @@ from baserow.contrib.database.tokens.exceptions import (
     TokenDoesNotBelongToUser,
     TokenDoesNotExist,
 )
-from baserow.contrib.database.tokens.handler import TokenHandler
+from baserow.contrib.database.tokens.handler import (
+    TOKENS_WITH_USAGE_CACHE_KEY,
+    TokenHandler,
+)
 from baserow.contrib.database.tokens.models import Token, TokenPermission
 from baserow.core.exceptions import UserNotInWorkspace
 
@@ -650,3 +654,92 @@ def test_update_token_usage(data_fixture):
 
     assert token_1.handled_calls == 1
     assert token_1.last_call == datetime(2020, 1, 1, 12, 00, tzinfo=timezone("UTC"))
+
+
+@pytest.mark.django_db
+def test_flush_token_usage(data_fixture):
+    token_1 = data_fixture.create_token()
+    token_2 = data_fixture.create_token()
+    token_3 = data_fixture.create_token()
+
+    handler = TokenHandler()
+
+    with freeze_time("2020-01-01 12:00"):
+        handler.update_token_usage(token_1)
+        handler.update_token_usage(token_2)
+    with freeze_time("2020-01-01 12:05"):
+        handler.update_token_usage(token_1)
+
+    # The usage is not written to the database until it's flushed.
+    token_1.refresh_from_db()
+    assert token_1.handled_calls == 0
+    assert token_1.last_call is None
+    # Only the used tokens are checked by the flush.
+    tokens_with_usage = cache.get(TOKENS_WITH_USAGE_CACHE_KEY)
+    assert {token_1.id, token_2.id} <= tokens_with_usage
+    assert token_3.id not in tokens_with_usage
+
+    assert handler.flush_token_usage(batch_size=2) == 2
+
+    token_1.refresh_from_db()
+    token_2.refresh_from_db()
+    token_3.refresh_from_db()
+    assert token_1.handled_calls == 2
+    assert token_1.last_call == datetime(2020, 1, 1, 12, 5, tzinfo=timezone("UTC"))
+    assert token_2.handled_calls == 1
+    assert token_2.last_call == datetime(2020, 1, 1, 12, 0, tzinfo=timezone("UTC"))
+    assert token_3.handled_calls == 0
+    assert token_3.last_call is None
+
+    # Nothing to flush anymore, the calls are not written twice.
+    assert handler.flush_token_usage() == 0
+
+    with freeze_time("2020-01-01 12:10"):
+        handler.update_token_usage(token_2)
+    assert handler.flush_token_usage() == 1
+
+    token_2.refresh_from_db()
+    assert token_2.handled_calls == 2
+    assert token_2.last_call == datetime(2020, 1, 1, 12, 10, tzinfo=timezone("UTC"))
+
+
+@pytest.mark.django_db
+def test_get_by_key_is_cached(data_fixture, django_assert_num_queries):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    token = data_fixture.create_token(user=user, workspace=workspace)
+
+    handler = TokenHandler()
+
+    with django_assert_num_queries(1):
+        cached_token = handler.get_by_key(token.key)
+    with django_assert_num_queries(0):
+        cached_token = handler.get_by_key(token.key)
+        assert cached_token.id == token.id
+        assert cached_token.user.id == user.id
+        assert cached_token.workspace.id == workspace.id
+
+    # Changing the user invalidates the cache.
+    user.is_active = False
+    user.save()
+    assert handler.get_by_key(token.key).user.is_active is False
+
+    # Rotating the key invalidates the old key.
+    old_key = token.key
+    handler.rotate_token_key(user, token)
+    with pytest.raises(TokenDoesNotExist):
+        handler.get_by_key(old_key)
+    assert handler.get_by_key(token.key).id == token.id
+
+    # Trashing the workspace invalidates the tokens of the workspace.
+    workspace.trashed = True
+    workspace.save()
+    with pytest.raises(TokenDoesNotExist):
+        handler.get_by_key(token.key)
+
+    workspace.trashed = False
+    workspace.save()
+    handler.get_by_key(token.key)
+    handler.delete_token(user, token)
+    with pytest.raises(TokenDoesNotExist):
+        handler.get_by_key(token.key)
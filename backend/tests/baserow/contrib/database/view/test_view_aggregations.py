@@ -5,6 +5,7 @@ import pytest
 
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.exceptions import FieldAggregationNotSupported
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
@@ -467,3 +468,154 @@ def test_aggregation_is_updated_when_view_is_trashed(data_fixture):
         user, grid_view_one
     )
     assert field.db_column not in aggregations_restored_view
+
+
+@pytest.mark.django_db
+def test_cached_aggregations_are_updated_incrementally_when_rows_change(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="not_equal", value="hidden"
+    )
+
+    view_handler = ViewHandler()
+    row_handler = RowHandler()
+    aggregation_types = {
+        number_field.id: "sum",
+        text_field.id: "empty_count",
+    }
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            field_id: {
+                "aggregation_type": aggregation_type,
+                "aggregation_raw_type": aggregation_type,
+            }
+            for field_id, aggregation_type in aggregation_types.items()
+        },
+    )
+
+    number = number_field.db_column
+    text = text_field.db_column
+    row_1, row_2 = row_handler.create_rows(
+        user, table, [{number: 1, text: "a"}, {number: 2, text: ""}]
+    )
+
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number: 3,
+        text: 1,
+    }
+
+    def assert_cached_aggregations(expected):
+        aggregations = grid_view.get_field_options().exclude(aggregation_raw_type="")
+        values, need_computation = view_handler._get_aggregations_to_compute(
+            grid_view, [(o.field, o.aggregation_raw_type) for o in aggregations]
+        )
+        assert need_computation == {}
+        assert values == expected
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_3 = row_handler.create_row(user, table, {number: 10, text: ""})
+    assert_cached_aggregations({number: 13, text: 2})
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_row_by_id(user, table, row_1.id, {number: 5})
+    assert_cached_aggregations({number: 17, text: 2})
+
+    # Hiding a row with the view filter removes it from the aggregations.
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_rows(user, table, [{"id": row_2.id, text: "hidden"}])
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number: 15,
+        text: 1,
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.delete_row_by_id(user, table, row_3.id)
+    assert_cached_aggregations({number: 5, text: 0})
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.delete_row_by_id(user, table, row_1.id)
+    assert_cached_aggregations({number: None, text: 0})
+
+
+@pytest.mark.django_db
+def test_cached_aggregations_not_computed_incrementally_are_recomputed(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    row_handler = RowHandler()
+    number = number_field.db_column
+    row_1, row_2 = row_handler.create_rows(user, table, [{number: 1}, {number: 2}])
+
+    def get_aggregation_to_compute(aggregation_type):
+        view_handler.update_field_options(
+            view=grid_view,
+            field_options={
+                number_field.id: {
+                    "aggregation_type": aggregation_type,
+                    "aggregation_raw_type": aggregation_type,
+                }
+            },
+        )
+        view_handler.get_view_field_aggregations(user, grid_view)
+        return [(number_field, aggregation_type)]
+
+    # The median can't be computed incrementally.
+    aggregations = get_aggregation_to_compute("median")
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.create_row(user, table, {number: 6})
+    _, need_computation = view_handler._get_aggregations_to_compute(
+        grid_view, aggregations
+    )
+    assert number in need_computation
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {number: 2}
+
+    # Removing the current minimum requires a full computation.
+    aggregations = get_aggregation_to_compute("min")
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.delete_row_by_id(user, table, row_1.id)
+    _, need_computation = view_handler._get_aggregations_to_compute(
+        grid_view, aggregations
+    )
+    assert number in need_computation
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {number: 2}
+
+    # But adding a row is applied to the cached value.
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.create_row(user, table, {number: 0})
+    values, need_computation = view_handler._get_aggregations_to_compute(
+        grid_view, aggregations
+    )
+    assert need_computation == {}
+    assert values == {number: 0}
+
+
+@pytest.mark.django_db
+def test_update_incremental_state_of_aggregations():
+    average = view_aggregation_type_registry.get("average")
+    state = average.update_incremental_state(
+        {"sum": Decimal("10"), "count": 4}, {"sum": Decimal("4"), "count": 1}, {}
+    )
+    assert state == {"sum": Decimal("6"), "count": 3}
+    assert average.get_value_from_incremental_state(state) == Decimal("2")
+    assert average.get_value_from_incremental_state({"sum": 0, "count": 0}) is None
+
+    maximum = view_aggregation_type_registry.get("max")
+    assert maximum.update_incremental_state(
+        {"value": 10}, {"value": 3}, {"value": 7}
+    ) == {"value": 10}
+    assert maximum.update_incremental_state({"value": 10}, {"value": 10}, {}) is None
+    assert maximum.update_incremental_state({"value": None}, {}, {"value": 1}) == {
+        "value": 1
+    }
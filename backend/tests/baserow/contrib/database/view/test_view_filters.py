@@ -5662,3 +5662,48 @@ def test_multiple_collaborators_has_filter_type_export_import(data_fixture):
     assert view_filter_type.set_import_serialized_value(user.email, {}) == ""
     assert view_filter_type.set_import_serialized_value("", id_mapping) == ""
     assert view_filter_type.set_import_serialized_value("wrong", id_mapping) == ""
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "filter_type,field_type,filter_values",
+    [
+        ("equal", "text", ["a", " a ", "A", ""]),
+        ("not_equal", "text", ["a", "A", ""]),
+        ("equal", "number", ["1"]),
+        ("boolean", "boolean", ["1", "0", "yes", ""]),
+    ],
+)
+def test_matches_row_value_is_consistent_with_get_filter(
+    data_fixture, filter_type, field_type, filter_values
+):
+    table = data_fixture.create_database_table()
+    field = getattr(data_fixture, f"create_{field_type}_field")(table=table)
+    field_name = f"field_{field.id}"
+    model = table.get_model()
+    row_values = {
+        "text": ["a", "A", "a ", "", None],
+        "number": [1, None],
+        "boolean": [True, False],
+    }[field_type]
+    rows = [model.objects.create(**{field_name: value}) for value in row_values]
+    view_filter_type = view_filter_type_registry.get(filter_type)
+
+    for filter_value in filter_values:
+        view = data_fixture.create_grid_view(table=table)
+        data_fixture.create_view_filter(
+            view=view, field=field, type=filter_type, value=filter_value
+        )
+        visible_ids = set(
+            ViewHandler()
+            .apply_filters(view, model.objects.all())
+            .values_list("id", flat=True)
+        )
+        for row in rows:
+            matches = view_filter_type.matches_row_value(
+                getattr(row, field_name), filter_value, field
+            )
+            if field_type == "number" or (field_type == "text" and filter_value == ""):
+                assert matches is None
+            else:
+                assert matches == (row.id in visible_ids)
@@ -1971,9 +1971,13 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
     # Should not appear in any results
     data_fixture.create_form_view(user, table=table, public=True)
 
-    # Public View 1 has filters which match row 1
+    # Public View 1 has filters which match row 1. The contains filter can't be
+    # checked in Python, so the database must be queried.
     data_fixture.create_view_filter(
-        view=public_grid_view, field=filtered_field, type="equal", value="FilterValue"
+        view=public_grid_view,
+        field=filtered_field,
+        type="contains",
+        value="FilterValue",
     )
     model = table.get_model()
     visible_row = model.objects.create(
@@ -1984,7 +1988,7 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
     )
     invisible_row = model.objects.create(
         **{
-            f"field_{filtered_field.id}": "NotFilterValue",
+            f"field_{filtered_field.id}": "OtherValue",
             f"field_{unfiltered_field.id}": "any",
         }
     )
@@ -2012,7 +2016,7 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
     data_fixture.create_view_filter(
         view=another_public_grid_view,
         field=filtered_field,
-        type="equal",
+        type="contains",
         value="FilterValue",
     )
 
@@ -2022,17 +2026,79 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
         only_include_views_which_want_realtime_events=True,
         updated_field_ids=[filtered_field.id, unfiltered_field.id],
     )
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(1):
+        # Still only one query checking the row in all the public views at once
         assert row_checker.get_public_views_where_row_is_visible(visible_row) == [
             public_grid_view.view_ptr,
             another_public_grid_view.view_ptr,
         ]
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(1):
+        # Still only one query checking the row in all the public views at once
         assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
 
 
+@pytest.mark.django_db
+def test_public_view_row_checker_checks_simple_filters_without_queries(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    equal_view = data_fixture.create_grid_view(user, table=table, public=True, order=0)
+    data_fixture.create_view_filter(
+        view=equal_view, field=text_field, type="equal", value="a"
+    )
+    or_view = data_fixture.create_grid_view(
+        user, table=table, public=True, order=1, filter_type="OR"
+    )
+    data_fixture.create_view_filter(
+        view=or_view, field=text_field, type="not_equal", value="a"
+    )
+    data_fixture.create_view_filter(
+        view=or_view, field=boolean_field, type="boolean", value="1"
+    )
+    contains_view = data_fixture.create_grid_view(
+        user, table=table, public=True, order=2
+    )
+    data_fixture.create_view_filter(
+        view=contains_view, field=text_field, type="contains", value="b"
+    )
+
+    model = table.get_model()
+    row_1 = model.objects.create(**{f"field_{text_field.id}": "a"})
+    row_2 = model.objects.create(
+        **{f"field_{text_field.id}": "ab", f"field_{boolean_field.id}": True}
+    )
+    row_3 = model.objects.create(
+        **{f"field_{text_field.id}": "a", f"field_{boolean_field.id}": True}
+    )
+    row_4 = model.objects.create()
+
+    row_checker = ViewHandler().get_public_views_row_checker(
+        table, model, only_include_views_which_want_realtime_events=True
+    )
+
+    with django_assert_num_queries(1):
+        # Only the contains filter must be checked in the database.
+        assert row_checker.get_public_views_where_rows_are_visible(
+            [row_1, row_2, row_3, row_4]
+        ) == [
+            PublicViewRows(equal_view.view_ptr, {row_1.id, row_3.id}),
+            PublicViewRows(or_view.view_ptr, {row_2.id, row_3.id, row_4.id}),
+            PublicViewRows(contains_view.view_ptr, {row_2.id}),
+        ]
+
+    contains_view.delete()
+    row_checker = ViewHandler().get_public_views_row_checker(
+        table, model, only_include_views_which_want_realtime_events=True
+    )
+    with django_assert_num_queries(0):
+        assert row_checker.get_public_views_where_row_is_visible(row_4) == [
+            or_view.view_ptr
+        ]
+
+
 @pytest.mark.django_db
 def test_cant_get_view_filter_when_view_trashed(data_fixture):
     user = data_fixture.create_user()
@@ -1,4 +1,5 @@
 import json
+from unittest.mock import patch
 
 from django.core.exceptions import ValidationError
 from django.test import override_settings
@@ -441,3 +442,62 @@ def test_clean_webhook_calls(data_fixture):
         ).count()
         == 0
     )
+
+
+@pytest.mark.django_db
+@override_settings(
+    BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS=5, BASEROW_WEBHOOKS_MAX_BATCH_SIZE=2
+)
+@patch("baserow.contrib.database.webhooks.tasks.call_webhook_batch")
+@patch("baserow.contrib.database.webhooks.tasks.call_webhook")
+def test_add_and_send_pending_calls(
+    mock_call_webhook, mock_call_webhook_batch, data_fixture
+):
+    webhook = data_fixture.create_table_webhook(
+        url="http://localhost/", headers={"Baserow-header-1": "Value 1"}
+    )
+    handler = WebhookHandler()
+
+    for i in range(3):
+        handler.add_pending_call(
+            webhook, "rows.created", f"event_{i}", {"event_id": f"event_{i}"}
+        )
+
+    # The task must only be scheduled once per window.
+    mock_call_webhook_batch.apply_async.assert_called_once_with(
+        kwargs={"webhook_id": webhook.id}, countdown=5
+    )
+
+    handler.send_pending_calls(webhook.id)
+
+    assert mock_call_webhook.delay.call_count == 2
+    batch_kwargs = mock_call_webhook.delay.call_args_list[0][1]
+    assert batch_kwargs["event_type"] == "batch"
+    assert batch_kwargs["headers"]["X-Baserow-Event"] == "batch"
+    assert batch_kwargs["headers"]["Baserow-header-1"] == "Value 1"
+    assert batch_kwargs["payload"] == {
+        "table_id": webhook.table_id,
+        "event_id": batch_kwargs["event_id"],
+        "event_type": "batch",
+        "events": [{"event_id": "event_0"}, {"event_id": "event_1"}],
+    }
+    # A batch of one event is sent as it would be without batching.
+    single_kwargs = mock_call_webhook.delay.call_args_list[1][1]
+    assert single_kwargs["event_type"] == "rows.created"
+    assert single_kwargs["event_id"] == "event_2"
+    assert single_kwargs["headers"]["X-Baserow-Delivery"] == "event_2"
+    assert single_kwargs["payload"] == {"event_id": "event_2"}
+
+    # The pending calls have been consumed, and a new event schedules a new task.
+    mock_call_webhook.delay.reset_mock()
+    handler.send_pending_calls(webhook.id)
+    mock_call_webhook.delay.assert_not_called()
+
+    handler.add_pending_call(webhook, "rows.created", "event_3", {})
+    assert mock_call_webhook_batch.apply_async.call_count == 2
+
+    # The pending calls of a deactivated webhook are dropped.
+    webhook.active = False
+    webhook.save()
+    handler.send_pending_calls(webhook.id)
+    mock_call_webhook.delay.assert_not_called()
@@ -1,6 +1,8 @@
 import uuid
 from unittest.mock import patch
 
+from django.test import override_settings
+
 import pytest
 
 from baserow.contrib.database.rows.handler import RowHandler
@@ -39,3 +41,46 @@ def test_signal_listener(mock_call_webhook, data_fixture):
         "event_type": "rows.created",
         "items": [{"id": 1, "order": "1.00000000000000000000"}],
     }
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS=5)
+@patch("baserow.contrib.database.webhooks.tasks.call_webhook")
+@patch("baserow.contrib.database.webhooks.registries.call_webhook")
+def test_signal_listener_batches_events(
+    mock_registries_call_webhook, mock_call_webhook, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    webhook = data_fixture.create_table_webhook(
+        user=user, table=table, url="http://localhost/", include_all_events=True
+    )
+
+    # The batch task is executed right away in the tests, so the first event is
+    # sent alone and the next ones are sent together.
+    with patch(
+        "baserow.contrib.database.webhooks.tasks.call_webhook_batch.apply_async"
+    ) as mock_apply_async:
+        RowHandler().create_row(user=user, table=table, values={})
+        RowHandler().create_row(user=user, table=table, values={})
+        mock_apply_async.assert_called_once()
+
+    mock_registries_call_webhook.delay.assert_not_called()
+    mock_call_webhook.delay.assert_not_called()
+
+    from baserow.contrib.database.webhooks.tasks import call_webhook_batch
+
+    call_webhook_batch(webhook_id=webhook.id)
+
+    mock_call_webhook.delay.assert_called_once()
+    args, kwargs = mock_call_webhook.delay.call_args
+    assert kwargs["webhook_id"] == webhook.id
+    assert kwargs["event_type"] == "batch"
+    assert [event["event_type"] for event in kwargs["payload"]["events"]] == [
+        "rows.created",
+        "rows.created",
+    ]
+    assert [event["items"][0]["id"] for event in kwargs["payload"]["events"]] == [
+        1,
+        2,
+    ]
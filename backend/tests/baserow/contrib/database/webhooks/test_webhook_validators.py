@@ -8,7 +8,10 @@ from django.test import override_settings
 import httpretty as httpretty
 import pytest
 
-from baserow.contrib.database.webhooks.validators import url_validator
+from baserow.contrib.database.webhooks.validators import (
+    get_webhook_session,
+    url_validator,
+)
 from baserow.test_utils.helpers import stub_getaddrinfo
 
 URL_BLACKLIST_ONLY_ALLOWING_GOOGLE_WEBHOOKS = re.compile(r"(?!(www\.)?google\.com).*")
@@ -186,3 +189,23 @@ def test_advocate_hostname_blacklist_overrides_ip_lists(
 
     # This request should still go through
     url_validator("https://www.google.com/")
+
+
+@override_settings(
+    BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=False,
+    BASEROW_WEBHOOKS_MAX_CONNECTIONS_PER_HOST=3,
+)
+def test_get_webhook_session():
+    session = get_webhook_session()
+    assert get_webhook_session() is session
+
+    adapter = session.get_adapter("https://example.com/")
+    assert adapter._pool_maxsize == 3
+    assert adapter._pool_block is True
+    # The cookies set by an endpoint must never be sent to another one.
+    assert session.cookies.get_policy().allowed_domains() == ()
+
+    with override_settings(BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=True):
+        private_session = get_webhook_session()
+        assert private_session is not session
+        assert private_session.get_adapter("http://localhost/")._pool_maxsize == 3
@@ -879,9 +879,13 @@ def test_batch_update_rows_not_visible_in_public_view_to_be_visible_event_sent(
 
 
 @pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_many_to_channel_group")
 @patch("baserow.ws.registries.broadcast_to_channel_group")
 def test_batch_update_rows_some_not_visible_in_public_view_to_be_visible_event_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_broadcast_to_channel_group,
+    mock_broadcast_many_to_channel_group,
+    data_fixture,
+    public_realtime_view_tester,
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -956,60 +960,68 @@ def test_batch_update_rows_some_not_visible_in_public_view_to_be_visible_event_s
             ],
         )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
-        [
-            call(f"table-{table.id}", ANY, ANY),
-            call(
-                f"view-{public_view_with_filters_initially_hiding_all_rows.slug}",
+    assert mock_broadcast_to_channel_group.delay.mock_calls == [
+        call(f"table-{table.id}", ANY, ANY)
+    ]
+    # The events of the view are sent in a single channel layer message.
+    assert mock_broadcast_many_to_channel_group.delay.mock_calls == [
+        call(
+            f"view-{public_view_with_filters_initially_hiding_all_rows.slug}",
+            [
                 {
-                    "type": "rows_created",
-                    "table_id": PUBLIC_PLACEHOLDER_ENTITY_ID,
-                    "rows": [
-                        {
-                            "id": initially_hidden_row.id,
-                            "order": "1.00000000000000000000",
-                            # Only the visible field should be sent
-                            f"field_{visible_field.id}": "Visible",
-                        },
-                    ],
-                    "metadata": {},
-                    "before_row_id": None,
+                    "payload": {
+                        "type": "rows_created",
+                        "table_id": PUBLIC_PLACEHOLDER_ENTITY_ID,
+                        "rows": [
+                            {
+                                "id": initially_hidden_row.id,
+                                "order": "1.00000000000000000000",
+                                # Only the visible field should be sent
+                                f"field_{visible_field.id}": "Visible",
+                            },
+                        ],
+                        "metadata": {},
+                        "before_row_id": None,
+                    },
+                    "ignore_web_socket_id": None,
                 },
-                None,
-            ),
-            call(
-                f"view-{public_view_with_filters_initially_hiding_all_rows.slug}",
                 {
-                    "type": "rows_updated",
-                    "table_id": PUBLIC_PLACEHOLDER_ENTITY_ID,
-                    "rows_before_update": [
-                        {
-                            "id": initially_visible_row.id,
-                            "order": "2.00000000000000000000",
-                            # Only the visible field should be sent
-                            f"field_{visible_field.id}": "Visible",
-                        },
-                    ],
-                    "rows": [
-                        {
-                            "id": initially_visible_row.id,
-                            "order": "2.00000000000000000000",
-                            # Only the visible field should be sent
-                            f"field_{visible_field.id}": "Visible",
-                        },
-                    ],
-                    "metadata": {},
+                    "payload": {
+                        "type": "rows_updated",
+                        "table_id": PUBLIC_PLACEHOLDER_ENTITY_ID,
+                        "rows_before_update": [
+                            {
+                                "id": initially_visible_row.id,
+                                "order": "2.00000000000000000000",
+                                # Only the visible field should be sent
+                                f"field_{visible_field.id}": "Visible",
+                            },
+                        ],
+                        "rows": [
+                            {
+                                "id": initially_visible_row.id,
+                                "order": "2.00000000000000000000",
+                                # Only the visible field should be sent
+                                f"field_{visible_field.id}": "Visible",
+                            },
+                        ],
+                        "metadata": {},
+                    },
+                    "ignore_web_socket_id": None,
                 },
-                None,
-            ),
-        ]
-    )
+            ],
+        )
+    ]
 
 
 @pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_many_to_channel_group")
 @patch("baserow.ws.registries.broadcast_to_channel_group")
 def test_batch_update_rows_visible_in_public_view_to_some_not_be_visible_event_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_broadcast_to_channel_group,
+    mock_broadcast_many_to_channel_group,
+    data_fixture,
+    public_realtime_view_tester,
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -1090,53 +1102,57 @@ def test_batch_update_rows_visible_in_public_view_to_some_not_be_visible_event_s
             ],
         )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
-        [
-            call(f"table-{table.id}", ANY, ANY),
-            call(
-                f"view-{public_view_with_filters_initially_hiding_all_rows.slug}",
+    assert mock_broadcast_to_channel_group.delay.mock_calls == [
+        call(f"table-{table.id}", ANY, ANY)
+    ]
+    # The events of the view are sent in a single channel layer message.
+    assert mock_broadcast_many_to_channel_group.delay.mock_calls == [
+        call(
+            f"view-{public_view_with_filters_initially_hiding_all_rows.slug}",
+            [
                 {
-                    "type": "rows_deleted",
-                    "table_id": PUBLIC_PLACEHOLDER_ENTITY_ID,
-                    "row_ids": [2],
-                    "rows": [
-                        {
-                            "id": initially_visible_row2.id,
-                            "order": "2.00000000000000000000",
-                            # Only the visible field should be sent
-                            f"field_{visible_field.id}": "Visible",
-                        },
-                    ],
+                    "payload": {
+                        "type": "rows_deleted",
+                        "table_id": PUBLIC_PLACEHOLDER_ENTITY_ID,
+                        "row_ids": [2],
+                        "rows": [
+                            {
+                                "id": initially_visible_row2.id,
+                                "order": "2.00000000000000000000",
+                                # Only the visible field should be sent
+                                f"field_{visible_field.id}": "Visible",
+                            },
+                        ],
+                    },
+                    "ignore_web_socket_id": None,
                 },
-                None,
-            ),
-            call(
-                f"view-{public_view_with_filters_initially_hiding_all_rows.slug}",
                 {
-                    "type": "rows_updated",
-                    "table_id": PUBLIC_PLACEHOLDER_ENTITY_ID,
-                    "rows_before_update": [
-                        {
-                            "id": initially_visible_row.id,
-                            "order": "1.00000000000000000000",
-                            # Only the visible field should be sent
-                            f"field_{visible_field.id}": "Visible",
-                        },
-                    ],
-                    "rows": [
-                        {
-                            "id": initially_visible_row.id,
-                            "order": "1.00000000000000000000",
-                            # Only the visible field should be sent
-                            f"field_{visible_field.id}": "Visible",
-                        },
-                    ],
-                    "metadata": {},
+                    "payload": {
+                        "type": "rows_updated",
+                        "table_id": PUBLIC_PLACEHOLDER_ENTITY_ID,
+                        "rows_before_update": [
+                            {
+                                "id": initially_visible_row.id,
+                                "order": "1.00000000000000000000",
+                                # Only the visible field should be sent
+                                f"field_{visible_field.id}": "Visible",
+                            },
+                        ],
+                        "rows": [
+                            {
+                                "id": initially_visible_row.id,
+                                "order": "1.00000000000000000000",
+                                # Only the visible field should be sent
+                                f"field_{visible_field.id}": "Visible",
+                            },
+                        ],
+                        "metadata": {},
+                    },
+                    "ignore_web_socket_id": None,
                 },
-                None,
-            ),
-        ]
-    )
+            ],
+        )
+    ]
 
 
 @pytest.mark.django_db(transaction=True)
@@ -1,6 +1,8 @@
 from typing import Any, Dict, List
 from unittest.mock import patch
 
+from django.db import transaction
+
 import pytest
 from rest_framework import serializers
 from rest_framework.fields import Field
@@ -191,3 +193,47 @@ def test_row_orders_recalculated(mock_broadcast_to_channel_group, data_fixture):
     assert args[0][0] == f"table-{table.id}"
     assert args[0][1]["type"] == "row_orders_recalculated"
     assert args[0][1]["table_id"] == table.id
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_many_to_channel_group")
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_row_events_in_the_same_transaction_are_coalesced(
+    mock_broadcast_to_channel_group, mock_broadcast_many_to_channel_group, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    handler = RowHandler()
+
+    with transaction.atomic():
+        row_1 = handler.create_row(user, table, {f"field_{field.id}": "a"})
+        row_2 = handler.create_row(user, table, {f"field_{field.id}": "b"})
+        handler.update_row_by_id(user, table, row_1.id, {f"field_{field.id}": "c"})
+        handler.update_row_by_id(user, table, row_2.id, {f"field_{field.id}": "d"})
+        handler.update_row_by_id(user, table, row_1.id, {f"field_{field.id}": "e"})
+        handler.delete_row_by_id(user, table, row_2.id)
+
+    mock_broadcast_to_channel_group.delay.assert_not_called()
+    mock_broadcast_many_to_channel_group.delay.assert_called_once()
+    group_name, messages = mock_broadcast_many_to_channel_group.delay.call_args[0]
+    assert group_name == f"table-{table.id}"
+    assert [message["payload"]["type"] for message in messages] == [
+        "rows_created",
+        "rows_updated",
+        "rows_deleted",
+    ]
+
+    rows_created = messages[0]["payload"]
+    assert [row["id"] for row in rows_created["rows"]] == [row_1.id, row_2.id]
+
+    # The first update of row 1 is superseded by the last one.
+    rows_updated = messages[1]["payload"]
+    assert [row["id"] for row in rows_updated["rows"]] == [row_1.id, row_2.id]
+    assert [row[f"field_{field.id}"] for row in rows_updated["rows_before_update"]] == [
+        "a",
+        "b",
+    ]
+    assert [row[f"field_{field.id}"] for row in rows_updated["rows"]] == ["e", "d"]
+
+    assert messages[2]["payload"]["row_ids"] == [row_2.id]
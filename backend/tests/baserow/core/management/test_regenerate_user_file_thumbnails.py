@@ -0,0 +1,38 @@
+from io import BytesIO
+from unittest.mock import patch
+
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+
+import pytest
+from PIL import Image
+
+from baserow.core.user_files.handler import UserFileHandler
+
+
+@pytest.mark.django_db
+def test_regenerate_user_file_thumbnails(data_fixture, tmpdir, settings):
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+    user_files = []
+    for index in range(3):
+        image_bytes = BytesIO()
+        Image.new("RGB", (100, 140), color="red").save(image_bytes, format="PNG")
+        user_files.append(
+            handler.upload_user_file(
+                None, f"image_{index}.png", image_bytes, storage=storage
+            )
+        )
+    handler.upload_user_file(None, "text.txt", BytesIO(b"text"), storage=storage)
+
+    settings.USER_THUMBNAILS = {"tiny": [21, 21], "small": [30, 30]}
+    with patch(
+        "baserow.core.management.commands.regenerate_user_file_thumbnails"
+        ".default_storage",
+        new=storage,
+    ):
+        call_command("regenerate_user_file_thumbnails", "small", "--workers", "2")
+
+    for user_file in user_files:
+        thumbnail_path = tmpdir.join("thumbnails", "small", user_file.name)
+        assert Image.open(thumbnail_path.open("rb")).size == (30, 30)
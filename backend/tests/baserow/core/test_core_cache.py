@@ -0,0 +1,20 @@
+from django.core.cache import cache
+
+from baserow.core.cache import add_to_cached_id_set, pop_cached_id_set
+
+
+def test_add_to_and_pop_cached_id_set():
+    cache_key = "test_cached_id_set"
+    assert pop_cached_id_set(cache_key) == set()
+
+    add_to_cached_id_set(cache_key, [1, 2])
+    add_to_cached_id_set(cache_key, [2, 3, 3])
+    add_to_cached_id_set(cache_key, [])
+    assert cache.get(cache_key) == {1, 2, 3}
+
+    assert pop_cached_id_set(cache_key) == {1, 2, 3}
+    assert pop_cached_id_set(cache_key) == set()
+
+    # The ids can be added again after the set has been popped.
+    add_to_cached_id_set(cache_key, [2])
+    assert pop_cached_id_set(cache_key) == {2}
@@ -10,7 +10,12 @@ import pytest
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import Field, LongTextField, TextField
 from baserow.contrib.database.views.models import GalleryView, GridView, View
-from baserow.core.db import LockedAtomicTransaction, specific_iterator
+from baserow.core.db import (
+    LockedAtomicTransaction,
+    chunked_iterator,
+    get_estimated_count,
+    specific_iterator,
+)
 from baserow.core.models import Settings
 
 
@@ -270,3 +275,33 @@ def test_specific_iterator_per_content_type_with_nested_prefetch(
         list(specific_objects[1].table.field_set.all())
         list(specific_objects[2].table.field_set.all())
         list(specific_objects[3].table.field_set.all())
+
+
+@pytest.mark.django_db
+def test_chunked_iterator_with_prefetch_related(
+    data_fixture, django_assert_num_queries
+):
+    views = [data_fixture.create_grid_view() for _ in range(3)]
+    filters = [data_fixture.create_view_filter(view=view) for view in views]
+
+    queryset = (
+        View.objects.filter(id__in=[view.id for view in views])
+        .order_by("id")
+        .prefetch_related("viewfilter_set")
+    )
+
+    # The main query and one prefetch query for each of the two chunks.
+    with django_assert_num_queries(3):
+        objects = list(chunked_iterator(queryset, chunk_size=2))
+        assert [obj.id for obj in objects] == [view.id for view in views]
+        assert [obj.viewfilter_set.all()[0].id for obj in objects] == [
+            view_filter.id for view_filter in filters
+        ]
+
+
+@pytest.mark.django_db
+def test_get_estimated_count(data_fixture):
+    data_fixture.create_grid_view()
+
+    assert get_estimated_count(View.objects.all()) >= 1
+    assert get_estimated_count(View.objects.none()) == 0
@@ -1,5 +1,6 @@
 import string
 from io import BytesIO
+from unittest.mock import patch
 
 from django.conf import settings
 from django.core.files.base import ContentFile
@@ -11,6 +12,7 @@ import responses
 from freezegun import freeze_time
 from PIL import Image
 
+from baserow.api.user_files.serializers import UserFileSerializer
 from baserow.core.models import UserFile
 from baserow.core.user_files.exceptions import (
     FileSizeTooLargeError,
@@ -219,6 +221,71 @@ def test_upload_user_file(data_fixture, tmpdir):
     )
 
 
+@pytest.mark.django_db
+def test_upload_user_file_generates_thumbnails_async(
+    data_fixture, tmpdir, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+
+    image = Image.new("RGB", (100, 140), color="red")
+    image_bytes = BytesIO()
+    image.save(image_bytes, format="PNG")
+
+    with patch("baserow.core.user_files.handler.default_storage", new=storage):
+        with django_capture_on_commit_callbacks() as callbacks:
+            user_file = handler.upload_user_file(user, "image.png", image_bytes)
+
+        thumbnail_path = tmpdir.join("thumbnails", "tiny", user_file.name)
+        assert tmpdir.join("user_files", user_file.name).isfile()
+        assert not thumbnail_path.isfile()
+        assert handler.are_thumbnails_pending(user_file.name, user_file.uploaded_at)
+        serialized = UserFileSerializer(user_file).data
+        assert serialized["thumbnails"]["tiny"]["url"] == serialized["url"]
+
+        for callback in callbacks:
+            callback()
+
+        assert thumbnail_path.isfile()
+        assert Image.open(thumbnail_path.open("rb")).size == (21, 21)
+        assert not handler.are_thumbnails_pending(user_file.name, user_file.uploaded_at)
+        serialized = UserFileSerializer(user_file).data
+        assert "tiny" in serialized["thumbnails"]["tiny"]["url"]
+
+    # Files uploaded a long time ago are never pending.
+    handler.generate_user_file_thumbnails_async(user_file)
+    assert handler.are_thumbnails_pending(user_file.name, user_file.uploaded_at)
+    assert not handler.are_thumbnails_pending(user_file.name, "2020-01-01T00:00:00Z")
+
+
+@pytest.mark.django_db
+def test_generate_jpeg_thumbnails_from_draft(data_fixture, tmpdir, settings):
+    settings.USER_THUMBNAILS = {"tiny": [21, 21], "card_cover": [300, None]}
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    user_file = data_fixture.create_user_file(
+        is_image=True, image_width=2400, image_height=1600
+    )
+
+    image_bytes = BytesIO()
+    Image.new("RGB", (2400, 1600), color="red").save(image_bytes, format="JPEG")
+    image_bytes.seek(0)
+    image = Image.open(image_bytes)
+    UserFileHandler().generate_and_save_image_thumbnails(
+        image, user_file, storage=storage
+    )
+
+    # The image is decoded at a reduced scale that is still larger than the
+    # biggest thumbnail.
+    assert image.size == (300, 200)
+    tiny = Image.open(tmpdir.join("thumbnails", "tiny", user_file.name).open("rb"))
+    assert tiny.size == (21, 21)
+    card_cover = Image.open(
+        tmpdir.join("thumbnails", "card_cover", user_file.name).open("rb")
+    )
+    assert card_cover.size == (300, 200)
+
+
 @pytest.mark.django_db
 @httpretty.activate(verbose=True, allow_net_connect=False)
 def test_upload_user_file_by_url(data_fixture, tmpdir):
@@ -0,0 +1,115 @@
+from unittest.mock import patch
+
+from django.db import transaction
+
+import pytest
+
+from baserow.ws.coalescer import PageEventCoalescer
+from baserow.ws.registries import page_registry
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_many_to_channel_group")
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_page_event_coalescer(
+    mock_broadcast_to_channel_group, mock_broadcast_many_to_channel_group
+):
+    coalescer = PageEventCoalescer()
+    coalescer.register_payload_merger(
+        "count", lambda previous, payload: {**previous, "n": previous["n"] + 1}
+    )
+    table_page = page_registry.get("table")
+
+    def broadcast(payload, ignore_web_socket_id=None, table_id=1):
+        coalescer.on_commit(
+            lambda: coalescer.add(
+                table_page, payload, ignore_web_socket_id, {"table_id": table_id}
+            )
+        )
+
+    # Outside of a transaction the payloads are sent right away.
+    broadcast({"type": "count", "n": 1})
+    mock_broadcast_to_channel_group.delay.assert_called_once_with(
+        "table-1", {"type": "count", "n": 1}, None
+    )
+
+    mock_broadcast_to_channel_group.reset_mock()
+    with transaction.atomic():
+        broadcast({"type": "count", "n": 1})
+        broadcast({"type": "count", "n": 1})
+        broadcast({"type": "count", "n": 1}, ignore_web_socket_id="123")
+        broadcast({"type": "other"})
+        broadcast({"type": "other"}, table_id=2)
+        mock_broadcast_many_to_channel_group.delay.assert_not_called()
+
+    mock_broadcast_many_to_channel_group.delay.assert_called_once_with(
+        "table-1",
+        [
+            {"payload": {"type": "count", "n": 2}, "ignore_web_socket_id": None},
+            {"payload": {"type": "count", "n": 1}, "ignore_web_socket_id": "123"},
+            {"payload": {"type": "other"}, "ignore_web_socket_id": None},
+        ],
+    )
+    mock_broadcast_to_channel_group.delay.assert_called_once_with(
+        "table-2", {"type": "other"}, None
+    )
+
+    # The payloads of a rolled back savepoint are not sent, but the others are.
+    mock_broadcast_to_channel_group.reset_mock()
+    with transaction.atomic():
+        broadcast({"type": "count", "n": 1})
+        try:
+            with transaction.atomic():
+                broadcast({"type": "rolled_back"})
+                raise ValueError()
+        except ValueError:
+            pass
+    mock_broadcast_to_channel_group.delay.assert_called_once_with(
+        "table-1", {"type": "count", "n": 1}, None
+    )
+
+    # Nothing is sent if the transaction is rolled back.
+    mock_broadcast_to_channel_group.reset_mock()
+    try:
+        with transaction.atomic():
+            broadcast({"type": "count", "n": 1})
+            raise ValueError()
+    except ValueError:
+        pass
+    mock_broadcast_to_channel_group.delay.assert_not_called()
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_many_to_channel_group")
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_page_event_coalescer_does_not_leak_payloads_of_failed_callbacks(
+    mock_broadcast_to_channel_group, mock_broadcast_many_to_channel_group
+):
+    coalescer = PageEventCoalescer()
+    table_page = page_registry.get("table")
+
+    def broadcast(payload):
+        coalescer.on_commit(
+            lambda: coalescer.add(table_page, payload, None, {"table_id": 1})
+        )
+
+    def fail():
+        raise ValueError()
+
+    # The remaining callbacks don't run if a commit callback fails, so the
+    # payloads collected before must not be sent with those of the next transaction.
+    for register_failing_callback in [transaction.on_commit, coalescer.on_commit]:
+        with pytest.raises(ValueError):
+            with transaction.atomic():
+                broadcast({"type": "stale"})
+                register_failing_callback(fail)
+                broadcast({"type": "never_sent"})
+
+        with transaction.atomic():
+            broadcast({"type": "next"})
+
+        mock_broadcast_to_channel_group.delay.assert_called_once_with(
+            "table-1", {"type": "next"}, None
+        )
+        mock_broadcast_many_to_channel_group.delay.assert_not_called()
+        mock_broadcast_to_channel_group.reset_mock()
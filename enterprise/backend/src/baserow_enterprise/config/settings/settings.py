@@ -20,6 +20,12 @@ def setup(settings):
         os.getenv("BASEROW_ENTERPRISE_AUDIT_LOG_RETENTION_DAYS", 365)
     )
 
+    # The compiled roles of the users are cached until the permissions of their
+    # workspace change, but at most this number of seconds.
+    settings.BASEROW_ENTERPRISE_PERMISSIONS_CACHE_TIMEOUT_SECONDS = int(
+        os.getenv("BASEROW_ENTERPRISE_PERMISSIONS_CACHE_TIMEOUT_SECONDS", 60 * 60)
+    )
+
     # Set this to True to enable users to login with auth providers different than
     # the one they were originally created with.
     settings.BASEROW_ALLOW_MULTIPLE_SSO_PROVIDERS_FOR_SAME_ACCOUNT = bool(
@@ -1,9 +1,13 @@
+import uuid
 from collections import defaultdict
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Case, IntegerField, Q, QuerySet, Value, When
 
 from baserow_premium.license.handler import LicenseHandler
@@ -295,7 +299,9 @@ class RoleAssignmentHandler:
     ) -> Dict[Subject, Tuple[ScopeObject, List[Role]]]:
         """
         Returns the role assignments for for all given actors who are all of the
-        actor_subject_type.
+        actor_subject_type. The compiled roles of each actor are cached between
+        requests until the permissions of the workspace change, so that the role
+        assignments and team memberships don't have to be queried every time.
 
         :param workspace: The workspace in which we want the role assignments for.
         :param actor_subject_type: The type of the actors.
@@ -305,6 +311,88 @@ class RoleAssignmentHandler:
             the object hierarchy, the earlier the tuple is in the list.
         """
 
+        permissions_version = self.get_permissions_version(workspace.id)
+        cache_keys = {
+            actor.id: self._get_compiled_roles_cache_key(
+                workspace.id,
+                permissions_version,
+                actor_subject_type,
+                actor.id,
+                include_trash,
+            )
+            for actor in actors
+        }
+        cached = cache.get_many(cache_keys.values())
+        compiled_roles_per_actor_id = {
+            actor_id: cached[cache_key]
+            for actor_id, cache_key in cache_keys.items()
+            if cache_key in cached
+        }
+
+        actors_to_compile = [
+            actor for actor in actors if actor.id not in compiled_roles_per_actor_id
+        ]
+        if actors_to_compile:
+            compiled_roles = self._compile_roles_per_scope_for_actors(
+                workspace, actor_subject_type, actors_to_compile, include_trash
+            )
+            cache.set_many(
+                {
+                    cache_keys[actor_id]: roles
+                    for actor_id, roles in compiled_roles.items()
+                },
+                timeout=settings.BASEROW_ENTERPRISE_PERMISSIONS_CACHE_TIMEOUT_SECONDS,
+            )
+            compiled_roles_per_actor_id.update(compiled_roles)
+
+        workspace_scope_param = (
+            ContentType.objects.get_for_model(Workspace).id,
+            workspace.id,
+        )
+
+        # Keep a list of scope params to query
+        scopes_to_query = defaultdict(set)
+        for compiled_roles in compiled_roles_per_actor_id.values():
+            for scope_param, _ in compiled_roles:
+                if scope_param != workspace_scope_param:
+                    content_type_id, scope_id = scope_param
+                    scopes_to_query[content_type_id].add(scope_id)
+
+        # Populate scope cache by querying all scopes type by type
+        scope_cache = {workspace_scope_param: workspace}
+        for content_type_id, content_ids in scopes_to_query.items():
+            for scope in self.get_scopes(content_type_id, content_ids):
+                scope_cache[(content_type_id, scope.id)] = scope
+
+        # Finally replace scope_params by real scope
+        roles_per_scope_per_user = defaultdict(list)
+        for actor in actors:
+            for scope_param, role_ids in compiled_roles_per_actor_id[actor.id]:
+                roles_per_scope_per_user[actor].append(
+                    (
+                        scope_cache[scope_param],
+                        [self.get_role_by_id(role_id) for role_id in role_ids],
+                    )
+                )
+
+        return roles_per_scope_per_user
+
+    def _compile_roles_per_scope_for_actors(
+        self,
+        workspace: Workspace,
+        actor_subject_type: SubjectType,
+        actors: List[Subject],
+        include_trash=False,
+    ) -> Dict[int, List[Tuple[Tuple[int, int], List[int]]]]:
+        """
+        Computes the roles per scope of the actors from the role assignments of the
+        actors and of their teams, and from their workspace level permissions.
+
+        :return: A dict with the actor ids as keys and a list of
+            ((scope content type id, scope id), list[role id]) as value, sorted like
+            the result of `get_roles_per_scope_for_actors`.
+        """
+
         content_types = ContentType.objects.get_for_models(
             actor_subject_type.model_class, Team, Workspace
         )
@@ -392,9 +480,6 @@ class RoleAssignmentHandler:
         # Track the latest role priority for each scope of each subject
         priorities_by_scope_per_actor_id = defaultdict(dict)
 
-        # Keep a list of scope params to query later
-        scopes_to_query = defaultdict(set)
-
         roles_by_scope = defaultdict(lambda: {workspace_scope_param: []})
 
         for role_assignment in role_assignments:
@@ -403,8 +488,6 @@ class RoleAssignmentHandler:
             role_assignment_priority = role_assignment.role_priority
             subject_id = role_assignment.subject_id
 
-            scopes_to_query[role_assignment.scope_type_id].add(role_assignment.scope_id)
-
             # Is it a simple actor or a team?
             # If it's a team we need to iterate over all the actor that are
             # subject of the team
@@ -467,19 +550,65 @@ class RoleAssignmentHandler:
                         workspace_level_role
                     ]
 
-        # Populate scope cache by querying all scopes type by type
-        scope_cache = {workspace_scope_param: workspace}
-        for content_type_id, content_ids in scopes_to_query.items():
-            for scope in self.get_scopes(content_type_id, content_ids):
-                scope_cache[(content_type_id, scope.id)] = scope
+        return {
+            actor.id: [
+                (scope_param, [role.id for role in roles])
+                for scope_param, roles in roles_by_scope[actor.id].items()
+            ]
+            for actor in actors
+        }
 
-        # Finally replace scope_params by real scope
-        roles_per_scope_per_user = defaultdict(list)
-        for actor in actors:
-            for (key, value) in roles_by_scope[actor.id].items():
-                roles_per_scope_per_user[actor].append((scope_cache[key], value))
+    def _get_permissions_version_cache_key(self, workspace_id: int) -> str:
+        return f"enterprise_permissions_version_{workspace_id}"
 
-        return roles_per_scope_per_user
+    def _get_compiled_roles_cache_key(
+        self,
+        workspace_id: int,
+        permissions_version: str,
+        actor_subject_type: SubjectType,
+        actor_id: int,
+        include_trash: bool,
+    ) -> str:
+        return (
+            f"enterprise_compiled_roles_{workspace_id}_{permissions_version}_"
+            f"{actor_subject_type.type}_{actor_id}_{include_trash}"
+        )
+
+    def get_permissions_version(self, workspace_id: int) -> str:
+        """
+        Returns the current permissions version of the workspace. The cached
+        compiled roles are only used if they have been computed for this version.
+
+        :param workspace_id: The id of the workspace.
+        :return: The version.
+        """
+
+        cache_key = self._get_permissions_version_cache_key(workspace_id)
+        version = cache.get(cache_key)
+        if version is None:
+            cache.add(cache_key, uuid.uuid4().hex, timeout=None)
+            version = cache.get(cache_key)
+        return version
+
+    def invalidate_permissions_cache(self, workspace_id: int):
+        """
+        Changes the permissions version of the workspace, so that the cached
+        compiled roles of all the actors of the workspace are not used anymore. The
+        version is changed right away, and once more when the transaction commits,
+        because roles compiled by another request before that would still be based
+        on the old data.
+
+        :param workspace_id: The id of the workspace of which the permissions
+            changed.
+        """
+
+        cache_key = self._get_permissions_version_cache_key(workspace_id)
+
+        def change_version():
+            cache.set(cache_key, uuid.uuid4().hex, timeout=None)
+
+        change_version()
+        transaction.on_commit(change_version)
 
     def get_computed_roles(
         self, roles_per_scopes, context: Any, cache: Optional[Dict] = None
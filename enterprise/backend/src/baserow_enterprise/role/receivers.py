@@ -1,7 +1,7 @@
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from baserow.core.models import Workspace, WorkspaceUser
@@ -13,10 +13,15 @@ from baserow_enterprise.signals import (
     role_assignment_created,
     role_assignment_deleted,
     role_assignment_updated,
+    team_created,
     team_deleted,
     team_restored,
+    team_updated,
 )
-from baserow_enterprise.teams.models import Team
+from baserow_enterprise.teams.models import Team, TeamSubject
+
+from .handler import RoleAssignmentHandler
+from .models import RoleAssignment
 
 User = get_user_model()
 
@@ -66,6 +71,47 @@ def notify_users_about_updated_permissions(
     )
 
 
+@receiver(post_save, sender=RoleAssignment)
+@receiver(post_delete, sender=RoleAssignment)
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+@receiver(post_save, sender=WorkspaceUser)
+@receiver(post_delete, sender=WorkspaceUser)
+def invalidate_permissions_cache_when_workspace_object_changed(
+    sender, instance, **kwargs
+):
+    RoleAssignmentHandler().invalidate_permissions_cache(instance.workspace_id)
+
+
+@receiver(post_save, sender=TeamSubject)
+@receiver(post_delete, sender=TeamSubject)
+def invalidate_permissions_cache_when_team_subject_changed(sender, instance, **kwargs):
+    workspace_id = (
+        Team.objects_and_trash.filter(id=instance.team_id)
+        .values_list("workspace_id", flat=True)
+        .first()
+    )
+    if workspace_id is not None:
+        RoleAssignmentHandler().invalidate_permissions_cache(workspace_id)
+
+
+@receiver(permissions_updated)
+def invalidate_permissions_cache_when_permissions_updated(
+    sender, subject: Subject, workspace: Workspace, **kwargs
+):
+    RoleAssignmentHandler().invalidate_permissions_cache(workspace.id)
+
+
+@receiver(team_created)
+@receiver(team_updated)
+def invalidate_permissions_cache_when_team_subjects_changed(
+    sender, team: Team, **kwargs
+):
+    # The subjects of a team are created with `bulk_create`, which doesn't send the
+    # `post_save` signal.
+    RoleAssignmentHandler().invalidate_permissions_cache(team.workspace_id)
+
+
 def cascade_subject_delete(sender, instance, **kwargs):
     """
     Delete role assignments linked to deleted subjects.
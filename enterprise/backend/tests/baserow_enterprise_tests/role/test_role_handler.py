@@ -943,6 +943,89 @@ def test_get_roles_per_scope_trashed_teams(data_fixture, enterprise_data_fixture
     ]
 
 
+@pytest.mark.django_db
+def test_get_roles_per_scope_for_actors_is_cached(
+    data_fixture, enterprise_data_fixture
+):
+    user = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    user_3 = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user, members=[user_2, user_3])
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    team = enterprise_data_fixture.create_team(workspace=workspace)
+    admin_role = Role.objects.get(uid="ADMIN")
+    builder_role = Role.objects.get(uid="BUILDER")
+    editor_role = Role.objects.get(uid="EDITOR")
+    viewer_role = Role.objects.get(uid="VIEWER")
+    user_subject_type = subject_type_registry.get(UserSubjectType.type)
+
+    RoleAssignmentHandler().assign_role(user, workspace, viewer_role, scope=table)
+
+    with CaptureQueriesContext(connection) as uncached_queries:
+        result = RoleAssignmentHandler().get_roles_per_scope_for_actors(
+            workspace, user_subject_type, [user, user_2]
+        )
+
+    assert result[user][1] == (table, [viewer_role])
+
+    with CaptureQueriesContext(connection) as cached_queries:
+        assert (
+            RoleAssignmentHandler().get_roles_per_scope_for_actors(
+                workspace, user_subject_type, [user, user_2]
+            )
+            == result
+        )
+
+    # Only the scopes are queried.
+    assert len(cached_queries) == 1
+    assert len(cached_queries) < len(uncached_queries)
+
+    # Only the actors that are not cached yet are computed.
+    with patch.object(
+        RoleAssignmentHandler,
+        "_compile_roles_per_scope_for_actors",
+        wraps=RoleAssignmentHandler()._compile_roles_per_scope_for_actors,
+    ) as compile_roles:
+        RoleAssignmentHandler().get_roles_per_scope_for_actors(
+            workspace, user_subject_type, [user, user_3]
+        )
+        RoleAssignmentHandler().get_roles_per_scope_for_actors(
+            workspace, user_subject_type, [user, user_3]
+        )
+        assert compile_roles.call_count == 1
+        assert compile_roles.call_args[0][2] == [user_3]
+
+    RoleAssignmentHandler().assign_role(user, workspace, editor_role, scope=table)
+    assert RoleAssignmentHandler().get_roles_per_scope(workspace, user) == [
+        (workspace, [admin_role]),
+        (table, [editor_role]),
+    ]
+
+    RoleAssignmentHandler().assign_role(team, workspace, viewer_role, scope=database)
+    enterprise_data_fixture.create_subject(team, user_2)
+    assert RoleAssignmentHandler().get_roles_per_scope(workspace, user_2) == [
+        (workspace, [builder_role]),
+        (database, [viewer_role]),
+    ]
+
+
+@pytest.mark.django_db
+def test_invalidate_permissions_cache(data_fixture):
+    workspace = data_fixture.create_workspace()
+    other_workspace = data_fixture.create_workspace()
+    handler = RoleAssignmentHandler()
+
+    version = handler.get_permissions_version(workspace.id)
+    other_version = handler.get_permissions_version(other_workspace.id)
+    assert handler.get_permissions_version(workspace.id) == version
+
+    handler.invalidate_permissions_cache(workspace.id)
+
+    assert handler.get_permissions_version(workspace.id) != version
+    assert handler.get_permissions_version(other_workspace.id) == other_version
+
+
 @pytest.mark.disabled_in_ci
 # You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
 # intellij by editing the run config for this test and adding --run-disabled-in-ci -s
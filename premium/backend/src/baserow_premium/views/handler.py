@@ -1,11 +1,26 @@
 from collections import defaultdict
 from datetime import date, datetime
-from typing import Dict, List, Optional, Tuple, Union
-
-from django.db.models import Count, Q, QuerySet
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from django.db import connection, models
+from django.db.models import (
+    Case,
+    Count,
+    Expression,
+    F,
+    IntegerField,
+    Q,
+    QuerySet,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.expressions import OrderBy
+from django.db.models.functions import RowNumber, TruncDate
 from django.utils import timezone
 from django.utils.timezone import utc
 
+import pytz
 from baserow_premium.views.exceptions import CalendarViewHasNoDateField
 from baserow_premium.views.models import OWNERSHIP_TYPE_PERSONAL
 from dateutil.tz import gettz
@@ -17,6 +32,121 @@ from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import View
 
 
+def get_rows_grouped_by_bucket(
+    queryset: QuerySet,
+    bucket_expression: Expression,
+    bucket_pages: Dict[Any, Tuple[int, int]],
+) -> Dict[Any, Dict[str, Union[int, list]]]:
+    """
+    Fetches the rows of the queryset grouped into buckets, where the bucket of a row
+    is the value of the provided expression, like the select option or the day of a
+    date. Instead of running a query per bucket, the buckets, the position of every
+    row within its bucket and the total count per bucket are calculated in a single
+    pass using the `ROW_NUMBER() OVER (PARTITION BY bucket)` and
+    `COUNT(*) OVER (PARTITION BY bucket)` window functions. Only the ids of the rows
+    on the requested pages are returned by that query, after which the rows are
+    fetched in a second query, so that the enhancements of the queryset are
+    respected. This can be reused by any view type that groups the rows.
+
+    Example:
+
+    get_rows_grouped_by_bucket(
+        queryset,
+        F("field_1_id"),
+        bucket_pages={1: (10, 0), 2: (10, 20)}
+    )
+
+    :param queryset: The already filtered and sorted queryset of the rows. The
+        order of the queryset is respected within every bucket.
+    :param bucket_expression: The expression that calculates the bucket of a row.
+        Rows for which this is not one of the provided buckets are excluded.
+    :param bucket_pages: The `limit` and `offset` of the rows to fetch per bucket
+        that must be fetched.
+    :return: The fetched rows and total count per bucket. Every provided bucket is
+        included, even if it doesn't contain any rows.
+    """
+
+    rows = {bucket: {"count": 0, "results": []} for bucket in bucket_pages}
+
+    if len(bucket_pages) == 0:
+        return rows
+
+    bucketed_queryset = (
+        queryset.annotate(bucket=bucket_expression)
+        .filter(bucket__in=list(bucket_pages))
+        .annotate(
+            bucket_row_number=Window(
+                RowNumber(),
+                partition_by=F("bucket"),
+                order_by=_get_order_by_expressions(queryset),
+            ),
+            bucket_count=Window(Count("*"), partition_by=F("bucket")),
+        )
+        .order_by()
+        .values_list("id", "bucket", "bucket_row_number", "bucket_count")
+    )
+    sql, params = bucketed_queryset.query.sql_with_params()
+    params = list(params)
+
+    # The first row of every bucket is always selected, so that the count of every
+    # bucket is known, even if the requested offset is beyond the last row.
+    conditions = ["bucket_row_number = 1"]
+    buckets_per_page = defaultdict(list)
+    for bucket, page in bucket_pages.items():
+        buckets_per_page[page].append(bucket)
+    for (limit, offset), buckets in buckets_per_page.items():
+        conditions.append(
+            "(bucket IN %s AND bucket_row_number > %s AND bucket_row_number <= %s)"
+        )
+        params += [tuple(buckets), offset, offset + limit]
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT id, bucket, bucket_row_number, bucket_count FROM ({sql}) "
+            f"AS buckets WHERE {' OR '.join(conditions)}",
+            params,
+        )
+        bucketed_rows = cursor.fetchall()
+
+    row_buckets = {}
+    for row_id, bucket, row_number, count in bucketed_rows:
+        rows[bucket]["count"] = count
+        limit, offset = bucket_pages[bucket]
+        if offset < row_number <= offset + limit:
+            row_buckets[row_id] = bucket
+
+    if len(row_buckets) > 0:
+        for row in queryset.filter(id__in=list(row_buckets)):
+            rows[row_buckets[row.id]]["results"].append(row)
+
+    return rows
+
+
+def _get_order_by_expressions(queryset: QuerySet) -> List[OrderBy]:
+    """
+    Converts the ordering of the queryset to expressions that can be used to order
+    the rows within a window function.
+    """
+
+    query = queryset.query
+    order_by = query.order_by
+    if not order_by and query.default_ordering:
+        order_by = queryset.model._meta.ordering
+    if not order_by:
+        order_by = ["id"]
+
+    expressions = []
+    for order in order_by:
+        if isinstance(order, str):
+            descending = order.startswith("-")
+            order = F(order.lstrip("-"))
+            order = order.desc() if descending else order.asc()
+        elif not isinstance(order, OrderBy):
+            order = order.asc()
+        expressions.append(order)
+    return expressions
+
+
 def get_rows_grouped_by_single_select_field(
     view: View,
     single_select_field: SingleSelectField,
@@ -72,19 +202,23 @@ def get_rows_grouped_by_single_select_field(
         base_queryset = model.objects.all().enhance_by_fields().order_by("order", "id")
 
     base_option_queryset = ViewHandler().apply_filters(view, base_queryset)
-    all_filters = Q()
-    count_aggregates = {}
-    all_options = list(single_select_field.select_options.all())
-    all_option_ids = [option.id for option in all_options]
-
-    def get_id_and_string(option):
-        return (
-            option.id if option else None,
-            str(option.id) if option else "null",
-        )
+    all_option_ids = list(
+        single_select_field.select_options.values_list("id", flat=True)
+    )
+
+    # The rows that don't have a value, or that have a value that's not one of the
+    # options of the field, are grouped in the `null` bucket. Because option ids are
+    # always positive, `0` can safely be used to identify that bucket.
+    field_name = f"field_{single_select_field.id}_id"
+    bucket_expression = Case(
+        When(Q(**{f"{field_name}__in": all_option_ids}), then=F(field_name)),
+        default=Value(0),
+        output_field=IntegerField(),
+    )
 
-    for select_option in [None] + all_options:
-        option_id, option_string = get_id_and_string(select_option)
+    bucket_pages = {}
+    for option_id in [0] + all_option_ids:
+        option_string = str(option_id) if option_id else "null"
 
         # If option settings have been provided, we only want to return rows for
         # those options, otherwise we will include all options.
@@ -92,48 +226,18 @@ def get_rows_grouped_by_single_select_field(
             continue
 
         option_setting = option_settings.get(option_string, {})
-        limit = option_setting.get("limit", default_limit)
-        offset = option_setting.get("offset", default_offset)
-
-        if option_id is None:
-            # Somehow the `Count` aggregate doesn't support an empty `__in` lookup.
-            # That's why we always add the `-1` value that never exists to make sure
-            # there is always a value in there.
-            filters = ~Q(
-                **{f"field_{single_select_field.id}_id__in": all_option_ids + [-1]}
-            )
-        else:
-            filters = Q(**{f"field_{single_select_field.id}_id": option_id})
-
-        # We don't want to execute a single query for each select option,
-        # so we create a subquery that finds the ids of the rows related to the
-        # option group. After the single query has been executed we can group the rows.
-        sub_queryset = base_option_queryset.filter(filters).values_list(
-            "id", flat=True
-        )[offset : offset + limit]
-        all_filters |= Q(id__in=sub_queryset)
-
-        # Same goes for fetching the total count. We will construct a single query,
-        # that calculates to total amount of rows per option.
-        count_aggregates[option_string] = Count(
-            "pk",
-            filter=filters,
+        bucket_pages[option_id] = (
+            option_setting.get("limit", default_limit),
+            option_setting.get("offset", default_offset),
         )
 
-    queryset = list(base_queryset.filter(all_filters))
-    counts = base_option_queryset.aggregate(**count_aggregates)
-
-    rows = defaultdict(lambda: {"count": 0, "results": []})
-
-    for row in queryset:
-        option_id = getattr(row, f"field_{single_select_field.id}_id")
-        option_string = str(option_id) if option_id in all_option_ids else "null"
-        rows[option_string]["results"].append(row)
-
-    for key, value in counts.items():
-        rows[key]["count"] = value
-
-    return rows
+    rows = get_rows_grouped_by_bucket(
+        base_option_queryset, bucket_expression, bucket_pages
+    )
+    return {
+        str(option_id) if option_id else "null": value
+        for option_id, value in rows.items()
+    }
 
 
 def get_rows_grouped_by_date_field(
@@ -181,29 +285,28 @@ def get_rows_grouped_by_date_field(
     if not date_field_type.can_represent_date:
         raise CalendarViewHasNoDateField()
 
+    field_name = f"field_{date_field.id}"
     if base_queryset is None:
         base_queryset = (
-            model.objects.all()
-            .enhance_by_fields()
-            .order_by(f"field_{date_field.id}", "order", "id")
+            model.objects.all().enhance_by_fields().order_by(field_name, "order", "id")
         )
 
     base_option_queryset = ViewHandler().apply_filters(view, base_queryset)
-    all_filters = Q()
-    count_aggregates = {}
 
     # Target timezone is the timezone that will be used
     # for aggregation of the results into date buckets
     if getattr(date_field, "date_include_time", False):
         field_timezone = getattr(date_field, "date_force_timezone", "UTC")
-        target_timezone = field_timezone or user_timezone
+        target_timezone = field_timezone or user_timezone or "UTC"
         target_timezone_info = gettz(target_timezone)
         from_timestamp = from_timestamp.astimezone(tz=target_timezone_info)
         to_timestamp = to_timestamp.astimezone(tz=target_timezone_info)
+        # The timezone is passed by name to the database.
+        bucket_timezone = pytz.timezone(target_timezone)
     else:
         # If our field is just representing dates, then it makes no sense to split it
         # by timezone as a date on its own cannot have a timezone.
-        target_timezone_info = utc
+        bucket_timezone = utc
         # We are querying upto but not including to_timestamp, so if someone
         # queries to_timestamp=2023-01-01 00:00 we should include rows with dates
         # on the 1st, however if we don't add one day django with query for
@@ -211,44 +314,28 @@ def get_rows_grouped_by_date_field(
         to_timestamp = (to_timestamp + timezone.timedelta(days=1)).date()
         from_timestamp = from_timestamp.date()
 
-    for start, end in generate_per_day_intervals(from_timestamp, to_timestamp):
-        date_filters = Q(
-            **{
-                f"field_{date_field.id}__gte": start,
-                f"field_{date_field.id}__lt": end,
-            }
-        )
-
-        sub_queryset = base_option_queryset.filter(date_filters).values_list(
-            "id", flat=True
-        )[offset : offset + limit]
-        all_filters |= Q(id__in=sub_queryset)
-
-        start_date = start.date() if isinstance(start, datetime) else start
-        count_aggregates[str(start_date)] = Count(
-            "pk",
-            filter=date_filters,
-        )
-
-    queryset = list(base_queryset.filter(all_filters))
-    counts = base_option_queryset.aggregate(**count_aggregates)
-
-    rows = defaultdict(lambda: {"count": 0, "results": []})
-
-    for row in queryset:
-        date_field_value = getattr(row, f"field_{date_field.id}")
-        if isinstance(date_field_value, date):
-            date_value = str(date_field_value)
-        if isinstance(date_field_value, datetime):
-            date_value = str(
-                date_field_value.astimezone(tz=target_timezone_info).date()
-            )
-        rows[date_value]["results"].append(row)
-
-    for key, value in counts.items():
-        rows[key]["count"] = value
+    # Fields like the created on field always store a datetime, even if they only
+    # represent the date, so those values must be converted to the date first.
+    if isinstance(model._meta.get_field(field_name), models.DateTimeField):
+        bucket_expression = TruncDate(field_name, tzinfo=bucket_timezone)
+    else:
+        bucket_expression = F(field_name)
+
+    bucket_pages = {
+        start.date() if isinstance(start, datetime) else start: (limit, offset)
+        for start, _ in generate_per_day_intervals(from_timestamp, to_timestamp)
+    }
+    date_range_queryset = base_option_queryset.filter(
+        **{
+            f"{field_name}__gte": from_timestamp,
+            f"{field_name}__lt": to_timestamp,
+        }
+    )
 
-    return rows
+    rows = get_rows_grouped_by_bucket(
+        date_range_queryset, bucket_expression, bucket_pages
+    )
+    return {str(date_value): value for date_value, value in rows.items()}
 
 
 def to_midnight(dt: datetime) -> datetime:
@@ -1,5 +1,10 @@
+from django.db.models import F
+
 import pytest
-from baserow_premium.views.handler import get_rows_grouped_by_single_select_field
+from baserow_premium.views.handler import (
+    get_rows_grouped_by_bucket,
+    get_rows_grouped_by_single_select_field,
+)
 
 from baserow.contrib.database.views.exceptions import ViewDoesNotExist, ViewNotInTable
 from baserow.contrib.database.views.handler import ViewHandler
@@ -241,6 +246,36 @@ def test_get_rows_grouped_by_single_select_field_with_empty_table(
     assert len(rows["null"]["results"]) == 0
 
 
+@pytest.mark.django_db
+def test_get_rows_grouped_by_bucket(premium_data_fixture, django_assert_num_queries):
+    table = premium_data_fixture.create_database_table()
+    number_field = premium_data_fixture.create_number_field(table=table)
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{number_field.id}": value})
+        for value in [1, 2, 1, 2, 1, 3]
+    ]
+    queryset = model.objects.all().order_by("-id")
+
+    with django_assert_num_queries(2):
+        grouped_rows = get_rows_grouped_by_bucket(
+            queryset,
+            F(f"field_{number_field.id}"),
+            bucket_pages={1: (2, 0), 2: (1, 1), 4: (10, 0), 3: (10, 5)},
+        )
+
+    assert list(grouped_rows.keys()) == [1, 2, 4, 3]
+    assert grouped_rows[1]["count"] == 3
+    assert [row.id for row in grouped_rows[1]["results"]] == [rows[4].id, rows[2].id]
+    assert grouped_rows[2]["count"] == 2
+    assert [row.id for row in grouped_rows[2]["results"]] == [rows[1].id]
+    assert grouped_rows[4] == {"count": 0, "results": []}
+    assert grouped_rows[3] == {"count": 1, "results": []}
+
+    with django_assert_num_queries(0):
+        assert get_rows_grouped_by_bucket(queryset, F("id"), bucket_pages={}) == {}
+
+
 @pytest.mark.django_db
 @pytest.mark.view_ownership
 def test_list_views_personal_ownership_type(
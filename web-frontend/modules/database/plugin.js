@@ -96,7 +96,10 @@ import publicStore from '@baserow/modules/database/store/view/public'
 import rowModalNavigationStore from '@baserow/modules/database/store/rowModalNavigation'
 
 import { registerRealtimeEvents } from '@baserow/modules/database/realtime'
-import { CSVTableExporterType } from '@baserow/modules/database/exporterTypes'
+import {
+  CSVTableExporterType,
+  ParquetTableExporterType,
+} from '@baserow/modules/database/exporterTypes'
 import {
   BaserowAdd,
   BaserowAnd,
@@ -388,6 +391,7 @@ export default (context) => {
   app.$registry.register('importer', new JSONImporterType(context))
   app.$registry.register('settings', new APITokenSettingsType(context))
   app.$registry.register('exporter', new CSVTableExporterType(context))
+  app.$registry.register('exporter', new ParquetTableExporterType(context))
   app.$registry.register(
     'webhookEvent',
     new RowsCreatedWebhookEventType(context)